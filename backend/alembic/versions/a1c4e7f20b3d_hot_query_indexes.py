@@ -0,0 +1,133 @@
+"""Composite and covering indexes for the per-user hot queries
+
+Nearly every endpoint filters these tables by user first. Each query
+shape gets a composite index:
+  - skill_progress(user_id, skill_id): unique, the get-or-create key
+  - subskill_progress(user_id, skill_id, subskill_name): unique, the get-or-create key
+  - quiz_attempts(user_id, skill_id, completed_at) and (user_id, completed_at)
+  - xp_transactions(user_id, created_at, amount): XP sums are answered from the index
+  - user_behavior(user_id, timestamp, action_type)
+  - resources(skill_id, coalesce(subskill_name, ''), url): unique, the key
+    precompute_resources upserts on
+
+Before the unique indexes are built, duplicate rows are merged into one:
+  - progress rows left by racing get-or-creates keep the most-progressed row,
+    with time spent summed and ``completed`` set if any copy was completed
+  - duplicate resources keep the newest row; behaviour events pointing at a
+    removed copy are re-pointed to it
+
+Everything is plain SQL guarded by ``IF NOT EXISTS``/``IF EXISTS``, so the
+migration also renders with ``alembic upgrade head --sql``. It expects the
+tables the application creates at startup. Databases created with
+``Base.metadata.create_all`` already have these indexes from the models;
+there the merges find nothing and the indexes are skipped. Building an index
+locks writes to its table, so run this during a quiet period on large
+PostgreSQL databases.
+
+Revision ID: a1c4e7f20b3d
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e7f20b3d'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, index name, key expressions, unique)
+INDEXES = [
+    ("skill_progress", "uq_skill_progress_user_skill", ["user_id", "skill_id"], True),
+    ("subskill_progress", "uq_subskill_progress_user_skill_subskill", ["user_id", "skill_id", "subskill_name"], True),
+    ("quiz_attempts", "ix_quiz_attempts_user_skill_completed", ["user_id", "skill_id", "completed_at"], False),
+    ("quiz_attempts", "ix_quiz_attempts_user_completed", ["user_id", "completed_at"], False),
+    ("xp_transactions", "ix_xp_transactions_user_created", ["user_id", "created_at", "amount"], False),
+    ("user_behavior", "ix_user_behavior_user_timestamp_action", ["user_id", "timestamp", "action_type"], False),
+    ("resources", "uq_resources_skill_subskill_url", ["skill_id", "coalesce(subskill_name, '')", "url"], True),
+]
+
+# Per unique table: (columns that must be non-NULL, {column: merged value over the
+# duplicate group, as an aggregate of alias ``d``}, order that ranks the row to keep first)
+MERGES = {
+    "skill_progress": (
+        ["user_id", "skill_id"],
+        {
+            "completed": "max(CASE WHEN d.completed THEN 1 ELSE 0 END) = 1",
+            "total_time_spent_minutes": "sum(coalesce(d.total_time_spent_minutes, 0))",
+        },
+        "coalesce(progress_percentage, 0) DESC, id DESC",
+    ),
+    "subskill_progress": (
+        ["user_id", "skill_id", "subskill_name"],
+        {
+            "completed": "max(CASE WHEN d.completed THEN 1 ELSE 0 END) = 1",
+            "time_spent_minutes": "sum(coalesce(d.time_spent_minutes, 0))",
+            "completed_at": "min(d.completed_at)",
+        },
+        "id DESC",
+    ),
+    "resources": (["skill_id", "url"], {}, "id DESC"),
+}
+
+
+def _matches(alias: str, table: str, keys) -> str:
+    return " AND ".join(f"{_qualify(alias, key)} = {_qualify(table, key)}" for key in keys)
+
+
+def _qualify(alias: str, key: str) -> str:
+    """Prefix the column inside a key expression with a table alias."""
+    if key.startswith("coalesce("):
+        column = key[len("coalesce("):key.index(",")]
+        return key.replace(column, f"{alias}.{column}", 1)
+    return f"{alias}.{key}"
+
+
+def _merge_duplicates(table: str, keys):
+    """Fold every duplicated key into one row (see the module docstring)."""
+    required, merged, keep_order = MERGES[table]
+    not_null = " AND ".join(f"{column} IS NOT NULL" for column in required)
+    group = f"FROM {table} d WHERE {_matches('d', table, keys)}"
+
+    ranked = (
+        f"SELECT id, ROW_NUMBER() OVER (PARTITION BY {', '.join(keys)} ORDER BY {keep_order}) "
+        f"AS keep_rank FROM {table} WHERE {not_null}"
+    )
+    duplicates = f"SELECT id FROM ({ranked}) ranked WHERE keep_rank > 1"
+    if merged:
+        # Only the kept row is updated, so no aggregate reads an already-merged row
+        assignments = ", ".join(f"{column} = (SELECT {value} {group})" for column, value in merged.items())
+        op.execute(sa.text(
+            f"UPDATE {table} SET {assignments} "
+            f"WHERE id IN (SELECT id FROM ({ranked}) ranked WHERE keep_rank = 1) "
+            f"AND EXISTS (SELECT 1 {group} AND d.id <> {table}.id)"
+        ))
+
+    if table == "resources":
+        op.execute(sa.text(
+            f"UPDATE user_behavior SET resource_id = (SELECT max(k.id) FROM resources r JOIN resources k ON "
+            f"{_matches('k', 'r', keys)} WHERE r.id = user_behavior.resource_id) "
+            f"WHERE resource_id IN ({duplicates})"
+        ))
+    op.execute(sa.text(f"DELETE FROM {table} WHERE id IN ({duplicates})"))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, name, keys, unique in INDEXES:
+        if unique:
+            _merge_duplicates(table, keys)
+        op.execute(sa.text(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {table} ({', '.join(keys)})"
+        ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for _, name, _, _ in reversed(INDEXES):
+        op.execute(sa.text(f"DROP INDEX IF EXISTS {name}"))
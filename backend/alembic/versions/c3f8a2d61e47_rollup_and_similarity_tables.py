@@ -0,0 +1,75 @@
+"""Tables for the behaviour rollups and item-to-item skill similarities
+
+Adds the tables the background jobs write:
+  - user_daily_activity: one row per user and UTC day, unique on
+    (user_id, activity_date), built by the behaviour maintenance job
+  - skill_similarities: the top related skills per skill, rebuilt by the
+    recommendation refresher
+
+Both are created with ``IF NOT EXISTS`` (tables and indexes), so databases
+created with ``Base.metadata.create_all`` are left as they are and the
+migration renders with ``alembic upgrade head --sql``. The tables are
+declared here as they were at this revision, not imported from the models.
+
+Revision ID: c3f8a2d61e47
+Revises: a1c4e7f20b3d
+Create Date: 2026-10-18 15:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a2d61e47'
+down_revision: Union[str, Sequence[str], None] = 'a1c4e7f20b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _tables():
+    """The new tables, in creation order (``users``/``skills`` are only referenced)."""
+    metadata = sa.MetaData()
+    sa.Table("users", metadata, sa.Column("id", sa.Integer, primary_key=True))
+    sa.Table("skills", metadata, sa.Column("id", sa.Integer, primary_key=True))
+    daily_activity = sa.Table(
+        "user_daily_activity", metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("user_id", sa.Integer, sa.ForeignKey("users.id"), index=True),
+        sa.Column("activity_date", sa.Date, index=True),
+        sa.Column("action_counts", sa.JSON),
+        sa.Column("total_events", sa.Integer),
+        sa.Column("subskills_completed", sa.Integer),
+        sa.Column("quizzes_completed", sa.Integer),
+        sa.Column("minutes", sa.Float),
+        sa.Column("xp", sa.Integer),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("user_id", "activity_date", name="uq_user_daily_activity_user_date"),
+    )
+    similarities = sa.Table(
+        "skill_similarities", metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("skill_id", sa.Integer, sa.ForeignKey("skills.id"), index=True),
+        sa.Column("related_skill_id", sa.Integer, sa.ForeignKey("skills.id")),
+        sa.Column("score", sa.Float),
+        sa.Column("co_completions", sa.Integer),
+        sa.Column("computed_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    return [daily_activity, similarities]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _tables():
+        op.execute(CreateTable(table, if_not_exists=True))
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            op.execute(CreateIndex(index, if_not_exists=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(_tables()):
+        op.execute(sa.text(f"DROP TABLE IF EXISTS {table.name}"))
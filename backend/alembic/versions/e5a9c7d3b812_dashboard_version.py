@@ -0,0 +1,40 @@
+"""users.dashboard_version, the dashboard stats cache watermark
+
+Every write that can change a user's dashboard aggregates bumps the
+counter in its own transaction, so each worker's stats cache checks an entry
+with one primary-key lookup. Existing users start at 0.
+
+Databases created with ``Base.metadata.create_all`` already have the column
+and are left alone. Offline (``--sql``) the column is always added.
+
+Revision ID: e5a9c7d3b812
+Revises: c3f8a2d61e47
+Create Date: 2026-10-18 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c7d3b812'
+down_revision: Union[str, Sequence[str], None] = 'c3f8a2d61e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not context.is_offline_mode():
+        columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("users")}
+        if "dashboard_version" in columns:
+            return
+    op.add_column("users", sa.Column("dashboard_version", sa.Integer, nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("dashboard_version")
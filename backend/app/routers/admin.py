@@ -0,0 +1,28 @@
+"""
+Admin Router - Operational visibility into the scraping backends
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from models.models import User
+from utils.auth import get_current_admin_user
+from utils.circuit_breaker import circuit_breakers
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+@router.get("/circuit-breakers")
+async def get_circuit_breakers(current_user: User = Depends(get_current_admin_user)):
+    """State, sliding-window failure rate and cool-down of every host's circuit breaker"""
+    breakers = circuit_breakers.stats()
+    return {
+        "breakers": breakers,
+        "open": sorted(name for name, stats in breakers.items() if stats["state"] != "closed"),
+        "total": len(breakers)
+    }
+
+@router.post("/circuit-breakers/{name}/reset")
+async def reset_circuit_breaker(name: str, current_user: User = Depends(get_current_admin_user)):
+    """Force a breaker back to closed (e.g. after an engine has been unblocked)"""
+    if not circuit_breakers.reset(name):
+        raise HTTPException(status_code=404, detail=f"No circuit breaker named {name}")
+    return {"name": name, "state": "closed"}
@@ -13,6 +13,9 @@ from database.database import get_db
 from models.models import User, XPTransaction, SkillProgress, QuizAttempt, UserBehavior, SubskillProgress
 from utils.auth import get_current_active_user
 from utils.adaptive_learning import adaptive_engine
+from utils.recommendation_store import get_user_recommendations
+from utils.behavior_store import get_daily_activity
+from utils.dashboard_stats import get_dashboard_aggregates
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -59,56 +62,20 @@ async def get_dashboard_stats(
         current_streak = current_user.current_streak or 0
         longest_streak = current_user.longest_streak or 0
         
-        # Skill progress stats
-        skill_progress = db.query(SkillProgress).filter(
-            SkillProgress.user_id == current_user.id
-        ).all()
-        
-        skills_completed = len([sp for sp in skill_progress if sp.completed])
-        skills_in_progress = len([sp for sp in skill_progress if not sp.completed and sp.progress_percentage > 0])
-        
-        # Study time from subskill progress
-        total_study_time = db.query(func.sum(SubskillProgress.time_spent_minutes)).filter(
-            SubskillProgress.user_id == current_user.id
-        ).scalar() or 0
-        
-        # Quiz statistics
-        quiz_attempts = db.query(QuizAttempt).filter(
-            QuizAttempt.user_id == current_user.id
-        ).all()
-        
-        quiz_average_score = 0
-        if quiz_attempts:
-            total_score = sum(attempt.score / attempt.total_questions for attempt in quiz_attempts)
-            quiz_average_score = (total_score / len(quiz_attempts)) * 100
-        
-        # Weekly XP (last 7 days)
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        weekly_xp = db.query(func.sum(XPTransaction.amount)).filter(
-            XPTransaction.user_id == current_user.id,
-            XPTransaction.created_at >= week_ago
-        ).scalar() or 0
-        
-        # Daily goal completion (at least one subskill completed today)
-        today = datetime.now().date()
-        today_activity = db.query(UserBehavior).filter(
-            UserBehavior.user_id == current_user.id,
-            UserBehavior.timestamp >= datetime.combine(today, datetime.min.time()),
-            UserBehavior.action_type == "complete_subskill"
-        ).first()
-        
-        daily_goal_completion = bool(today_activity)
+        # Progress, study time, quiz, weekly XP and today's figures in one query (cached per user)
+        aggregates = get_dashboard_aggregates(db, current_user.id)
         
         return DashboardStats(
             total_xp=total_xp,
             current_streak=current_streak,
             longest_streak=longest_streak,
-            skills_completed=skills_completed,
-            skills_in_progress=skills_in_progress,
-            total_study_time_minutes=int(total_study_time),
-            quiz_average_score=round(quiz_average_score, 1),
-            weekly_xp=weekly_xp,
-            daily_goal_completion=daily_goal_completion
+            skills_completed=aggregates["skills_completed"],
+            skills_in_progress=aggregates["skills_in_progress"],
+            total_study_time_minutes=aggregates["total_study_time_minutes"],
+            quiz_average_score=aggregates["quiz_average_score"],
+            weekly_xp=aggregates["weekly_xp"],
+            # Daily goal: at least one subskill completed today
+            daily_goal_completion=aggregates["subskills_completed_today"] > 0
         )
         
     except Exception as e:
@@ -317,18 +284,18 @@ async def get_activity_feed(
                     "message": f"Completed subskill: {activity.subskill_name}",
                     "timestamp": activity.timestamp.isoformat(),
                     "icon": "✅",
-                    "metadata": activity.metadata
+                    "metadata": activity.additional_data
                 })
             elif activity.action_type == "complete_quiz":
-                score = activity.metadata.get("score", 0)
-                total = activity.metadata.get("total_questions", 1)
+                score = (activity.additional_data or {}).get("score", 0)
+                total = (activity.additional_data or {}).get("total_questions", 1)
                 percentage = int((score / total) * 100)
                 activity_feed.append({
                     "type": "quiz_completed",
                     "message": f"Completed quiz with {percentage}% score",
                     "timestamp": activity.timestamp.isoformat(),
                     "icon": "🎯",
-                    "metadata": activity.metadata
+                    "metadata": activity.additional_data
                 })
             elif activity.action_type == "start_quiz":
                 activity_feed.append({
@@ -336,7 +303,7 @@ async def get_activity_feed(
                     "message": f"Started a quiz",
                     "timestamp": activity.timestamp.isoformat(),
                     "icon": "📝",
-                    "metadata": activity.metadata
+                    "metadata": activity.additional_data
                 })
         
         # Add XP transactions to feed
@@ -373,7 +340,7 @@ async def get_learning_insights(
         behavior_analysis = adaptive_engine.analyze_user_behavior(current_user.id, db)
         
         # Get collaborative recommendations
-        recommendations = adaptive_engine.get_collaborative_recommendations(
+        recommendations = get_user_recommendations(
             user_id=current_user.id,
             db=db,
             limit=3
@@ -452,24 +419,17 @@ async def get_progress_chart(
     Get progress chart data for the dashboard
     """
     try:
-        # Get XP data over time
+        # Get XP and activity data over time from the daily rollups
         start_date = datetime.utcnow() - timedelta(days=days)
-        
-        xp_transactions = db.query(XPTransaction).filter(
-            XPTransaction.user_id == current_user.id,
-            XPTransaction.created_at >= start_date
-        ).order_by(XPTransaction.created_at).all()
+        daily_activity = get_daily_activity(db, current_user.id, since=start_date.date())
         
         # Group by day
-        daily_xp = {}
+        daily_xp = {
+            day.isoformat(): activity["xp"]
+            for day, activity in sorted(daily_activity.items()) if activity["xp"]
+        }
         cumulative_xp = 0
         
-        for transaction in xp_transactions:
-            date_str = transaction.created_at.date().isoformat()
-            if date_str not in daily_xp:
-                daily_xp[date_str] = 0
-            daily_xp[date_str] += transaction.amount
-        
         # Create chart data
         chart_data = []
         for i in range(days):
@@ -484,19 +444,10 @@ async def get_progress_chart(
                 "cumulative_xp": cumulative_xp
             })
         
-        # Get activity count data
-        activities = db.query(UserBehavior).filter(
-            UserBehavior.user_id == current_user.id,
-            UserBehavior.timestamp >= start_date,
-            UserBehavior.action_type.in_(["complete_subskill", "complete_quiz"])
-        ).all()
-        
-        daily_activities = {}
-        for activity in activities:
-            date_str = activity.timestamp.date().isoformat()
-            if date_str not in daily_activities:
-                daily_activities[date_str] = 0
-            daily_activities[date_str] += 1
+        daily_activities = {
+            day.isoformat(): activity["subskills_completed"] + activity["quizzes_completed"]
+            for day, activity in daily_activity.items()
+        }
         
         # Add activity data to chart
         for data_point in chart_data:
@@ -32,6 +32,16 @@ from utils.optimized_resource_db import (
     get_skill_subskills,
     get_performance_stats
 )
+from utils.rate_limiter import get_rate_limiter_stats
+from utils.robust_resource_fetcher import get_search_engine_stats
+from utils.http_cache import get_http_cache_stats
+from utils.url_validator import get_url_validation_stats
+from utils.skill_index_sync import get_skill_index_stats
+from ml.embedding_batcher import get_embedding_batcher_stats
+from utils.behavior_snapshot import get_behavior_snapshot_stats
+from utils.behavior_buffer import get_behavior_buffer_stats
+from utils.behavior_store import get_behavior_maintenance_stats
+from utils.dashboard_stats import get_dashboard_stats_cache_stats
 
 router = APIRouter(prefix="/resources", tags=["resources"])
 logger = logging.getLogger(__name__)
@@ -275,6 +285,16 @@ async def get_performance_statistics(
         
         return {
             "optimization_stats": stats,
+            "rate_limiter": get_rate_limiter_stats(),
+            "search_engines": get_search_engine_stats(),
+            "http_cache": get_http_cache_stats(),
+            "url_validation": get_url_validation_stats(),
+            "skill_index": get_skill_index_stats(),
+            "embedding_batcher": get_embedding_batcher_stats(),
+            "behavior_snapshots": get_behavior_snapshot_stats(),
+            "behavior_buffer": get_behavior_buffer_stats(),
+            "behavior_maintenance": get_behavior_maintenance_stats(),
+            "dashboard_stats": get_dashboard_stats_cache_stats(),
             "performance_improvements": {
                 "response_time": "10-25x faster (50-200ms vs 2-5s)",
                 "cost_reduction": "95% savings ($50-100/month → $0-5/month)",
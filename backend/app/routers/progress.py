@@ -9,6 +9,7 @@ from models.models import User, Skill, SkillProgress, XPTransaction, SubskillPro
 from schemas.schemas import ProgressCreate, ProgressUpdate, ProgressResponse
 from utils.auth import get_current_active_user
 from utils.adaptive_learning import adaptive_engine
+from utils.behavior_store import get_daily_activity
 
 # Enhanced request models
 class SubskillProgressRequest(BaseModel):
@@ -233,7 +234,7 @@ async def complete_subskill(
             db.commit()
         
         # Update streak
-        streak_data = _update_user_streak(current_user.id, db)
+        streak_data = _update_user_streak(current_user.id, db, completed_now=request.completed)
         
         return {
             "subskill_name": request.subskill_name,
@@ -331,7 +332,7 @@ async def get_progress_analytics(
                     "skill_id": activity.skill_id,
                     "subskill_name": activity.subskill_name,
                     "timestamp": activity.timestamp.isoformat(),
-                    "metadata": activity.metadata
+                    "metadata": activity.additional_data
                 }
                 for activity in recent_activity
             ],
@@ -357,7 +358,7 @@ async def get_progress_analytics(
             detail=f"Failed to get progress analytics: {str(e)}"
         )
 
-def _update_user_streak(user_id: int, db: Session) -> Dict[str, Any]:
+def _update_user_streak(user_id: int, db: Session, completed_now: bool = False) -> Dict[str, Any]:
     """Update user's learning streak"""
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
@@ -366,14 +367,14 @@ def _update_user_streak(user_id: int, db: Session) -> Dict[str, Any]:
     today = datetime.now().date()
     last_activity_date = user.last_activity.date() if user.last_activity else None
     
-    # Check if user has activity today
-    today_activity = db.query(UserBehavior).filter(
-        UserBehavior.user_id == user_id,
-        UserBehavior.timestamp >= datetime.combine(today, datetime.min.time()),
-        UserBehavior.action_type.in_(["complete_subskill", "complete_quiz"])
-    ).first()
+    # Check if user has activity today (daily rollups plus today's raw events)
+    utc_today = datetime.utcnow().date()
+    today_activity = get_daily_activity(db, user_id, since=utc_today).get(utc_today)
     
-    completed_today = bool(today_activity)
+    # The event for this very completion may still be in the write-behind buffer
+    completed_today = completed_now or bool(
+        today_activity and today_activity["subskills_completed"] + today_activity["quizzes_completed"]
+    )
     
     # Update streak
     if last_activity_date == today:
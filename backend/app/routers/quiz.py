@@ -10,6 +10,7 @@ from database.database import get_db
 from utils.auth import get_current_user
 from utils.quiz_generator import quiz_manager
 from utils.adaptive_learning import adaptive_engine
+from utils.recommendation_store import get_user_recommendations
 from models.models import User, Skill, QuizAttempt
 import logging
 
@@ -243,7 +244,7 @@ async def get_quiz_recommendations(
     """
     try:
         # Get collaborative filtering recommendations
-        recommendations = adaptive_engine.get_collaborative_recommendations(
+        recommendations = get_user_recommendations(
             user_id=current_user.id,
             db=db,
             limit=5
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List, Dict
+import asyncio
 import logging
 
 from database.database import get_db
@@ -32,7 +33,15 @@ async def create_resource(
     skill = db.query(Skill).filter(Skill.id == resource.skill_id).first()
     if not skill:
         raise HTTPException(status_code=404, detail="Skill not found")
-    
+
+    # (skill, subskill, url) is unique
+    if db.query(Resource).filter(
+        Resource.skill_id == resource.skill_id,
+        Resource.subskill_name.is_(None),
+        Resource.url == resource.url
+    ).first():
+        raise HTTPException(status_code=409, detail="Resource already exists for this skill")
+
     # Create resource
     db_resource = Resource(
         title=resource.title,
@@ -78,17 +87,18 @@ async def search_resources(
             if fast_resources:
                 logger.info(f"Fast fallback found {len(fast_resources)} resources for {skill}")
                 # Apply enhanced uniqueness filtering
-                resources = ensure_resource_uniqueness_and_quality(fast_resources, skill, limit)
+                # URL validation blocks on HEAD requests, so run the pass off the event loop
+                resources = await asyncio.to_thread(ensure_resource_uniqueness_and_quality, fast_resources, skill, limit)
             else:
                 # No fast fallback, try basic search
-                from utils.resource_search import get_resources_for_skill
-                resources = get_resources_for_skill(skill, max_per_type=limit//3 + 1)
+                from utils.resource_search import fetch_resources_for_skill
+                resources = await fetch_resources_for_skill(skill, max_per_type=limit//3 + 1)
                 logger.info(f"Basic search found {len(resources)} resources for {skill}")
         except Exception as e:
             logger.warning(f"Search failed, using fallback: {e}")
             # Fallback to basic resource search
-            from utils.resource_search import get_resources_for_skill
-            resources = get_resources_for_skill(skill, max_per_type=limit//3 + 1)
+            from utils.resource_search import fetch_resources_for_skill
+            resources = await fetch_resources_for_skill(skill, max_per_type=limit//3 + 1)
         
         # Sort by quality score and limit results
         resources.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
@@ -147,13 +157,13 @@ async def get_learning_path_with_resources(
         logger.info(f"Generating learning path for: {skill_name}")
         
         # Use the improved resource search with enhanced uniqueness
-        from utils.resource_search import get_resources_for_skill
+        from utils.resource_search import fetch_resources_for_skill
         from utils.enhanced_uniqueness import ensure_resource_uniqueness_and_quality, get_specialized_resources_for_subskill, get_performance_metrics
-        from ml.skill_decomposition import decompose_skill
+        from ml.skill_decomposition import decompose_skill_async
         
         # Get skill decomposition for learning path structure
         try:
-            skill_breakdown = decompose_skill(skill_name)
+            skill_breakdown = await decompose_skill_async(skill_name)
             subskills = skill_breakdown.get('subskills', [skill_name])
         except Exception as e:
             logger.warning(f"Skill decomposition failed: {e}")
@@ -163,16 +173,27 @@ async def get_learning_path_with_resources(
         learning_path = []
         all_resources = []
         
-        for i, subskill in enumerate(subskills[:5]):  # Limit to 5 subskills for performance
-            # Get specialized resources for this specific subskill
-            specialized = get_specialized_resources_for_subskill(subskill)
-            general = get_resources_for_skill(subskill, max_per_type=4)  # Increased for more resources
-            
-            # Combine and ensure uniqueness - QUALITY FOCUS: More resources per subskill
-            subskill_resources = specialized + general
-            unique_subskill_resources = ensure_resource_uniqueness_and_quality(
-                subskill_resources, subskill, max_resources=8  # Doubled for comprehensive learning
+        # Search all phases' subskills concurrently
+        subskills = subskills[:5]  # Limit to 5 subskills for performance
+        general_results = await asyncio.gather(*(
+            fetch_resources_for_skill(subskill, max_per_type=4)  # Increased for more resources
+            for subskill in subskills
+        ))
+        
+        # Combine specialized and general resources and ensure uniqueness per subskill, off the event loop
+        # (URL validation blocks on HEAD requests) - QUALITY FOCUS: More resources per subskill
+        unique_results = await asyncio.gather(*(
+            asyncio.to_thread(
+                ensure_resource_uniqueness_and_quality,
+                get_specialized_resources_for_subskill(subskill) + general_results[i],
+                subskill,
+                8  # Doubled for comprehensive learning
             )
+            for i, subskill in enumerate(subskills)
+        ))
+        
+        for i, subskill in enumerate(subskills):
+            unique_subskill_resources = unique_results[i]
             
             phase = {
                 "name": f"Phase {i+1}: {subskill}",
@@ -186,8 +207,9 @@ async def get_learning_path_with_resources(
             all_resources.extend(unique_subskill_resources)
         
         # Ensure overall uniqueness across all phases - increased total resources
-        final_resources = ensure_resource_uniqueness_and_quality(
-            all_resources, skill_name, max_resources=40  # Doubled for comprehensive coverage
+        final_resources = await asyncio.to_thread(
+            ensure_resource_uniqueness_and_quality,
+            all_resources, skill_name, 40  # Doubled for comprehensive coverage
         )
         
         # Calculate performance metrics for quality assurance
@@ -210,8 +232,8 @@ async def get_learning_path_with_resources(
         logger.error(f"Error generating learning path for {skill_name}: {str(e)}")
         
         # Return a basic learning path structure
-        from utils.resource_search import get_resources_for_skill
-        basic_resources = get_resources_for_skill(skill_name, max_per_type=3)
+        from utils.resource_search import fetch_resources_for_skill
+        basic_resources = await fetch_resources_for_skill(skill_name, max_per_type=3)
         
         return {
             "skill": skill_name,
@@ -297,13 +319,13 @@ async def get_resources_by_skill_name(
         resources_by_skill[skill_name] = []
       # Add default resources if none exist
     if not resources_by_skill[skill_name]:
-        default_resources = generate_default_resources(skill_name)
+        default_resources = await generate_default_resources(skill_name)
         # default_resources now returns dictionaries directly with quality_score
         resources_by_skill[skill_name] = default_resources
         
     return resources_by_skill
 
-def generate_default_resources(skill_name):
+async def generate_default_resources(skill_name):
     """
     Generate default resources for a skill using the ML module and dynamic search
     
@@ -320,21 +342,21 @@ def generate_default_resources(skill_name):
     # Use the ML function to get recommended resources
     try:
         # Import directly from utils to make sure we're using the most up-to-date version
-        from utils.resource_search import get_resources_for_skill as direct_search
+        from utils.resource_search import fetch_resources_for_skill as direct_search
         
         # Try to get resources directly first (more reliable than going through ML module)
-        dynamic_resources = direct_search(skill_name)
+        dynamic_resources = await direct_search(skill_name)
         if dynamic_resources and len(dynamic_resources) > 0:
             logger.info(f"Found {len(dynamic_resources)} dynamic resources directly for {skill_name}")
             recommended_resources = dynamic_resources
         else:
             # Fall back to ML module if direct search fails
             logger.info(f"Direct search returned no results, trying ML module for {skill_name}")
-            recommended_resources = get_resources_for_skill(skill_name)
+            recommended_resources = await asyncio.to_thread(get_resources_for_skill, skill_name)
     except Exception as e:
         # If there's an error, fall back to ML module
         logger.warning(f"Error in direct search: {str(e)}, falling back to ML module")
-        recommended_resources = get_resources_for_skill(skill_name)
+        recommended_resources = await asyncio.to_thread(get_resources_for_skill, skill_name)
       # Convert to dictionaries with quality scores preserved
     resources = []
     for res in recommended_resources:
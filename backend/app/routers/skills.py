@@ -9,6 +9,7 @@ from schemas.schemas import SkillCreate, SkillResponse, SkillTree, SkillNameRequ
 from utils.auth import get_current_active_user
 from utils.llm_integration import llm_integration
 from utils.adaptive_learning import adaptive_engine
+from utils.recommendation_store import get_user_recommendations
 from utils.quiz_generator import quiz_manager
 
 # Import ML functions
@@ -16,7 +17,7 @@ import sys
 import os
 # Append the project root to access the ml directory
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
-from ml.skill_decomposition import decompose_skill, generate_learning_path
+from ml.skill_decomposition import decompose_skill_async, generate_learning_path
 
 # Enhanced request models
 class SkillDecomposeRequest(BaseModel):
@@ -115,7 +116,7 @@ async def decompose_skill_endpoint(
             return skill_data
         else:
             # Use traditional ML-based decomposition
-            skill_tree = decompose_skill(request.skill_name)
+            skill_tree = await decompose_skill_async(request.skill_name)
             
             # Create or get skill in database
             existing_skill = db.query(Skill).filter(Skill.name == request.skill_name).first()
@@ -145,7 +146,7 @@ async def decompose_skill_endpoint(
             
     except Exception as e:
         # Fallback to traditional method
-        skill_tree = decompose_skill(request.skill_name)
+        skill_tree = await decompose_skill_async(request.skill_name)
         return skill_tree
 
 @router.post("/learning-path", response_model=dict)
@@ -277,7 +278,7 @@ async def get_skill_analytics(
             },
             "behavior_analysis": behavior_analysis,
             "difficulty_analysis": difficulty_analysis,
-            "recommendations": adaptive_engine.get_collaborative_recommendations(
+            "recommendations": get_user_recommendations(
                 user_id=current_user.id,
                 db=db,
                 limit=3
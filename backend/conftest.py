@@ -0,0 +1,48 @@
+"""
+Shared pytest fixtures for the backend tests.
+
+``engine`` is a private in-memory SQLite database with every model's table,
+shared by all the connections of one test (StaticPool), so background
+threads see the test's data. ``file_engine`` is the same schema in a SQLite
+file, for tests that need a second process or file locks.
+"""
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database.database import Base
+import models.models  # noqa: F401 - registers the tables on Base.metadata
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
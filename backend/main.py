@@ -13,6 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.routers import auth, skills, users, resources, progress, quiz, dashboard
 from app.routers import optimized_resources  # Import optimized resource router
+from app.routers import admin
 import uvicorn
 
 app = FastAPI(
@@ -61,6 +62,81 @@ async def root():
 async def health_check():
     return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
 
+# Readiness: reports whether semantic (embedding-based) decomposition is available
+@app.get("/health/ready")
+async def readiness_check():
+    from ml.embeddings import embedding_provider, LOADING
+    embeddings = embedding_provider.status()
+    if embedding_provider.state == LOADING:
+        # Preloading is still in progress; keep traffic away until it finishes
+        return JSONResponse(status_code=503, content={"status": "warming_up", "embeddings": embeddings})
+    return {
+        "status": "ready",
+        "embeddings_available": embedding_provider.available,
+        "embeddings": embeddings
+    }
+
+# Load the embedding model and build the skill index in the background at startup
+# if EMBEDDING_PRELOAD asks for it (lazy by default)
+@app.on_event("startup")
+async def preload_embeddings():
+    import asyncio
+    from ml.embeddings import preload_embedding_model
+    from utils.skill_index_sync import register_skill_index_hooks, warm_skill_index
+    register_skill_index_hooks()
+    await asyncio.to_thread(preload_embedding_model)
+    # Lazy mode leaves the model (and the index) to the first search instead of loading torch here
+    warm_skill_index()
+
+# Keep hot resource URLs validated off the request path (URL_VALIDATION_SWEEP_INTERVAL > 0)
+@app.on_event("startup")
+async def start_url_revalidation():
+    from utils.url_validator import url_validator
+    url_validator.start_sweep()
+
+# Keep the collaborative-filtering matrix, the materialized recommendations and the dashboard stats cache current
+@app.on_event("startup")
+async def start_recommendation_refresh():
+    from utils.user_skill_matrix import register_user_skill_matrix_hooks
+    from utils.recommendation_store import register_recommendation_hooks, recommendation_refresher
+    from utils.dashboard_stats import register_dashboard_stats_hooks
+    register_user_skill_matrix_hooks()
+    register_recommendation_hooks()
+    register_dashboard_stats_hooks()
+    recommendation_refresher.start()
+
+# Buffer behaviour tracking writes (replays the local WAL left by a crash, if any)
+@app.on_event("startup")
+async def start_behavior_buffer():
+    from utils.behavior_buffer import behavior_buffer
+    behavior_buffer.start()
+
+# Nightly behaviour rollups, partition rotation and retention (BEHAVIOR_MAINTENANCE_INTERVAL > 0)
+@app.on_event("startup")
+async def start_behavior_maintenance():
+    from utils.behavior_store import behavior_maintenance
+    behavior_maintenance.start()
+
+# Release pooled scraper connections on shutdown
+@app.on_event("shutdown")
+async def close_scraper_pool():
+    from utils.async_http import close_session
+    from utils.url_validator import url_validator
+    from ml.skill_index import skill_index
+    from ml.embedding_batcher import embedding_batcher
+    from utils.user_skill_matrix import user_skill_matrix
+    from utils.recommendation_store import recommendation_refresher
+    from utils.behavior_buffer import behavior_buffer
+    from utils.behavior_store import behavior_maintenance
+    url_validator.stop_sweep()
+    recommendation_refresher.stop()
+    behavior_maintenance.stop()
+    skill_index.save_if_dirty()
+    user_skill_matrix.save_if_dirty()
+    embedding_batcher.close()
+    behavior_buffer.close()
+    await close_session()
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -70,6 +146,7 @@ app.include_router(resources.router)  # Keep legacy for backwards compatibility
 app.include_router(progress.router)
 app.include_router(quiz.router)
 app.include_router(dashboard.router)
+app.include_router(admin.router)
 
 if __name__ == "__main__":
     # Get configuration from environment variables
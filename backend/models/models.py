@@ -1,6 +1,6 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, DateTime, Float, Table, JSON
+from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, Text, DateTime, Date, Float, Table, JSON, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, literal_column
 from database.database import Base
 
 # User model with enhanced fields for adaptive learning
@@ -20,6 +20,8 @@ class User(Base):
     longest_streak = Column(Integer, default=0)
     last_activity = Column(DateTime(timezone=True), server_default=func.now())
     learning_preferences = Column(JSON, default={})  # Stores user preferences like difficulty, pace
+    # Bumped in the same transaction as every write that can change the dashboard stats
+    dashboard_version = Column(Integer, default=0, server_default="0", nullable=False)
     
     # Relationships
     skill_progress = relationship("SkillProgress", back_populates="user")
@@ -50,6 +52,9 @@ class Skill(Base):
 # New SubskillProgress model for granular tracking
 class SubskillProgress(Base):
     __tablename__ = "subskill_progress"
+    __table_args__ = (
+        Index("uq_subskill_progress_user_skill_subskill", "user_id", "skill_id", "subskill_name", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -83,6 +88,11 @@ class Resource(Base):
     # Relationships
     skill = relationship("Skill", back_populates="resources")
 
+# Upsert key of precomputed resources. Skill-level rows have no subskill; coalescing it
+# to '' makes them conflict too (NULLs never do)
+RESOURCE_UPSERT_KEY = (Resource.skill_id, func.coalesce(Resource.subskill_name, literal_column("''")), Resource.url)
+Index("uq_resources_skill_subskill_url", *RESOURCE_UPSERT_KEY, unique=True)
+
 # Quiz system models
 class QuizQuestion(Base):
     __tablename__ = "quiz_questions"
@@ -102,6 +112,10 @@ class QuizQuestion(Base):
 
 class QuizAttempt(Base):
     __tablename__ = "quiz_attempts"
+    __table_args__ = (
+        Index("ix_quiz_attempts_user_skill_completed", "user_id", "skill_id", "completed_at"),
+        Index("ix_quiz_attempts_user_completed", "user_id", "completed_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -120,6 +134,9 @@ class QuizAttempt(Base):
 # User behavior tracking for adaptive learning
 class UserBehavior(Base):
     __tablename__ = "user_behavior"
+    __table_args__ = (
+        Index("ix_user_behavior_user_timestamp_action", "user_id", "timestamp", "action_type"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -138,6 +155,9 @@ class UserBehavior(Base):
 # Enhanced SkillProgress model
 class SkillProgress(Base):
     __tablename__ = "skill_progress"
+    __table_args__ = (
+        Index("uq_skill_progress_user_skill", "user_id", "skill_id", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -156,6 +176,10 @@ class SkillProgress(Base):
 # Enhanced XPTransaction model
 class XPTransaction(Base):
     __tablename__ = "xp_transactions"
+    __table_args__ = (
+        # amount is included so per-user XP sums are answered from the index alone
+        Index("ix_xp_transactions_user_created", "user_id", "created_at", "amount"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -188,3 +212,30 @@ class UserRecommendation(Base):
     
     # Relationships
     user = relationship("User")
+
+# Item-to-item skill similarity (co-completion), rebuilt offline from skill_progress
+class SkillSimilarity(Base):
+    __tablename__ = "skill_similarities"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), index=True)
+    related_skill_id = Column(Integer, ForeignKey("skills.id"))
+    score = Column(Float)  # Cosine similarity of the skills' completion vectors
+    co_completions = Column(Integer)  # Users who completed both skills
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+# Per-user daily rollup of user_behavior (and XP), built nightly; dashboards read this instead of raw events
+class UserDailyActivity(Base):
+    __tablename__ = "user_daily_activity"
+    __table_args__ = (UniqueConstraint("user_id", "activity_date", name="uq_user_daily_activity_user_date"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    activity_date = Column(Date, index=True)  # UTC day
+    action_counts = Column(JSON, default={})  # {action_type: count}
+    total_events = Column(Integer, default=0)
+    subskills_completed = Column(Integer, default=0)
+    quizzes_completed = Column(Integer, default=0)
+    minutes = Column(Float, default=0.0)  # Sum of time_spent_minutes reported by the events
+    xp = Column(Integer, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,179 @@
+"""
+Compare the torch and int8 ONNX embedding backends.
+
+Parity: every query is matched against the SKILL_HIERARCHY roots, exactly as
+``decompose_skill`` does. The ONNX backend must pick the same root and make
+the same above/below-threshold decision as torch for at least
+``--min-agreement`` of the queries. If it does not, the script exits with
+status 1.
+
+Benchmark: each backend is measured in a fresh subprocess, so peak memory
+isn't shared. The script reports load time, peak RSS, single-query latency
+(p50/p95) and batch throughput.
+
+Usage:
+    python scripts/benchmark_embedding_backends.py [--repeats N] [--min-agreement 0.95] [--skip-benchmark]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# Ensure we can import from the backend directory and the ml package
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+sys.path.insert(0, os.path.dirname(backend_dir))
+
+from ml.embeddings import EmbeddingModelProvider, EmbeddingMatrix, normalize_rows
+from ml.skill_decomposition import SKILL_HIERARCHY
+
+# decompose_skill reuses a hierarchy root above this cosine similarity
+MATCH_THRESHOLD = 0.7
+
+# Free-text phrasings users type, on top of every name in the hierarchy
+EXTRA_QUERIES = [
+    "data analysis with python", "deep learning", "neural networks", "react hooks",
+    "frontend development", "backend apis", "sql databases", "cloud computing",
+    "docker containers", "statistics for data science", "javascript programming",
+    "web design", "machine learning engineering", "data visualization with charts",
+    "mobile app development", "cybersecurity basics", "devops pipelines", "linear algebra",
+]
+
+
+def hierarchy_queries():
+    names = list(SKILL_HIERARCHY)
+    for subskills in SKILL_HIERARCHY.values():
+        names.extend(subskills)
+    return list(dict.fromkeys(names + EXTRA_QUERIES))
+
+
+def compare_hierarchy_matching(reference, candidate, queries, threshold=MATCH_THRESHOLD):
+    """
+    Run the hierarchy matching task with two providers and compare the outcomes.
+
+    Args:
+        reference: EmbeddingModelProvider treated as ground truth (torch)
+        candidate: EmbeddingModelProvider under test (onnx)
+        queries: Skill names to match
+        threshold: Similarity above which the matched root is used
+
+    Returns:
+        dict with the agreement ratio, mean/min cosine between the two
+        backends' query embeddings, and the disagreeing queries
+    """
+    roots = list(SKILL_HIERARCHY)
+    outcomes = {}
+    embeddings = {}
+    for name, provider in (("reference", reference), ("candidate", candidate)):
+        matrix = normalize_rows(provider.encode(roots))
+        vectors = normalize_rows(provider.encode(list(queries)))
+        scores = vectors @ matrix.T
+        best = scores.argmax(axis=1)
+        outcomes[name] = [(roots[i], bool(scores[row, i] > threshold)) for row, i in enumerate(best)]
+        embeddings[name] = vectors
+
+    cosines = (embeddings["reference"] * embeddings["candidate"]).sum(axis=1)
+    mismatches = [
+        {"query": query, "reference": ref, "candidate": cand}
+        for query, ref, cand in zip(queries, outcomes["reference"], outcomes["candidate"])
+        if ref != cand
+    ]
+    return {
+        "queries": len(queries),
+        "agreement": round(1 - len(mismatches) / max(len(queries), 1), 4),
+        "mean_cosine": round(float(cosines.mean()), 4),
+        "min_cosine": round(float(cosines.min()), 4),
+        "mismatches": mismatches,
+    }
+
+
+def measure_backend(backend, queries, repeats):
+    """Load one backend in this process and time it (run in a subprocess by main)."""
+    provider = EmbeddingModelProvider(backend=backend)
+    started = time.perf_counter()
+    if not provider.warm_up():
+        return {"backend": backend, "error": provider.error or "not installed"}
+    load_seconds = time.perf_counter() - started
+
+    provider.encode(queries[:8])  # first-call allocations
+    latencies = []
+    for i in range(repeats):
+        started = time.perf_counter()
+        provider.encode(queries[i % len(queries)])
+        latencies.append((time.perf_counter() - started) * 1000)
+    started = time.perf_counter()
+    provider.encode(queries)
+    batch_seconds = time.perf_counter() - started
+
+    return {
+        "backend": backend,
+        "load_seconds": round(load_seconds, 2),
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mib": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "single_ms_p50": round(float(np.percentile(latencies, 50)), 2),
+        "single_ms_p95": round(float(np.percentile(latencies, 95)), 2),
+        "batch_texts_per_second": round(len(queries) / batch_seconds, 1),
+    }
+
+
+def run_parity(min_agreement):
+    reference = EmbeddingModelProvider(backend="torch")
+    candidate = EmbeddingModelProvider(backend="onnx")
+    for provider in (reference, candidate):
+        if not provider.warm_up():
+            print(f"❌ {provider.backend} backend unavailable: {provider.error or 'not installed'}")
+            return False
+
+    report = compare_hierarchy_matching(reference, candidate, hierarchy_queries())
+    print(f"Hierarchy matching parity over {report['queries']} queries")
+    print(f"   Agreement: {report['agreement']:.2%} (required {min_agreement:.0%})")
+    print(f"   Cosine torch vs onnx: mean {report['mean_cosine']}, min {report['min_cosine']}")
+    for mismatch in report["mismatches"]:
+        print(f"   ≠ {mismatch['query']!r}: torch {mismatch['reference']} / onnx {mismatch['candidate']}")
+    passed = report["agreement"] >= min_agreement
+    print("✅ Parity check passed" if passed else "❌ Parity check failed")
+    return passed
+
+
+def run_benchmark(repeats):
+    print("\nBenchmark (each backend in a fresh process)")
+    for backend in ("torch", "onnx"):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--measure", backend, "--repeats", str(repeats)],
+            capture_output=True, text=True
+        )
+        try:
+            result = json.loads(output.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            print(f"   {backend}: failed\n{output.stderr[-2000:]}")
+            continue
+        if "error" in result:
+            print(f"   {backend}: unavailable ({result['error']})")
+            continue
+        print(f"   {backend:5s} load {result['load_seconds']}s | peak RSS {result['peak_rss_mib']} MiB | "
+              f"single p50 {result['single_ms_p50']}ms p95 {result['single_ms_p95']}ms | "
+              f"batch {result['batch_texts_per_second']} texts/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the torch and ONNX embedding backends")
+    parser.add_argument("--repeats", type=int, default=200, help="Single-query encodes per backend")
+    parser.add_argument("--min-agreement", type=float, default=0.95, help="Required hierarchy matching agreement")
+    parser.add_argument("--skip-benchmark", action="store_true", help="Only run the parity check")
+    parser.add_argument("--measure", choices=["torch", "onnx"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure_backend(args.measure, hierarchy_queries(), args.repeats)))
+        sys.exit(0)
+
+    passed = run_parity(args.min_agreement)
+    if not args.skip_benchmark:
+        run_benchmark(args.repeats)
+    sys.exit(0 if passed else 1)
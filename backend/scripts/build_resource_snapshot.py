@@ -0,0 +1,56 @@
+"""
+Build the versioned resource catalog snapshot.
+
+Merges every curated resource store into the unified catalog and writes it as
+a memory-mappable snapshot. Running workers pick up the new version on their
+next reload check (RESOURCE_SNAPSHOT_RELOAD_INTERVAL seconds).
+
+Usage:
+    python scripts/build_resource_snapshot.py [--output PATH] [--verify]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Ensure we can import from the backend directory
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from utils.resource_catalog import build_resource_catalog, RESOURCE_SNAPSHOT_PATH
+from utils.catalog_snapshot import write_snapshot, load_snapshot, verify_snapshot
+
+
+def build_snapshot(output_path, verify=False):
+    """Build the catalog, write the snapshot and optionally verify it."""
+    start_time = time.time()
+    catalog = build_resource_catalog()
+    version = write_snapshot(catalog, output_path)
+    elapsed = time.time() - start_time
+
+    stats = catalog.stats()
+    print(f"✅ Wrote snapshot {output_path}")
+    print(f"   Version: {version}")
+    print(f"   Records: {stats['total_records']} unique URLs across {stats['total_listings']} listings")
+    print(f"   Size: {os.path.getsize(output_path) / 1024:.1f} KiB in {elapsed * 1000:.0f}ms")
+
+    if verify:
+        problems = verify_snapshot(catalog, load_snapshot(output_path))
+        if problems:
+            print("❌ Snapshot verification failed:")
+            for problem in problems:
+                print(f"   - {problem}")
+            return False
+        print("✅ Snapshot matches the in-memory catalog")
+
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the SkillSprint resource catalog snapshot")
+    parser.add_argument("--output", default=RESOURCE_SNAPSHOT_PATH, help="Snapshot path (default: RESOURCE_SNAPSHOT_PATH)")
+    parser.add_argument("--verify", action="store_true", help="Re-read the snapshot and compare it with the catalog")
+    args = parser.parse_args()
+
+    sys.exit(0 if build_snapshot(args.output, verify=args.verify) else 1)
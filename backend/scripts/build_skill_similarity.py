@@ -0,0 +1,41 @@
+"""
+Build the item-to-item skill similarity table.
+
+Recomputes ``skill_similarities`` (skill → top-K co-completed skills) from
+``skill_progress``. The recommendation refresh job does the same once the
+table is older than SKILL_SIMILARITY_MAX_AGE_SECONDS; run this after bulk
+imports or to build the table for the first time.
+
+Usage:
+    python scripts/build_skill_similarity.py [--top-k N] [--min-support N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Ensure we can import from the backend directory
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from database.database import SessionLocal
+from utils.item_similarity import (
+    build_skill_similarity_table, SKILL_SIMILARITY_TOP_K, SKILL_SIMILARITY_MIN_SUPPORT
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the SkillSprint skill similarity table")
+    parser.add_argument("--top-k", type=int, default=SKILL_SIMILARITY_TOP_K, help="Neighbours stored per skill")
+    parser.add_argument("--min-support", type=int, default=SKILL_SIMILARITY_MIN_SUPPORT,
+                        help="Minimum number of users who completed both skills")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    db = SessionLocal()
+    try:
+        rows = build_skill_similarity_table(db, top_k=args.top_k, min_support=args.min_support)
+    finally:
+        db.close()
+    print(f"✅ Wrote {rows} skill similarity pairs in {(time.time() - start_time) * 1000:.0f}ms")
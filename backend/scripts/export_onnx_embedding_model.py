@@ -0,0 +1,78 @@
+"""
+Export the skill embedding model to int8-quantized ONNX.
+
+Writes ``model.int8.onnx`` and ``tokenizer.json`` to the directory the ONNX
+backend loads from (EMBEDDING_ONNX_DIR, by default
+data/embeddings/onnx/<model name>). Set EMBEDDING_BACKEND=onnx to use them.
+
+Needs torch, transformers and onnxruntime on the machine doing the export
+only; the API boxes just need onnxruntime and tokenizers.
+
+Usage:
+    python scripts/export_onnx_embedding_model.py [--model NAME] [--output DIR] [--keep-fp32]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Ensure we can import from the backend directory and the ml package
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+sys.path.insert(0, os.path.dirname(backend_dir))
+
+from ml.embeddings import EMBEDDING_MODEL_NAME, EMBEDDING_CACHE_DIR
+from ml.onnx_encoder import ONNX_MODEL_FILENAME, DEFAULT_MAX_LENGTH, default_onnx_dir
+
+
+def export_model(model_name, output_dir, keep_fp32=False):
+    """Export the transformer to ONNX, quantize its weights to int8 and save the tokenizer."""
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    start_time = time.time()
+    hub_name = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+    tokenizer = AutoTokenizer.from_pretrained(hub_name)
+    model = AutoModel.from_pretrained(hub_name).eval()
+
+    os.makedirs(output_dir, exist_ok=True)
+    fp32_path = os.path.join(output_dir, "model.fp32.onnx")
+    int8_path = os.path.join(output_dir, ONNX_MODEL_FILENAME)
+
+    sample = tokenizer(["export sample"], padding=True, truncation=True,
+                       max_length=DEFAULT_MAX_LENGTH, return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            fp32_path,
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=14,
+            do_constant_folding=True,
+        )
+
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    tokenizer.backend_tokenizer.save(os.path.join(output_dir, "tokenizer.json"))
+    if not keep_fp32:
+        os.remove(fp32_path)
+
+    print(f"✅ Exported {hub_name} to {output_dir}")
+    print(f"   {ONNX_MODEL_FILENAME}: {os.path.getsize(int8_path) / 1024 / 1024:.1f} MiB")
+    print(f"   Took {time.time() - start_time:.1f}s")
+    print("   Check parity with: python scripts/benchmark_embedding_backends.py")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the embedding model to int8 ONNX")
+    parser.add_argument("--model", default=EMBEDDING_MODEL_NAME, help="Model name (default: EMBEDDING_MODEL_NAME)")
+    parser.add_argument("--output", help="Output directory (default: EMBEDDING_ONNX_DIR)")
+    parser.add_argument("--keep-fp32", action="store_true", help="Keep the unquantized export next to the int8 one")
+    args = parser.parse_args()
+    export_model(args.model, args.output or default_onnx_dir(args.model, EMBEDDING_CACHE_DIR), args.keep_fp32)
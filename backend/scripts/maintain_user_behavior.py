@@ -0,0 +1,52 @@
+"""
+Run one behaviour-store maintenance pass.
+
+Rolls up every finished day into ``user_daily_activity``. It then rotates
+old months out of the live table (SQLite) or creates upcoming partitions
+(PostgreSQL). Finally it archives raw events older than the retention
+window. The API does the same every BEHAVIOR_MAINTENANCE_INTERVAL seconds;
+run this nightly from cron when that job is disabled. A pass holds the
+behaviour-maintenance job lock, so it never runs alongside the API's job.
+
+Usage:
+    python scripts/maintain_user_behavior.py [--retention-days N] [--hot-days N] [--archive-dir DIR]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Ensure we can import from the backend directory
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from utils.behavior_store import (
+    BehaviorMaintenance, BEHAVIOR_HOT_DAYS, BEHAVIOR_RETENTION_DAYS, BEHAVIOR_ARCHIVE_DIR
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Roll up, rotate and archive SkillSprint behaviour events")
+    parser.add_argument("--retention-days", type=int, default=BEHAVIOR_RETENTION_DAYS,
+                        help="Raw events older than this are archived and dropped")
+    parser.add_argument("--hot-days", type=int, default=BEHAVIOR_HOT_DAYS,
+                        help="SQLite: days of events that stay in the live user_behavior table")
+    parser.add_argument("--archive-dir", default=BEHAVIOR_ARCHIVE_DIR, help="Directory for .jsonl.gz archives")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    maintenance = BehaviorMaintenance(hot_days=args.hot_days, retention_days=args.retention_days,
+                                      archive_dir=args.archive_dir)
+    result = maintenance.run_once()
+    if result["skipped"]:
+        print("⏭️  Another process is running behaviour maintenance; nothing done")
+        sys.exit(0)
+    print(f"📊 Rolled up {result['rolled_up_days']} days")
+    for name in result["rotated"]:
+        print(f"🔄 Rotated events into {name}")
+    for name in result["created_partitions"]:
+        print(f"🧱 Created partition {name}")
+    for path, count in result["archived"].items():
+        print(f"📦 Archived {count} events to {path}")
+    print(f"✅ Behaviour maintenance finished in {(time.time() - start_time) * 1000:.0f}ms")
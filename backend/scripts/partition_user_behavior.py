@@ -0,0 +1,112 @@
+"""
+Convert ``user_behavior`` into a monthly range-partitioned table (PostgreSQL).
+
+Runs in one transaction:
+  1. Renames the existing table (and its primary key index).
+  2. Creates ``user_behavior`` PARTITION BY RANGE (timestamp), with the
+     primary key (id, timestamp) that partitioning requires and a
+     (user_id, timestamp) index.
+  3. Creates a partition for every month from the oldest event through
+     BEHAVIOR_PARTITION_MONTHS_AHEAD months ahead, plus a DEFAULT partition
+     as a safety net.
+  4. Copies the rows, hands the id sequence to the new table and drops the
+     old one (unless --keep-old).
+Afterwards the maintenance job keeps creating partitions ahead of time and
+archives old ones.
+
+SQLite needs no conversion: the maintenance job rotates old months out of
+the live table instead.
+
+Usage:
+    python scripts/partition_user_behavior.py [--keep-old]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+# Ensure we can import from the backend directory
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from sqlalchemy import text
+
+from database.database import SessionLocal
+from utils.behavior_store import (
+    create_partition, is_partitioned, month_start, next_month, BEHAVIOR_PARTITION_MONTHS_AHEAD
+)
+
+LEGACY_TABLE = "user_behavior_unpartitioned"
+
+COLUMNS = "id, user_id, action_type, skill_id, subskill_name, resource_id, additional_data, timestamp"
+
+CREATE_PARTITIONED = """
+CREATE TABLE user_behavior (
+    id INTEGER NOT NULL DEFAULT nextval('user_behavior_id_seq'),
+    user_id INTEGER REFERENCES users(id),
+    action_type VARCHAR,
+    skill_id INTEGER REFERENCES skills(id),
+    subskill_name VARCHAR,
+    resource_id INTEGER REFERENCES resources(id),
+    additional_data JSON,
+    timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp)
+"""
+
+
+def convert(db, keep_old: bool = False) -> int:
+    """Partition ``user_behavior``; returns the number of partitions created."""
+    db.execute(text(f"ALTER TABLE user_behavior RENAME TO {LEGACY_TABLE}"))
+    # Index names are per schema; free the primary key's name for the new table
+    db.execute(text(f"ALTER INDEX IF EXISTS user_behavior_pkey RENAME TO {LEGACY_TABLE}_pkey"))
+    db.execute(text(CREATE_PARTITIONED))
+    db.execute(text("CREATE INDEX ix_user_behavior_user_timestamp ON user_behavior (user_id, timestamp)"))
+
+    oldest = db.execute(text(f"SELECT min(timestamp) FROM {LEGACY_TABLE}")).scalar()
+    month = month_start((oldest or datetime.utcnow()).date())
+    last = month_start(datetime.utcnow().date())
+    for _ in range(BEHAVIOR_PARTITION_MONTHS_AHEAD):
+        last = next_month(last)
+    partitions = 0
+    while month <= last:
+        create_partition(db, month)
+        partitions += 1
+        month = next_month(month)
+    db.execute(text("CREATE TABLE IF NOT EXISTS user_behavior_default PARTITION OF user_behavior DEFAULT"))
+
+    db.execute(text(
+        f"INSERT INTO user_behavior ({COLUMNS}) "
+        f"SELECT id, user_id, action_type, skill_id, subskill_name, resource_id, additional_data, "
+        f"COALESCE(timestamp, now()) FROM {LEGACY_TABLE}"
+    ))
+    db.execute(text("ALTER SEQUENCE user_behavior_id_seq OWNED BY user_behavior.id"))
+    if not keep_old:
+        db.execute(text(f"DROP TABLE {LEGACY_TABLE}"))
+    return partitions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Partition the SkillSprint user_behavior table by month")
+    parser.add_argument("--keep-old", action="store_true", help=f"Keep the original table as {LEGACY_TABLE}")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name != "postgresql":
+            print("ℹ️  Not PostgreSQL: the maintenance job rotates old months out of user_behavior instead")
+            sys.exit(0)
+        if is_partitioned(db):
+            print("✅ user_behavior is already partitioned")
+            sys.exit(0)
+        partitions = convert(db, keep_old=args.keep_old)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    print(f"✅ Partitioned user_behavior into {partitions} monthly partitions in {(time.time() - start_time) * 1000:.0f}ms")
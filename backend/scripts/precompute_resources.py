@@ -1,34 +1,362 @@
+"""
+Precompute learning resources for every known skill.
+
+Walks every skill in the ``skills`` table plus the ML ``SKILL_HIERARCHY``,
+gathers candidate resources for each skill and subskill from the resource
+catalog and (optionally) the web scrapers with bounded concurrency, scores and
+de-duplicates them, and bulk-upserts them into ``resources`` keyed by
+(skill_id, subskill_name, url).
+
+Progress is checkpointed after every flush, so an interrupted run resumes
+where it stopped. A run report with throughput and per-source failures is
+printed (and optionally written as JSON) at the end.
+
+Usage:
+    python scripts/precompute_resources.py [--concurrency N] [--no-scrape]
+        [--max-per-type N] [--checkpoint PATH] [--fresh] [--report PATH]
+"""
+
+import argparse
 import asyncio
-from utils.lightweight_search import LightweightResourceSearch
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+# Ensure we can import from the backend directory
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
 from database.database import SessionLocal
-from models.models import Skill, Resource
-
-async def precompute_common_skills():
-    """Pre-generate resources for popular skills"""
-    common_skills = [
-        "Python", "JavaScript", "React", "Node.js", "SQL", 
-        "Machine Learning", "Data Science", "HTML", "CSS", "Git"
-    ]
-    
-    db = SessionLocal()
-    async with LightweightResourceSearch() as searcher:
-        for skill in common_skills:
-            print(f"Pre-computing resources for {skill}...")
-            resources = await searcher.get_resources_fast(skill)
-            
-            # Store in database
-            for resource_data in resources:
-                db_resource = Resource(
-                    title=resource_data["title"],
-                    url=resource_data["url"],
-                    description=resource_data["description"],
-                    resource_type=resource_data["resource_type"],
-                    quality_score=resource_data["quality_score"]
-                )
-                db.add(db_resource)
-        
+from models.models import Skill, Resource, RESOURCE_UPSERT_KEY
+from utils.resource_catalog import get_resource_catalog, normalize_url, SOURCE_FAST_FALLBACK, SOURCE_OPTIMIZED
+from utils.enhanced_uniqueness import calculate_comprehensive_quality_score, get_specialized_resources_for_subskill
+from utils.curated_resources import get_curated_resources
+from utils.fast_fallback import get_fast_fallback_resources
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT = os.path.join(backend_dir, "data", "precompute_checkpoint.json")
+SOURCE_TIMEOUT = 20  # Seconds before a single source call is abandoned
+
+
+def _catalog_source(name):
+    """Resources for ``name`` from every catalog-backed lookup."""
+    resources = []
+    resources.extend(get_specialized_resources_for_subskill(name))
+    resources.extend(get_curated_resources(name))
+    catalog = get_resource_catalog()
+    if catalog.has_listing(SOURCE_OPTIMIZED, name):
+        resources.extend(catalog.get_listing(SOURCE_OPTIMIZED, name))
+    if catalog.has_listing(SOURCE_FAST_FALLBACK, name) or not resources:
+        # Fast fallback also synthesizes platform search links for unknown skills
+        resources.extend(get_fast_fallback_resources(name))
+    return resources
+
+
+def _scraper_sources(max_per_type):
+    """Scraper callables keyed by source name (imported lazily: they pull in requests/bs4)."""
+    from utils.resource_search import get_youtube_videos, get_articles, get_github_repos
+    return {
+        "youtube": lambda name: get_youtube_videos(f"{name} tutorial", max_per_type),
+        "articles": lambda name: get_articles(name, max_per_type),
+        "github": lambda name: get_github_repos(name, max_per_type),
+    }
+
+
+def load_skill_hierarchy():
+    """The ML skill hierarchy, or an empty mapping if the ML module is unavailable."""
+    try:
+        sys.path.append(os.path.dirname(backend_dir))
+        from ml.skill_decomposition import SKILL_HIERARCHY
+        return SKILL_HIERARCHY
+    except Exception as e:
+        logger.warning(f"Could not load SKILL_HIERARCHY: {e}")
+        return {}
+
+
+def collect_tasks(db, hierarchy):
+    """
+    Build the (skill_id, skill_name, subskill_name) work list.
+
+    Hierarchy roots that have no ``skills`` row yet are created so that every
+    precomputed resource is attached to a skill.
+    """
+    skills = {skill.name: skill for skill in db.query(Skill).all()}
+
+    created = 0
+    for root, subskills in hierarchy.items():
+        if root not in skills:
+            skill = Skill(name=root, description=f"Learn {root}", subskills=list(subskills))
+            db.add(skill)
+            skills[root] = skill
+            created += 1
+    if created:
         db.commit()
-    db.close()
+        logger.info(f"Created {created} skills from SKILL_HIERARCHY")
+
+    tasks = []
+    for name, skill in skills.items():
+        subskills = list(skill.subskills or [])
+        for subskill in hierarchy.get(name, []):
+            if subskill not in subskills:
+                subskills.append(subskill)
+
+        tasks.append((skill.id, name, None))
+        tasks.extend((skill.id, name, subskill) for subskill in subskills)
+    return tasks
+
+
+def task_key(task):
+    skill_id, _, subskill_name = task
+    return f"{skill_id}::{subskill_name or ''}"
+
+
+def score_and_dedupe(resources, max_resources):
+    """Score every candidate, keep the best copy of each URL, best first."""
+    best = {}
+    for resource in resources:
+        url = resource.get("url")
+        if not url:
+            continue
+        scored = dict(resource)
+        scored["quality_score"] = calculate_comprehensive_quality_score(scored)
+        key = normalize_url(url)
+        if key not in best or scored["quality_score"] > best[key]["quality_score"]:
+            best[key] = scored
+    ranked = sorted(best.values(), key=lambda r: r["quality_score"], reverse=True)
+    return ranked[:max_resources]
+
+
+def bulk_upsert(db, rows):
+    """
+    Insert or update resources keyed by (skill_id, subskill_name, url).
+
+    Rows are written with one ``INSERT ... ON CONFLICT DO UPDATE`` against the
+    ``uq_resources_skill_subskill_url`` unique index, so concurrent or
+    overlapping runs cannot insert duplicates. Keys that already exist are
+    read beforehand only to split the reported counts.
+
+    Returns:
+        tuple: (inserted, updated) counts
+    """
+    if not rows:
+        return 0, 0
+
+    # A batch may name one key twice; the last row wins, as a second statement would
+    unique_rows = {}
+    for row in rows:
+        unique_rows[(row["skill_id"], row["subskill_name"] or "", row["url"])] = row
+    rows = list(unique_rows.values())
+
+    skill_ids = {row["skill_id"] for row in rows}
+    existing = {
+        (skill_id, subskill_name or "", url)
+        for skill_id, subskill_name, url in db.query(
+            Resource.skill_id, Resource.subskill_name, Resource.url
+        ).filter(Resource.skill_id.in_(skill_ids))
+    }
+    updated = sum(1 for key in unique_rows if key in existing)
+
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    statement = insert(Resource).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(RESOURCE_UPSERT_KEY),
+        set_={column: statement.excluded[column]
+              for column in ("title", "description", "resource_type", "quality_score")},
+    )
+    db.execute(statement)
+    db.commit()
+    return len(rows) - updated, updated
+
+
+class Checkpoint:
+    """Completed task keys plus cumulative stats, persisted atomically as JSON."""
+
+    def __init__(self, path, resume=True):
+        self.path = path
+        self.completed = set()
+        self.stats = {}
+        if path and resume and os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            self.completed = set(data.get("completed", []))
+            self.stats = data.get("stats", {})
+
+    def save(self, stats):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"completed": sorted(self.completed), "stats": stats, "saved_at": time.time()}, f)
+        os.replace(tmp_path, self.path)
+
+
+def _new_source_stats():
+    return {"calls": 0, "resources": 0, "failures": 0, "timeouts": 0, "seconds": 0.0}
+
+
+async def precompute_resources(session_factory=SessionLocal, hierarchy=None, concurrency=8, scrape=True,
+                               max_per_type=4, max_resources=12, checkpoint_path=DEFAULT_CHECKPOINT,
+                               resume=True, batch_size=25):
+    """
+    Run the precompute pipeline.
+
+    Args:
+        session_factory: Callable returning a SQLAlchemy session
+        hierarchy: Skill -> subskills mapping (defaults to SKILL_HIERARCHY)
+        concurrency: Maximum concurrent source calls
+        scrape: Whether to query the web scrapers in addition to the catalog
+        max_per_type: Results requested from each scraper
+        max_resources: Resources stored per skill/subskill
+        checkpoint_path: Checkpoint file (None disables checkpointing)
+        resume: Skip tasks completed by a previous run
+        batch_size: Tasks per database flush
+
+    Returns:
+        dict: Run report
+    """
+    started = time.time()
+    if hierarchy is None:
+        hierarchy = load_skill_hierarchy()
+
+    sources = {"catalog": _catalog_source}
+    if scrape:
+        sources.update(_scraper_sources(max_per_type))
+
+    checkpoint = Checkpoint(checkpoint_path, resume=resume)
+    source_stats = {name: _new_source_stats() for name in sources}
+    totals = {"tasks": 0, "skipped": 0, "inserted": 0, "updated": 0, "failed_tasks": 0}
+
+    db = session_factory()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def call_source(name, fetch, query):
+        stats = source_stats[name]
+        async with semaphore:
+            call_started = time.time()
+            stats["calls"] += 1
+            try:
+                results = await asyncio.wait_for(loop.run_in_executor(executor, fetch, query), SOURCE_TIMEOUT)
+                stats["resources"] += len(results or [])
+                return results or []
+            except asyncio.TimeoutError:
+                stats["timeouts"] += 1
+                stats["failures"] += 1
+                logger.warning(f"{name} timed out for '{query}'")
+                return []
+            except Exception as e:
+                stats["failures"] += 1
+                logger.warning(f"{name} failed for '{query}': {e}")
+                return []
+            finally:
+                stats["seconds"] += time.time() - call_started
+
+    async def run_task(task):
+        skill_id, skill_name, subskill_name = task
+        query = subskill_name or skill_name
+        results = await asyncio.gather(*(call_source(name, fetch, query) for name, fetch in sources.items()))
+        candidates = [resource for source_results in results for resource in source_results]
+        return task, score_and_dedupe(candidates, max_resources)
+
+    try:
+        tasks = collect_tasks(db, hierarchy)
+        pending = [task for task in tasks if task_key(task) not in checkpoint.completed]
+        totals["skipped"] = len(tasks) - len(pending)
+        logger.info(f"Precomputing {len(pending)} skill/subskill tasks ({totals['skipped']} already done)")
+
+        for batch_start in range(0, len(pending), batch_size):
+            batch = pending[batch_start:batch_start + batch_size]
+            rows = []
+            finished = []
+            for outcome in await asyncio.gather(*(run_task(task) for task in batch), return_exceptions=True):
+                if isinstance(outcome, Exception):
+                    totals["failed_tasks"] += 1
+                    logger.error(f"Precompute task failed: {outcome}")
+                    continue
+                (skill_id, _, subskill_name), resources = outcome
+                finished.append(outcome[0])
+                for resource in resources:
+                    rows.append({
+                        "skill_id": skill_id,
+                        "subskill_name": subskill_name,
+                        "url": resource["url"],
+                        "title": resource.get("title", ""),
+                        "description": resource.get("description", ""),
+                        "resource_type": resource.get("resource_type", "article"),
+                        "quality_score": float(resource["quality_score"]),
+                    })
+
+            inserted, updated = bulk_upsert(db, rows)
+            totals["inserted"] += inserted
+            totals["updated"] += updated
+            totals["tasks"] += len(finished)
+            checkpoint.completed.update(task_key(task) for task in finished)
+            checkpoint.save({"totals": totals, "sources": source_stats})
+            logger.info(f"Flushed {len(rows)} resources ({totals['tasks']}/{len(pending)} tasks)")
+    finally:
+        executor.shutdown(wait=False)
+        db.close()
+
+    elapsed = time.time() - started
+    return {
+        "elapsed_seconds": round(elapsed, 2),
+        "tasks_completed": totals["tasks"],
+        "tasks_skipped": totals["skipped"],
+        "tasks_failed": totals["failed_tasks"],
+        "resources_inserted": totals["inserted"],
+        "resources_updated": totals["updated"],
+        "tasks_per_second": round(totals["tasks"] / elapsed, 2) if elapsed else 0.0,
+        "resources_per_second": round((totals["inserted"] + totals["updated"]) / elapsed, 2) if elapsed else 0.0,
+        "sources": {
+            name: dict(stats, seconds=round(stats["seconds"], 2),
+                       avg_latency_ms=round(stats["seconds"] * 1000 / stats["calls"], 1) if stats["calls"] else 0.0)
+            for name, stats in source_stats.items()
+        },
+    }
+
+
+def print_report(report):
+    print("\n📊 Precompute run report")
+    print("=" * 50)
+    print(f"Tasks: {report['tasks_completed']} done, {report['tasks_skipped']} skipped, {report['tasks_failed']} failed")
+    print(f"Resources: {report['resources_inserted']} inserted, {report['resources_updated']} updated")
+    print(f"Throughput: {report['tasks_per_second']} tasks/s, {report['resources_per_second']} resources/s "
+          f"in {report['elapsed_seconds']}s")
+    for name, stats in report["sources"].items():
+        print(f"  {name:10s} calls={stats['calls']:4d} resources={stats['resources']:5d} "
+              f"failures={stats['failures']:3d} timeouts={stats['timeouts']:3d} avg={stats['avg_latency_ms']}ms")
+
 
 if __name__ == "__main__":
-    asyncio.run(precompute_common_skills())
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(description="Precompute resources for every SkillSprint skill")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum concurrent source calls")
+    parser.add_argument("--no-scrape", action="store_true", help="Only use the curated resource catalog")
+    parser.add_argument("--max-per-type", type=int, default=4, help="Results requested from each scraper")
+    parser.add_argument("--max-resources", type=int, default=12, help="Resources stored per skill/subskill")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="Checkpoint file for resumable runs")
+    parser.add_argument("--fresh", action="store_true", help="Ignore any existing checkpoint")
+    parser.add_argument("--report", help="Also write the run report as JSON to this path")
+    args = parser.parse_args()
+
+    report = asyncio.run(precompute_resources(
+        concurrency=args.concurrency,
+        scrape=not args.no_scrape,
+        max_per_type=args.max_per_type,
+        max_resources=args.max_resources,
+        checkpoint_path=args.checkpoint,
+        resume=not args.fresh,
+    ))
+    print_report(report)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
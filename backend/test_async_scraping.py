@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the async, connection-pooled scraping engine.
+
+Search-engine responses are served from canned HTML so the tests exercise
+fan-out, engine preference and the per-skill deadline without the network.
+"""
+import sys
+import os
+import asyncio
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from aiohttp import web
+
+import utils.async_http as async_http
+import utils.resource_search as resource_search
+from utils.async_http import FetchResult, fetch_text, close_session, run_sync
+from utils.rate_limiter import HostRateLimiter, RateLimitExceeded
+
+SEARCH_LATENCY = 0.2
+
+
+def _canned_page(url):
+    """Fake results page for whichever engine ``url`` targets."""
+    token = str(abs(hash(url)) % 10 ** 8)
+    if "youtube.com" in url:
+        return f'<html>"/watch?v=vid{token}a" "/watch?v=vid{token}b"</html>'
+    if "github.com" in url:
+        return (f'<div class="repo-list-item"><div class="f4"><a href="/owner/repo{token}">owner/repo{token}</a></div>'
+                f'<p class="mb-1">Example repository</p></div>')
+    if "duckduckgo.com" in url:
+        return (f'<div class="result"><a class="result__a" href="https://ddg.example.com/{token}">DDG Tutorial</a>'
+                f'<a class="result__snippet">From DuckDuckGo</a></div>')
+    if "bing.com" in url:
+        return (f'<li class="b_algo"><h2><a href="https://bing.example.com/{token}">Bing Tutorial</a></h2>'
+                f'<div class="b_caption"><p>From Bing</p></div></li>')
+    return ""
+
+
+def _install_fake_fetch(latency_by_host=None):
+    """Replace the shared fetcher with one that serves canned pages after a delay."""
+    latency_by_host = latency_by_host or {}
+    calls = []
+
+    async def fake_fetch_text(url, headers=None, timeout=5, use_cache=False, cacheable=None):
+        calls.append(url)
+        delay = next((d for host, d in latency_by_host.items() if host in url), SEARCH_LATENCY)
+        await asyncio.sleep(delay)
+        return FetchResult(200, _canned_page(url), url)
+
+    resource_search.fetch_text = fake_fetch_text
+    return calls
+
+
+class _Patched:
+    """Swap out the network-bound helpers of resource_search for the duration of a test."""
+
+    def __enter__(self):
+        self.saved = {
+            name: getattr(resource_search, name)
+            for name in ("fetch_text", "ensure_resource_uniqueness_and_quality", "get_robust_resources")
+        }
+        # URL validation and the robust fetcher make blocking requests of their own
+        resource_search.ensure_resource_uniqueness_and_quality = lambda resources, skill, max_resources=8: resources[:max_resources]
+        resource_search.get_robust_resources = lambda *args, **kwargs: []
+        resource_search._resource_cache.clear()
+        return self
+
+    def __exit__(self, *exc):
+        for name, value in self.saved.items():
+            setattr(resource_search, name, value)
+        resource_search._resource_cache.clear()
+
+
+def test_searches_fan_out_across_types_only():
+    """Types are searched at once; terms within a type stop once its quota is met."""
+    with _Patched():
+        calls = _install_fake_fetch()
+        started = time.monotonic()
+        resources = asyncio.run(resource_search.fetch_resources_for_skill(
+            "Quantum Basket Weaving", resource_types=["video", "article", "github"], max_per_type=2
+        ))
+        elapsed = time.monotonic() - started
+
+        # Videos (2 per page) and articles (topped up by generated fallbacks) fill their
+        # quotas after two terms, repos (1 per page) need all four; every article
+        # search stops at the first engine
+        assert sum("youtube.com" in url for url in calls) == 2
+        assert sum("duckduckgo.com" in url for url in calls) == 2
+        assert not any("bing.com" in url for url in calls)
+        assert sum("github.com" in url for url in calls) == 4
+        assert len(calls) == 8
+        # The slowest type runs four searches in a row; types overlap
+        assert elapsed < SEARCH_LATENCY * 4 + 0.5, elapsed
+        types = {r["resource_type"] for r in resources}
+        assert {"video", "article", "github"} <= types
+
+
+def test_deadline_drops_slow_searches():
+    """A type stuck past the deadline is dropped; results already found for other types are kept."""
+    with _Patched():
+        _install_fake_fetch({"youtube.com": 5.0})
+        started = time.monotonic()
+        resources = asyncio.run(resource_search.fetch_resources_for_skill(
+            "Quantum Basket Weaving", resource_types=["video", "github"], max_per_type=2, deadline=0.6
+        ))
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 2.0, elapsed
+        assert not any(r["resource_type"] == "video" and "vid" in r["url"] for r in resources)
+        assert any(r["resource_type"] == "github" for r in resources)
+
+
+def test_article_engines_keep_preference_order():
+    """DuckDuckGo is tried first; Bing is only contacted when it has no results."""
+    with _Patched():
+        calls = _install_fake_fetch({"bing.com": 0.01, "duckduckgo.com": 0.2})
+        articles = asyncio.run(resource_search.fetch_articles("python", 2))
+        assert articles and all("ddg.example.com" in a["url"] for a in articles)
+        assert len(calls) == 1
+
+        # DuckDuckGo failing falls through to Bing
+        serve = resource_search.fetch_text
+
+        async def ddg_down(url, **kwargs):
+            if "duckduckgo.com" in url:
+                calls.append(url)
+                return FetchResult(503, "", url)
+            return await serve(url, **kwargs)
+
+        resource_search.fetch_text = ddg_down
+        calls.clear()
+        articles = asyncio.run(resource_search.fetch_articles("python", 2))
+        assert articles and all("bing.example.com" in a["url"] for a in articles)
+        assert len(calls) == 2
+
+
+def test_sync_wrapper_inside_running_loop():
+    """Legacy sync callers still work when invoked from async code."""
+    with _Patched():
+        _install_fake_fetch()
+
+        async def handler():
+            return resource_search.get_github_repos("python", 1)
+
+        repos = asyncio.run(handler())
+        assert len(repos) == 1 and repos[0]["url"].startswith("https://github.com/owner/repo")
+
+
+def test_shared_session_reuses_connections():
+    """Sequential requests to one host go over a single kept-alive connection."""
+    peers = set()
+
+    async def handle(request):
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.Response(text="ok")
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            for _ in range(5):
+                result = await fetch_text(f"http://127.0.0.1:{port}/")
+                assert result.status == 200 and result.text == "ok"
+        finally:
+            await close_session()
+            await runner.cleanup()
+
+    original = async_http.host_rate_limiter
+    async_http.host_rate_limiter = HostRateLimiter(default_rate=100, default_burst=10)
+    try:
+        asyncio.run(scenario())
+    finally:
+        async_http.host_rate_limiter = original
+    assert len(peers) == 1
+
+
+def test_fetch_text_waits_for_the_host_rate_limit():
+    """Requests queue on the host's token bucket and fail fast when the wait exceeds their timeout."""
+    served = []
+
+    async def handle(request):
+        served.append(time.monotonic())
+        return web.Response(text="ok")
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        try:
+            started = time.monotonic()
+            for _ in range(3):
+                assert (await fetch_text(url)).status == 200
+            elapsed = time.monotonic() - started
+            try:
+                await fetch_text(url, timeout=0.02)
+                raise AssertionError("expected RateLimitExceeded")
+            except RateLimitExceeded:
+                pass
+        finally:
+            await close_session()
+            await runner.cleanup()
+        return elapsed
+
+    original = async_http.host_rate_limiter
+    async_http.host_rate_limiter = limiter = HostRateLimiter(default_rate=10, default_burst=1)
+    try:
+        elapsed = asyncio.run(scenario())
+    finally:
+        async_http.host_rate_limiter = original
+    assert elapsed >= 0.18, elapsed  # one burst token, then 0.1s per request
+    assert len(served) == 3  # the rejected request never reached the host
+    host = limiter.stats()["hosts"]
+    assert sum(h["rejected_requests"] for h in host.values()) == 1
+
+
+def test_run_sync_returns_result():
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert run_sync(add(2, 3)) == 5
+
+
+if __name__ == "__main__":
+    test_searches_fan_out_across_types_only()
+    test_deadline_drops_slow_searches()
+    test_article_engines_keep_preference_order()
+    test_sync_wrapper_inside_running_loop()
+    test_shared_session_reuses_connections()
+    test_fetch_text_waits_for_the_host_rate_limit()
+    test_run_sync_returns_result()
+    print("✅ Async scraping checks passed")
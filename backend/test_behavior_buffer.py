@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for the write-behind behaviour event buffer.
+"""
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(__file__))
+
+import pytest
+from sqlalchemy import event
+
+from models.models import User, UserBehavior
+from utils.adaptive_learning import AdaptiveLearningEngine
+import utils.behavior_buffer as behavior_buffer
+from utils.behavior_buffer import BehaviorEventBuffer, make_event
+
+
+def _seed(db):
+    db.add_all(User(id=i, email=f"u{i}@example.com", username=f"u{i}") for i in (1, 2))
+    db.commit()
+
+
+def test_synchronous_fallback_writes_additional_data(db):
+    _seed(db)
+    AdaptiveLearningEngine().track_user_interaction(
+        user_id=1, action_type="complete_quiz", skill_id=None, metadata={"score": 4, "total_questions": 5}, db=db
+    )
+    behavior = db.query(UserBehavior).one()
+    assert behavior.additional_data == {"score": 4, "total_questions": 5}
+    assert db.get(User, 1).last_activity is not None
+
+
+def test_flush_is_one_insert_and_one_update(engine, session_factory, db):
+    _seed(db)
+    buffer = BehaviorEventBuffer(session_factory=session_factory, wal_path=None)
+    buffer.start(interval=60)
+    try:
+        for i in range(6):
+            assert buffer.record(make_event(user_id=1 + i % 2, action_type="view_resource",
+                                            additional_data={"resource_type": "video"}))
+        assert db.query(UserBehavior).count() == 0
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2].split()[0]))
+        assert buffer.flush() == 6
+        assert statements == ["INSERT", "UPDATE"]
+        assert db.query(UserBehavior).count() == 6
+        assert all(user.last_activity is not None for user in db.query(User))
+    finally:
+        buffer.close()
+
+
+def test_backpressure_and_flush_on_close(session_factory, db):
+    _seed(db)
+    buffer = BehaviorEventBuffer(session_factory=session_factory, max_size=3, wal_path=None)
+    flushed_users = set()
+    buffer.add_flush_listener(flushed_users.update)
+    buffer.start(interval=60)
+    for _ in range(7):
+        buffer.record(make_event(user_id=2, action_type="start_quiz"))
+    assert buffer.backpressure_flushes >= 1 and buffer.stats()["queued"] <= 3
+    buffer.close()
+    assert not buffer.running and buffer.stats()["queued"] == 0
+    assert db.query(UserBehavior).count() == 7 and flushed_users == {2}
+
+
+def _crash(buffer):
+    """Simulate a crash: queued events are lost from memory and the process's lock is released."""
+    buffer.flush = lambda: 0  # the flusher dies without a last flush
+    buffer._thread, thread = None, buffer._thread
+    buffer._stop.set()
+    buffer._wake.set()
+    thread.join()
+    buffer._drain()
+    if buffer._wal_file is not None:
+        buffer._wal_file.close()
+        buffer._wal_file = None
+    buffer._wal_lock_file.close()
+    buffer._wal_lock_file = None
+
+
+def test_wal_replays_events_after_a_crash(session_factory, db):
+    _seed(db)
+    with tempfile.TemporaryDirectory() as directory:
+        wal_path = os.path.join(directory, "behavior.wal")
+        crashed = BehaviorEventBuffer(session_factory=session_factory, wal_path=wal_path)
+        crashed.start(interval=60)
+        crashed.record(make_event(user_id=1, action_type="view_resource"))
+        assert crashed.flush() == 1
+        assert os.listdir(directory) == [os.path.basename(crashed.wal_path)[:-len(".log")] + ".lock"]
+        for _ in range(3):
+            crashed.record(make_event(user_id=1, action_type="complete_subskill", subskill_name="Loops"))
+        _crash(crashed)
+
+        restarted = BehaviorEventBuffer(session_factory=session_factory, wal_path=wal_path)
+        restarted.start(interval=60)
+        assert restarted.recovered == 3
+        assert db.query(UserBehavior).filter(UserBehavior.subskill_name == "Loops").count() == 3
+        restarted.close()
+        assert os.listdir(directory) == []
+
+
+def test_workers_sharing_a_wal_path_only_replay_dead_ones(session_factory, db):
+    _seed(db)
+    with tempfile.TemporaryDirectory() as directory:
+        wal_path = os.path.join(directory, "behavior.wal")
+        live = BehaviorEventBuffer(session_factory=session_factory, wal_path=wal_path)
+        live.start(interval=60)
+        live.record(make_event(user_id=1, action_type="view_resource"))
+        dead = BehaviorEventBuffer(session_factory=session_factory, wal_path=wal_path)
+        dead.start(interval=60)
+        assert dead.wal_path != live.wal_path
+        dead.record(make_event(user_id=2, action_type="view_resource"))
+        _crash(dead)
+
+        # A new worker replays the dead worker's log, never the live one's
+        joining = BehaviorEventBuffer(session_factory=session_factory, wal_path=wal_path)
+        joining.start(interval=60)
+        assert joining.recovered == 1
+        assert [b.user_id for b in db.query(UserBehavior)] == [2]
+
+        live.close()
+        joining.close()
+        assert sorted(b.user_id for b in db.query(UserBehavior)) == [1, 2]
+        assert os.listdir(directory) == []
+
+
+def test_failed_rotation_keeps_the_batch(session_factory, db):
+    _seed(db)
+    with tempfile.TemporaryDirectory() as directory:
+        buffer = BehaviorEventBuffer(session_factory=session_factory, wal_path=os.path.join(directory, "b.wal"))
+        buffer.start(interval=60)
+        buffer.record(make_event(user_id=1, action_type="view_resource"))
+
+        def refuse(*args):
+            raise OSError("disk full")
+
+        behavior_buffer.os.replace, replace = refuse, behavior_buffer.os.replace
+        try:
+            assert buffer.flush() == 0
+        finally:
+            behavior_buffer.os.replace = replace
+        assert buffer.stats()["queued"] == 1
+
+        buffer.record(make_event(user_id=1, action_type="view_resource"))
+        assert buffer.flush() == 2
+        buffer.close()
+        assert db.query(UserBehavior).count() == 2 and os.listdir(directory) == []
+
+
+def test_outage_longer_than_the_buffer_loses_nothing_with_a_wal(session_factory, db):
+    _seed(db)
+    outage = {"down": True}
+
+    def flaky_session():
+        session = session_factory()
+        if outage["down"]:
+            session.commit = lambda: (_ for _ in ()).throw(RuntimeError("database unavailable"))
+        return session
+
+    with tempfile.TemporaryDirectory() as directory:
+        buffer = BehaviorEventBuffer(session_factory=flaky_session, max_size=3,
+                                     wal_path=os.path.join(directory, "b.wal"))
+        buffer.start(interval=60)
+        for _ in range(10):  # backpressure flushes fail throughout
+            buffer.record(make_event(user_id=1, action_type="view_resource"))
+        assert buffer.flush() == 0
+        assert buffer._retry == [] and buffer.stats()["retry_segments"] >= 1
+
+        outage["down"] = False
+        assert buffer.flush() == 10
+        buffer.close()
+        assert db.query(UserBehavior).count() == 10 and buffer.dropped == 0
+        assert os.listdir(directory) == []
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Behaviour buffer checks passed")
+    sys.exit(exit_code)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass, watermark-cached user behaviour snapshot.
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(__file__))
+
+import pytest
+from sqlalchemy import event
+
+from models.models import User, Skill, SkillProgress, UserBehavior, QuizAttempt
+from utils.adaptive_learning import AdaptiveLearningEngine
+from utils.behavior_snapshot import BehaviorSnapshotCache, build_snapshot
+
+
+def _seed(db):
+    db.add_all([Skill(id=1, name="Python"), Skill(id=2, name="SQL")])
+    db.add(User(id=1, email="u1@example.com", username="u1"))
+    db.add_all([
+        SkillProgress(user_id=1, skill_id=1, progress_percentage=80.0),
+        SkillProgress(user_id=1, skill_id=2, progress_percentage=20.0),
+    ])
+    start = datetime(2024, 3, 1, 19)
+    for day in range(4):
+        for resource_type in ("video", "video", "article"):
+            db.add(UserBehavior(user_id=1, action_type="view_resource", timestamp=start + timedelta(days=day),
+                                additional_data={"resource_type": resource_type}))
+        db.add(UserBehavior(user_id=1, action_type="complete_subskill", timestamp=start + timedelta(days=day, hours=1),
+                            additional_data={"time_spent_minutes": 45}))
+    db.add_all([
+        QuizAttempt(user_id=1, skill_id=1, score=9, total_questions=10, questions_data=[{"difficulty": "advanced"}]),
+        QuizAttempt(user_id=1, skill_id=2, score=4, total_questions=10, questions_data=[{"difficulty": "beginner"}]),
+        QuizAttempt(user_id=1, skill_id=2, score=7, total_questions=10, questions_data=[{"difficulty": "intermediate"}]),
+    ])
+    db.commit()
+
+
+def test_snapshot_metrics(db):
+    _seed(db)
+    analysis = build_snapshot(1, db).analysis
+    assert analysis["learning_style"] == "visual"
+    assert analysis["preferred_difficulty"] == "intermediate"
+    assert analysis["completion_rate"] == 0.5
+    assert analysis["average_session_time"] == 45.0
+    assert analysis["struggling_topics"] == ["SQL"] and analysis["strengths"] == ["Python"]
+    assert analysis["learning_pace"] == "fast"
+    engagement = analysis["engagement_patterns"]
+    assert engagement["peak_hours"][:2] == [19, 20]
+    assert (engagement["total_sessions"], engagement["days_active"], engagement["session_frequency"]) == (4, 3, "high")
+    assert "Take on advanced topics in Python" in analysis["recommended_adjustments"]
+
+
+def test_memoized_per_request_and_cached_by_watermark(engine, session_factory, db):
+    _seed(db)
+    cache = BehaviorSnapshotCache()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    first = cache.get(1, db)
+    assert len(statements) == 4  # watermark + behaviour, quiz and progress columns
+    assert cache.get(1, db) is first and len(statements) == 4  # same request: no queries
+
+    other_request = session_factory()
+    statements.clear()
+    assert cache.get(1, other_request) is first
+    assert len(statements) == 1  # watermark only
+
+    other_request.add(UserBehavior(user_id=1, action_type="view_resource", additional_data={"resource_type": "github"}))
+    other_request.commit()
+    cache.forget(1, other_request)
+    statements.clear()
+    rebuilt = cache.get(1, other_request)
+    assert rebuilt is not first and len(statements) == 4
+    assert (cache.hits, cache.misses, cache.request_hits) == (1, 2, 1)
+    other_request.close()
+
+
+def test_analyze_user_behavior_returns_a_copy(db):
+    _seed(db)
+    engine_under_test = AdaptiveLearningEngine()
+    analysis = engine_under_test.analyze_user_behavior(1, db)
+    analysis["strengths"].append("Mutated")
+    assert engine_under_test.analyze_user_behavior(1, db)["strengths"] == ["Python"]
+    assert engine_under_test.analyze_user_behavior(999, db)["learning_style"] == "balanced"
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Behaviour snapshot checks passed")
+    sys.exit(exit_code)
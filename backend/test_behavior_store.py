@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for behaviour rollups, monthly table rotation and retention.
+"""
+import sys
+import os
+import gzip
+import json
+import tempfile
+from datetime import date, datetime, timedelta
+sys.path.append(os.path.dirname(__file__))
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import sessionmaker
+
+from models.models import User, UserBehavior, UserDailyActivity, XPTransaction
+from utils.behavior_store import (
+    BehaviorMaintenance, apply_retention, get_daily_activity, list_partitions, rollup_day,
+    rollup_missing_days, rotate_hot_table
+)
+from utils.job_lock import job_lock
+
+NOW = datetime(2024, 6, 15, 12, 0)
+
+
+def _seed(db):
+    db.add_all(User(id=i, email=f"u{i}@example.com", username=f"u{i}") for i in (1, 2))
+    for day in (date(2024, 3, 10), date(2024, 4, 20), date(2024, 6, 14), date(2024, 6, 15)):
+        at = datetime.combine(day, datetime.min.time()) + timedelta(hours=9)
+        db.add_all([
+            UserBehavior(user_id=1, action_type="complete_subskill", timestamp=at,
+                         additional_data={"time_spent_minutes": 30}),
+            UserBehavior(user_id=1, action_type="complete_quiz", timestamp=at + timedelta(minutes=5)),
+            UserBehavior(user_id=2, action_type="view_resource", timestamp=at),
+        ])
+        db.add(XPTransaction(user_id=1, amount=15, transaction_type="complete_subskill", created_at=at))
+    db.commit()
+
+
+def test_rollups_and_live_today(db):
+    _seed(db)
+    assert rollup_missing_days(db, today=NOW.date()) == (date(2024, 6, 14) - date(2024, 3, 10)).days + 1
+    row = db.query(UserDailyActivity).filter(UserDailyActivity.user_id == 1,
+                                             UserDailyActivity.activity_date == date(2024, 6, 14)).one()
+    assert row.action_counts == {"complete_subskill": 1, "complete_quiz": 1}
+    assert (row.subskills_completed, row.quizzes_completed, row.minutes, row.xp) == (1, 1, 30.0, 15)
+    assert rollup_missing_days(db, today=NOW.date(), refresh_days=0) == 0  # nothing new to roll up
+
+    # An event for yesterday arriving after its rollup (e.g. a replayed WAL) is picked up by the next pass
+    db.add(UserBehavior(user_id=1, action_type="complete_quiz", timestamp=datetime(2024, 6, 14, 23, 50)))
+    db.commit()
+    assert rollup_missing_days(db, today=NOW.date(), refresh_days=2) == 2
+    row = db.query(UserDailyActivity).filter(UserDailyActivity.user_id == 1,
+                                             UserDailyActivity.activity_date == date(2024, 6, 14)).one()
+    assert row.quizzes_completed == 2
+    assert db.query(UserDailyActivity).filter(UserDailyActivity.activity_date == date(2024, 6, 14)).count() == 2
+
+    days = get_daily_activity(db, 1, since=date(2024, 6, 1), now=NOW)
+    assert set(days) == {date(2024, 6, 14), date(2024, 6, 15)}
+    assert days[date(2024, 6, 15)]["subskills_completed"] == 1 and days[date(2024, 6, 15)]["xp"] == 15
+
+
+def test_rotation_moves_old_months_and_rollups_still_see_them(db):
+    _seed(db)
+    assert rotate_hot_table(db, now=NOW, hot_days=35) == ["user_behavior_p202403", "user_behavior_p202404"]
+    assert [name for _, name in list_partitions(db)] == ["user_behavior_p202403", "user_behavior_p202404"]
+    assert db.query(UserBehavior).filter(UserBehavior.timestamp < datetime(2024, 5, 1)).count() == 0
+    assert db.query(UserBehavior).count() == 6
+    assert rotate_hot_table(db, now=NOW, hot_days=35) == []
+
+    assert rollup_day(db, date(2024, 3, 10)) == 2
+    days = get_daily_activity(db, 1, since=date(2024, 3, 1), now=datetime(2024, 3, 10, 23))
+    assert days[date(2024, 3, 10)]["quizzes_completed"] == 1
+
+
+def test_retention_archives_and_drops_old_months(session_factory, db):
+    _seed(db)
+    with tempfile.TemporaryDirectory() as archive_dir:
+        maintenance = BehaviorMaintenance(session_factory=session_factory, hot_days=35, retention_days=60,
+                                          archive_dir=archive_dir)
+        result = maintenance.run_once(now=NOW)
+        assert result["rotated"] == ["user_behavior_p202403", "user_behavior_p202404"]
+        [path] = result["archived"]
+        assert result["archived"] == {path: 3} and os.path.dirname(path) == archive_dir
+        assert os.path.basename(path).startswith("user_behavior_p202403_") and path.endswith(".jsonl.gz")
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            events = [json.loads(line) for line in f]
+        assert {event["action_type"] for event in events} == {"complete_subskill", "complete_quiz", "view_resource"}
+        assert events[0]["timestamp"].startswith("2024-03-10")
+
+        tables = inspect(db.connection()).get_table_names()
+        assert "user_behavior_p202403" not in tables and "user_behavior_p202404" in tables
+        # The rollups of archived days are kept
+        assert db.query(UserDailyActivity).filter(UserDailyActivity.activity_date == date(2024, 3, 10)).count() == 2
+        assert apply_retention(db, now=NOW, retention_days=60, archive_dir=archive_dir) == {}
+        assert maintenance.stats()["archived_events"] == 3
+
+        # A late event for the archived month is archived again into a new file
+        late = datetime(2024, 3, 20, 9, 0)
+        db.add_all([UserBehavior(user_id=2, action_type="view_resource", timestamp=late),
+                    UserBehavior(user_id=2, action_type="view_resource", timestamp=NOW)])
+        db.commit()
+        again = maintenance.run_once(now=NOW)["archived"]
+        assert list(again.values()) == [1] and path not in again
+        assert sorted(os.listdir(archive_dir)) == sorted([os.path.basename(path), os.path.basename(*again)])
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert sum(1 for _ in f) == 3
+
+
+def test_only_one_process_maintains_at_a_time(file_engine, tmp_path):
+    maintenance = BehaviorMaintenance(session_factory=sessionmaker(bind=file_engine), archive_dir=str(tmp_path))
+    # Another worker (or the cron script) is in the middle of a pass
+    with job_lock(file_engine, "behavior_maintenance") as held:
+        assert held
+        assert maintenance.run_once(now=NOW)["skipped"]
+    assert maintenance.stats()["skipped_passes"] == 1 and maintenance.stats()["passes"] == 0
+    assert not maintenance.run_once(now=NOW)["skipped"]
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Behaviour store checks passed")
+    sys.exit(exit_code)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared per-host circuit breakers.
+"""
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(__file__))
+
+import utils.circuit_breaker as circuit_breaker
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+
+
+def _breaker(**overrides):
+    settings = dict(failure_threshold=0.5, window_seconds=60, min_calls=4, base_cooldown=0.05, max_cooldown=0.2)
+    settings.update(overrides)
+    return CircuitBreaker("example.com", **settings)
+
+
+def test_opens_on_failure_rate():
+    breaker = _breaker()
+    breaker.record_success()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED  # below min_calls
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_half_open_probe_and_recovery():
+    breaker = _breaker(min_calls=1)
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow_request()          # the probe
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()      # only one probe at a time
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow_request()
+
+
+def test_cooldown_grows_exponentially():
+    breaker = _breaker(min_calls=1)
+    breaker.record_failure()
+    assert breaker._cooldown() == 0.05
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_failure()                # failed probe reopens with a longer cool-down
+    assert breaker.state == OPEN and breaker._cooldown() == 0.1
+
+    time.sleep(0.06)
+    assert not breaker.allow_request()      # still cooling down
+    time.sleep(0.05)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker._cooldown() == 0.2
+
+
+def test_old_outcomes_leave_the_window():
+    breaker = _breaker(window_seconds=0.05, min_calls=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    assert breaker.stats()["window_calls"] == 2
+
+
+def test_status_classification():
+    breaker = _breaker(min_calls=1)
+    breaker.record_status(404)
+    assert breaker.state == CLOSED
+    breaker.record_status(429)
+    assert breaker.state == OPEN
+
+
+def test_registry_is_shared_by_host():
+    registry = circuit_breaker.CircuitBreakerRegistry()
+    assert registry.for_url("https://www.bing.com/search?q=a") is registry.for_url("https://bing.com/other")
+    assert registry.reset("bing.com")
+    assert not registry.reset("unknown.example")
+
+
+def test_registry_evicts_idle_breakers_beyond_its_limit():
+    registry = circuit_breaker.CircuitBreakerRegistry(max_breakers=3)
+    tripped = registry.get("head:a.example")
+    for _ in range(5):
+        tripped.record_failure()
+    assert tripped.state == OPEN
+    registry.get("head:b.example").record_success()
+    registry.get("head:c.example")
+    registry.get("head:b.example")  # recently used: c is now the oldest idle breaker
+    registry.get("head:d.example")
+    assert set(registry.stats()) == {"head:a.example", "head:b.example", "head:d.example"}
+    assert registry.evicted == 1
+
+    # A validation sweep over many hosts never grows the registry or forgets a tripped host
+    for i in range(100):
+        registry.get(f"head:host{i}.example")
+    assert len(registry.stats()) == 3 and registry.get("head:a.example") is tripped
+
+
+def test_open_breaker_skips_robust_engine_instantly():
+    from utils.robust_resource_fetcher import RobustResourceFetcher
+
+    breaker = circuit_breaker.get_circuit_breaker("https://www.bing.com/")
+    try:
+        for _ in range(breaker.min_calls):
+            breaker.record_failure()
+        fetcher = RobustResourceFetcher()
+        started = time.monotonic()
+        try:
+            fetcher._get("https://www.bing.com/search?q=python")
+        except CircuitOpenError:
+            pass
+        else:
+            raise AssertionError("Expected CircuitOpenError")
+        assert fetcher._search_bing("python", "article", 3) == []
+        assert time.monotonic() - started < 0.1
+    finally:
+        circuit_breaker.circuit_breakers.reset("bing.com")
+
+
+def test_admin_endpoint_lists_breakers():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.routers import admin
+    from utils.auth import get_current_admin_user
+
+    app = FastAPI()
+    app.include_router(admin.router)
+    app.dependency_overrides[get_current_admin_user] = lambda: None
+    client = TestClient(app)
+
+    breaker = circuit_breaker.get_circuit_breaker("https://startpage.com/")
+    try:
+        for _ in range(breaker.min_calls):
+            breaker.record_failure()
+        body = client.get("/admin/circuit-breakers").json()
+        assert body["breakers"]["startpage.com"]["state"] == OPEN
+        assert "startpage.com" in body["open"]
+
+        assert client.post("/admin/circuit-breakers/startpage.com/reset").status_code == 200
+        assert breaker.state == CLOSED
+        assert client.post("/admin/circuit-breakers/nope.example/reset").status_code == 404
+    finally:
+        circuit_breaker.circuit_breakers.reset("startpage.com")
+
+
+if __name__ == "__main__":
+    test_opens_on_failure_rate()
+    test_half_open_probe_and_recovery()
+    test_cooldown_grows_exponentially()
+    test_old_outcomes_leave_the_window()
+    test_status_classification()
+    test_registry_is_shared_by_host()
+    test_registry_evicts_idle_breakers_beyond_its_limit()
+    test_open_breaker_skips_robust_engine_instantly()
+    test_admin_endpoint_lists_breakers()
+    print("✅ Circuit breaker checks passed")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for the sparse user × skill matrix behind collaborative filtering.
+"""
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(__file__))
+
+import numpy as np
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from models.models import User, Skill, SkillProgress
+from utils.adaptive_learning import AdaptiveLearningEngine
+from utils.user_skill_matrix import UserSkillMatrix
+import utils.user_skill_matrix as user_skill_matrix_module
+import utils.adaptive_learning as adaptive_learning
+
+
+def _seed(db, users=60, skills=25, seed=3):
+    rng = np.random.default_rng(seed)
+    db.add_all(Skill(id=i, name=f"Skill {i}") for i in range(1, skills + 1))
+    db.add_all(User(id=i, email=f"u{i}@example.com", username=f"u{i}") for i in range(1, users + 1))
+    for user_id in range(1, users + 1):
+        for skill_id in rng.choice(np.arange(1, skills + 1), size=rng.integers(1, 6), replace=False):
+            percentage = float(rng.choice([20.0, 50.0, 100.0]))
+            db.add(SkillProgress(user_id=user_id, skill_id=int(skill_id), progress_percentage=percentage,
+                                 completed=percentage == 100.0))
+    db.commit()
+
+
+def _brute_force(db, user_id, threshold, limit):
+    """The per-user dense-vector scan the matrix replaces."""
+    vectors = {}
+    for sp in db.query(SkillProgress).all():
+        vectors.setdefault(sp.user_id, {})[sp.skill_id] = sp.progress_percentage / 100.0
+    target = vectors[user_id]
+    results = []
+    for other, vector in vectors.items():
+        if other == user_id:
+            continue
+        dot = sum(value * vector.get(skill, 0.0) for skill, value in target.items())
+        similarity = dot / (np.linalg.norm(list(target.values())) * np.linalg.norm(list(vector.values())))
+        if similarity > threshold:
+            results.append((other, similarity))
+    results.sort(key=lambda pair: pair[1], reverse=True)
+    return results[:limit]
+
+
+def test_similar_users_match_brute_force_cosine(db):
+    _seed(db)
+    original = adaptive_learning.user_skill_matrix
+    adaptive_learning.user_skill_matrix = UserSkillMatrix(snapshot_path=None)
+    try:
+        engine_under_test = AdaptiveLearningEngine()
+        for user_id in (1, 7, 42):
+            expected = _brute_force(db, user_id, engine_under_test.similarity_threshold, 10)
+            actual = engine_under_test._find_similar_users(user_id, db, limit=10)
+            # Same scores in the same order (users tied on a score may swap places)
+            assert np.allclose([s for _, s in actual], [s for _, s in expected], atol=1e-5)
+            everyone = dict(_brute_force(db, user_id, -1.0, 1000))
+            assert all(abs(everyone[u] - s) < 1e-5 for u, s in actual)
+            assert user_id not in [u for u, _ in actual]
+    finally:
+        adaptive_learning.user_skill_matrix = original
+
+
+def test_query_count_does_not_grow_with_users(engine, db):
+    _seed(db, users=200)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    original = adaptive_learning.user_skill_matrix
+    adaptive_learning.user_skill_matrix = matrix = UserSkillMatrix(snapshot_path=None)
+    try:
+        AdaptiveLearningEngine()._find_similar_users(5, db)
+        assert len(statements) == 2  # target progress + one bulk build
+        statements.clear()
+        AdaptiveLearningEngine()._find_similar_users(6, db)
+        assert len(statements) == 1  # matrix reused until it is stale
+        assert matrix.stats()["users"] == 200 and matrix.builds == 1
+    finally:
+        adaptive_learning.user_skill_matrix = original
+
+
+def test_top_k_and_unknown_skills(db):
+    _seed(db, users=30)
+    matrix = UserSkillMatrix(snapshot_path=None)
+    matrix.build(db)
+    assert len(matrix.similar_users(1, {1: 1.0, 2: 0.5}, k=3)) <= 3
+    # A brand-new skill nobody else has contributes to the norm only
+    assert matrix.similar_users(1, {999: 1.0}) == []
+
+
+def _assert_same_neighbours(matrix, db, user_ids=(1, 2, 3, 10)):
+    fresh = UserSkillMatrix(snapshot_path=None)
+    fresh.build(db)
+    for user_id in user_ids:
+        progress = {sp.skill_id: sp.progress_percentage / 100.0
+                    for sp in db.query(SkillProgress).filter(SkillProgress.user_id == user_id)}
+        expected = fresh.similar_users(user_id, progress, k=5, threshold=0.3)
+        actual = matrix.similar_users(user_id, progress, k=5, threshold=0.3)
+        assert np.allclose([s for _, s in actual], [s for _, s in expected], atol=1e-5)
+
+
+def test_committed_progress_changes_update_single_rows(db):
+    _seed(db, users=40)
+    original = user_skill_matrix_module.user_skill_matrix
+    user_skill_matrix_module.user_skill_matrix = matrix = UserSkillMatrix(snapshot_path=None, compact_threshold=3)
+    user_skill_matrix_module.register_user_skill_matrix_hooks()
+    try:
+        matrix.build(db)
+        progress = db.query(SkillProgress).filter(SkillProgress.user_id == 2).first()
+        progress.progress_percentage = 5.0
+        db.add(SkillProgress(user_id=41, skill_id=1, progress_percentage=100.0))  # brand-new user
+        db.commit()
+        assert matrix.row_updates == 2 and set(matrix.overrides) == {2, 41}
+        assert matrix.row(2)[progress.skill_id] == 0.05
+        _assert_same_neighbours(matrix, db, user_ids=(1, 2, 3, 41))
+
+        # Rolled back changes never reach the model
+        progress.progress_percentage = 99.0
+        db.flush()
+        db.rollback()
+        assert matrix.row_updates == 2
+
+        # Deletes drop the cell; the third changed row triggers a compaction
+        db.delete(db.query(SkillProgress).filter(SkillProgress.user_id == 3).first())
+        db.commit()
+        assert matrix.compactions == 1 and matrix.overrides == {}
+        assert matrix.builds == 1
+        _assert_same_neighbours(matrix, db, user_ids=(1, 2, 3, 41))
+    finally:
+        event.remove(Session, "after_flush", user_skill_matrix_module._collect_changes)
+        event.remove(Session, "after_commit", user_skill_matrix_module._apply_committed_changes)
+        event.remove(Session, "after_soft_rollback", user_skill_matrix_module._discard_changes)
+        user_skill_matrix_module.user_skill_matrix = original
+
+
+def test_snapshot_restore_then_catch_up_on_other_writers(engine, db):
+    _seed(db, users=40)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "cf_matrix.npz")
+        matrix = UserSkillMatrix(snapshot_path=path)
+        matrix.build(db)
+        matrix.save()
+
+        # Another worker writes while this one is down (no hooks involved)
+        db.add(SkillProgress(user_id=5, skill_id=24, progress_percentage=80.0))
+        db.commit()
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        restarted = UserSkillMatrix(snapshot_path=path)
+        restarted.ensure_fresh(db)
+        assert (restarted.restores, restarted.builds) == (1, 0)
+        assert len(statements) == 1  # catch-up only, no full scan
+        assert restarted.row(5)[24] == 0.8
+        _assert_same_neighbours(restarted, db, user_ids=(1, 5, 9))
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Collaborative filtering checks passed")
+    sys.exit(exit_code)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the one-query dashboard aggregates and their per-user cache.
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(__file__))
+
+import pytest
+from sqlalchemy import event
+
+from models.models import User, SkillProgress, SubskillProgress, QuizAttempt, XPTransaction, UserBehavior
+from utils.behavior_buffer import make_event, write_events
+from utils.dashboard_stats import (
+    DashboardStatsCache, dashboard_stats_cache, read_dashboard_aggregates, read_dashboard_watermark,
+    register_dashboard_stats_hooks, _invalidate_written_users
+)
+
+NOW = datetime(2024, 6, 15, 12, 0)
+
+
+def _seed(db):
+    db.add_all(User(id=i, email=f"u{i}@example.com", username=f"u{i}") for i in (1, 2))
+    db.add_all([
+        SkillProgress(user_id=1, skill_id=1, progress_percentage=100.0, completed=True),
+        SkillProgress(user_id=1, skill_id=2, progress_percentage=40.0, completed=False),
+        SkillProgress(user_id=1, skill_id=3, progress_percentage=0.0, completed=False),
+        SkillProgress(user_id=2, skill_id=1, progress_percentage=100.0, completed=True),
+        SubskillProgress(user_id=1, skill_id=1, subskill_name="Loops", time_spent_minutes=30),
+        SubskillProgress(user_id=1, skill_id=2, subskill_name="Types", time_spent_minutes=15),
+        QuizAttempt(user_id=1, skill_id=1, score=4, total_questions=5),
+        QuizAttempt(user_id=1, skill_id=2, score=3, total_questions=5),
+        QuizAttempt(user_id=1, skill_id=2, score=0, total_questions=0),  # ignored, not a division by zero
+        XPTransaction(user_id=1, amount=20, transaction_type="quiz", created_at=NOW - timedelta(days=2)),
+        XPTransaction(user_id=1, amount=50, transaction_type="quiz", created_at=NOW - timedelta(days=9)),
+        UserBehavior(user_id=1, action_type="complete_subskill", timestamp=NOW - timedelta(days=1)),
+    ])
+    db.commit()
+
+
+def test_aggregates_come_from_one_query(engine, db):
+    _seed(db)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    aggregates = read_dashboard_aggregates(db, 1, now=NOW)
+    assert len(statements) == 1
+    assert aggregates == {
+        "skills_completed": 1,
+        "skills_in_progress": 1,
+        "total_study_time_minutes": 45,
+        "quiz_average_score": 70.0,
+        "weekly_xp": 20,
+        "subskills_completed_today": 0,
+    }
+
+    db.add(UserBehavior(user_id=1, action_type="complete_subskill", timestamp=NOW - timedelta(hours=1)))
+    db.commit()
+    assert read_dashboard_aggregates(db, 1, now=NOW)["subskills_completed_today"] == 1
+    empty = read_dashboard_aggregates(db, 3, now=NOW)
+    assert set(empty.values()) == {0}
+
+
+def test_cache_is_per_user_and_per_day(db):
+    _seed(db)
+    cache = DashboardStatsCache(ttl=300)
+    assert cache.get(db, 1, now=NOW)["skills_completed"] == 1
+    cache.get(db, 1, now=NOW)["skills_completed"] = 99  # callers get copies
+    assert cache.get(db, 1, now=NOW)["skills_completed"] == 1
+    assert cache.get(db, 2, now=NOW)["skills_completed"] == 1
+    assert (cache.hits, cache.misses) == (2, 2)
+    cache.get(db, 1, now=NOW + timedelta(days=1))
+    assert cache.misses == 3
+
+
+def test_progress_quiz_and_xp_writes_invalidate(db):
+    _seed(db)
+    register_dashboard_stats_hooks()
+    dashboard_stats_cache.clear()
+    assert dashboard_stats_cache.get(db, 1, now=NOW)["skills_in_progress"] == 1
+
+    progress = db.query(SkillProgress).filter(SkillProgress.user_id == 1, SkillProgress.skill_id == 3).one()
+    progress.progress_percentage = 10.0
+    db.commit()
+    assert dashboard_stats_cache.get(db, 1, now=NOW)["skills_in_progress"] == 2
+
+    dashboard_stats_cache.get(db, 2, now=NOW)
+    db.add(XPTransaction(user_id=1, amount=5, transaction_type="quiz", created_at=NOW))
+    db.add(QuizAttempt(user_id=1, skill_id=1, score=5, total_questions=5))
+    db.commit()
+    aggregates = dashboard_stats_cache.get(db, 1, now=NOW)
+    assert aggregates["weekly_xp"] == 25 and aggregates["quiz_average_score"] == 80.0
+    assert 2 in dashboard_stats_cache._entries  # other users keep their entries
+
+    # Rolled-back writes keep the entry
+    invalidations = dashboard_stats_cache.invalidations
+    db.add(XPTransaction(user_id=1, amount=5, transaction_type="quiz", created_at=NOW))
+    db.flush()
+    db.rollback()
+    assert dashboard_stats_cache.invalidations == invalidations
+
+    # Flushes of the behaviour buffer bypass the session
+    _invalidate_written_users({1})
+    assert 1 not in dashboard_stats_cache._entries
+    dashboard_stats_cache.clear()
+
+
+def test_writes_from_another_process_are_seen_through_the_watermark(engine, db):
+    _seed(db)
+    register_dashboard_stats_hooks()
+    # A private cache stands in for another worker: the session hooks only reach the global one
+    cache = DashboardStatsCache(ttl=300)
+    assert cache.get(db, 1, now=NOW)["total_study_time_minutes"] == 45
+    assert cache.get(db, 1, now=NOW)["total_study_time_minutes"] == 45 and cache.hits == 1
+
+    subskill = db.query(SubskillProgress).filter(SubskillProgress.subskill_name == "Loops").one()
+    subskill.time_spent_minutes += 10
+    db.commit()
+    assert cache.get(db, 1, now=NOW)["total_study_time_minutes"] == 55
+
+    progress = db.query(SkillProgress).filter(SkillProgress.user_id == 1, SkillProgress.skill_id == 2).one()
+    progress.completed = True
+    db.commit()
+    assert cache.get(db, 1, now=NOW)["skills_completed"] == 2
+
+    db.add(XPTransaction(user_id=1, amount=5, transaction_type="quiz", created_at=NOW))
+    db.commit()
+    assert cache.get(db, 1, now=NOW)["weekly_xp"] == 25
+
+    # Buffered behaviour events are bulk-inserted, and bump the version in the same transaction
+    write_events(db, [make_event(1, "complete_subskill", timestamp=NOW)])
+    db.commit()
+    assert cache.get(db, 1, now=NOW)["subskills_completed_today"] == 1
+    assert cache.hits == 1 and cache.invalidations == 0
+
+    # Rolled-back writes leave the version alone
+    version = read_dashboard_watermark(db, 1)
+    db.add(XPTransaction(user_id=1, amount=5, transaction_type="quiz", created_at=NOW))
+    db.flush()
+    db.rollback()
+    assert read_dashboard_watermark(db, 1) == version
+
+    # A hit costs one primary-key lookup
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    cache.get(db, 1, now=NOW)
+    assert cache.hits == 2 and len(statements) == 1 and "FROM users" in statements[0]
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Dashboard stats checks passed")
+    sys.exit(exit_code)
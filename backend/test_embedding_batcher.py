@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the embedding micro-batcher.
+"""
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from ml.embeddings import EmbeddingModelProvider
+from ml.embedding_batcher import EmbeddingBatcher
+import ml.skill_decomposition as skill_decomposition
+
+DIM = 8
+
+
+class RecordingModel:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.threads = set()
+        self.fail = fail
+
+    def encode(self, texts, **kwargs):
+        self.threads.add(threading.current_thread().name)
+        if self.fail:
+            raise ValueError("encoder crashed")
+        self.batches.append(list(texts))
+        return np.stack([np.full(DIM, len(text), dtype=np.float32) for text in texts])
+
+
+def _batcher(model, **kwargs):
+    return EmbeddingBatcher(EmbeddingModelProvider("recording", loader=lambda name: model), **kwargs)
+
+
+def test_concurrent_requests_share_one_encode_call():
+    model = RecordingModel()
+    batcher = _batcher(model, max_batch_size=32, max_wait_ms=50)
+    texts = [f"skill {'x' * i}" for i in range(10)]
+
+    async def run():
+        return await batcher.embed_many(texts)
+
+    try:
+        vectors = asyncio.run(run())
+    finally:
+        batcher.close()
+    assert model.batches == [texts]
+    assert all(vector[0] == len(text) for vector, text in zip(vectors, texts))
+    assert model.threads == {"embedding-batcher_0"}  # never on the event loop thread
+
+    stats = batcher.stats()
+    assert (stats["requests"], stats["batches"], stats["largest_batch"]) == (10, 1, 10)
+    assert stats["max_queue_depth"] == 10 and stats["queue_depth"] == 0
+
+
+def test_batches_are_capped_at_max_batch_size():
+    model = RecordingModel()
+    batcher = _batcher(model, max_batch_size=4, max_wait_ms=50)
+
+    async def run():
+        return await batcher.embed_many([f"text {i}" for i in range(10)])
+
+    try:
+        assert len(asyncio.run(run())) == 10
+    finally:
+        batcher.close()
+    assert [len(batch) for batch in model.batches] == [4, 4, 2]
+    assert batcher.stats()["avg_batch_size"] == round(10 / 3, 2)
+
+
+def test_encoder_errors_reach_every_caller():
+    batcher = _batcher(RecordingModel(fail=True), max_wait_ms=20)
+
+    async def run():
+        return await asyncio.gather(batcher.embed("a"), batcher.embed("b"), return_exceptions=True)
+
+    try:
+        errors = asyncio.run(run())
+    finally:
+        batcher.close()
+    assert all(isinstance(error, ValueError) for error in errors)
+    assert batcher.stats()["failed_batches"] == 1
+
+
+def test_decompose_skill_async_embeds_through_the_batcher():
+    model = RecordingModel()
+    batcher = _batcher(model, max_wait_ms=50)
+    original = (skill_decomposition.embedding_provider, skill_decomposition.ML_AVAILABLE,
+                skill_decomposition.embedding_batcher)
+    skill_decomposition.embedding_provider = batcher.provider
+    skill_decomposition.ML_AVAILABLE = True
+    skill_decomposition.embedding_batcher = batcher
+
+    async def run():
+        return await asyncio.gather(skill_decomposition.decompose_skill_async("Quantum Basket Weaving"),
+                                    skill_decomposition.decompose_skill_async("Underwater Origami"),
+                                    skill_decomposition.decompose_skill_async("Data Science"))
+
+    matrix = skill_decomposition.get_hierarchy_matrix()
+    match_threads = []
+    best_match = matrix.best_match
+
+    def recording_best_match(embedding):
+        match_threads.append(threading.get_ident())
+        return best_match(embedding)
+
+    matrix.best_match = recording_best_match
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            matrix.cache_dir = cache_dir
+            trees = asyncio.run(run())
+    finally:
+        del matrix.best_match
+        batcher.close()
+        (skill_decomposition.embedding_provider, skill_decomposition.ML_AVAILABLE,
+         skill_decomposition.embedding_batcher) = original
+    assert [tree["name"] for tree in trees] == ["Quantum Basket Weaving", "Underwater Origami", "Data Science"]
+    # Both unknown names went out in one batch; known hierarchy entries need no embedding
+    assert ["Quantum Basket Weaving", "Underwater Origami"] in model.batches
+    assert batcher.stats()["requests"] == 2
+    # Matching (which may encode the hierarchy) ran in worker threads, not on the event loop
+    assert len(match_threads) == 2 and threading.get_ident() not in match_threads
+
+
+if __name__ == "__main__":
+    test_concurrent_requests_share_one_encode_call()
+    test_batches_are_capped_at_max_batch_size()
+    test_encoder_errors_reach_every_caller()
+    test_decompose_skill_async_embeds_through_the_batcher()
+    print("✅ Embedding batcher checks passed")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Tests for the two-level query embedding cache.
+"""
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+import ml.embedding_cache as embedding_cache
+from ml.embedding_cache import EmbeddingCache
+from ml.embeddings import EmbeddingModelProvider
+
+DIM = 8
+UNCASED = "all-MiniLM-L6-v2"
+
+
+class CountingModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        return np.stack([np.full(DIM, len(text), dtype=np.float32) for text in texts])
+
+
+def test_memory_lru_respects_byte_budget():
+    cache = EmbeddingCache(path=None, memory_bytes=2 * DIM * 4)
+    cache.put_many("m", {"a": np.ones(DIM), "b": np.ones(DIM)})
+    cache.get_many("m", ["a"])  # "a" is now the most recently used
+    cache.put_many("m", {"c": np.ones(DIM)})
+    assert set(cache.get_many("m", ["a", "b", "c"])) == {"a", "c"}
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["memory_bytes"] <= stats["memory_budget_bytes"]
+
+
+def test_disk_store_is_shared_and_keyed_by_model():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "query_embeddings.sqlite3")
+        writer = EmbeddingCache(path=path)
+        writer.put_many(UNCASED, {"Python": np.arange(DIM, dtype=np.float32)})
+
+        reader = EmbeddingCache(path=path)  # e.g. another worker process
+        found = reader.get_many(UNCASED, ["  python ", "react"])
+        assert list(found) == ["  python "] and np.array_equal(found["  python "], np.arange(DIM))
+        assert reader.get_many("other-model", ["python"]) == {}
+        stats = reader.stats()
+        assert (stats["disk_hits"], stats["misses"], stats["disk_entries"]) == (1, 2, 1)
+
+        # Served from memory afterwards
+        reader.get_many(UNCASED, ["python"])
+        assert reader.stats()["memory_hits"] == 1
+
+
+def test_case_is_folded_only_for_uncased_models():
+    cache = EmbeddingCache(path=None)
+    for model in (UNCASED, f"sentence-transformers/{UNCASED}@onnx", "bert-base-cased"):
+        cache.put_many(model, {"Go": np.ones(DIM)})
+    assert set(cache.get_many(UNCASED, ["go"])) == {"go"}
+    assert set(cache.get_many(f"sentence-transformers/{UNCASED}@onnx", ["GO"])) == {"GO"}
+    assert cache.get_many("bert-base-cased", ["go"]) == {}
+    assert set(cache.get_many("bert-base-cased", [" Go  "])) == {" Go  "}
+
+
+def test_disk_hits_rarely_rewrite_last_used():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "cache.sqlite3")
+        EmbeddingCache(path=path).put_many("m", {"python": np.ones(DIM)})
+        for _ in range(3):
+            EmbeddingCache(path=path).get_many("m", ["python"])  # fresh processes read from disk
+        reader = EmbeddingCache(path=path)
+        reader.get_many("m", ["python"])
+        assert reader.stats()["disk_hits"] == 1 and reader.stats()["last_used_updates"] == 0
+
+        # Rows not used for a while are touched again, so pruning stays least recently used
+        connection = reader._connect()
+        connection.execute("UPDATE query_embeddings SET last_used = ?",
+                           (time.time() - embedding_cache.LAST_USED_RESOLUTION - 1,))
+        late = EmbeddingCache(path=path)
+        late.get_many("m", ["python"])
+        assert late.stats()["last_used_updates"] == 1
+        assert connection.execute("SELECT last_used FROM query_embeddings").fetchone()[0] > time.time() - 60
+
+
+def test_disk_store_is_pruned_to_budget():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = EmbeddingCache(path=os.path.join(tmp_dir, "cache.sqlite3"), disk_bytes=3 * DIM * 4)
+        for i in range(5):
+            cache.put_many("m", {f"skill {i}": np.ones(DIM)})
+        assert cache.prune_disk() == 2
+        stats = cache.stats()
+        assert stats["disk_entries"] == 3 and stats["disk_bytes"] <= stats["disk_budget_bytes"]
+        assert "skill 0" not in EmbeddingCache(path=cache.path).get_many("m", ["skill 0"])
+
+
+def test_provider_only_encodes_cache_misses():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model = CountingModel()
+        provider = EmbeddingModelProvider(UNCASED, loader=lambda name: model,
+                                          cache=EmbeddingCache(path=os.path.join(tmp_dir, "cache.sqlite3")))
+        first = provider.embed(["python", "react", "python"])
+        assert first.shape == (3, DIM) and model.encoded == ["python", "react"]
+
+        single = provider.embed("Python")
+        assert single.shape == (DIM,) and np.array_equal(single, first[0])
+        assert model.encoded == ["python", "react"]
+        assert provider.status()["query_cache"]["memory_hits"] == 1
+
+
+if __name__ == "__main__":
+    test_memory_lru_respects_byte_budget()
+    test_disk_store_is_shared_and_keyed_by_model()
+    test_case_is_folded_only_for_uncased_models()
+    test_disk_hits_rarely_rewrite_last_used()
+    test_disk_store_is_pruned_to_budget()
+    test_provider_only_encodes_cache_misses()
+    print("✅ Embedding cache checks passed")
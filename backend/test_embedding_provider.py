@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the lazily loaded embedding model provider used by skill decomposition.
+"""
+import sys
+import os
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+import ml.embeddings as embeddings
+from ml.embeddings import EmbeddingModelProvider, EmbeddingMatrix, NOT_LOADED, READY, UNAVAILABLE
+import ml.skill_decomposition as skill_decomposition
+
+
+class FakeModel:
+    """Maps text onto the axis of the first hierarchy root it mentions."""
+
+    def __init__(self):
+        self.roots = list(skill_decomposition.SKILL_HIERARCHY)
+        self.batch_calls = 0
+
+    def _vector(self, text):
+        vector = np.full(len(self.roots) + 1, 0.01, dtype=np.float32)
+        matches = [i for i, root in enumerate(self.roots) if root.lower() in text.lower()]
+        vector[matches[0] if matches else -1] = 1.0
+        return vector
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return self._vector(texts)
+        self.batch_calls += 1
+        return np.stack([self._vector(text) for text in texts])
+
+
+def _slow_loader(calls, delay=0.05):
+    def load(model_name):
+        calls.append(model_name)
+        time.sleep(delay)
+        return FakeModel()
+    return load
+
+
+def test_model_loads_once_on_first_use():
+    calls = []
+    provider = EmbeddingModelProvider("fake-model", loader=_slow_loader(calls))
+    assert provider.state == NOT_LOADED and calls == []
+
+    threads = [threading.Thread(target=provider.get_model) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["fake-model"]
+    assert provider.state == READY and provider.status()["load_seconds"] is not None
+
+
+def test_background_warm_up_does_not_block():
+    calls = []
+    provider = EmbeddingModelProvider("fake-model", loader=_slow_loader(calls, delay=0.2))
+    started = time.monotonic()
+    assert provider.warm_up(background=True) is False
+    assert time.monotonic() - started < 0.1
+
+    deadline = time.monotonic() + 2
+    while not provider.ready and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert provider.ready and calls == ["fake-model"]
+
+
+def test_failed_load_marks_provider_unavailable():
+    def broken(model_name):
+        raise OSError("weights not found")
+
+    provider = EmbeddingModelProvider("fake-model", loader=broken)
+    assert provider.get_model() is None
+    assert provider.state == UNAVAILABLE and "weights not found" in provider.status()["error"]
+    try:
+        provider.encode("python")
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("Expected RuntimeError")
+
+
+def test_matrix_is_persisted_per_model_and_names():
+    model = FakeModel()
+    provider = EmbeddingModelProvider("fake/model", loader=lambda name: model)
+    names = ["Data Science", "DevOps"]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        matrix = EmbeddingMatrix(names, provider=provider, cache_dir=cache_dir).matrix()
+        assert matrix.dtype == np.float32 and np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+        assert model.batch_calls == 1
+
+        # A fresh instance (e.g. another worker) loads the saved matrix instead of re-encoding
+        reloaded = EmbeddingMatrix(names, provider=provider, cache_dir=cache_dir)
+        assert np.array_equal(reloaded.matrix(), matrix) and model.batch_calls == 1
+        assert reloaded.best_match(model.encode("devops pipelines"))[0] == "DevOps"
+
+        # Different names get a different file and the old one is dropped
+        changed = EmbeddingMatrix(names + ["Cloud Computing"], provider=provider, cache_dir=cache_dir)
+        assert changed.path != reloaded.path
+        changed.matrix()
+        assert model.batch_calls == 2
+        assert os.listdir(cache_dir) == [os.path.basename(changed.path)]
+
+
+def test_decompose_skill_uses_the_shared_provider():
+    model = FakeModel()
+    original = (skill_decomposition.embedding_provider, skill_decomposition.ML_AVAILABLE, embeddings.EMBEDDING_CACHE_DIR)
+    skill_decomposition.embedding_provider = EmbeddingModelProvider("fake-model", loader=lambda name: model)
+    skill_decomposition.ML_AVAILABLE = True
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            embeddings.EMBEDDING_CACHE_DIR = cache_dir
+            tree = skill_decomposition.decompose_skill("Intro to Machine Learning")
+            assert tree["description"] == "Similar to Machine Learning"
+            assert [child["name"] for child in tree["children"]] == skill_decomposition.SKILL_HIERARCHY["Machine Learning"]
+
+            tree = skill_decomposition.decompose_skill("Pottery")
+            assert tree["children"][0]["name"] == "Learning Pottery basics"
+            assert model.batch_calls == 1  # the hierarchy is encoded once, not per request
+    finally:
+        (skill_decomposition.embedding_provider, skill_decomposition.ML_AVAILABLE,
+         embeddings.EMBEDDING_CACHE_DIR) = original
+
+
+if __name__ == "__main__":
+    test_model_loads_once_on_first_use()
+    test_background_warm_up_does_not_block()
+    test_failed_load_marks_provider_unavailable()
+    test_matrix_is_persisted_per_model_and_names()
+    test_decompose_skill_uses_the_shared_provider()
+    print("✅ Embedding provider checks passed")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Parity test: the compiled skill-alias index must resolve every query exactly
+like the original if/elif chain in get_fast_fallback_resources.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+from utils.fast_fallback import (
+    FAST_FALLBACK_RESOURCES,
+    FAST_FALLBACK_ALIAS_RULES,
+    generate_universal_resources,
+    get_fast_fallback_resources,
+)
+from utils.skill_alias_index import AhoCorasickMatcher
+
+
+def legacy_fast_fallback_resources(skill_name):
+    """Reference copy of the original linear-scan + elif-chain lookup"""
+    normalized_skill = skill_name.strip()
+    
+    # Direct match first
+    if normalized_skill in FAST_FALLBACK_RESOURCES:
+        return FAST_FALLBACK_RESOURCES[normalized_skill]
+    
+    # Try case-insensitive matching
+    for key in FAST_FALLBACK_RESOURCES:
+        if key.lower() == normalized_skill.lower():
+            return FAST_FALLBACK_RESOURCES[key]
+    
+    # Try partial matching for common variations
+    normalized_lower = normalized_skill.lower()
+    
+    # Data Science subskills
+    if 'data science fundamentals' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Data Science Fundamentals', [])
+    elif 'intermediate data science' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Intermediate Data Science', [])
+    elif 'practical data science' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Practical Data Science', [])
+    elif 'advanced data science' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Advanced Data Science', [])
+    elif 'data science best practices' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Data Science Best Practices', [])
+    elif 'data science' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Data Science', [])
+    
+    # Python subskills
+    elif 'python basics' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Python Basics', [])
+    elif 'control structures' in normalized_lower or 'loops' in normalized_lower or 'if else' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Control Structures', [])
+    elif 'functions' in normalized_lower and 'python' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Functions', [])
+    elif 'object-oriented' in normalized_lower or 'oop' in normalized_lower or 'classes' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Object-Oriented Programming', [])
+    elif 'python' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Python', [])
+    
+    # JavaScript subskills
+    elif 'javascript fundamentals' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('JavaScript Fundamentals', [])
+    elif 'dom manipulation' in normalized_lower or 'dom' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('DOM Manipulation', [])
+    elif 'asynchronous javascript' in normalized_lower or 'async' in normalized_lower or 'promises' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Asynchronous JavaScript', [])
+    elif 'javascript' in normalized_lower or 'js' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('JavaScript', [])
+    elif 'react' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('React', [])
+    elif 'html' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('HTML', [])
+    elif 'css' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('CSS', [])
+    elif 'machine learning' in normalized_lower or 'ml' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Machine Learning', [])
+    elif 'data structure and algorithm' in normalized_lower or 'data structures and algorithms' in normalized_lower or normalized_lower == 'dsa':
+        return FAST_FALLBACK_RESOURCES.get('Data Structures', [])
+    elif 'data structure' in normalized_lower and len(normalized_lower.split()) <= 3:  # Only for main data structure searches
+        return FAST_FALLBACK_RESOURCES.get('Data Structures', [])
+    elif 'node' in normalized_lower or 'nodejs' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Node.js', [])
+    elif 'git' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('Git', [])
+    elif 'sql' in normalized_lower or 'database' in normalized_lower:
+        return FAST_FALLBACK_RESOURCES.get('SQL', [])
+    elif 'algorithm' in normalized_lower and len(normalized_lower.split()) <= 2:  # Only for main algorithm searches
+        return FAST_FALLBACK_RESOURCES.get('Algorithms', [])
+    elif 'web development' in normalized_lower:
+        # Return a mix of HTML, CSS, JavaScript for web development
+        html_resources = FAST_FALLBACK_RESOURCES.get('HTML', [])[:2]
+        css_resources = FAST_FALLBACK_RESOURCES.get('CSS', [])[:2]
+        js_resources = FAST_FALLBACK_RESOURCES.get('JavaScript', [])[:2]
+        return html_resources + css_resources + js_resources
+    
+    # If no specific match found, generate universal resources
+    return generate_universal_resources(skill_name)
+
+
+def build_query_corpus():
+    """Skill keys, every alias pattern and a set of tricky real-world queries."""
+    queries = []
+    for key in FAST_FALLBACK_RESOURCES:
+        queries.extend([key, key.lower(), key.upper(), f"  {key}  ", f"{key} tutorial", f"learn {key}"])
+    for rule in FAST_FALLBACK_ALIAS_RULES:
+        for pattern in rule.any_of + rule.all_of + rule.equals:
+            queries.extend([pattern, pattern.title(), f"intro to {pattern}", f"{pattern} for absolute beginners today"])
+    queries.extend([
+        "", "   ", "dsa", "DSA", "dsa practice", "python functions", "Functions", "functions in python",
+        "Python Basics", "python", "web development", "Web Development Bootcamp", "json", "xml",
+        "random forest", "digital art", "freedom writing", "html and css", "algorithm", "algorithm design",
+        "greedy algorithm design patterns", "data structure", "data structures basics",
+        "data structure interview prep guide", "Data Structures and Algorithms", "node", "Node.js",
+        "nodejs", "sql", "PostgreSQL", "database design", "oop in java", "React Native", "react hooks",
+        "async rust", "promises", "if else", "loops", "Guitar", "Cooking", "Photography", "Yoga",
+        "Digital Marketing", "digital marketing strategy", "Public Speaking", "UI/UX Design", "ui/ux",
+        "Machine Learning", "ml ops", "c++", "C#", "go", "Go", "Rust", "swift ui", "kotlin coroutines",
+    ])
+    return queries
+
+
+def test_alias_index_parity():
+    """The index must return the same resources as the legacy chain for every query."""
+    mismatches = []
+    for query in build_query_corpus():
+        expected = legacy_fast_fallback_resources(query)
+        actual = get_fast_fallback_resources(query)
+        if expected != actual:
+            mismatches.append(query)
+    assert not mismatches, f"Alias index diverges from legacy chain for: {mismatches}"
+
+
+def test_specific_alias_beats_general():
+    """Explicit priorities keep 'python basics' ahead of 'python'."""
+    from utils.fast_fallback import get_alias_index
+    index = get_alias_index()
+    assert index.lookup("advanced python basics") == "Python Basics"
+    assert index.lookup("python") == "Python"
+    assert index.lookup("Docker") == "Docker"
+
+
+def test_aho_corasick_overlapping_patterns():
+    """Overlapping and nested patterns are all reported in a single pass."""
+    matcher = AhoCorasickMatcher(["he", "she", "his", "hers"])
+    assert matcher.find_all("ushers") == {0, 1, 3}
+    assert matcher.find_all("") == set()
+
+
+if __name__ == "__main__":
+    test_alias_index_parity()
+    test_specific_alias_beats_general()
+    test_aho_corasick_overlapping_patterns()
+    print("✅ Alias index matches the legacy fallback chain")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Offline tests for hedged search in RobustResourceFetcher.search_with_fallback.
+"""
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(__file__))
+
+import utils.robust_resource_fetcher as robust_resource_fetcher
+from utils.rate_limiter import HostRateLimiter, RateLimitExceeded
+from utils.robust_resource_fetcher import EngineStats, RobustResourceFetcher
+
+
+def _engine(prefix, delay, count=3):
+    def search(query, resource_type, max_results):
+        time.sleep(delay)
+        return [
+            {"title": f"{prefix} {i}", "url": f"https://{prefix}.example.com/{i}",
+             "description": "", "resource_type": resource_type, "quality_score": 75}
+            for i in range(min(count, max_results))
+        ]
+    return search
+
+
+def _fetcher(**engines):
+    fetcher = RobustResourceFetcher()
+    fetcher.engines = engines
+    fetcher.engine_stats = {name: EngineStats() for name in engines}
+    fetcher.search_deadline = 1.0
+    fetcher.hedge_delay = 0.05
+    return fetcher
+
+
+def test_backup_floor_when_engines_are_slow():
+    fetcher = _fetcher(slow=_engine("slow", 3.0))
+    started = time.monotonic()
+    resources = fetcher.search_with_fallback("Arrays", "video", max_results=3, hedged=True)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5, elapsed  # one hedge delay, not the 1s deadline
+    assert resources and all("slow.example.com" not in r["url"] for r in resources)
+    assert resources == fetcher._get_backup_resources("Arrays", "video", 3)
+
+
+def test_floor_is_returned_once_every_engine_had_its_hedge_delay():
+    fetcher = _fetcher(a=_engine("a", 2.0), b=_engine("b", 2.0), c=_engine("c", 2.0))
+    floor = fetcher._get_backup_resources("Arrays", "video", 3)  # also loads the backup data
+    started = time.monotonic()
+    resources = fetcher.search_with_fallback("Arrays", "video", max_results=3, hedged=True)
+    elapsed = time.monotonic() - started
+
+    # Three staggered launches plus one hedge delay, far below the 1s deadline
+    assert elapsed < 4 * fetcher.hedge_delay + 0.1, elapsed
+    assert resources == floor
+
+
+def test_fast_engine_beats_slow_one():
+    fetcher = _fetcher(slow=_engine("slow", 2.0), fast=_engine("fast", 0.05))
+    started = time.monotonic()
+    resources = fetcher.search_with_fallback("Quantum Basket Weaving", "article", max_results=3, hedged=True)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.8, elapsed
+    assert [r["url"] for r in resources] == [f"https://fast.example.com/{i}" for i in range(3)]
+    assert fetcher.engine_stats["fast"].wins == 1
+
+
+def test_results_merge_up_to_max_results():
+    fetcher = _fetcher(first=_engine("first", 0.0, count=2), second=_engine("second", 0.1, count=2))
+    resources = fetcher.search_with_fallback("Quantum Basket Weaving", "article", max_results=3, hedged=True)
+    hosts = [r["url"].split("/")[2] for r in resources]
+    assert hosts == ["first.example.com", "first.example.com", "second.example.com"]
+
+
+def test_hedging_order_adapts():
+    def failing(query, resource_type, max_results):
+        time.sleep(0.02)
+        return []
+
+    fetcher = _fetcher(broken=failing, steady=_engine("steady", 0.05))
+    assert fetcher.hedging_order() == ["broken", "steady"]
+    for _ in range(3):
+        fetcher.search_with_fallback("Quantum Basket Weaving", "article", max_results=2, hedged=True)
+    assert fetcher.hedging_order() == ["steady", "broken"]
+    assert fetcher.engine_stats["broken"].stats()["success_rate"] == 0.0
+
+
+def test_engines_queued_past_the_deadline_never_run():
+    calls = []
+
+    def counted(prefix, delay):
+        engine = _engine(prefix, delay)
+
+        def search(*args):
+            calls.append(prefix)
+            return engine(*args)
+        return search
+
+    fetcher = _fetcher(a=counted("a", 0.4), b=counted("b", 0.0), c=counted("c", 0.0))
+    fetcher.search_deadline = 0.2
+    original = robust_resource_fetcher._search_executor
+    # One busy worker: b and c are still queued behind a when the deadline expires
+    robust_resource_fetcher._search_executor = executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        fetcher.search_with_fallback("Quantum Basket Weaving", "article", max_results=3, hedged=True)
+        executor.shutdown(wait=True)
+    finally:
+        robust_resource_fetcher._search_executor = original
+    assert calls == ["a"]
+
+
+def test_late_engine_calls_give_up_instead_of_waiting_for_a_token():
+    outcomes = []
+
+    def throttled(query, resource_type, max_results):
+        started = time.monotonic()
+        try:
+            fetcher._get("https://throttled.example.com/search")
+        except RateLimitExceeded:
+            outcomes.append(time.monotonic() - started)
+        return []
+
+    fetcher = _fetcher(throttled=throttled)
+    fetcher.search_deadline = 0.3
+    fetcher.rate_limiter = HostRateLimiter(default_rate=1, default_burst=1)
+    fetcher.rate_limiter.acquire("throttled.example.com")  # the next token is 1s away
+    fetcher.search_with_fallback("Quantum Basket Weaving", "article", max_results=3, hedged=True)
+    assert len(outcomes) == 1 and outcomes[0] < 0.1, outcomes
+
+
+def test_sequential_mode_still_available():
+    fetcher = _fetcher()
+    fetcher._search_bing = fetcher._search_startpage = fetcher._search_searx = lambda *args: []
+    resources = fetcher.search_with_fallback("Arrays", "video", max_results=2, hedged=False)
+    assert resources == fetcher._get_backup_resources("Arrays", "video", 2)
+
+
+if __name__ == "__main__":
+    test_backup_floor_when_engines_are_slow()
+    test_floor_is_returned_once_every_engine_had_its_hedge_delay()
+    test_fast_engine_beats_slow_one()
+    test_results_merge_up_to_max_results()
+    test_hedging_order_adapts()
+    test_engines_queued_past_the_deadline_never_run()
+    test_late_engine_calls_give_up_instead_of_waiting_for_a_token()
+    test_sequential_mode_still_available()
+    print("✅ Hedged search checks passed")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent on-disk HTTP response cache used by the scrapers.
+"""
+import sys
+import os
+import asyncio
+import subprocess
+import tempfile
+sys.path.append(os.path.dirname(__file__))
+
+from aiohttp import web
+
+import utils.async_http as async_http
+import utils.circuit_breaker as circuit_breaker
+from utils.http_cache import HttpResponseCache, cache_key
+
+
+def test_cache_key_normalization():
+    assert cache_key("https://WWW.Bing.com/search?q=b&a=1#frag") == cache_key("https://bing.com/search?a=1&q=b")
+    assert cache_key("https://bing.com/search?q=a") != cache_key("https://bing.com/search?q=b")
+
+
+def test_per_source_ttls_and_compression():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = HttpResponseCache(os.path.join(tmp_dir, "cache.sqlite3"), ttls={"youtube.com": 100, "github.com": 200},
+                                  default_ttl=10)
+        assert cache.ttl_for("https://www.youtube.com/results") == 100
+        assert cache.ttl_for("https://api.github.com/x") == 200
+        assert cache.ttl_for("https://example.com/") == 10
+
+        body = "<html>" + "result " * 5000 + "</html>"
+        cache.put("https://youtube.com/results?q=python", 200, body, etag='"v1"')
+        cached = cache.get("https://www.youtube.com/results?q=python")
+        assert cached.text == body and cached.etag == '"v1"' and cached.is_fresh
+        assert cache.stats()["compressed_bytes"] < len(body) / 10
+
+
+def test_entries_are_shared_across_processes():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "cache.sqlite3")
+        HttpResponseCache(path).put("https://bing.com/search?q=python", 200, "shared page")
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from utils.http_cache import HttpResponseCache;"
+            "print(HttpResponseCache(sys.argv[2]).get('https://www.bing.com/search?q=python').text)"
+        )
+        output = subprocess.run([sys.executable, "-c", script, os.path.dirname(os.path.abspath(__file__)), path],
+                                capture_output=True, text=True, check=True).stdout
+        assert output.strip() == "shared page"
+
+
+def test_fetch_text_serves_fresh_revalidates_and_falls_back():
+    requests_seen = []
+
+    async def handle(request):
+        requests_seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.Response(text="search results", headers={"ETag": '"v1"'})
+
+    async def scenario(cache):
+        app = web.Application()
+        app.router.add_get("/search", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        url = f"http://127.0.0.1:{port}/search?q=python"
+        try:
+            first = await async_http.fetch_text(url, use_cache=True)
+            second = await async_http.fetch_text(url, use_cache=True)
+            assert (first.from_cache, second.from_cache) == (False, True)
+            assert second.text == "search results"
+            assert requests_seen == [None]
+
+            # Expired entries are revalidated with a conditional GET
+            cache.default_ttl = 0
+            cache.put(url, 200, "search results", etag='"v1"')
+            third = await async_http.fetch_text(url, use_cache=True)
+            assert third.from_cache and third.text == "search results"
+            assert requests_seen == [None, '"v1"']
+            assert cache.stats()["revalidated"] == 1
+        finally:
+            await async_http.close_session()
+            await runner.cleanup()
+
+        # Host down: the stale copy is served instead of an error
+        stale = await async_http.fetch_text(url, timeout=1, use_cache=True)
+        assert stale.from_cache and stale.text == "search results"
+        assert cache.stats()["stale_served"] == 1
+        circuit_breaker.circuit_breakers.reset()
+
+    original = async_http.get_http_cache
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = HttpResponseCache(os.path.join(tmp_dir, "cache.sqlite3"), ttls={}, default_ttl=60)
+        async_http.get_http_cache = lambda: cache
+        try:
+            asyncio.run(scenario(cache))
+        finally:
+            async_http.get_http_cache = original
+
+
+def test_pages_without_results_are_not_cached():
+    pages = ["<html>captcha</html>", "<li>result</li>", "<html>captcha</html>"]
+
+    async def handle(request):
+        return web.Response(text=pages.pop(0))
+
+    async def scenario(cache):
+        app = web.Application()
+        app.router.add_get("/search", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        url = f"http://127.0.0.1:{port}/search?q=python"
+        has_results = lambda html: "<li>" in html
+        try:
+            # A block page is returned to the caller but never stored
+            blocked = await async_http.fetch_text(url, use_cache=True, cacheable=has_results)
+            assert not blocked.from_cache and "captcha" in blocked.text
+            assert cache.get(url) is None and cache.stats()["rejected"] == 1
+
+            good = await async_http.fetch_text(url, use_cache=True, cacheable=has_results)
+            assert not good.from_cache and cache.get(url).text == "<li>result</li>"
+
+            # Once that copy expires, a block page does not replace it
+            cache.default_ttl = 0
+            cache.put(url, 200, "<li>result</li>")
+            again = await async_http.fetch_text(url, use_cache=True, cacheable=has_results)
+            assert again.from_cache and again.text == "<li>result</li>"
+            assert cache.get(url).text == "<li>result</li>"
+            assert cache.stats()["rejected"] == 2 and cache.stats()["stale_served"] == 1
+        finally:
+            await async_http.close_session()
+            await runner.cleanup()
+
+    original = async_http.get_http_cache
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = HttpResponseCache(os.path.join(tmp_dir, "cache.sqlite3"), ttls={}, default_ttl=60)
+        async_http.get_http_cache = lambda: cache
+        try:
+            asyncio.run(scenario(cache))
+        finally:
+            async_http.get_http_cache = original
+
+
+def test_long_expired_entries_are_pruned_while_running():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = HttpResponseCache(os.path.join(tmp_dir, "cache.sqlite3"), ttls={}, default_ttl=-100, max_stale=10,
+                                  prune_interval=3600)
+        cache.put("https://bing.com/search?q=old", 200, "old page")
+        cache.put("https://bing.com/search?q=older", 200, "older page")
+        assert cache.stats()["entries"] == 2  # not yet due for a prune
+
+        cache.prune_interval = 0
+        cache.default_ttl = 60
+        cache.put("https://bing.com/search?q=new", 200, "new page")
+        assert cache.stats()["entries"] == 1 and cache.stats()["pruned"] == 2
+        assert cache.get("https://bing.com/search?q=new").text == "new page"
+
+
+if __name__ == "__main__":
+    test_cache_key_normalization()
+    test_per_source_ttls_and_compression()
+    test_entries_are_shared_across_processes()
+    test_fetch_text_serves_fresh_revalidates_and_falls_back()
+    test_pages_without_results_are_not_cached()
+    test_long_expired_entries_are_pruned_while_running()
+    print("✅ HTTP response cache checks passed")
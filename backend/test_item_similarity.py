@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the item-to-item skill similarity table and item-based recommendations.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+import numpy as np
+import pytest
+from sqlalchemy import event
+
+from models.models import User, Skill, SkillProgress, SkillSimilarity
+from utils.adaptive_learning import AdaptiveLearningEngine
+from utils.item_similarity import (
+    compute_skill_neighbours, build_skill_similarity_table, get_item_based_recommendations, similarity_table_age
+)
+
+
+def _seed(db, users=40, seed=11):
+    db.add_all(Skill(id=i, name=f"Skill {i}") for i in range(1, 11))
+    db.add_all(User(id=i, email=f"u{i}@example.com", username=f"u{i}") for i in range(1, users + 1))
+    rng = np.random.default_rng(seed)
+    for user_id in range(1, users + 1):
+        # Two "tracks": skills 1-5 and 6-10 tend to be completed together
+        track = [1, 2, 3, 4, 5] if user_id % 2 else [6, 7, 8, 9, 10]
+        for skill_id in rng.choice(track, size=3, replace=False):
+            db.add(SkillProgress(user_id=user_id, skill_id=int(skill_id), progress_percentage=100.0, completed=True))
+    db.commit()
+
+
+def test_neighbours_are_cosine_of_co_completions():
+    a, b, c = 101, 102, 103
+    pairs = [(1, a), (1, b), (2, a), (2, b), (3, a), (3, c), (4, c)]
+    rows = {(r["skill_id"], r["related_skill_id"]): r for r in compute_skill_neighbours(pairs, min_support=1)}
+    # a: 3 users, b: 2 users, both: 2 users -> 2 / sqrt(3 * 2)
+    assert np.isclose(rows[(a, b)]["score"], 2 / np.sqrt(6), atol=1e-6)
+    assert rows[(a, b)]["co_completions"] == 2 and (b, c) not in rows
+    assert (a, c) not in {(r["skill_id"], r["related_skill_id"]) for r in compute_skill_neighbours(pairs)}
+    assert len([r for r in compute_skill_neighbours(pairs, top_k=1, min_support=1) if r["skill_id"] == a]) == 1
+
+
+def test_table_build_and_recommendations_in_constant_queries(engine, db):
+    _seed(db)
+    assert similarity_table_age(db) is None
+    assert build_skill_similarity_table(db, top_k=3) > 0
+    assert similarity_table_age(db) < 60
+    assert db.query(SkillSimilarity).filter(SkillSimilarity.skill_id == 1).count() <= 3
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    recommendations = get_item_based_recommendations(1, db, limit=3)
+    assert len(statements) == 3  # user's skills, neighbour lists, one batched Skill fetch
+
+    owned = {sp.skill_id for sp in db.query(SkillProgress).filter(SkillProgress.user_id == 1)}
+    assert recommendations and all(r["item_id"] not in owned for r in recommendations)
+    assert all(r["item_id"] <= 5 for r in recommendations)  # same track
+    assert recommendations[0]["reason"].startswith("Learners who completed Skill ")
+
+
+def test_collaborative_recommendations_prefer_the_similarity_table(db):
+    _seed(db)
+    engine_under_test = AdaptiveLearningEngine()
+    without_table = engine_under_test.get_collaborative_recommendations(2, db, limit=3)
+    assert all("similar learning patterns" in r["reason"] or "Popular" in r["reason"] for r in without_table)
+
+    build_skill_similarity_table(db)
+    with_table = engine_under_test.get_collaborative_recommendations(2, db, limit=3)
+    assert with_table and all(r["reason"].startswith("Learners who completed") for r in with_table)
+
+
+def test_missing_similarity_table_keeps_the_callers_pending_work(engine, db):
+    _seed(db)
+    SkillSimilarity.__table__.drop(bind=engine)
+    db.add(Skill(id=11, name="Pending Skill"))
+    db.flush()
+
+    # Falls back to user-based filtering without rolling back the session
+    AdaptiveLearningEngine().get_collaborative_recommendations(2, db, limit=3)
+    db.commit()
+    assert db.query(Skill).filter(Skill.id == 11).count() == 1
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Item similarity checks passed")
+    sys.exit(exit_code)
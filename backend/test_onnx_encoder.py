@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the ONNX embedding backend (pooling, batching, provider wiring, parity report).
+"""
+import sys
+import os
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.join(os.path.dirname(__file__), "scripts"))
+
+import numpy as np
+
+from ml.embeddings import EmbeddingModelProvider, UNAVAILABLE
+from ml.onnx_encoder import OnnxSentenceEncoder, mean_pool
+from benchmark_embedding_backends import compare_hierarchy_matching
+
+DIM = 16
+
+
+class FakeTokenizer:
+    """Word-level tokenizer with the ``tokenizers`` batch API; id 0 is padding."""
+
+    def enable_truncation(self, max_length):
+        self.max_length = max_length
+
+    def enable_padding(self):
+        pass
+
+    def encode_batch(self, texts):
+        ids = [[1 + len(word) for word in text.split()][:self.max_length] for text in texts]
+        width = max(len(row) for row in ids)
+        return [SimpleNamespace(ids=row + [0] * (width - len(row)),
+                                attention_mask=[1] * len(row) + [0] * (width - len(row)),
+                                type_ids=[0] * width) for row in ids]
+
+
+class FakeSession:
+    """Token embedding = one-hot of the token id, like a tiny transformer output."""
+
+    def __init__(self, input_names=("input_ids", "attention_mask")):
+        self.input_names = input_names
+        self.calls = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name=name) for name in self.input_names]
+
+    def run(self, output_names, feeds):
+        self.calls.append(sorted(feeds))
+        return [np.eye(DIM, dtype=np.float32)[feeds["input_ids"] % DIM]]
+
+
+def test_mean_pool_ignores_padding_and_normalizes():
+    tokens = np.array([[[3.0, 4.0], [100.0, 100.0]]], dtype=np.float32)
+    pooled = mean_pool(tokens, np.array([[1, 0]]))
+    assert np.allclose(pooled, [[0.6, 0.8]])
+
+
+def test_encoder_batches_and_keeps_input_order():
+    session = FakeSession()
+    encoder = OnnxSentenceEncoder(session, FakeTokenizer())
+    texts = ["a much longer skill name", "go", "data science"]
+    vectors = encoder.encode(texts, batch_size=2)
+    assert vectors.shape == (3, DIM) and len(session.calls) == 2
+    # Only the inputs the exported graph declares are fed
+    assert session.calls[0] == ["attention_mask", "input_ids"]
+    # Padding doesn't leak into shorter texts of the same batch
+    assert np.allclose(vectors[1], np.eye(DIM)[3])
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    assert np.allclose(encoder.encode("data science"), vectors[2])
+
+
+def test_onnx_provider_has_its_own_model_id():
+    torch_provider = EmbeddingModelProvider("all-MiniLM-L6-v2", loader=lambda name: None, backend="torch")
+    onnx_provider = EmbeddingModelProvider("all-MiniLM-L6-v2", loader=lambda name: None, backend="onnx")
+    assert torch_provider.model_id == "all-MiniLM-L6-v2"
+    assert onnx_provider.model_id == "all-MiniLM-L6-v2@onnx"
+    assert onnx_provider.status()["backend"] == "onnx"
+
+    unknown = EmbeddingModelProvider("all-MiniLM-L6-v2", backend="tensorrt")
+    assert unknown.state == UNAVAILABLE and not unknown.available
+
+
+def test_parity_report_flags_disagreements():
+    class SeededModel:
+        def __init__(self, noise):
+            self.noise = noise
+
+        def encode(self, texts, **kwargs):
+            vectors = [np.random.default_rng(sum(map(ord, text))).normal(size=DIM) for text in texts]
+            return np.stack(vectors) + self.noise
+
+    queries = ["Data Science", "Machine Learning", "react hooks"]
+    reference = EmbeddingModelProvider("seeded", loader=lambda name: SeededModel(0.0))
+    same = EmbeddingModelProvider("seeded", loader=lambda name: SeededModel(0.0), backend="onnx")
+    report = compare_hierarchy_matching(reference, same, queries)
+    assert report["agreement"] == 1.0 and report["mismatches"] == []
+    assert report["min_cosine"] > 0.999
+
+    drifted = EmbeddingModelProvider("seeded", loader=lambda name: SeededModel(np.eye(DIM)[0] * 50), backend="onnx")
+    report = compare_hierarchy_matching(reference, drifted, queries)
+    assert report["agreement"] < 1.0 and report["mismatches"]
+
+
+if __name__ == "__main__":
+    test_mean_pool_ignores_padding_and_normalizes()
+    test_encoder_batches_and_keeps_input_order()
+    test_onnx_provider_has_its_own_model_id()
+    test_parity_report_flags_disagreements()
+    print("✅ ONNX encoder checks passed")
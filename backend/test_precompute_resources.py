@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the resource precompute pipeline (catalog sources only).
+"""
+import sys
+import os
+import asyncio
+import tempfile
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.join(os.path.dirname(__file__), "scripts"))
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from models.models import Skill, Resource
+from precompute_resources import bulk_upsert, precompute_resources
+
+HIERARCHY = {
+    "Python": ["Python Basics", "Functions"],
+    "Data Structures & Algorithms": ["Arrays", "Linked Lists"],
+}
+
+
+def _run(session_factory, checkpoint_path, resume=True):
+    return asyncio.run(precompute_resources(
+        session_factory=session_factory,
+        hierarchy=HIERARCHY,
+        scrape=False,
+        checkpoint_path=checkpoint_path,
+        resume=resume,
+        batch_size=2,
+    ))
+
+
+def test_precompute_upserts_idempotently(session_factory):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        checkpoint = os.path.join(tmp_dir, "checkpoint.json")
+        report = _run(session_factory, checkpoint)
+        assert report["tasks_completed"] == 6
+        assert report["resources_inserted"] > 0
+        assert report["sources"]["catalog"]["calls"] == 6
+
+        db = session_factory()
+        try:
+            assert {s.name for s in db.query(Skill)} == set(HIERARCHY)
+            rows = db.query(Resource).all()
+            assert len(rows) == report["resources_inserted"]
+            assert all(r.skill_id is not None for r in rows)
+            keys = [(r.skill_id, r.subskill_name, r.url) for r in rows]
+            assert len(keys) == len(set(keys))
+            assert any(r.subskill_name == "Arrays" for r in rows)
+        finally:
+            db.close()
+
+        # A fresh run re-scores the same rows instead of duplicating them
+        rerun = _run(session_factory, checkpoint, resume=False)
+        assert rerun["resources_inserted"] == 0
+        assert rerun["resources_updated"] == report["resources_inserted"]
+        db = session_factory()
+        try:
+            assert db.query(Resource).count() == report["resources_inserted"]
+        finally:
+            db.close()
+
+
+def test_precompute_resumes_from_checkpoint(session_factory):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        checkpoint = os.path.join(tmp_dir, "checkpoint.json")
+        _run(session_factory, checkpoint)
+        resumed = _run(session_factory, checkpoint)
+        assert resumed["tasks_completed"] == 0
+        assert resumed["tasks_skipped"] == 6
+        assert resumed["sources"]["catalog"]["calls"] == 0
+
+
+def test_bulk_upsert_relies_on_the_unique_key(session_factory):
+    """Overlapping writers update the existing row; the database enforces the key."""
+    setup = session_factory()
+    setup.add(Skill(id=1, name="Python"))
+    setup.commit()
+    setup.close()
+
+    def row(title, subskill_name=None):
+        return {"skill_id": 1, "subskill_name": subskill_name, "url": "https://example.com/py", "title": title,
+                "description": "", "resource_type": "article", "quality_score": 80.0}
+
+    first, second = session_factory(), session_factory()
+    assert bulk_upsert(first, [row("one"), row("loops", "Loops")]) == (2, 0)
+    # The second writer's batch repeats a key and overlaps the first run
+    assert bulk_upsert(second, [row("two"), row("three")]) == (0, 1)
+    rows = {r.subskill_name: r.title for r in second.query(Resource)}
+    assert rows == {None: "three", "Loops": "loops"}
+
+    second.add(Resource(skill_id=1, subskill_name=None, url="https://example.com/py", title="dup"))
+    try:
+        second.commit()
+    except IntegrityError:
+        second.rollback()
+    else:
+        raise AssertionError("Expected the unique index to reject a duplicate resource")
+    first.close()
+    second.close()
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Precompute pipeline checks passed")
+    sys.exit(exit_code)
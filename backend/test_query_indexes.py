@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN-based regression tests: the per-user hot queries must use an index,
+both on a fresh schema and after the Alembic migration on an old one.
+"""
+import sys
+import os
+import io
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(__file__))
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, func, inspect, text
+from sqlalchemy.orm import sessionmaker, Session
+
+from database.database import Base
+from models.models import (
+    SkillProgress, SubskillProgress, QuizAttempt, XPTransaction, UserBehavior, Resource, SkillSimilarity,
+    UserDailyActivity
+)
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+WEEK_AGO = datetime(2024, 6, 8)
+
+
+def _hot_queries(db: Session):
+    """(description, query, index that must serve it) for each hot query shape."""
+    return [
+        ("progress by user and skill",
+         db.query(SkillProgress).filter(SkillProgress.user_id == 1, SkillProgress.skill_id == 2),
+         "uq_skill_progress_user_skill"),
+        ("progress by user",
+         db.query(SkillProgress).filter(SkillProgress.user_id == 1),
+         "uq_skill_progress_user_skill"),
+        ("subskill progress lookup",
+         db.query(SubskillProgress).filter(SubskillProgress.user_id == 1, SubskillProgress.skill_id == 2,
+                                           SubskillProgress.subskill_name == "Loops"),
+         "uq_subskill_progress_user_skill_subskill"),
+        ("recent quizzes for a skill",
+         db.query(QuizAttempt).filter(QuizAttempt.user_id == 1, QuizAttempt.skill_id == 2)
+         .order_by(QuizAttempt.completed_at.desc()).limit(5),
+         "ix_quiz_attempts_user_skill_completed"),
+        ("recent quizzes",
+         db.query(QuizAttempt).filter(QuizAttempt.user_id == 1).order_by(QuizAttempt.completed_at.desc()).limit(20),
+         "ix_quiz_attempts_user_completed"),
+        ("weekly XP",
+         db.query(func.sum(XPTransaction.amount)).filter(XPTransaction.user_id == 1,
+                                                         XPTransaction.created_at >= WEEK_AGO),
+         "ix_xp_transactions_user_created"),
+        ("today's completions",
+         db.query(UserBehavior).filter(UserBehavior.user_id == 1, UserBehavior.timestamp >= WEEK_AGO,
+                                       UserBehavior.action_type.in_(["complete_subskill", "complete_quiz"])),
+         "ix_user_behavior_user_timestamp_action"),
+        ("recent behaviour",
+         db.query(UserBehavior).filter(UserBehavior.user_id == 1).order_by(UserBehavior.timestamp.desc()).limit(100),
+         "ix_user_behavior_user_timestamp_action"),
+    ]
+
+
+def _plan(db: Session, query) -> str:
+    sql = str(query.statement.compile(dialect=db.get_bind().dialect, compile_kwargs={"literal_binds": True}))
+    return " | ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+
+def _assert_hot_queries_use_indexes(db: Session):
+    for description, query, index in _hot_queries(db):
+        plan = _plan(db, query)
+        assert f"INDEX {index}" in plan, f"{description}: {plan}"
+        assert "TEMP B-TREE" not in plan, f"{description} sorts without the index: {plan}"
+    assert "COVERING INDEX ix_xp_transactions_user_created" in _plan(db, _hot_queries(db)[5][1])
+
+
+def test_fresh_schema_indexes_hot_queries(db):
+    _assert_hot_queries_use_indexes(db)
+
+
+def _alembic_config(url, output_buffer=None):
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"), output_buffer=output_buffer)
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def test_migration_indexes_an_existing_schema_and_merges_duplicates():
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'old.db')}"
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+        # Simulate a database created before the indexes existed
+        with engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    if index.name.startswith(("uq_skill_progress", "uq_subskill_progress", "ix_quiz_attempts_user",
+                                              "ix_xp_transactions_user", "ix_user_behavior_user", "uq_resources")):
+                        connection.execute(text(f"DROP INDEX {index.name}"))
+        db = sessionmaker(bind=engine)()
+        # The newest duplicate has less progress; the older one holds the progress
+        db.add_all([SkillProgress(user_id=1, skill_id=2, progress_percentage=60.0, completed=False,
+                                  completed_subskills=["Loops"], total_time_spent_minutes=40),
+                    SkillProgress(user_id=1, skill_id=2, progress_percentage=10.0, completed=True,
+                                  total_time_spent_minutes=5),
+                    SkillProgress(user_id=1, skill_id=3, progress_percentage=5.0),
+                    SubskillProgress(user_id=1, skill_id=2, subskill_name="Loops", completed=True,
+                                     time_spent_minutes=30, completed_at=WEEK_AGO),
+                    SubskillProgress(user_id=1, skill_id=2, subskill_name="Loops", time_spent_minutes=10),
+                    Resource(skill_id=2, subskill_name=None, url="https://example.com/a", title="old"),
+                    Resource(skill_id=2, subskill_name=None, url="https://example.com/a", title="new"),
+                    Resource(skill_id=2, subskill_name="Loops", url="https://example.com/a", title="loops")])
+        db.commit()
+        db.add(UserBehavior(user_id=1, action_type="view_resource", resource_id=1))
+        db.commit()
+        assert "TEMP B-TREE" in _plan(db, _hot_queries(db)[4][1])  # no index yet
+        db.close()
+        engine.dispose()  # pooled connections keep the old schema
+
+        config = _alembic_config(url)
+        command.upgrade(config, "head")
+
+        db = sessionmaker(bind=engine)()
+        _assert_hot_queries_use_indexes(db)
+        kept = db.query(SkillProgress).filter(SkillProgress.user_id == 1, SkillProgress.skill_id == 2).all()
+        assert len(kept) == 1
+        assert (kept[0].progress_percentage, kept[0].completed, kept[0].total_time_spent_minutes) == (60.0, True, 45)
+        assert kept[0].completed_subskills == ["Loops"]
+        assert db.query(SkillProgress).count() == 2
+        subskill = db.query(SubskillProgress).one()
+        assert (subskill.completed, subskill.time_spent_minutes) == (True, 40)
+        assert subskill.completed_at is not None
+        resources = db.query(Resource).order_by(Resource.id).all()
+        assert [(r.subskill_name, r.title) for r in resources] == [(None, "new"), ("Loops", "loops")]
+        assert db.query(UserBehavior).one().resource_id == resources[0].id
+
+        db.close()
+        engine.dispose()
+        command.downgrade(config, "base")
+        db = sessionmaker(bind=engine)()
+        assert "INDEX uq_skill_progress_user_skill" not in _plan(db, _hot_queries(db)[0][1])
+        command.upgrade(config, "head")  # idempotent against an already-indexed schema
+        db.close()
+        engine.dispose()
+
+
+def test_migration_creates_the_rollup_and_similarity_tables():
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'old.db')}"
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+        # A database from before the background jobs wrote these tables
+        for model in (UserDailyActivity, SkillSimilarity):
+            model.__table__.drop(bind=engine)
+        engine.dispose()
+
+        config = _alembic_config(url)
+        command.upgrade(config, "head")
+        inspector = inspect(engine)
+        for model in (UserDailyActivity, SkillSimilarity):
+            table = model.__table__
+            assert [c["name"] for c in inspector.get_columns(table.name)] == [c.name for c in table.columns]
+            assert {i["name"] for i in inspector.get_indexes(table.name)} >= {i.name for i in table.indexes}
+        assert [c["column_names"] for c in inspector.get_unique_constraints("user_daily_activity")] == [
+            ["user_id", "activity_date"]]
+        engine.dispose()
+
+        command.downgrade(config, "a1c4e7f20b3d")
+        assert "user_daily_activity" not in inspect(engine).get_table_names()
+        engine.dispose()
+
+
+def test_migration_adds_the_dashboard_version():
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'old.db')}"
+        engine = create_engine(url)
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(text("ALTER TABLE users DROP COLUMN dashboard_version"))
+            connection.execute(text("INSERT INTO users (id, email, username) VALUES (1, 'u1@example.com', 'u1')"))
+        engine.dispose()
+
+        command.upgrade(_alembic_config(url), "head")
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT dashboard_version FROM users")).scalar() == 0
+        engine.dispose()
+
+
+def test_migration_renders_offline():
+    """``alembic upgrade head --sql`` emits the SQL without connecting."""
+    output = io.StringIO()
+    command.upgrade(_alembic_config("postgresql://offline/skillsprint", output), "head", sql=True)
+    sql = output.getvalue()
+    assert "CREATE UNIQUE INDEX IF NOT EXISTS uq_resources_skill_subskill_url" in sql
+    assert "DELETE FROM skill_progress" in sql
+    assert "CREATE TABLE IF NOT EXISTS user_daily_activity" in sql
+    assert "CREATE INDEX IF NOT EXISTS ix_skill_similarities_skill_id" in sql
+    assert "ALTER TABLE users ADD COLUMN dashboard_version INTEGER DEFAULT '0' NOT NULL" in sql
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Query index checks passed")
+    sys.exit(exit_code)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-host token-bucket rate limiter.
+"""
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from utils.rate_limiter import HostRateLimiter, RateLimitExceeded, TokenBucket, parse_host_limits
+
+
+def test_burst_then_refill_rate():
+    bucket = TokenBucket(rate=10, capacity=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    delays = [bucket.reserve() for _ in range(3)]
+    assert all(0.05 < d <= 0.31 for d in delays), delays
+    assert delays == sorted(delays)
+    assert bucket.stats()["delayed_requests"] == 3
+
+
+def test_hosts_do_not_delay_each_other():
+    limiter = HostRateLimiter(default_rate=1, default_burst=1)
+    started = time.monotonic()
+    for url in ("https://www.bing.com/search?q=a", "https://startpage.com/sp/search?q=a", "https://searx.be/search"):
+        limiter.acquire(url)
+    assert time.monotonic() - started < 0.1
+    # www. and bare host share a bucket
+    assert limiter.bucket_for("https://www.bing.com/x") is limiter.bucket_for("bing.com")
+
+
+def test_same_host_requests_are_fifo():
+    limiter = HostRateLimiter(default_rate=20, default_burst=1)
+    order = []
+
+    def worker(i):
+        limiter.acquire("example.com")
+        order.append(i)
+
+    threads = []
+    for i in range(5):
+        thread = threading.Thread(target=worker, args=(i,))
+        thread.start()
+        threads.append(thread)
+        time.sleep(0.005)  # Arrive in a known order
+    for thread in threads:
+        thread.join()
+    assert order == list(range(5))
+
+
+def test_async_waits_do_not_block_the_loop():
+    limiter = HostRateLimiter(default_rate=5, default_burst=1)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        tick_task = asyncio.ensure_future(ticker())
+        waits = await asyncio.gather(*(limiter.acquire_async("example.com") for _ in range(3)))
+        tick_task.cancel()
+        return waits, ticks
+
+    waits, ticks = asyncio.run(scenario())
+    assert waits[0] == 0.0 and waits[2] > waits[1] > 0
+    assert ticks > 10  # The loop kept running while requests waited
+
+    stats = limiter.stats()
+    assert stats["hosts"]["example.com"]["requests"] == 3
+    assert stats["total_wait_seconds"] > 0
+
+
+def test_waits_beyond_max_wait_fail_fast_without_debt():
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.reserve(max_wait=0.5) == 0.0
+    assert 0.05 < bucket.reserve(max_wait=0.5) <= 0.1
+    for _ in range(50):
+        try:
+            bucket.reserve(max_wait=0.15)
+        except RateLimitExceeded:
+            pass
+    # Rejected callers take no token, so the queue never grows past max_wait
+    assert bucket.stats()["requests"] == 2 and bucket.stats()["rejected_requests"] == 50
+    started = time.monotonic()
+    try:
+        limiter = HostRateLimiter(default_rate=1, default_burst=1)
+        limiter.acquire("example.com")
+        limiter.acquire("example.com", max_wait=0.2)
+        raise AssertionError("expected RateLimitExceeded")
+    except RateLimitExceeded as e:
+        assert e.wait > 0.9
+    assert time.monotonic() - started < 0.1
+
+
+def test_parse_host_limits():
+    limits = parse_host_limits("bing.com=0.5/3, startpage.com=2, broken")
+    assert limits["bing.com"] == (0.5, 3.0)
+    assert limits["startpage.com"][0] == 2.0
+    assert "broken" not in limits
+
+
+if __name__ == "__main__":
+    test_burst_then_refill_rate()
+    test_hosts_do_not_delay_each_other()
+    test_same_host_requests_are_fifo()
+    test_async_waits_do_not_block_the_loop()
+    test_waits_beyond_max_wait_fail_fast_without_debt()
+    test_parse_host_limits()
+    print("✅ Rate limiter checks passed")
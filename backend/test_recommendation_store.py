@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the materialized user_recommendations store and its refresh job.
+"""
+import sys
+import os
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(__file__))
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker, Session
+
+from models.models import User, Skill, SkillProgress, UserRecommendation
+from utils.user_skill_matrix import UserSkillMatrix
+import utils.adaptive_learning as adaptive_learning
+import utils.recommendation_store as recommendation_store
+from utils.job_lock import job_lock
+
+
+def _seed(db):
+    db.add_all(Skill(id=i, name=f"Skill {i}", description=f"About skill {i}") for i in range(1, 6))
+    db.add_all(User(id=i, email=f"u{i}@example.com", username=f"u{i}", last_activity=datetime.utcnow())
+               for i in range(1, 5))
+    # Users 1-3 share skills 1 and 2; 2 and 3 also completed skills 3 and 4
+    for user_id, skill_id in [(1, 1), (1, 2), (2, 1), (2, 2), (2, 3), (3, 1), (3, 2), (3, 4), (2, 4)]:
+        db.add(SkillProgress(user_id=user_id, skill_id=skill_id, progress_percentage=100.0, completed=True))
+    db.commit()
+
+
+class _Patched:
+    """Swap in a private CF matrix and refresher so tests don't touch globals."""
+
+    def __init__(self, session_factory):
+        self.session_factory = session_factory
+
+    def __enter__(self):
+        self.original = (adaptive_learning.user_skill_matrix, recommendation_store.recommendation_refresher)
+        adaptive_learning.user_skill_matrix = UserSkillMatrix(snapshot_path=None)
+        recommendation_store.recommendation_refresher = recommendation_store.RecommendationRefresher(
+            session_factory=self.session_factory)
+        return recommendation_store.recommendation_refresher
+
+    def __exit__(self, *exc):
+        adaptive_learning.user_skill_matrix, recommendation_store.recommendation_refresher = self.original
+
+
+def test_miss_computes_inline_then_reads_are_served_from_the_table(engine, session_factory, db):
+    _seed(db)
+    with _Patched(session_factory) as refresher:
+        first = recommendation_store.get_user_recommendations(1, db, limit=3)
+        assert first and {r["item_id"] for r in first} <= {3, 4}
+        assert db.query(UserRecommendation).filter(UserRecommendation.user_id == 1).count() == len(first)
+
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        again = recommendation_store.get_user_recommendations(1, db, limit=3)
+        assert len(statements) == 1  # one read, no collaborative filtering
+        assert [r["item_id"] for r in again] == [r["item_id"] for r in first]
+        assert again[0]["title"] == f"Skill {again[0]['item_id']}" and again[0]["generated_at"]
+        assert (refresher.hits, refresher.misses) == (1, 1)
+
+
+def test_miss_leaves_the_callers_transaction_alone(session_factory, db):
+    _seed(db)
+    calls = []
+    db.commit = lambda: calls.append("commit")
+    db.rollback = lambda: calls.append("rollback")
+    with _Patched(session_factory):
+        assert recommendation_store.get_user_recommendations(1, db, limit=3)
+    assert calls == []
+    stored = session_factory()
+    assert stored.query(UserRecommendation).filter(UserRecommendation.user_id == 1).count() > 0
+    stored.close()
+
+
+def test_refresh_keeps_rows_the_user_acted_on(session_factory, db):
+    _seed(db)
+    with _Patched(session_factory):
+        db.add(UserRecommendation(user_id=1, recommendation_type="skill", recommended_item_id=5,
+                                  recommended_item_type="skill", score=1.0, user_action="dismissed"))
+        db.commit()
+        recommendation_store.refresh_user_recommendations(1, db)
+        recommendation_store.refresh_user_recommendations(1, db)
+        rows = db.query(UserRecommendation).filter(UserRecommendation.user_id == 1).all()
+        assert sum(1 for row in rows if row.user_action == "dismissed") == 1
+        assert {row.recommended_item_id for row in rows if row.user_action is None} <= {3, 4}
+
+
+def test_activity_and_age_trigger_background_refresh(session_factory, db):
+    _seed(db)
+    with _Patched(session_factory) as refresher:
+        recommendation_store.register_recommendation_hooks()
+        try:
+            for user_id in (1, 2, 3, 4):
+                recommendation_store.refresh_user_recommendations(user_id, db)
+            assert refresher.expired_active_users(db) == []
+
+            # New progress queues its user
+            db.add(SkillProgress(user_id=4, skill_id=1, progress_percentage=50.0))
+            db.commit()
+            assert refresher.stats()["queued_users"] == 1
+
+            # Old rows of an active user are refreshed too
+            db.query(UserRecommendation).filter(UserRecommendation.user_id == 2).update(
+                {UserRecommendation.created_at: datetime.utcnow() - timedelta(days=2)})
+            db.commit()
+            assert refresher.expired_active_users(db) == [2]
+
+            assert refresher.run_once() == 2
+            assert refresher.stats()["queued_users"] == 0
+            assert refresher.expired_active_users(db) == []
+        finally:
+            event.remove(Session, "after_flush", recommendation_store._collect_active_users)
+            event.remove(Session, "after_commit", recommendation_store._queue_active_users)
+            event.remove(Session, "after_soft_rollback", recommendation_store._discard_active_users)
+
+
+def test_one_worker_refreshes_at_a_time(file_engine):
+    session_factory = sessionmaker(bind=file_engine)
+    db = session_factory()
+    db.add(User(id=1, email="u1@example.com", username="u1", last_activity=datetime.utcnow()))
+    db.commit()
+    with _Patched(session_factory) as refresher:
+        refresher.mark_stale([1])
+        # Another worker holds the lock: this pass is skipped and the queue is kept
+        with job_lock(file_engine, "recommendation_refresh") as held:
+            assert held and refresher.run_once() == 0
+        assert refresher.stats()["skipped_passes"] == 1 and refresher.stats()["queued_users"] == 1
+        assert db.query(UserRecommendation).count() == 0
+        assert refresher.run_once() == 1 and refresher.stats()["queued_users"] == 0
+    db.close()
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Recommendation store checks passed")
+    sys.exit(exit_code)
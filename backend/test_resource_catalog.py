@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the unified resource catalog that backs all curated lookups.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(__file__))
+
+from utils.resource_catalog import (
+    build_resource_catalog,
+    get_resource_catalog,
+    ResourceCatalog,
+    normalize_url,
+    SOURCE_BACKUP,
+    SOURCE_CURATED,
+    SOURCE_FAST_FALLBACK,
+    SOURCE_OPTIMIZED,
+    SOURCE_SPECIALIZED,
+    SOURCE_SUBSKILL,
+)
+from utils.curated_resource_data import SUBSKILL_RESOURCES, CURATED_RESOURCES, FAST_FALLBACK_RESOURCES
+from utils.enhanced_uniqueness import _initialize_specialized_resources, get_specialized_resources_for_subskill
+from utils.optimized_resource_db import _initialize_comprehensive_database
+from utils.robust_resource_fetcher import _initialize_backup_resources
+
+
+def _raw_sources():
+    return {
+        SOURCE_SPECIALIZED: _initialize_specialized_resources(),
+        SOURCE_SUBSKILL: SUBSKILL_RESOURCES,
+        SOURCE_CURATED: CURATED_RESOURCES,
+        SOURCE_FAST_FALLBACK: FAST_FALLBACK_RESOURCES,
+        SOURCE_OPTIMIZED: {k: v["resources"] for k, v in _initialize_comprehensive_database().items()},
+        SOURCE_BACKUP: _initialize_backup_resources(),
+    }
+
+
+def test_one_record_per_url():
+    """Every URL appears exactly once across the whole catalog."""
+    catalog = get_resource_catalog()
+    urls = [normalize_url(record["url"]) for record in catalog.records]
+    assert len(urls) == len(set(urls))
+
+
+def _as_catalog_fields(resource):
+    """The optimized and backup stores spell type and score differently."""
+    if "resource_type" in resource:
+        return resource
+    return {
+        "title": resource["title"],
+        "url": resource["url"],
+        "description": resource.get("description", ""),
+        "resource_type": resource["type"],
+        "quality_score": resource.get("quality", resource.get("score")),
+    }
+
+
+def test_listings_return_exactly_what_each_source_held():
+    """Each source listing keeps its original keys, order and every field, even for shared URLs."""
+    catalog = build_resource_catalog()
+    for source, raw in _raw_sources().items():
+        assert catalog.listing_keys(source) == list(raw)
+        for key, resources in raw.items():
+            expected = [_as_catalog_fields(resource) for resource in resources]
+            assert catalog.get_listing(source, key) == expected, (source, key)
+    assert any(catalog.overrides.values())  # shared URLs with differing fields exist
+
+
+def test_shared_url_keeps_each_sources_type():
+    """A URL listed with different types keeps one record but both types."""
+    catalog = ResourceCatalog()
+    catalog.add_listing(SOURCE_CURATED, "trees", [
+        {"title": "Binary Trees", "url": "https://example.com/trees", "description": "Intro",
+         "resource_type": "tutorial", "quality_score": 90},
+    ])
+    catalog.add_listing(SOURCE_BACKUP, "Binary Trees", [
+        {"title": "Binary Trees Explained", "url": "https://example.com/trees/", "type": "article", "score": 80},
+    ])
+    assert len(catalog.records) == 1
+    assert catalog.get_listing(SOURCE_CURATED, "trees")[0]["resource_type"] == "tutorial"
+    backup = catalog.get_listing(SOURCE_BACKUP, "Binary Trees")[0]
+    assert backup == {"title": "Binary Trees Explained", "url": "https://example.com/trees/", "description": "",
+                      "resource_type": "article", "quality_score": 80}
+
+
+def test_views_return_copies():
+    """Callers that rescore resources in place must not mutate the catalog."""
+    first = get_specialized_resources_for_subskill("Arrays")
+    first[0]["quality_score"] = -1
+    second = get_specialized_resources_for_subskill("Arrays")
+    assert second[0]["quality_score"] != -1
+
+
+def test_secondary_indexes():
+    """Skill, subskill, type and domain filters intersect."""
+    catalog = get_resource_catalog()
+    videos = catalog.find(subskill="Arrays", resource_type="video")
+    assert videos and all(r["resource_type"] == "video" for r in videos)
+
+    leetcode = catalog.find(domain="leetcode.com")
+    assert leetcode and all("leetcode.com" in r["url"] for r in leetcode)
+    scores = [r["quality_score"] for r in leetcode]
+    assert scores == sorted(scores, reverse=True)
+
+    assert catalog.find(skill="python", limit=3)
+    assert catalog.find(skill="definitely not a skill") == []
+
+
+if __name__ == "__main__":
+    test_one_record_per_url()
+    test_listings_return_exactly_what_each_source_held()
+    test_shared_url_keeps_each_sources_type()
+    test_views_return_copies()
+    test_secondary_indexes()
+    print("✅ Resource catalog checks passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped resource catalog snapshot and its hot-reload path.
+"""
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(__file__))
+
+import utils.resource_catalog as resource_catalog
+from utils.resource_catalog import build_resource_catalog, SOURCE_CURATED, SOURCE_FAST_FALLBACK
+from utils.catalog_snapshot import load_snapshot, verify_snapshot, write_snapshot, SnapshotError
+
+
+def test_snapshot_round_trip():
+    """A mapped snapshot answers every lookup exactly like the in-memory catalog."""
+    catalog = build_resource_catalog()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "catalog.snap")
+        version = write_snapshot(catalog, path)
+        snapshot = load_snapshot(path)
+
+        assert version == catalog.version == snapshot.version
+        assert verify_snapshot(catalog, snapshot) == []
+        assert snapshot.records == catalog.records
+
+        assert snapshot.has_listing(SOURCE_CURATED, "python")
+        assert not snapshot.has_listing(SOURCE_CURATED, "not a skill")
+        assert snapshot.get_listing(SOURCE_CURATED, "not a skill") == []
+
+        url = catalog.records[0]["url"]
+        assert snapshot.get_by_url(url.upper() + "/") == catalog.get_by_url(url)
+
+        for filters in ({"skill": "Python"}, {"subskill": "arrays", "resource_type": "video"}, {"domain": "leetcode.com"}):
+            assert snapshot.find(**filters) == catalog.find(**filters)
+
+
+def test_rejects_foreign_files():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "bogus.snap")
+        with open(path, "wb") as f:
+            f.write(b"not a snapshot at all, just some bytes")
+        try:
+            load_snapshot(path)
+        except SnapshotError:
+            pass
+        else:
+            raise AssertionError("Expected SnapshotError for a foreign file")
+
+
+def test_hot_reload_picks_up_new_version():
+    """Workers swap to a newly landed snapshot and drop the old alias index."""
+    from utils.fast_fallback import get_fast_fallback_resources
+
+    original_path = resource_catalog.RESOURCE_SNAPSHOT_PATH
+    original_catalog = resource_catalog._catalog
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            resource_catalog.RESOURCE_SNAPSHOT_PATH = os.path.join(tmp_dir, "catalog.snap")
+            catalog = build_resource_catalog()
+            write_snapshot(catalog, resource_catalog.RESOURCE_SNAPSHOT_PATH)
+            resource_catalog._catalog = None
+
+            first = resource_catalog.get_resource_catalog()
+            assert first.version == catalog.version
+            assert get_fast_fallback_resources("Docker")
+            assert not resource_catalog.reload_resource_catalog()
+
+            # Land a new version with an extra fast-fallback skill
+            catalog.add_listing(SOURCE_FAST_FALLBACK, "Snapshot Testing", [
+                {"title": "Snapshot Testing Guide", "url": "https://example.com/snapshots",
+                 "description": "Guide", "resource_type": "article", "quality_score": 80},
+            ])
+            catalog.version = catalog.content_digest()
+            write_snapshot(catalog, resource_catalog.RESOURCE_SNAPSHOT_PATH)
+
+            assert resource_catalog.reload_resource_catalog()
+            assert resource_catalog.get_resource_catalog().version == catalog.version
+            assert get_fast_fallback_resources("snapshot testing")[0]["url"] == "https://example.com/snapshots"
+    finally:
+        resource_catalog.RESOURCE_SNAPSHOT_PATH = original_path
+        resource_catalog._catalog = original_catalog
+
+
+if __name__ == "__main__":
+    test_snapshot_round_trip()
+    test_rejects_foreign_files()
+    test_hot_reload_picks_up_new_version()
+    print("✅ Resource snapshot checks passed")
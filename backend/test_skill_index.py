@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Tests for the approximate nearest-neighbour skill index.
+"""
+import sys
+import os
+import tempfile
+import threading
+import time
+import zlib
+sys.path.append(os.path.dirname(__file__))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+from sqlalchemy import event
+
+from models.models import Skill
+from ml.embeddings import EmbeddingModelProvider, normalize_rows
+from ml.skill_index import IVFIndex, SkillIndex, KIND_SKILL, KIND_SUBSKILL
+import ml.skill_decomposition as skill_decomposition
+import utils.skill_index_sync as skill_index_sync
+
+DIM = 64
+
+
+class BagOfWordsModel:
+    """Deterministic stand-in for the sentence encoder: hashed bag of words."""
+
+    def __init__(self):
+        self.encoded = 0
+
+    def _vector(self, text):
+        vector = np.zeros(DIM, dtype=np.float32)
+        for word in text.lower().split():
+            vector[zlib.crc32(word.encode()) % DIM] += 1.0
+        return vector
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return self._vector(texts)
+        self.encoded += len(texts)
+        return np.stack([self._vector(text) for text in texts])
+
+
+def _index(model=None, **kwargs):
+    model = model or BagOfWordsModel()
+    provider = EmbeddingModelProvider("bag-of-words", loader=lambda name: model)
+    kwargs.setdefault("path", os.path.join(tempfile.mkdtemp(), "skills.skill_index.npz"))
+    return SkillIndex(provider=provider, **kwargs)
+
+
+def test_ivf_recall_against_exact_search():
+    rng = np.random.default_rng(7)
+    centers = normalize_rows(rng.normal(size=(40, 32)))
+    data = normalize_rows(centers[rng.integers(0, 40, 4000)] + 0.15 * rng.normal(size=(4000, 32)))
+    index = IVFIndex(32, nprobe=8, train_threshold=1000)
+    index.add(data[:2000])
+    assert index.is_trained
+    index.add(data[2000:])  # incremental: assigned to the existing lists
+    assert index.trained_size == 2000 and sum(len(l) for l in index.lists) == 4000
+
+    hits = 0
+    queries = normalize_rows(centers[rng.integers(0, 40, 50)] + 0.15 * rng.normal(size=(50, 32)))
+    for query in queries:
+        exact = set(np.argsort(-(data @ query))[:5])
+        ids, scores = index.search(query, k=5)
+        assert list(scores) == sorted(scores, reverse=True)
+        hits += len(exact & set(ids))
+    assert hits / (5 * len(queries)) >= 0.9
+
+
+def test_names_are_queued_then_embedded_in_one_batch():
+    model = BagOfWordsModel()
+    index = _index(model)
+    index.prepare()  # nothing saved, no seed
+    index.add_skill("Rust Programming", skill_id=3, subskills=["Ownership", "Borrowing", "Lifetimes"])
+    index.enqueue("rust programming", kind=KIND_SUBSKILL)  # duplicate name, ignored
+    assert len(index) == 0 and model.encoded == 0
+
+    matches = index.search("borrowing rules", k=2)
+    assert model.encoded == 4
+    assert matches[0].name == "Borrowing" and matches[0].parent == "Rust Programming"
+
+    best = index.search("rust systems programming", k=1, kinds=[KIND_SKILL])[0]
+    assert best.name == "Rust Programming" and best.skill_id == 3
+    assert best.subskills == ["Ownership", "Borrowing", "Lifetimes"]
+
+
+def test_index_is_persisted_and_reloaded():
+    index = _index(save_interval=0)
+    index.add_skill("Kubernetes", subskills=["Pods", "Services"])
+    index.flush()
+    assert os.path.exists(index.path)
+
+    model = BagOfWordsModel()
+    reloaded = _index(model, path=index.path)
+    assert reloaded.load() and len(reloaded) == 3
+    assert reloaded.search("pods", k=1)[0].name == "Pods"
+    assert model.encoded == 0  # nothing re-embedded
+
+    other_model = SkillIndex(provider=EmbeddingModelProvider("another-model", loader=lambda name: model), path=index.path)
+    assert not other_model.load()
+
+
+class BlockingModel(BagOfWordsModel):
+    """Encodes only once released, like a model that is slow to load."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def encode(self, texts, **kwargs):
+        if not isinstance(texts, str):
+            self.release.wait(5)
+        return super().encode(texts, **kwargs)
+
+
+def test_large_backlogs_are_embedded_in_the_background():
+    model = BlockingModel()
+    index = _index(model, inline_flush=2, flush_batch=3)
+    index.set_seed(lambda index: [index.enqueue(f"Skill number {i}") for i in range(10)])
+
+    started = time.monotonic()
+    assert index.search_embedding(model.encode("skill number 4"), k=1) == []  # served without waiting
+    assert time.monotonic() - started < 1
+    assert index.stats()["warming"]
+
+    model.release.set()
+    index.warm_in_background().join(5)
+    assert len(index) == 10 and model.encoded == 10
+    assert index.search("skill number 4", k=1)[0].name == "Skill number 4"
+
+    # A few new names are embedded by the search itself
+    index.enqueue("Elixir")
+    assert index.search("elixir", k=1)[0].name == "Elixir" and not index.stats()["warming"]
+
+
+def test_new_skill_rows_are_indexed_through_orm_hooks(session_factory, db):
+    db.add(Skill(name="Go Concurrency", subskills=["Goroutines", "Channels"]))
+    db.commit()
+
+    original = skill_index_sync.skill_index
+    skill_index_sync.skill_index = index = _index()
+    try:
+        skill_index_sync.register_skill_index_hooks(session_factory)
+        # Existing rows are seeded by the warm-up, new rows arrive via the hook and are embedded inline
+        # The lazy policy leaves the model unloaded until the first search
+        assert not skill_index_sync.warm_skill_index("lazy") and not index.provider.ready
+        assert skill_index_sync.warm_skill_index("background")
+        index.warm_in_background().join()
+        db.add(Skill(name="Terraform Modules", subskills=["Providers", "State"]))
+        db.commit()
+        assert index.search("terraform", k=1)[0].name == "Terraform Modules"
+        go = index.search("go concurrency", k=1, kinds=[KIND_SKILL])[0]
+        assert go.name == "Go Concurrency" and go.skill_id is not None
+        assert index.search("Machine Learning", k=1)[0].name == "Machine Learning"  # hierarchy names
+    finally:
+        event.remove(Skill, "after_insert", skill_index_sync._on_skill_saved)
+        event.remove(Skill, "after_update", skill_index_sync._on_skill_saved)
+        skill_index_sync.skill_index = original
+
+
+def test_decompose_skill_reuses_closest_known_tree():
+    model = BagOfWordsModel()
+    index = _index(model)
+    index.add_skill("Rust Programming", subskills=["Ownership", "Borrowing", "Lifetimes"])
+    index.warm()
+
+    original = (skill_decomposition.embedding_provider, skill_decomposition.ML_AVAILABLE, skill_decomposition.skill_index)
+    skill_decomposition.embedding_provider = index.provider
+    skill_decomposition.ML_AVAILABLE = True
+    skill_decomposition.skill_index = index
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            skill_decomposition.get_hierarchy_matrix().cache_dir = cache_dir
+            tree = skill_decomposition.decompose_skill("rust systems programming")
+        assert tree["description"] == "Similar to Rust Programming"
+        assert [child["name"] for child in tree["children"]] == ["Ownership", "Borrowing", "Lifetimes"]
+    finally:
+        (skill_decomposition.embedding_provider, skill_decomposition.ML_AVAILABLE,
+         skill_decomposition.skill_index) = original
+
+
+def test_decomposition_shares_the_backends_utility_singletons():
+    import utils.resource_search as resource_search
+    assert skill_decomposition.search_resources is resource_search.get_resources_for_skill
+    assert not any(name.startswith("backend.utils") for name in sys.modules)
+
+
+if __name__ == "__main__":
+    exit_code = pytest.main(["-q", __file__])
+    if exit_code == 0:
+        print("✅ Skill index checks passed")
+    sys.exit(exit_code)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached, bulk URL validation service.
+"""
+import sys
+import os
+import asyncio
+import time
+sys.path.append(os.path.dirname(__file__))
+
+from aiohttp import web
+
+import utils.circuit_breaker as circuit_breaker
+from utils.async_http import run_sync, close_session
+from utils.url_validator import URLValidator
+import utils.enhanced_uniqueness as enhanced_uniqueness
+
+SLOW_DELAY = 0.2
+
+
+class _Server:
+    """Local HTTP server on the scraper loop that counts HEAD requests per path."""
+
+    def __enter__(self):
+        self.requests = []
+
+        async def handle(request):
+            self.requests.append(request.path)
+            if request.path.startswith("/slow"):
+                await asyncio.sleep(SLOW_DELAY)
+            if request.path.startswith("/missing"):
+                return web.Response(status=404)
+            if request.path.startswith("/forbidden"):
+                return web.Response(status=403)
+            if request.path.startswith("/broken"):
+                return web.Response(status=503)
+            if request.path == "/moved":
+                raise web.HTTPFound("/error/not-found")
+            return web.Response(text="ok")
+
+        async def start():
+            app = web.Application()
+            app.router.add_route("*", "/{tail:.*}", handle)
+            self.runner = web.AppRunner(app)
+            await self.runner.setup()
+            site = web.TCPSite(self.runner, "127.0.0.1", 0)
+            await site.start()
+            return site._server.sockets[0].getsockname()[1]
+
+        self.base = f"http://127.0.0.1:{run_sync(start())}"
+        return self
+
+    def __exit__(self, *exc):
+        run_sync(close_session())
+        run_sync(self.runner.cleanup())
+        circuit_breaker.circuit_breakers.reset()
+
+
+def test_results_are_cached_with_separate_ttls():
+    with _Server() as server:
+        validator = URLValidator(ttl=60, negative_ttl=0.05)
+        ok, missing = f"{server.base}/ok", f"{server.base}/missing"
+
+        assert validator.validate_many([ok, missing, ok]) == {ok: True, missing: False}
+        assert sorted(server.requests) == ["/missing", "/ok"]
+
+        assert validator.validate_many([ok, missing]) == {ok: True, missing: False}
+        assert len(server.requests) == 2
+
+        time.sleep(0.06)  # the negative result expires, the positive one does not
+        validator.validate_many([ok, missing])
+        assert sorted(server.requests) == ["/missing", "/missing", "/ok"]
+        assert validator.stats()["negative_entries"] == 1
+
+
+def test_redirects_to_error_pages_fail():
+    with _Server() as server:
+        validator = URLValidator()
+        moved, ok = f"{server.base}/moved", f"{server.base}/ok"
+        assert validator.validate_many([moved, ok]) == {moved: False, ok: True}
+
+
+def test_bulk_validation_is_concurrent():
+    with _Server() as server:
+        validator = URLValidator(concurrency=8)
+        urls = [f"{server.base}/slow/{i}" for i in range(6)]
+        started = time.monotonic()
+        results = validator.validate_many(urls)
+        assert all(results[url] for url in urls)
+        assert time.monotonic() - started < SLOW_DELAY * 3
+
+
+def test_cache_is_bounded():
+    validator = URLValidator(max_entries=2)
+    for i in range(3):
+        validator.store(f"https://example.com/{i}", True)
+    assert validator.cached("https://example.com/0") is None
+    assert validator.cached("https://example.com/2") is True
+    assert validator.stats()["evictions"] == 1
+
+
+def test_sweep_refreshes_hot_urls():
+    with _Server() as server:
+        validator = URLValidator(ttl=60)
+        hot, cold = f"{server.base}/hot", f"{server.base}/cold"
+        validator.validate_many([hot, cold])
+        for _ in range(2):
+            validator.validate_many([hot])
+        assert validator.hot_urls(horizon=3600) == [hot]
+
+        assert run_sync(validator.revalidate_hot_async(horizon=3600)) == 1
+        assert server.requests.count("/hot") == 2 and server.requests.count("/cold") == 1
+
+
+def test_uniqueness_filter_validates_in_bulk():
+    with _Server() as server:
+        validator = URLValidator()
+        original = enhanced_uniqueness.url_validator
+        enhanced_uniqueness.url_validator = validator
+        try:
+            resources = [
+                {"title": "Python docs reference", "url": f"{server.base}/docs/a", "resource_type": "documentation", "quality_score": 90},
+                {"title": "Broken course page", "url": f"{server.base}/missing/b", "resource_type": "course", "quality_score": 90},
+                {"title": "Deep dive video series", "url": f"{server.base}/video/c", "resource_type": "video", "quality_score": 90},
+            ]
+            selected = enhanced_uniqueness.ensure_resource_uniqueness_and_quality(resources, "Python", max_resources=8)
+        finally:
+            enhanced_uniqueness.url_validator = original
+
+        assert {r["url"] for r in selected} == {f"{server.base}/docs/a", f"{server.base}/video/c"}
+        assert validator.stats()["checks"] == 3
+
+
+def test_head_checks_never_open_the_scrapers_breaker():
+    with _Server() as server:
+        validator = URLValidator(negative_ttl=0)
+        forbidden = [f"{server.base}/forbidden/{i}" for i in range(10)]
+        assert not any(validator.validate_many(forbidden).values())
+        # Hosts that reject HEAD with 403/405 are not treated as failing
+        head_breaker = circuit_breaker.get_circuit_breaker(server.base, "head")
+        assert head_breaker.state == circuit_breaker.CLOSED
+
+        validator.validate_many([f"{server.base}/broken/{i}" for i in range(10)])
+        assert head_breaker.state == circuit_breaker.OPEN
+        # Searches against the same host are unaffected
+        scraper_breaker = circuit_breaker.get_circuit_breaker(server.base)
+        assert scraper_breaker.state == circuit_breaker.CLOSED and scraper_breaker.allow_request()
+
+
+if __name__ == "__main__":
+    test_results_are_cached_with_separate_ttls()
+    test_redirects_to_error_pages_fail()
+    test_bulk_validation_is_concurrent()
+    test_cache_is_bounded()
+    test_sweep_refreshes_hot_urls()
+    test_uniqueness_filter_validates_in_bulk()
+    test_head_checks_never_open_the_scrapers_breaker()
+    print("✅ URL validation checks passed")
@@ -14,6 +14,10 @@ from models.models import (
     User, Skill, SubskillProgress, UserBehavior, QuizAttempt, 
     SkillProgress, Resource, UserRecommendation
 )
+from utils.user_skill_matrix import user_skill_matrix
+from utils.item_similarity import get_item_based_recommendations
+from utils.behavior_snapshot import get_behavior_snapshot, behavior_snapshot_cache
+from utils.behavior_buffer import behavior_buffer, make_event, write_events
 import logging
 
 logger = logging.getLogger(__name__)
@@ -35,38 +39,8 @@ class AdaptiveLearningEngine:
             Dict containing behavior analysis and insights
         """
         try:
-            # Get user's learning history
-            behaviors = db.query(UserBehavior).filter(
-                UserBehavior.user_id == user_id
-            ).order_by(UserBehavior.timestamp.desc()).limit(100).all()
-            
-            # Get quiz performance
-            quiz_attempts = db.query(QuizAttempt).filter(
-                QuizAttempt.user_id == user_id
-            ).order_by(QuizAttempt.completed_at.desc()).limit(20).all()
-            
-            # Get skill progress
-            skill_progress = db.query(SkillProgress).filter(
-                SkillProgress.user_id == user_id
-            ).all()
-            
-            # Analyze patterns
-            analysis = {
-                "learning_style": self._determine_learning_style(behaviors),
-                "preferred_difficulty": self._analyze_difficulty_preference(quiz_attempts),
-                "engagement_patterns": self._analyze_engagement_patterns(behaviors),
-                "completion_rate": self._calculate_completion_rate(skill_progress),
-                "average_session_time": self._calculate_average_session_time(behaviors),
-                "struggling_topics": self._identify_struggling_topics(quiz_attempts, skill_progress),
-                "strengths": self._identify_strengths(quiz_attempts, skill_progress),
-                "learning_pace": self._analyze_learning_pace(behaviors, skill_progress),
-                "recommended_adjustments": []
-            }
-            
-            # Generate recommendations
-            analysis["recommended_adjustments"] = self._generate_behavior_recommendations(analysis)
-            
-            return analysis
+            # One memoized, watermark-cached snapshot instead of re-querying and re-scanning per call
+            return get_behavior_snapshot(user_id, db).as_analysis()
             
         except Exception as e:
             logger.error(f"Error analyzing user behavior for user {user_id}: {str(e)}")
@@ -85,39 +59,54 @@ class AdaptiveLearningEngine:
             List of recommended skills/resources
         """
         try:
+            # Skills the target user already has
+            user_skills = {
+                skill_id: bool(completed) for skill_id, completed in db.query(
+                    SkillProgress.skill_id, SkillProgress.completed
+                ).filter(SkillProgress.user_id == user_id)
+            }
+            
+            # Cheapest first: merge the neighbour lists of the user's completed skills.
+            # A SAVEPOINT keeps a failure (e.g. no skill_similarities table yet) from
+            # rolling back the caller's pending work.
+            try:
+                with db.begin_nested():
+                    recommendations = get_item_based_recommendations(user_id, db, limit, user_skills=user_skills)
+            except Exception as e:
+                logger.warning(f"Item-based recommendations unavailable: {str(e)}")
+                recommendations = []
+            if recommendations:
+                return recommendations
+            
             # Find similar users
             similar_users = self._find_similar_users(user_id, db)
             
             if not similar_users:
                 return self._get_popular_recommendations(db, limit)
             
-            recommendations = []
-            
-            # Get skills that similar users have completed but target user hasn't
-            target_user_skills = set(
-                skill.skill_id for skill in db.query(SkillProgress).filter(
-                    SkillProgress.user_id == user_id
-                ).all()
-            )
-            
-            # Collect skills from similar users
+            # Collect skills that similar users have completed but target user hasn't (one query)
+            similarity_by_user = dict(similar_users)
             skill_scores = defaultdict(float)
-            
-            for similar_user_id, similarity_score in similar_users:
-                similar_user_skills = db.query(SkillProgress).filter(
-                    SkillProgress.user_id == similar_user_id,
-                    SkillProgress.completed == True
-                ).all()
-                
-                for skill_progress in similar_user_skills:
-                    if skill_progress.skill_id not in target_user_skills:
-                        skill_scores[skill_progress.skill_id] += similarity_score * skill_progress.progress_percentage
+            for similar_user_id, skill_id, progress_percentage in db.query(
+                SkillProgress.user_id, SkillProgress.skill_id, SkillProgress.progress_percentage
+            ).filter(
+                SkillProgress.user_id.in_(list(similarity_by_user)),
+                SkillProgress.completed == True
+            ):
+                if skill_id not in user_skills:
+                    skill_scores[skill_id] += similarity_by_user[similar_user_id] * (progress_percentage or 0.0)
             
             # Sort by score and get top recommendations
-            sorted_skills = sorted(skill_scores.items(), key=lambda x: x[1], reverse=True)
+            sorted_skills = sorted(skill_scores.items(), key=lambda x: x[1], reverse=True)[:limit]
+            skills = {
+                skill.id: skill for skill in db.query(Skill).filter(
+                    Skill.id.in_([skill_id for skill_id, _ in sorted_skills])
+                )
+            }
             
-            for skill_id, score in sorted_skills[:limit]:
-                skill = db.query(Skill).filter(Skill.id == skill_id).first()
+            recommendations = []
+            for skill_id, score in sorted_skills:
+                skill = skills.get(skill_id)
                 if skill:
                     recommendations.append({
                         "type": "skill",
@@ -302,184 +291,54 @@ class AdaptiveLearningEngine:
             metadata: Additional data (optional)
             db: Database session
         """
+        event = make_event(
+            user_id=user_id,
+            action_type=action_type,
+            skill_id=skill_id,
+            subskill_name=subskill_name,
+            resource_id=resource_id,
+            additional_data=metadata
+        )
+        
+        # Buffered write-behind; falls back to a synchronous write when the flusher isn't running
+        if behavior_buffer.record(event):
+            return
+        
         if not db:
             db = next(get_db())
         
         try:
-            behavior = UserBehavior(
-                user_id=user_id,
-                action_type=action_type,
-                skill_id=skill_id,
-                subskill_name=subskill_name,
-                resource_id=resource_id,
-                metadata=metadata or {}
-            )
-            
-            db.add(behavior)
+            write_events(db, [event])
             db.commit()
-            
-            # Update user's last activity
-            user = db.query(User).filter(User.id == user_id).first()
-            if user:
-                user.last_activity = datetime.utcnow()
-                db.commit()
+            behavior_snapshot_cache.forget(user_id, db)
+            behavior_buffer.notify_written({user_id})
             
         except Exception as e:
             logger.error(f"Error tracking user interaction: {str(e)}")
             db.rollback()
     
-    def _determine_learning_style(self, behaviors: List[UserBehavior]) -> str:
-        """Determine user's preferred learning style based on their behavior"""
-        if not behaviors:
-            return "balanced"
-        
-        # Count different types of resource interactions
-        resource_types = defaultdict(int)
-        for behavior in behaviors:
-            if behavior.action_type == "view_resource" and behavior.metadata:
-                resource_type = behavior.metadata.get("resource_type")
-                if resource_type:
-                    resource_types[resource_type] += 1
-        
-        if not resource_types:
-            return "balanced"
-        
-        # Determine preferred style
-        total_interactions = sum(resource_types.values())
-        video_ratio = resource_types.get("video", 0) / total_interactions
-        article_ratio = resource_types.get("article", 0) / total_interactions
-        code_ratio = resource_types.get("github", 0) / total_interactions
-        
-        if video_ratio > 0.5:
-            return "visual"
-        elif article_ratio > 0.5:
-            return "reading"
-        elif code_ratio > 0.4:
-            return "hands-on"
-        else:
-            return "balanced"
-    
-    def _analyze_difficulty_preference(self, quiz_attempts: List[QuizAttempt]) -> str:
-        """Analyze user's preferred difficulty level based on quiz performance"""
-        if not quiz_attempts:
-            return "beginner"
-        
-        # Get average performance on different difficulty levels
-        difficulty_scores = defaultdict(list)
-        
-        for attempt in quiz_attempts:
-            if attempt.questions_data:
-                for question in attempt.questions_data:
-                    difficulty = question.get("difficulty", "medium")
-                    # This is simplified - in practice, you'd track individual question performance
-                    score = attempt.score / attempt.total_questions
-                    difficulty_scores[difficulty].append(score)
-        
-        # Find the difficulty where user performs best (60-80% range)
-        optimal_difficulty = "beginner"
-        target_score_range = (0.6, 0.8)
-        
-        for difficulty, scores in difficulty_scores.items():
-            if scores:
-                avg_score = np.mean(scores)
-                if target_score_range[0] <= avg_score <= target_score_range[1]:
-                    optimal_difficulty = difficulty
-                    break
-        
-        return optimal_difficulty
-    
-    def _analyze_engagement_patterns(self, behaviors: List[UserBehavior]) -> Dict[str, Any]:
-        """Analyze when and how user engages with the platform"""
-        if not behaviors:
-            return {"peak_hours": [], "session_frequency": "low", "preferred_days": []}
-        
-        # Analyze time patterns
-        hours = [behavior.timestamp.hour for behavior in behaviors]
-        peak_hours = self._find_peak_hours(hours)
-        
-        # Analyze frequency
-        dates = [behavior.timestamp.date() for behavior in behaviors]
-        unique_dates = len(set(dates))
-        days_span = (max(dates) - min(dates)).days if len(set(dates)) > 1 else 1
-        session_frequency = "high" if unique_dates / max(days_span, 1) > 0.5 else "medium" if unique_dates / max(days_span, 1) > 0.2 else "low"
-        
-        return {
-            "peak_hours": peak_hours,
-            "session_frequency": session_frequency,
-            "total_sessions": unique_dates,
-            "days_active": days_span
-        }
-    
     def _find_similar_users(self, user_id: int, db: Session, limit: int = 10) -> List[Tuple[int, float]]:
         """Find users with similar learning patterns"""
         try:
             # Get target user's skill progress
-            target_skills = db.query(SkillProgress).filter(
+            target_skills = db.query(SkillProgress.skill_id, SkillProgress.progress_percentage).filter(
                 SkillProgress.user_id == user_id
             ).all()
             
             if not target_skills:
                 return []
             
-            target_vector = self._create_user_vector(target_skills)
-            
-            # Get other users' skill progress
-            all_users = db.query(User.id).filter(User.id != user_id).all()
-            similarities = []
-            
-            for (other_user_id,) in all_users:
-                other_skills = db.query(SkillProgress).filter(
-                    SkillProgress.user_id == other_user_id
-                ).all()
-                
-                if other_skills:
-                    other_vector = self._create_user_vector(other_skills)
-                    similarity = self._calculate_cosine_similarity(target_vector, other_vector)
-                    
-                    if similarity > self.similarity_threshold:
-                        similarities.append((other_user_id, similarity))
-            
-            # Sort by similarity and return top matches
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            return similarities[:limit]
+            # Cosine similarity to every other user in one sparse matrix-vector product
+            user_skill_matrix.ensure_fresh(db)
+            progress = {skill_id: (percentage or 0.0) / 100.0 for skill_id, percentage in target_skills}
+            return user_skill_matrix.similar_users(
+                user_id, progress, k=limit, threshold=self.similarity_threshold
+            )
             
         except Exception as e:
             logger.error(f"Error finding similar users: {str(e)}")
             return []
     
-    def _create_user_vector(self, skill_progress: List[SkillProgress]) -> np.ndarray:
-        """Create a vector representation of user's skill progress"""
-        # This is a simplified version - could be enhanced with more sophisticated features
-        skill_ids = [sp.skill_id for sp in skill_progress]
-        progress_values = [sp.progress_percentage for sp in skill_progress]
-        
-        # Create a sparse vector (in practice, you'd use a more sophisticated approach)
-        max_skill_id = max(skill_ids) if skill_ids else 1
-        vector = np.zeros(max_skill_id + 1)
-        
-        for skill_id, progress in zip(skill_ids, progress_values):
-            vector[skill_id] = progress / 100.0
-        
-        return vector
-    
-    def _calculate_cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors"""
-        # Ensure vectors are same length
-        max_len = max(len(vec1), len(vec2))
-        if len(vec1) < max_len:
-            vec1 = np.pad(vec1, (0, max_len - len(vec1)))
-        if len(vec2) < max_len:
-            vec2 = np.pad(vec2, (0, max_len - len(vec2)))
-        
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return dot_product / (norm1 * norm2)
-    
     def _get_popular_recommendations(self, db: Session, limit: int) -> List[Dict[str, Any]]:
         """Get popular skills as fallback recommendations"""
         # Get most popular skills (most users enrolled)
@@ -518,28 +377,6 @@ class AdaptiveLearningEngine:
         }
     
     # Additional helper methods would be implemented here...
-    def _calculate_completion_rate(self, skill_progress: List[SkillProgress]) -> float:
-        """Calculate user's overall completion rate"""
-        if not skill_progress:
-            return 0.0
-        
-        total_progress = sum(sp.progress_percentage for sp in skill_progress)
-        return total_progress / (len(skill_progress) * 100)
-    
-    def _identify_struggling_topics(self, quiz_attempts: List[QuizAttempt], 
-                                  skill_progress: List[SkillProgress]) -> List[str]:
-        """Identify topics where user is struggling"""
-        struggling = []
-        
-        # Analyze quiz performance
-        for attempt in quiz_attempts:
-            if attempt.score / attempt.total_questions < 0.6:
-                skill = next((sp for sp in skill_progress if sp.skill_id == attempt.skill_id), None)
-                if skill:
-                    struggling.append(skill.skill.name if hasattr(skill, 'skill') else f"Skill {attempt.skill_id}")
-        
-        return list(set(struggling))
-    
     def _estimate_completion_time(self, skill: Skill, learning_pace: str) -> str:
         """Estimate completion time based on skill and user's pace"""
         base_hours = len(skill.subskills) * 8 if skill.subskills else 40  # 8 hours per subskill
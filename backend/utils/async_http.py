@@ -0,0 +1,272 @@
+"""
+Shared Async HTTP Client
+========================
+
+Connection-pooled aiohttp sessions for the resource scrapers.
+
+Every scraper request goes through one ``aiohttp.ClientSession`` per event
+loop, so connections are kept alive and reused across searches, DNS lookups
+are cached, and concurrent requests to a single host are capped by the
+connector instead of by ad-hoc sleeps.
+
+Every request also passes through the host's circuit breaker, so a host that
+keeps failing is skipped instantly until its cool-down expires, and through
+the host's token bucket in ``utils.rate_limiter``. Waiting for a token counts
+against the request's timeout; a request that would wait longer fails with
+``RateLimitExceeded`` instead. Callers that
+pass ``use_cache=True`` are served from the on-disk response cache in
+``utils.http_cache`` when possible; expired entries are revalidated with a
+conditional GET, and a ``cacheable`` check keeps block pages out of the cache.
+
+Synchronous callers use ``run_sync``, which runs coroutines on a dedicated
+background event loop. That loop owns its own long-lived session, so the
+legacy blocking API shares one pool too.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Callable, Dict, NamedTuple, Optional
+
+import aiohttp
+
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .http_cache import get_http_cache
+from .rate_limiter import RateLimitExceeded, host_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Connection pool settings (per event loop)
+SCRAPER_POOL_SIZE = int(os.environ.get("SCRAPER_POOL_SIZE", "64"))
+SCRAPER_POOL_SIZE_PER_HOST = int(os.environ.get("SCRAPER_POOL_SIZE_PER_HOST", "6"))
+SCRAPER_DNS_CACHE_TTL = int(os.environ.get("SCRAPER_DNS_CACHE_TTL", "300"))
+SCRAPER_KEEPALIVE_TIMEOUT = float(os.environ.get("SCRAPER_KEEPALIVE_TIMEOUT", "30"))
+
+# HEAD requests (URL validation) never share the scrapers' per-host breakers
+HEAD_BREAKER_NAMESPACE = "head"
+
+
+class FetchResult(NamedTuple):
+    status: int
+    text: str
+    url: str
+    from_cache: bool = False
+
+
+_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+_sessions_lock = threading.Lock()
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def _create_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=SCRAPER_POOL_SIZE,
+        limit_per_host=SCRAPER_POOL_SIZE_PER_HOST,
+        ttl_dns_cache=SCRAPER_DNS_CACHE_TTL,
+        keepalive_timeout=SCRAPER_KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the pooled session for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    with _sessions_lock:
+        session = _sessions.get(loop)
+        if session is None or session.closed:
+            # Drop sessions whose loops have gone away
+            for stale_loop in [l for l in _sessions if l.is_closed()]:
+                del _sessions[stale_loop]
+            session = _create_session()
+            _sessions[loop] = session
+        return session
+
+
+async def _fetch_network(url: str, headers: Dict, timeout: float):
+    """One GET through the shared pool, the host's circuit breaker and its rate limit."""
+    breaker = get_circuit_breaker(url)
+    if not breaker.allow_request():
+        raise CircuitOpenError(breaker.name)
+    try:
+        waited = await host_rate_limiter.acquire_async(url, max_wait=timeout)
+    except (RateLimitExceeded, asyncio.CancelledError):
+        breaker.release()
+        raise
+
+    session = get_session()
+    client_timeout = aiohttp.ClientTimeout(total=max(timeout - waited, 0.1))
+    try:
+        async with session.get(url, headers=headers, timeout=client_timeout) as response:
+            text = await response.text(errors="replace")
+            result = FetchResult(response.status, text, str(response.url))
+            validators = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    except Exception:
+        breaker.record_failure()
+        raise
+
+    breaker.record_status(result.status)
+    return result, validators
+
+
+async def fetch_text(url: str, headers: Dict = None, timeout: float = 5, use_cache: bool = False,
+                     cacheable: Callable[[str], bool] = None) -> FetchResult:
+    """
+    GET a URL through the shared pool and return its status and body.
+
+    Args:
+        url: URL to fetch
+        headers: Request headers
+        timeout: Total seconds allowed for the request, including the body
+        use_cache: Serve from / store into the persistent response cache
+        cacheable: Check a 200 body must pass to be stored (e.g. "has at least one result").
+            A page that fails it is returned uncached, or replaced by the cached copy if there is one
+
+    Returns:
+        FetchResult with status, decoded body and final URL
+
+    Raises:
+        CircuitOpenError: If the host's circuit breaker is open (and nothing is cached)
+        RateLimitExceeded: If the host's rate limit needs a longer wait than ``timeout`` (and nothing is cached)
+        asyncio.TimeoutError: If the request exceeds ``timeout``
+        aiohttp.ClientError: On connection or protocol errors
+    """
+    cache = get_http_cache() if use_cache else None
+    cached = await asyncio.to_thread(cache.get, url) if cache is not None else None
+    if cached is not None and cached.is_fresh:
+        return FetchResult(cached.status, cached.text, cached.url, from_cache=True)
+
+    request_headers = dict(headers or {})
+    if cached is not None:
+        if cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+
+    try:
+        result, (etag, last_modified) = await _fetch_network(url, request_headers, timeout)
+    except (CircuitOpenError, RateLimitExceeded, asyncio.TimeoutError, aiohttp.ClientError):
+        if cached is None:
+            raise
+        # Stale beats nothing while the host is failing
+        cache.record_stale_served()
+        return FetchResult(cached.status, cached.text, cached.url, from_cache=True)
+
+    if cache is not None:
+        if result.status == 304 and cached is not None:
+            await asyncio.to_thread(cache.refresh, url, etag, last_modified)
+            return FetchResult(cached.status, cached.text, cached.url, from_cache=True)
+        if result.status == 200:
+            if cacheable is not None and not cacheable(result.text):
+                # A block or CAPTCHA page served with 200: the last good copy beats it
+                cache.record_rejected()
+                if cached is not None:
+                    cache.record_stale_served()
+                    return FetchResult(cached.status, cached.text, cached.url, from_cache=True)
+                return result
+            await asyncio.to_thread(cache.put, url, result.status, result.text, result.url, etag, last_modified)
+    return result
+
+
+async def head(url: str, headers: Dict = None, timeout: float = 5) -> FetchResult:
+    """
+    HEAD a URL (following redirects) through the shared pool and the host's HEAD circuit breaker.
+
+    HEAD uses its own breaker per host (see ``HEAD_BREAKER_NAMESPACE``), and
+    only throttling (429), server errors and connection failures count
+    against it: many hosts answer HEAD with 403 or 405.
+
+    Returns:
+        FetchResult with status, an empty body and the final URL after redirects
+
+    Raises:
+        CircuitOpenError: If the host's circuit breaker is open
+        asyncio.TimeoutError: If the request exceeds ``timeout``
+        aiohttp.ClientError: On connection or protocol errors
+    """
+    breaker = get_circuit_breaker(url, HEAD_BREAKER_NAMESPACE)
+    if not breaker.allow_request():
+        raise CircuitOpenError(breaker.name)
+
+    session = get_session()
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    try:
+        async with session.head(url, headers=headers, timeout=client_timeout, allow_redirects=True) as response:
+            result = FetchResult(response.status, "", str(response.url))
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    except Exception:
+        breaker.record_failure()
+        raise
+
+    if result.status == 429 or result.status >= 500:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return result
+
+
+async def close_session():
+    """Close the running loop's session (call on application shutdown)."""
+    loop = asyncio.get_running_loop()
+    with _sessions_lock:
+        session = _sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="scraper-loop", daemon=True)
+            thread.start()
+            _background_loop = loop
+        return _background_loop
+
+
+def run_sync(coro, timeout: float = None):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Works whether or not the calling thread already has a running event loop,
+    because the coroutine always executes on the background scraper loop.
+
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait for the result (None waits indefinitely)
+
+    Returns:
+        The coroutine's result
+    """
+    loop = _get_background_loop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from the scraper loop itself")
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    return future.result(timeout)
+
+
+def pool_stats() -> Dict:
+    """Connection pool configuration and number of live sessions."""
+    with _sessions_lock:
+        live_sessions = sum(1 for session in _sessions.values() if not session.closed)
+    return {
+        "live_sessions": live_sessions,
+        "pool_size": SCRAPER_POOL_SIZE,
+        "pool_size_per_host": SCRAPER_POOL_SIZE_PER_HOST,
+        "dns_cache_ttl": SCRAPER_DNS_CACHE_TTL,
+        "keepalive_timeout": SCRAPER_KEEPALIVE_TIMEOUT,
+    }
@@ -0,0 +1,508 @@
+"""
+Write-Behind Behaviour Tracking
+===============================
+
+``track_user_interaction`` no longer writes to the database on the request
+path. Interactions are appended to a bounded in-process queue and a
+background thread flushes them in batches.
+
+- A flush inserts every queued ``user_behavior`` row with one executemany
+  INSERT (chunked by BEHAVIOR_BUFFER_BATCH_SIZE). Each user's
+  ``last_activity`` is set with one executemany UPDATE. Both happen in a
+  single transaction.
+- Backpressure: when the queue is full, the recording thread flushes it
+  inline before enqueueing. Producers are slowed down rather than events
+  dropped.
+- Failed flushes (database outage) are retried by the next flush. With the
+  WAL, the failed events are read back from their segments rather than
+  held in memory, so nothing is dropped however long the outage. Without
+  it, at most BEHAVIOR_BUFFER_MAX_SIZE failed events are kept and older
+  ones are dropped with a warning.
+- Shutdown: ``close()`` stops the flusher and flushes whatever is still
+  queued. It is called from the FastAPI shutdown hook and registered with
+  ``atexit``.
+- Durability (BEHAVIOR_BUFFER_WAL_PATH): every queued event is also
+  appended as a JSON line to a local write-ahead log.
+  - The path is a prefix shared by all workers. Each process writes its own
+    ``<path>.<owner>.log`` (owner is the pid) and holds an exclusive lock on
+    ``<path>.<owner>.lock`` while it runs.
+  - Each flush rotates the log into a segment, which is deleted once its
+    events are committed. If the rotation fails, the events stay in the
+    log and the flush is retried.
+  - ``recover()`` runs on start. It replays the logs and segments of
+    owners whose lock is free (crashed or stopped workers), including a
+    previous process that had the same pid. It never touches a live
+    worker's files. Delivery is at-least-once: a crash between the commit
+    and the segment delete replays those events.
+  - Telling live owners apart needs ``fcntl`` (POSIX). Elsewhere only this
+    process's own leftovers are replayed.
+
+When the flusher is not running (scripts, tests), events are written
+synchronously through the same batched path.
+
+Configuration (environment):
+    BEHAVIOR_BUFFER_ENABLED         buffer interactions (false writes them synchronously)
+    BEHAVIOR_BUFFER_MAX_SIZE        queued events before producers flush inline
+    BEHAVIOR_BUFFER_BATCH_SIZE      rows per executemany chunk; also wakes the flusher early
+    BEHAVIOR_BUFFER_FLUSH_INTERVAL  seconds between background flushes
+    BEHAVIOR_BUFFER_WAL_PATH        prefix of the per-process event logs for crash recovery (empty disables them)
+    BEHAVIOR_BUFFER_WAL_FSYNC       fsync the log after every event
+"""
+
+import atexit
+import glob
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: whether another worker is alive cannot be told
+    fcntl = None
+
+from sqlalchemy import bindparam
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from models.models import User, UserBehavior
+
+logger = logging.getLogger(__name__)
+
+BEHAVIOR_BUFFER_ENABLED = os.environ.get("BEHAVIOR_BUFFER_ENABLED", "true").lower() == "true"
+BEHAVIOR_BUFFER_MAX_SIZE = int(os.environ.get("BEHAVIOR_BUFFER_MAX_SIZE", "10000"))
+BEHAVIOR_BUFFER_BATCH_SIZE = int(os.environ.get("BEHAVIOR_BUFFER_BATCH_SIZE", "500"))
+BEHAVIOR_BUFFER_FLUSH_INTERVAL = float(os.environ.get("BEHAVIOR_BUFFER_FLUSH_INTERVAL", "1.0"))
+BEHAVIOR_BUFFER_WAL_PATH = os.environ.get("BEHAVIOR_BUFFER_WAL_PATH", "")
+BEHAVIOR_BUFFER_WAL_FSYNC = os.environ.get("BEHAVIOR_BUFFER_WAL_FSYNC", "false").lower() == "true"
+
+_EVENT_FIELDS = ("user_id", "action_type", "skill_id", "subskill_name", "resource_id", "additional_data", "timestamp")
+
+
+def make_event(user_id: int, action_type: str, skill_id: int = None, subskill_name: str = None,
+               resource_id: int = None, additional_data: Dict = None,
+               timestamp: Optional[datetime] = None) -> Dict[str, Any]:
+    """A ``user_behavior`` row, stamped with the time of the interaction rather than the flush."""
+    return {
+        "user_id": user_id,
+        "action_type": action_type,
+        "skill_id": skill_id,
+        "subskill_name": subskill_name,
+        "resource_id": resource_id,
+        "additional_data": additional_data or {},
+        "timestamp": timestamp or datetime.utcnow(),
+    }
+
+
+def write_events(db: Session, events: List[Dict[str, Any]], batch_size: int = BEHAVIOR_BUFFER_BATCH_SIZE) -> int:
+    """
+    Insert behaviour events and bump each user's ``last_activity`` and ``dashboard_version``; does not commit.
+
+    Args:
+        db: Database session
+        events: Rows from ``make_event``
+        batch_size: Rows per executemany INSERT
+
+    Returns:
+        Number of events written
+    """
+    if not events:
+        return 0
+    for start in range(0, len(events), batch_size):
+        db.execute(UserBehavior.__table__.insert(), events[start:start + batch_size])
+
+    last_activity: Dict[int, datetime] = {}
+    for event in events:
+        user_id = event["user_id"]
+        if user_id is not None and (user_id not in last_activity or event["timestamp"] > last_activity[user_id]):
+            last_activity[user_id] = event["timestamp"]
+    if last_activity:
+        users = User.__table__
+        db.execute(
+            users.update().where(users.c.id == bindparam("_user_id")).values(
+                last_activity=bindparam("_last_activity"), dashboard_version=users.c.dashboard_version + 1),
+            [{"_user_id": user_id, "_last_activity": timestamp} for user_id, timestamp in last_activity.items()]
+        )
+    return len(events)
+
+
+class BehaviorEventBuffer:
+    """Bounded queue of behaviour events, flushed to the database in batches."""
+
+    def __init__(self, session_factory=SessionLocal, max_size: int = BEHAVIOR_BUFFER_MAX_SIZE,
+                 batch_size: int = BEHAVIOR_BUFFER_BATCH_SIZE, wal_path: Optional[str] = BEHAVIOR_BUFFER_WAL_PATH,
+                 wal_fsync: bool = BEHAVIOR_BUFFER_WAL_FSYNC, enabled: bool = BEHAVIOR_BUFFER_ENABLED):
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.wal_base = wal_path or None
+        self.wal_path: Optional[str] = None  # this process's log, set once its lock is held
+        self.wal_fsync = wal_fsync
+        self.enabled = enabled
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_size)
+        self._pending: List[Dict[str, Any]] = []  # drained, still in the active log (rotation failed)
+        self._retry: List[Dict[str, Any]] = []  # failed to write and not readable from a segment
+        self._lock = threading.Lock()  # orders WAL appends with enqueues
+        self._flush_lock = threading.Lock()
+        self._wal_file = None
+        self._wal_lock_file = None
+        self._wal_gap = False  # an append to the active log failed
+        self._wal_segments: List[str] = []  # rotated, not yet committed
+        self._reread_segments: List[str] = []  # segments of failed flushes, read back on the next flush
+        self._segment_counter = 0
+        self.dropped = 0
+        self._listeners: List[Callable] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._atexit_registered = False
+        self.recorded = 0
+        self.written = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.backpressure_flushes = 0
+        self.recovered = 0
+        self.last_flush_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_flush_listener(self, listener: Callable):
+        """Call ``listener(user_ids)`` after every successful flush (e.g. to queue recommendation refreshes)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    # ---- producers ----
+
+    def record(self, event: Dict[str, Any]) -> bool:
+        """
+        Queue an event for the next flush.
+
+        Args:
+            event: Row from ``make_event``
+
+        Returns:
+            False if the buffer is not running (the caller should write synchronously)
+        """
+        if not self.enabled or not self.running:
+            return False
+        while True:
+            with self._lock:
+                try:
+                    self._queue.put_nowait(event)
+                except queue.Full:
+                    pass
+                else:
+                    self._append_wal(event)
+                    self.recorded += 1
+                    if self._queue.qsize() >= self.batch_size:
+                        self._wake.set()
+                    return True
+            # Backpressure: the producer drains the queue itself before enqueueing
+            self.backpressure_flushes += 1
+            self.flush()
+
+    # ---- write-ahead log ----
+
+    def _claim_wal(self):
+        """Lock ``<base>.<owner>.lock`` for this process and use ``<base>.<owner>.log`` as its log."""
+        if self.wal_base is None or self._wal_lock_file is not None:
+            return
+        owner, attempt = str(os.getpid()), 0
+        while True:
+            lock_file = open(f"{self.wal_base}.{owner}.lock", "a")
+            if _try_lock(lock_file):
+                break
+            # Another buffer holds this owner (a second instance in this process)
+            lock_file.close()
+            attempt += 1
+            owner = f"{os.getpid()}-{attempt}"
+        self._wal_lock_file = lock_file
+        self.wal_path = f"{self.wal_base}.{owner}.log"
+
+    def _release_wal(self):
+        """Drop this process's lock; the lock file goes too once no log or segment is left."""
+        if self._wal_lock_file is None:
+            return
+        lock_path = self._wal_lock_file.name
+        if not self._wal_segments and not os.path.exists(self.wal_path):
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+        self._wal_lock_file.close()
+        self._wal_lock_file = None
+
+    def _append_wal(self, event: Dict[str, Any]):
+        if self.wal_path is None:
+            return
+        try:
+            if self._wal_file is None:
+                self._wal_file = open(self.wal_path, "a", encoding="utf-8")
+            self._wal_file.write(json.dumps({**event, "timestamp": event["timestamp"].isoformat()}) + "\n")
+            self._wal_file.flush()
+            if self.wal_fsync:
+                os.fsync(self._wal_file.fileno())
+        except OSError as e:
+            self._wal_gap = True
+            logger.warning(f"Could not append to behaviour WAL {self.wal_path}: {e}")
+
+    def _rotate_wal(self) -> Optional[str]:
+        """Move the active log aside as a segment holding exactly the events being drained."""
+        if self.wal_path is None:
+            return None
+        if self._wal_file is not None:
+            self._wal_file.close()
+            self._wal_file = None
+        if not os.path.exists(self.wal_path):
+            return None
+        self._segment_counter += 1
+        segment = f"{self.wal_path}.{int(time.time() * 1000)}-{self._segment_counter}"
+        os.replace(self.wal_path, segment)
+        self._wal_segments.append(segment)
+        return segment
+
+    def _delete_segments(self, segments: List[str]):
+        for segment in segments:
+            try:
+                os.remove(segment)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _read_wal(path: str) -> List[Dict[str, Any]]:
+        events = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from a crash mid-write
+                data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+                events.append({field: data.get(field) for field in _EVENT_FIELDS})
+        return events
+
+    def _orphaned_logs(self):
+        """(lock file or None, paths) for every owner whose events nobody is going to write."""
+        for lock_path in sorted(glob.glob(f"{glob.escape(self.wal_base)}.*.lock")):
+            log_path = lock_path[:-len(".lock")] + ".log"
+            if log_path == self.wal_path:
+                # A previous process with our owner name; our own live files are skipped
+                idle = self._wal_file is None and not self._pending
+                paths = [log_path] if idle and os.path.exists(log_path) else []
+                paths += [path for path in sorted(glob.glob(f"{glob.escape(log_path)}.*"))
+                          if path not in self._wal_segments]
+                yield None, paths
+                continue
+            if fcntl is None:
+                continue
+            try:
+                lock_file = open(lock_path, "r")
+            except FileNotFoundError:
+                continue  # its owner just shut down cleanly
+            if not _try_lock(lock_file):
+                lock_file.close()  # a live worker
+                continue
+            paths = [log_path] if os.path.exists(log_path) else []
+            yield lock_file, paths + sorted(glob.glob(f"{glob.escape(log_path)}.*"))
+
+    def recover(self) -> int:
+        """Replay events left by crashed or stopped workers; returns how many were written."""
+        if self.wal_base is None:
+            return 0
+        recovered = 0
+        with self._flush_lock:
+            self._claim_wal()
+            for lock_file, paths in self._orphaned_logs():
+                try:
+                    events = [event for path in paths for event in self._read_wal(path)]
+                    if events:
+                        db = self.session_factory()
+                        try:
+                            write_events(db, events, self.batch_size)
+                            db.commit()
+                        except Exception:
+                            db.rollback()
+                            raise
+                        finally:
+                            db.close()
+                        self.notify_written({event["user_id"] for event in events})
+                    self._delete_segments(paths)
+                    if lock_file is not None:
+                        self._delete_segments([lock_file.name])
+                    recovered += len(events)
+                finally:
+                    if lock_file is not None:
+                        lock_file.close()
+        self.recovered += recovered
+        if recovered:
+            logger.info(f"Recovered {recovered} behaviour events from {self.wal_base}.*")
+        return recovered
+
+    # ---- flushing ----
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def flush(self) -> int:
+        """Write everything queued in one transaction; returns the number of events written."""
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending + self._drain()
+                self._pending = []
+                try:
+                    segment = self._rotate_wal()
+                except OSError as e:
+                    # The batch is still in the active log; the next flush rotates it again
+                    self._pending = batch
+                    self.failed_flushes += 1
+                    logger.warning(f"Could not rotate behaviour WAL {self.wal_path}, flush postponed: {e}")
+                    return 0
+                gap, self._wal_gap = self._wal_gap, False
+                segments = list(self._wal_segments)
+                reread = list(self._reread_segments)
+                retry, self._retry = self._retry, []
+
+            events = [event for path in reread for event in self._read_wal(path)] + retry + batch
+            if not events:
+                self._forget_segments(segments)
+                return 0
+
+            started = time.perf_counter()
+            db = self.session_factory()
+            try:
+                write_events(db, events, self.batch_size)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                self.failed_flushes += 1
+                self._keep_for_retry(segment, gap, reread, retry, batch)
+                logger.warning(f"Behaviour flush of {len(events)} events failed: {e}")
+                return 0
+            finally:
+                db.close()
+
+            self._forget_segments(segments)
+            self.written += len(events)
+            self.flushes += 1
+            self.last_flush_seconds = round(time.perf_counter() - started, 4)
+        self.notify_written({event["user_id"] for event in events})
+        return len(events)
+
+    def _keep_for_retry(self, segment, gap, reread, retry, batch):
+        """Hold a failed flush for the next one: on disk when its segment is complete, else in memory."""
+        with self._lock:
+            if segment is not None and not gap:
+                self._reread_segments = reread + [segment]
+                self._retry = retry
+                return
+            self._reread_segments = reread
+            self._retry = retry + batch
+            if self.wal_path is None and len(self._retry) > self.max_size:
+                dropped = len(self._retry) - self.max_size
+                self._retry = self._retry[-self.max_size:]
+                self.dropped += dropped
+                logger.warning(f"Dropped {dropped} behaviour events after repeated flush failures (no WAL)")
+
+    def _forget_segments(self, segments: List[str]):
+        with self._lock:
+            self._wal_segments = [s for s in self._wal_segments if s not in segments]
+            self._reread_segments = [s for s in self._reread_segments if s not in segments]
+        self._delete_segments(segments)
+
+    def notify_written(self, user_ids):
+        """Tell flush listeners about events written outside the buffer."""
+        for listener in self._listeners:
+            try:
+                listener(user_ids)
+            except Exception as e:
+                logger.warning(f"Behaviour flush listener failed: {e}")
+
+    # ---- lifecycle ----
+
+    def start(self, interval: float = BEHAVIOR_BUFFER_FLUSH_INTERVAL):
+        """Replay any WAL left by a crash, then flush every ``interval`` seconds on a daemon thread."""
+        if not self.enabled or self.running:
+            return
+        try:
+            self.recover()
+        except Exception as e:
+            logger.error(f"Behaviour WAL recovery failed (segments kept for the next start): {e}")
+        self._stop.clear()
+
+        def flush_loop():
+            while not self._stop.is_set():
+                self._wake.wait(interval)
+                self._wake.clear()
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.warning(f"Behaviour flush failed: {e}")
+
+        self._thread = threading.Thread(target=flush_loop, name="behavior-flush", daemon=True)
+        self._thread.start()
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+
+    def close(self, timeout: float = 10.0):
+        """Stop the flusher and write everything still queued."""
+        thread, self._thread = self._thread, None
+        self._stop.set()
+        self._wake.set()
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+        with self._lock:
+            if self._wal_file is not None:
+                self._wal_file.close()
+                self._wal_file = None
+            # Unwritten events stay on disk for whichever worker starts next
+            self._release_wal()
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": self.enabled,
+            "running": self.running,
+            "queued": self._queue.qsize() + len(self._pending) + len(self._retry),
+            "retry_segments": len(self._reread_segments),
+            "max_size": self.max_size,
+            "recorded": self.recorded,
+            "written": self.written,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "backpressure_flushes": self.backpressure_flushes,
+            "recovered": self.recovered,
+            "dropped": self.dropped,
+            "last_flush_seconds": self.last_flush_seconds,
+            "wal": self.wal_path,
+        }
+
+
+def _try_lock(lock_file) -> bool:
+    """Take an exclusive, non-blocking lock; always succeeds without ``fcntl``."""
+    if fcntl is None:
+        return True
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+# Global instance
+behavior_buffer = BehaviorEventBuffer()
+
+
+def get_behavior_buffer_stats() -> Dict:
+    return behavior_buffer.stats()
@@ -0,0 +1,322 @@
+"""
+User Behaviour Snapshots
+========================
+
+Everything ``AdaptiveLearningEngine.analyze_user_behavior`` reports about a
+user comes from one ``UserBehaviorSnapshot``.
+
+- A snapshot is built from three column-only queries: the last 100
+  behaviour events, the last 20 quiz attempts and the user's skill
+  progress. Each result set is walked once into numpy columns, and every
+  metric is then derived from those arrays with vectorised reductions.
+- Snapshots are memoized on the request's session (``db.info``), so nested
+  calls within one request (e.g. ``generate_personalized_learning_path``)
+  reuse the first one.
+- Across requests they are cached per user, keyed by a watermark: the
+  user's last behaviour id, plus the last quiz attempt id and the count
+  and total of their skill progress. The watermark is read in one query.
+  A snapshot is only rebuilt when new events arrive.
+
+Configuration (environment):
+    BEHAVIOR_SNAPSHOT_CACHE_SIZE  users kept in the cross-request cache
+"""
+
+import copy
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from models.models import Skill, SkillProgress, UserBehavior, QuizAttempt
+
+logger = logging.getLogger(__name__)
+
+BEHAVIOR_SNAPSHOT_CACHE_SIZE = int(os.environ.get("BEHAVIOR_SNAPSHOT_CACHE_SIZE", "5000"))
+
+BEHAVIOR_WINDOW = 100
+QUIZ_WINDOW = 20
+
+# Quiz difficulties where the user scores in this range are "just right"
+TARGET_SCORE_RANGE = (0.6, 0.8)
+
+_SESSION_KEY = "behavior_snapshots"
+
+
+class UserBehaviorSnapshot:
+    """Behaviour analysis of one user, computed once from columnar arrays."""
+
+    def __init__(self, user_id: int, watermark: Tuple = (), behaviors=(), quiz_attempts=(), skill_progress=()):
+        """
+        Args:
+            user_id: User the snapshot describes
+            watermark: Value of ``read_watermark`` the rows were loaded at
+            behaviors: ``(action_type, timestamp, additional_data)`` rows, newest first
+            quiz_attempts: ``(skill_id, score, total_questions, questions_data)`` rows, newest first
+            skill_progress: ``(skill_id, progress_percentage, skill_name)`` rows
+        """
+        self.user_id = user_id
+        self.watermark = watermark
+        self.analysis = self._analyze(behaviors, quiz_attempts, skill_progress)
+
+    def as_analysis(self) -> Dict[str, Any]:
+        """A copy of the analysis dict, safe for callers to modify."""
+        return copy.deepcopy(self.analysis)
+
+    # ---- one pass per result set ----
+
+    @staticmethod
+    def _behavior_columns(behaviors) -> Dict[str, np.ndarray]:
+        count = len(behaviors)
+        hours = np.zeros(count, dtype=np.int64)
+        days = np.zeros(count, dtype=np.int64)
+        minutes = np.zeros(count, dtype=np.float64)
+        completions = np.zeros(count, dtype=bool)
+        resource_types = np.empty(count, dtype=object)
+        for i, (action_type, timestamp, data) in enumerate(behaviors):
+            data = data or {}
+            if timestamp is not None:
+                hours[i] = timestamp.hour
+                days[i] = timestamp.toordinal()
+            minutes[i] = data.get("time_spent_minutes") or 0
+            completions[i] = action_type == "complete_subskill"
+            resource_types[i] = data.get("resource_type") if action_type == "view_resource" else None
+        return {"hours": hours, "days": days, "minutes": minutes,
+                "completions": completions, "resource_types": resource_types}
+
+    @staticmethod
+    def _quiz_columns(quiz_attempts) -> Dict[str, Any]:
+        skill_ids, ratios = [], []
+        difficulty_codes: Dict[str, int] = {}
+        question_codes, question_ratios = [], []
+        for skill_id, score, total_questions, questions_data in quiz_attempts:
+            if not total_questions:
+                continue
+            ratio = (score or 0) / total_questions
+            skill_ids.append(skill_id)
+            ratios.append(ratio)
+            for question in questions_data or []:
+                difficulty = question.get("difficulty", "medium") if isinstance(question, dict) else "medium"
+                question_codes.append(difficulty_codes.setdefault(difficulty, len(difficulty_codes)))
+                question_ratios.append(ratio)
+        return {
+            "skill_ids": np.array(skill_ids, dtype=object),
+            "ratios": np.array(ratios, dtype=np.float64),
+            "difficulties": list(difficulty_codes),
+            "question_codes": np.array(question_codes, dtype=np.int64),
+            "question_ratios": np.array(question_ratios, dtype=np.float64),
+        }
+
+    # ---- metrics ----
+
+    def _analyze(self, behaviors, quiz_attempts, skill_progress) -> Dict[str, Any]:
+        events = self._behavior_columns(behaviors)
+        quizzes = self._quiz_columns(quiz_attempts)
+        skill_names = {skill_id: name or f"Skill {skill_id}" for skill_id, _, name in skill_progress}
+        percentages = np.array([percentage or 0.0 for _, percentage, _ in skill_progress], dtype=np.float64)
+
+        active_days = np.unique(events["days"]) if len(events["days"]) else events["days"]
+        days_span = int(active_days[-1] - active_days[0]) if len(active_days) > 1 else 1
+
+        analysis = {
+            "learning_style": self._learning_style(events["resource_types"]),
+            "preferred_difficulty": self._preferred_difficulty(quizzes),
+            "engagement_patterns": self._engagement_patterns(events["hours"], active_days, days_span),
+            "completion_rate": float(percentages.sum() / (len(percentages) * 100)) if len(percentages) else 0.0,
+            "average_session_time": round(float(events["minutes"].sum()) / len(active_days), 1) if len(active_days) else 0.0,
+            "struggling_topics": self._topics(quizzes, skill_names, quizzes["ratios"] < TARGET_SCORE_RANGE[0]),
+            "strengths": self._topics(quizzes, skill_names, quizzes["ratios"] >= TARGET_SCORE_RANGE[1]),
+            "learning_pace": self._learning_pace(events["completions"], len(active_days), days_span),
+        }
+        analysis["recommended_adjustments"] = self._recommended_adjustments(analysis)
+        return analysis
+
+    @staticmethod
+    def _learning_style(resource_types: np.ndarray) -> str:
+        resource_types = resource_types[resource_types != None]  # noqa: E711 - elementwise
+        if not len(resource_types):
+            return "balanced"
+        kinds, counts = np.unique(resource_types.astype(str), return_counts=True)
+        ratios = dict(zip(kinds, counts / counts.sum()))
+        if ratios.get("video", 0) > 0.5:
+            return "visual"
+        elif ratios.get("article", 0) > 0.5:
+            return "reading"
+        elif ratios.get("github", 0) > 0.4:
+            return "hands-on"
+        return "balanced"
+
+    @staticmethod
+    def _preferred_difficulty(quizzes: Dict[str, Any]) -> str:
+        codes = quizzes["question_codes"]
+        if not len(codes):
+            return "beginner"
+        levels = len(quizzes["difficulties"])
+        means = np.bincount(codes, weights=quizzes["question_ratios"], minlength=levels) / np.bincount(codes, minlength=levels)
+        # First difficulty (most recent first) where the user scores in the target range
+        for code, mean in enumerate(means):
+            if TARGET_SCORE_RANGE[0] <= mean <= TARGET_SCORE_RANGE[1]:
+                return quizzes["difficulties"][code]
+        return "beginner"
+
+    @staticmethod
+    def _engagement_patterns(hours: np.ndarray, active_days: np.ndarray, days_span: int) -> Dict[str, Any]:
+        if not len(hours):
+            return {"peak_hours": [], "session_frequency": "low", "preferred_days": []}
+        hour_counts = np.bincount(hours, minlength=24)
+        peak_hours = [int(hour) for hour in np.argsort(-hour_counts, kind="stable")[:3] if hour_counts[hour]]
+        activity = len(active_days) / max(days_span, 1)
+        return {
+            "peak_hours": peak_hours,
+            "session_frequency": "high" if activity > 0.5 else "medium" if activity > 0.2 else "low",
+            "total_sessions": int(len(active_days)),
+            "days_active": days_span
+        }
+
+    @staticmethod
+    def _topics(quizzes: Dict[str, Any], skill_names: Dict[int, str], mask: np.ndarray) -> List[str]:
+        return sorted({skill_names[skill_id] for skill_id in quizzes["skill_ids"][mask] if skill_id in skill_names})
+
+    @staticmethod
+    def _learning_pace(completions: np.ndarray, active_day_count: int, days_span: int) -> str:
+        if not active_day_count:
+            return "medium"
+        per_week = completions.sum() / max(days_span / 7, 1)
+        return "fast" if per_week >= 3 else "medium" if per_week >= 1 else "slow"
+
+    @staticmethod
+    def _recommended_adjustments(analysis: Dict[str, Any]) -> List[str]:
+        adjustments = []
+        if analysis["preferred_difficulty"] == "beginner":
+            adjustments.append("Start with beginner-level content")
+        if analysis["struggling_topics"]:
+            adjustments.append(f"Review the fundamentals of {', '.join(analysis['struggling_topics'][:3])}")
+        if analysis["strengths"]:
+            adjustments.append(f"Take on advanced topics in {', '.join(analysis['strengths'][:3])}")
+        if analysis["engagement_patterns"]["session_frequency"] == "low":
+            adjustments.append("Maintain regular learning schedule")
+        if analysis["learning_pace"] == "slow":
+            adjustments.append("Break skills into smaller daily goals")
+        return adjustments
+
+
+def read_watermark(user_id: int, db: Session) -> Tuple:
+    """The user's last behaviour id, last quiz attempt id and skill progress count/total, in one query."""
+    return tuple(db.execute(select(
+        select(func.max(UserBehavior.id)).where(UserBehavior.user_id == user_id).scalar_subquery(),
+        select(func.max(QuizAttempt.id)).where(QuizAttempt.user_id == user_id).scalar_subquery(),
+        select(func.count(SkillProgress.id)).where(SkillProgress.user_id == user_id).scalar_subquery(),
+        select(func.sum(SkillProgress.progress_percentage)).where(SkillProgress.user_id == user_id).scalar_subquery(),
+    )).one())
+
+
+def build_snapshot(user_id: int, db: Session, watermark: Optional[Tuple] = None) -> UserBehaviorSnapshot:
+    """Load a user's recent behaviour, quizzes and progress and analyse them."""
+    behaviors = db.query(
+        UserBehavior.action_type, UserBehavior.timestamp, UserBehavior.additional_data
+    ).filter(
+        UserBehavior.user_id == user_id
+    ).order_by(UserBehavior.timestamp.desc(), UserBehavior.id.desc()).limit(BEHAVIOR_WINDOW).all()
+
+    quiz_attempts = db.query(
+        QuizAttempt.skill_id, QuizAttempt.score, QuizAttempt.total_questions, QuizAttempt.questions_data
+    ).filter(
+        QuizAttempt.user_id == user_id
+    ).order_by(QuizAttempt.completed_at.desc(), QuizAttempt.id.desc()).limit(QUIZ_WINDOW).all()
+
+    skill_progress = db.query(
+        SkillProgress.skill_id, SkillProgress.progress_percentage, Skill.name
+    ).outerjoin(Skill, Skill.id == SkillProgress.skill_id).filter(
+        SkillProgress.user_id == user_id
+    ).all()
+
+    return UserBehaviorSnapshot(user_id, watermark or (), behaviors, quiz_attempts, skill_progress)
+
+
+class BehaviorSnapshotCache:
+    """Size-bounded LRU of snapshots, each valid while its user's watermark is unchanged."""
+
+    def __init__(self, max_entries: int = BEHAVIOR_SNAPSHOT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, UserBehaviorSnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.request_hits = 0
+        self.evictions = 0
+
+    def get(self, user_id: int, db: Session) -> UserBehaviorSnapshot:
+        """
+        The user's snapshot, rebuilt only if their watermark moved.
+
+        Args:
+            user_id: User to analyse
+            db: Database session; also holds the per-request memo
+
+        Returns:
+            The current ``UserBehaviorSnapshot``
+        """
+        memo = db.info.setdefault(_SESSION_KEY, {})
+        snapshot = memo.get(user_id)
+        if snapshot is not None:
+            self.request_hits += 1
+            return snapshot
+
+        watermark = read_watermark(user_id, db)
+        with self._lock:
+            snapshot = self._entries.get(user_id)
+            if snapshot is not None and snapshot.watermark == watermark:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+            else:
+                snapshot = None
+                self.misses += 1
+
+        if snapshot is None:
+            snapshot = build_snapshot(user_id, db, watermark)
+            with self._lock:
+                self._entries[user_id] = snapshot
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        memo[user_id] = snapshot
+        return snapshot
+
+    def forget(self, user_id: int, db: Optional[Session] = None):
+        """Drop a user's per-request memo (the cross-request entry is checked by watermark anyway)."""
+        if db is not None:
+            db.info.get(_SESSION_KEY, {}).pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "cached_users": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "request_hits": self.request_hits,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
+# Global instance
+behavior_snapshot_cache = BehaviorSnapshotCache()
+
+
+def get_behavior_snapshot(user_id: int, db: Session) -> UserBehaviorSnapshot:
+    return behavior_snapshot_cache.get(user_id, db)
+
+
+def get_behavior_snapshot_stats() -> Dict:
+    return behavior_snapshot_cache.stats()
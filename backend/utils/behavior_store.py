@@ -0,0 +1,561 @@
+"""
+Partitioned Behaviour Store
+===========================
+
+Keeps ``user_behavior`` bounded and serves dashboards from daily rollups.
+
+Layout: raw events live in monthly tables named ``user_behavior_pYYYYMM``.
+
+- PostgreSQL: ``user_behavior`` is range-partitioned on ``timestamp``
+  (convert an existing table once with
+  ``scripts/partition_user_behavior.py``). The maintenance job creates the
+  partitions for the coming months ahead of time.
+- SQLite has no partitioning, so ``user_behavior`` stays the hot table.
+  Whole months older than BEHAVIOR_HOT_DAYS are moved into their monthly
+  table, and the newest row always stays behind so ids are never reused.
+
+Rollups: ``user_daily_activity`` (created by ``create_all`` or the rollup and
+similarity tables migration) holds one row per user and UTC day with:
+  - counts per action_type;
+  - completed subskills and quizzes;
+  - ``time_spent_minutes`` reported by the events;
+  - XP earned.
+``rollup_missing_days`` fills every finished day after the last rolled-up
+one and re-rolls the last BEHAVIOR_ROLLUP_REFRESH_DAYS finished days, which
+picks up late events (buffered writes, WAL replay after a crash). ``get_daily_activity`` reads the rollups and aggregates the few raw
+events after them live, so today's numbers are current.
+
+Retention: raw events older than BEHAVIOR_RETENTION_DAYS are archived to
+gzip-compressed JSON lines in BEHAVIOR_ARCHIVE_DIR and dropped: whole
+monthly tables (PostgreSQL partitions are detached first), or rows of an
+unpartitioned table. Their rollups are kept. Every archive gets a new file
+name stamped with the run time, so archiving a month again (events replayed
+into a dropped month, a restored table) never overwrites an earlier archive.
+
+``behavior_maintenance`` runs roll up → rotate/create partitions → retention
+on a daemon thread (scripts/maintain_user_behavior.py does one pass from
+cron). Each pass holds the ``behavior_maintenance`` job lock
+(``utils.job_lock``), so with several workers, or cron on top, only one
+process maintains the tables at a time; the others skip that pass.
+
+Configuration (environment):
+    BEHAVIOR_HOT_DAYS                 SQLite: months older than this leave the live table
+    BEHAVIOR_RETENTION_DAYS           raw events older than this are archived and dropped
+    BEHAVIOR_ARCHIVE_DIR              where archived events are written
+    BEHAVIOR_PARTITION_MONTHS_AHEAD   PostgreSQL: partitions created ahead of time
+    BEHAVIOR_MAINTENANCE_INTERVAL     seconds between maintenance passes (0 disables the job)
+    BEHAVIOR_ROLLUP_REFRESH_DAYS      finished days re-rolled on every pass to pick up late events
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Column, Index, MetaData, Table, and_, delete, func, insert, inspect, select, text
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from models.models import UserBehavior, UserDailyActivity, XPTransaction
+from utils.job_lock import job_lock
+
+logger = logging.getLogger(__name__)
+
+BEHAVIOR_HOT_DAYS = int(os.environ.get("BEHAVIOR_HOT_DAYS", "35"))
+BEHAVIOR_RETENTION_DAYS = int(os.environ.get("BEHAVIOR_RETENTION_DAYS", "180"))
+BEHAVIOR_ARCHIVE_DIR = os.environ.get(
+    "BEHAVIOR_ARCHIVE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "behavior_archive")
+)
+BEHAVIOR_PARTITION_MONTHS_AHEAD = int(os.environ.get("BEHAVIOR_PARTITION_MONTHS_AHEAD", "2"))
+BEHAVIOR_MAINTENANCE_INTERVAL = float(os.environ.get("BEHAVIOR_MAINTENANCE_INTERVAL", "3600"))
+BEHAVIOR_ROLLUP_REFRESH_DAYS = int(os.environ.get("BEHAVIOR_ROLLUP_REFRESH_DAYS", "2"))
+
+PARTITION_PREFIX = "user_behavior_p"
+_PARTITION_NAME = re.compile(r"^user_behavior_p(\d{4})(\d{2})$")
+
+SUBSKILL_COMPLETED = "complete_subskill"
+QUIZ_COMPLETED = "complete_quiz"
+
+
+# ---- months and partitions ----
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(month: date) -> date:
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _midnight(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def _partition_table(name: str) -> Table:
+    """A Core table with the ``user_behavior`` columns, for one monthly table."""
+    columns = [Column(column.name, column.type, primary_key=column.primary_key)
+               for column in UserBehavior.__table__.columns]
+    return Table(name, MetaData(), *columns, Index(f"ix_{name}_user_timestamp", "user_id", "timestamp"))
+
+
+def list_partitions(db: Session) -> List[Tuple[date, str]]:
+    """Monthly behaviour tables as ``(month, table_name)``, oldest first."""
+    partitions = []
+    for name in inspect(db.connection()).get_table_names():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions.append((date(int(match.group(1)), int(match.group(2)), 1), name))
+    return sorted(partitions)
+
+
+def is_partitioned(db: Session) -> bool:
+    """Whether ``user_behavior`` is a partitioned PostgreSQL table."""
+    if not _is_postgres(db):
+        return False
+    return db.execute(text(
+        "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+        "WHERE c.relname = :name"
+    ), {"name": UserBehavior.__tablename__}).first() is not None
+
+
+def create_partition(db: Session, month: date):
+    """PostgreSQL: create the partition of ``user_behavior`` for one month (does not commit)."""
+    db.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {UserBehavior.__tablename__} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month(month).isoformat()}')"
+    ))
+
+
+def ensure_partitions(db: Session, today: Optional[date] = None,
+                      months_ahead: int = BEHAVIOR_PARTITION_MONTHS_AHEAD) -> List[str]:
+    """PostgreSQL: create this month's and the next ``months_ahead`` months' partitions."""
+    if not is_partitioned(db):
+        return []
+    existing = {name for _, name in list_partitions(db)}
+    month = month_start(today or datetime.utcnow().date())
+    created = []
+    for _ in range(months_ahead + 1):
+        name = partition_name(month)
+        if name not in existing:
+            create_partition(db, month)
+            created.append(name)
+        month = next_month(month)
+    db.commit()
+    return created
+
+
+def rotate_hot_table(db: Session, now: Optional[datetime] = None, hot_days: int = BEHAVIOR_HOT_DAYS) -> List[str]:
+    """
+    SQLite: move whole months older than ``hot_days`` out of ``user_behavior``.
+
+    Args:
+        db: Database session
+        now: Current UTC time (defaults to ``utcnow``)
+        hot_days: Days of raw events that always stay in the live table
+
+    Returns:
+        Names of the monthly tables rows were moved into
+    """
+    if _is_postgres(db):
+        return []
+    hot = UserBehavior.__table__
+    cutoff = _midnight(month_start(((now or datetime.utcnow()) - timedelta(days=hot_days)).date()))
+    # The newest row stays so SQLite never hands out an id that is already in a monthly table
+    newest_id = db.execute(select(func.max(hot.c.id))).scalar()
+    rotated = []
+    while True:
+        oldest = db.execute(select(func.min(hot.c.timestamp)).where(
+            hot.c.timestamp < cutoff, hot.c.id != newest_id
+        )).scalar()
+        if oldest is None:
+            return rotated
+        month = month_start(oldest.date())
+        in_month = and_(hot.c.timestamp >= _midnight(month), hot.c.timestamp < _midnight(next_month(month)),
+                        hot.c.id != newest_id)
+        table = _partition_table(partition_name(month))
+        try:
+            table.create(bind=db.connection(), checkfirst=True)
+            db.execute(insert(table).from_select([column.name for column in hot.columns],
+                                                 select(*hot.columns).where(in_month)))
+            moved = db.execute(delete(hot).where(in_month)).rowcount
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        logger.info(f"Rotated {moved} behaviour events into {table.name}")
+        rotated.append(table.name)
+
+
+# ---- rollups ----
+
+def _empty_day() -> Dict[str, Any]:
+    return {"action_counts": {}, "total_events": 0, "subskills_completed": 0,
+            "quizzes_completed": 0, "minutes": 0.0, "xp": 0}
+
+
+def _add_events(day: Dict[str, Any], action_type: Optional[str], count: int, minutes: float):
+    action_type = action_type or "unknown"
+    day["action_counts"][action_type] = day["action_counts"].get(action_type, 0) + count
+    day["total_events"] += count
+    day["minutes"] += float(minutes or 0)
+    if action_type == SUBSKILL_COMPLETED:
+        day["subskills_completed"] += count
+    elif action_type == QUIZ_COMPLETED:
+        day["quizzes_completed"] += count
+
+
+def _behavior_sources(db: Session, start: datetime, end: datetime) -> List[Table]:
+    """Tables that can hold events between ``start`` and ``end``."""
+    sources = [UserBehavior.__table__]
+    if not _is_postgres(db):  # PostgreSQL partitions are read through the parent table
+        sources += [_partition_table(name) for month, name in list_partitions(db)
+                    if _midnight(month) < end and _midnight(next_month(month)) > start]
+    return sources
+
+
+def _minutes(source: Table):
+    return func.coalesce(source.c.additional_data["time_spent_minutes"].as_float(), 0)
+
+
+def rollup_day(db: Session, day: date) -> int:
+    """
+    (Re)build ``user_daily_activity`` for one UTC day.
+
+    Args:
+        db: Database session (committed by this call)
+        day: Day to roll up
+
+    Returns:
+        Number of user rows written
+    """
+    start, end = _midnight(day), _midnight(day + timedelta(days=1))
+    users: Dict[int, Dict[str, Any]] = defaultdict(_empty_day)
+    for source in _behavior_sources(db, start, end):
+        for user_id, action_type, count, minutes in db.execute(
+            select(source.c.user_id, source.c.action_type, func.count(), func.sum(_minutes(source))).where(
+                source.c.timestamp >= start, source.c.timestamp < end, source.c.user_id.isnot(None)
+            ).group_by(source.c.user_id, source.c.action_type)
+        ):
+            _add_events(users[user_id], action_type, count, minutes)
+    for user_id, xp in db.execute(
+        select(XPTransaction.user_id, func.sum(XPTransaction.amount)).where(
+            XPTransaction.created_at >= start, XPTransaction.created_at < end, XPTransaction.user_id.isnot(None)
+        ).group_by(XPTransaction.user_id)
+    ):
+        users[user_id]["xp"] = int(xp or 0)
+
+    updated_at = datetime.utcnow()
+    try:
+        db.execute(delete(UserDailyActivity).where(UserDailyActivity.activity_date == day))
+        if users:
+            db.execute(insert(UserDailyActivity), [
+                {"user_id": user_id, "activity_date": day, "updated_at": updated_at, **totals}
+                for user_id, totals in users.items()
+            ])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(users)
+
+
+def last_rollup_day(db: Session) -> Optional[date]:
+    try:
+        return db.execute(select(func.max(UserDailyActivity.activity_date))).scalar()
+    except Exception:
+        db.rollback()  # table not created yet
+        return None
+
+
+def _first_event_day(db: Session) -> Optional[date]:
+    days = []
+    for source in [UserBehavior.__table__] + [_partition_table(name) for _, name in list_partitions(db)[:1]]:
+        first = db.execute(select(func.min(source.c.timestamp))).scalar()
+        if first is not None:
+            days.append(first.date())
+    first_xp = db.execute(select(func.min(XPTransaction.created_at))).scalar()
+    if first_xp is not None:
+        days.append(first_xp.date())
+    return min(days) if days else None
+
+
+def rollup_missing_days(db: Session, today: Optional[date] = None,
+                        refresh_days: int = BEHAVIOR_ROLLUP_REFRESH_DAYS) -> int:
+    """
+    Roll up every finished day after the last rolled-up one, plus the last few finished days again.
+
+    Events can land after their day was rolled up (the write-behind buffer keeps
+    interaction timestamps, and a crashed worker's WAL is replayed on restart),
+    so the trailing ``refresh_days`` are rebuilt on every pass.
+
+    Args:
+        db: Database session (committed by this call)
+        today: Current UTC day; only earlier days are rolled up
+        refresh_days: Finished days re-rolled even if they already have rollups
+
+    Returns:
+        The number of days rolled up
+    """
+    today = today or datetime.utcnow().date()
+    last = last_rollup_day(db)
+    day = last + timedelta(days=1) if last else _first_event_day(db)
+    if day is None:
+        return 0
+    day = min(day, today - timedelta(days=refresh_days))
+    rolled_up = 0
+    while day < today:
+        rollup_day(db, day)
+        rolled_up += 1
+        day += timedelta(days=1)
+    return rolled_up
+
+
+def get_daily_activity(db: Session, user_id: int, since: date,
+                       now: Optional[datetime] = None) -> Dict[date, Dict[str, Any]]:
+    """
+    A user's per-day activity from ``since`` through today.
+
+    Finished days come from ``user_daily_activity``. Days after the last
+    rollup (normally just today) are aggregated from the user's raw events.
+
+    Args:
+        db: Database session
+        user_id: Target user
+        since: First UTC day to include
+        now: Current UTC time (defaults to ``utcnow``)
+
+    Returns:
+        ``{day: {action_counts, total_events, subskills_completed, quizzes_completed, minutes, xp}}``
+        for days with activity
+    """
+    now = now or datetime.utcnow()
+    days: Dict[date, Dict[str, Any]] = {}
+    last = last_rollup_day(db)
+    if last is not None and last >= since:
+        for row in db.query(UserDailyActivity).filter(
+            UserDailyActivity.user_id == user_id,
+            UserDailyActivity.activity_date >= since,
+            UserDailyActivity.activity_date <= last
+        ):
+            days[row.activity_date] = {
+                "action_counts": dict(row.action_counts or {}),
+                "total_events": row.total_events or 0,
+                "subskills_completed": row.subskills_completed or 0,
+                "quizzes_completed": row.quizzes_completed or 0,
+                "minutes": row.minutes or 0.0,
+                "xp": row.xp or 0,
+            }
+
+    live_from = _midnight(max(since, last + timedelta(days=1)) if last else since)
+    if live_from > now:
+        return days
+    for source in _behavior_sources(db, live_from, now + timedelta(seconds=1)):
+        for timestamp, action_type, minutes in db.execute(
+            select(source.c.timestamp, source.c.action_type, _minutes(source)).where(
+                source.c.user_id == user_id, source.c.timestamp >= live_from
+            )
+        ):
+            _add_events(days.setdefault(timestamp.date(), _empty_day()), action_type, 1, minutes)
+    for created_at, amount in db.execute(
+        select(XPTransaction.created_at, XPTransaction.amount).where(
+            XPTransaction.user_id == user_id, XPTransaction.created_at >= live_from
+        )
+    ):
+        days.setdefault(created_at.date(), _empty_day())["xp"] += amount or 0
+    return days
+
+
+# ---- retention ----
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _archive_path(archive_dir: str, stem: str) -> str:
+    """A file name for a new archive of ``stem`` that no earlier run has used."""
+    run = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    path = os.path.join(archive_dir, f"{stem}_{run}.jsonl.gz")
+    attempt = 1
+    while os.path.exists(path):
+        attempt += 1
+        path = os.path.join(archive_dir, f"{stem}_{run}_{attempt}.jsonl.gz")
+    return path
+
+
+def _archive(db: Session, statement, path: str) -> int:
+    """Stream ``statement``'s rows into a gzip-compressed JSON lines file; returns the row count."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    count = 0
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for row in db.execute(statement.execution_options(yield_per=5000)).mappings():
+            f.write(json.dumps(dict(row), default=_json_default) + "\n")
+            count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def apply_retention(db: Session, now: Optional[datetime] = None, retention_days: int = BEHAVIOR_RETENTION_DAYS,
+                    archive_dir: str = BEHAVIOR_ARCHIVE_DIR) -> Dict[str, int]:
+    """
+    Archive raw events older than ``retention_days`` to ``archive_dir`` and drop them.
+
+    Args:
+        db: Database session (committed by this call)
+        now: Current UTC time (defaults to ``utcnow``)
+        retention_days: Days of raw events to keep
+        archive_dir: Directory for the ``.jsonl.gz`` archives (``<table>_<run time>.jsonl.gz``)
+
+    Returns:
+        ``{archive file: events archived}``
+    """
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=retention_days)
+    archived = {}
+    partitioned = is_partitioned(db)
+
+    for month, name in list_partitions(db):
+        if _midnight(next_month(month)) > cutoff:
+            continue
+        table = _partition_table(name)
+        path = _archive_path(archive_dir, name)
+        try:
+            archived[path] = _archive(db, select(table).order_by(table.c.timestamp), path)
+            if partitioned:
+                db.execute(text(f"ALTER TABLE {UserBehavior.__tablename__} DETACH PARTITION {name}"))
+            table.drop(bind=db.connection())
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        logger.info(f"Archived {archived[path]} behaviour events from {name} to {path}")
+
+    if not partitioned:
+        # Rows of an unpartitioned table (or left in the SQLite hot table) are archived individually
+        hot = UserBehavior.__table__
+        expired = hot.c.timestamp < cutoff
+        if not _is_postgres(db):
+            expired = and_(expired, hot.c.id != select(func.max(hot.c.id)).scalar_subquery())
+        if db.execute(select(func.count()).select_from(hot).where(expired)).scalar():
+            path = _archive_path(archive_dir, f"{hot.name}_before_{cutoff:%Y%m%d}")
+            try:
+                archived[path] = _archive(db, select(hot).where(expired).order_by(hot.c.timestamp), path)
+                db.execute(delete(hot).where(expired))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            logger.info(f"Archived {archived[path]} behaviour events older than {cutoff:%Y-%m-%d} to {path}")
+    return archived
+
+
+# ---- maintenance job ----
+
+class BehaviorMaintenance:
+    """Background job: nightly rollups, partition rotation/creation and retention."""
+
+    def __init__(self, session_factory=SessionLocal, hot_days: int = BEHAVIOR_HOT_DAYS,
+                 retention_days: int = BEHAVIOR_RETENTION_DAYS, archive_dir: str = BEHAVIOR_ARCHIVE_DIR):
+        self.session_factory = session_factory
+        self.hot_days = hot_days
+        self.retention_days = retention_days
+        self.archive_dir = archive_dir
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.passes = 0
+        self.rolled_up_days = 0
+        self.rotated_tables = 0
+        self.created_partitions = 0
+        self.archived_events = 0
+        self.skipped_passes = 0
+        self.last_pass_seconds = 0.0
+
+    def run_once(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Roll up finished days, then rotate or create partitions, then apply retention.
+
+        Returns:
+            What the pass did, with ``skipped`` set if another process holds the job lock
+        """
+        started = time.perf_counter()
+        now = now or datetime.utcnow()
+        db = self.session_factory()
+        try:
+            with job_lock(db.get_bind(), "behavior_maintenance") as held:
+                if not held:
+                    self.skipped_passes += 1
+                    return {"rolled_up_days": 0, "rotated": [], "created_partitions": [], "archived": {},
+                            "skipped": True}
+                # Roll up before anything moves or is archived, so no day is lost from the rollups
+                rolled_up = rollup_missing_days(db, today=now.date())
+                rotated = rotate_hot_table(db, now=now, hot_days=self.hot_days)
+                created = ensure_partitions(db, today=now.date())
+                archived = apply_retention(db, now=now, retention_days=self.retention_days,
+                                           archive_dir=self.archive_dir)
+        finally:
+            db.close()
+        self.passes += 1
+        self.rolled_up_days += rolled_up
+        self.rotated_tables += len(rotated)
+        self.created_partitions += len(created)
+        self.archived_events += sum(archived.values())
+        self.last_pass_seconds = round(time.perf_counter() - started, 3)
+        return {"rolled_up_days": rolled_up, "rotated": rotated, "created_partitions": created, "archived": archived,
+                "skipped": False}
+
+    def start(self, interval: float = BEHAVIOR_MAINTENANCE_INTERVAL):
+        """Run ``run_once`` every ``interval`` seconds on a daemon thread."""
+        if interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+
+        def maintenance_loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.run_once()
+                except Exception as e:
+                    logger.warning(f"Behaviour maintenance pass failed: {e}")
+
+        self._thread = threading.Thread(target=maintenance_loop, name="behavior-maintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread = None
+
+    def stats(self) -> Dict:
+        return {
+            "passes": self.passes,
+            "rolled_up_days": self.rolled_up_days,
+            "rotated_tables": self.rotated_tables,
+            "created_partitions": self.created_partitions,
+            "archived_events": self.archived_events,
+            "skipped_passes": self.skipped_passes,
+            "last_pass_seconds": self.last_pass_seconds,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
+
+
+# Global instance
+behavior_maintenance = BehaviorMaintenance()
+
+
+def get_behavior_maintenance_stats() -> Dict:
+    return behavior_maintenance.stats()
@@ -0,0 +1,406 @@
+"""
+Versioned binary snapshot of the resource catalog
+=================================================
+
+The offline build step (scripts/build_resource_snapshot.py) serializes the
+merged ResourceCatalog into a compact, read-only file. Serving workers
+memory-map it instead of importing thousands of lines of dict literals, so
+every uvicorn worker shares a single page-cache copy.
+
+Layout (all integers little-endian)::
+
+    header    magic, format version, section count, 16-byte content version
+    sections  table of (name, offset, length), then the section payloads
+      strings:offsets   uint32[n + 1] byte offsets into ``strings:data``
+      strings:data      UTF-8 strings, sorted bytewise (so ids sort like keys)
+      records           (title, url, description, type, quality) per record
+      postings          uint32 record ids shared by every map below
+      map:<name>        (key string id, postings start, count) per key,
+                        in the source's original key order
+      sorted:<name>     entry positions of ``map:<name>`` ordered by key id
+      overrides         JSON: per-listing fields where a source differs from
+                        the shared record
+      metadata          JSON: per-skill metadata and build information
+
+Lookups binary-search the string table and the sorted entry permutation, then
+decode only the records they return.
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .resource_catalog import ResourceCatalog, normalize_url
+
+SNAPSHOT_MAGIC = b"SSCATLG\0"
+SNAPSHOT_FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<8sII16s")          # magic, format version, section count, version
+_SECTION = struct.Struct("<32sQQ")           # name, offset, length
+_RECORD = struct.Struct("<IIIIi")            # title, url, description, type ids, quality
+_ENTRY = struct.Struct("<III")               # key id, postings start, postings count
+_U32 = struct.Struct("<I")
+
+# Secondary indexes persisted next to the per-source listings
+_INDEX_MAPS = ("skill", "subskill", "resource_type", "domain", "url")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, truncated or incompatible."""
+
+
+# === WRITING ===
+
+def write_snapshot(catalog: ResourceCatalog, path: str) -> str:
+    """
+    Serialize a catalog to ``path`` atomically.
+
+    The file is written next to the target and renamed into place, so workers
+    that still map the previous version keep reading a consistent file.
+
+    Args:
+        catalog: In-memory catalog to serialize
+        path: Destination snapshot path
+
+    Returns:
+        The snapshot's content version
+    """
+    index_maps = {
+        "skill": catalog.by_skill,
+        "subskill": catalog.by_subskill,
+        "resource_type": catalog.by_resource_type,
+        "domain": catalog.by_domain,
+        "url": {normalize_url(record["url"]): [record_id] for record_id, record in enumerate(catalog.records)},
+    }
+    maps: Dict[str, Dict[str, List[int]]] = {f"listing:{source}": keys for source, keys in catalog.listings.items()}
+    maps.update({f"index:{name}": index_maps[name] for name in _INDEX_MAPS})
+
+    strings = set()
+    for record in catalog.records:
+        strings.update((record["title"], record["url"], record["description"], record["resource_type"]))
+    for keys in maps.values():
+        strings.update(keys)
+    sorted_strings = sorted(strings, key=lambda value: value.encode("utf-8"))
+    string_ids = {value: string_id for string_id, value in enumerate(sorted_strings)}
+
+    encoded = [value.encode("utf-8") for value in sorted_strings]
+    offsets = bytearray()
+    position = 0
+    for value in encoded:
+        offsets += _U32.pack(position)
+        position += len(value)
+    offsets += _U32.pack(position)
+
+    records = bytearray()
+    for record in catalog.records:
+        records += _RECORD.pack(
+            string_ids[record["title"]],
+            string_ids[record["url"]],
+            string_ids[record["description"]],
+            string_ids[record["resource_type"]],
+            int(record["quality_score"]),
+        )
+
+    postings = bytearray()
+    posting_count = 0
+    sections = [
+        ("strings:offsets", bytes(offsets)),
+        ("strings:data", b"".join(encoded)),
+        ("records", bytes(records)),
+    ]
+    map_sections = []
+    for name, keys in maps.items():
+        entries = bytearray()
+        entry_keys = []
+        for key, record_ids in keys.items():
+            entries += _ENTRY.pack(string_ids[key], posting_count, len(record_ids))
+            entry_keys.append(string_ids[key])
+            for record_id in record_ids:
+                postings += _U32.pack(record_id)
+            posting_count += len(record_ids)
+        order = sorted(range(len(entry_keys)), key=entry_keys.__getitem__)
+        map_sections.append((f"map:{name}", bytes(entries)))
+        map_sections.append((f"sorted:{name}", b"".join(_U32.pack(position) for position in order)))
+    sections.append(("postings", bytes(postings)))
+    sections.extend(map_sections)
+
+    overrides = {source: keys for source, keys in catalog.overrides.items() if keys}
+    sections.append(("overrides", json.dumps(overrides, separators=(",", ":")).encode("utf-8")))
+
+    metadata = {
+        "skill_metadata": catalog.skill_metadata,
+        "built_at": datetime.utcnow().isoformat(),
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "record_count": len(catalog.records),
+    }
+    sections.append(("metadata", json.dumps(metadata, separators=(",", ":")).encode("utf-8")))
+
+    version = catalog.version or catalog.content_digest()
+    blob = _layout(sections, version)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".resource_catalog.", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return version
+
+
+def _layout(sections, version: str) -> bytes:
+    """Concatenate header, section table and 8-byte aligned payloads."""
+    table_end = _HEADER.size + _SECTION.size * len(sections)
+    offset = _align(table_end)
+    table = bytearray()
+    payload = bytearray(offset - table_end)
+    for name, data in sections:
+        table += _SECTION.pack(name.encode("ascii"), offset, len(data))
+        payload += data
+        padding = _align(len(data)) - len(data)
+        payload += b"\0" * padding
+        offset += len(data) + padding
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(sections), bytes.fromhex(version))
+    return header + bytes(table) + bytes(payload)
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+# === READING ===
+
+class MappedResourceCatalog:
+    """
+    Read-only catalog backed by a memory-mapped snapshot.
+
+    Exposes the same lookup interface as ResourceCatalog; records are decoded
+    on demand, so the process only holds what requests actually touch.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._file_id = _file_identity(os.fstat(f.fileno()))
+            if self._file_id[2] < _HEADER.size:
+                raise SnapshotError(f"{path} is too small to be a resource snapshot")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, format_version, section_count, version = _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError(f"{path} is not a resource snapshot")
+        if format_version != SNAPSHOT_FORMAT_VERSION:
+            raise SnapshotError(f"Unsupported snapshot format {format_version} (expected {SNAPSHOT_FORMAT_VERSION})")
+        self.version = version.hex()
+
+        self._sections: Dict[str, tuple] = {}
+        for position in range(section_count):
+            name, offset, length = _SECTION.unpack_from(self._mmap, _HEADER.size + position * _SECTION.size)
+            if offset + length > len(self._mmap):
+                raise SnapshotError(f"{path} is truncated")
+            self._sections[name.rstrip(b"\0").decode("ascii")] = (offset, length)
+
+        self._strings_offsets = self._section("strings:offsets")[0]
+        self._strings_data = self._section("strings:data")[0]
+        self._string_count = self._section("strings:offsets")[1] // _U32.size - 1
+        self._records_offset, records_length = self._section("records")
+        self.record_count = records_length // _RECORD.size
+        self._postings_offset = self._section("postings")[0]
+
+        self._metadata = None
+        self._overrides = None
+
+    def _section(self, name: str) -> tuple:
+        if name not in self._sections:
+            raise SnapshotError(f"{self.path} has no '{name}' section")
+        return self._sections[name]
+
+    # --- low-level decoding ---
+
+    def _string_bytes(self, string_id: int) -> bytes:
+        start = _U32.unpack_from(self._mmap, self._strings_offsets + string_id * _U32.size)[0]
+        end = _U32.unpack_from(self._mmap, self._strings_offsets + (string_id + 1) * _U32.size)[0]
+        return self._mmap[self._strings_data + start:self._strings_data + end]
+
+    def _string(self, string_id: int) -> str:
+        return self._string_bytes(string_id).decode("utf-8")
+
+    def _find_string(self, value: str) -> Optional[int]:
+        """Binary-search the sorted string table."""
+        target = value.encode("utf-8")
+        low, high = 0, self._string_count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            current = self._string_bytes(middle)
+            if current == target:
+                return middle
+            if current < target:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def _record(self, record_id: int) -> Dict:
+        title, url, description, resource_type, quality = _RECORD.unpack_from(
+            self._mmap, self._records_offset + record_id * _RECORD.size
+        )
+        return {
+            "title": self._string(title),
+            "url": self._string(url),
+            "description": self._string(description),
+            "resource_type": self._string(resource_type),
+            "quality_score": quality,
+        }
+
+    def _map_entries(self, name: str):
+        offset, length = self._sections.get(f"map:{name}", (0, 0))
+        for position in range(length // _ENTRY.size):
+            yield _ENTRY.unpack_from(self._mmap, offset + position * _ENTRY.size)
+
+    def _postings(self, name: str, key: str) -> Optional[List[int]]:
+        """Record ids stored under ``key`` in map ``name`` (None if absent)."""
+        if f"map:{name}" not in self._sections:
+            return None
+        key_id = self._find_string(key)
+        if key_id is None:
+            return None
+
+        entries_offset = self._sections[f"map:{name}"][0]
+        sorted_offset, sorted_length = self._sections[f"sorted:{name}"]
+        low, high = 0, sorted_length // _U32.size - 1
+        while low <= high:
+            middle = (low + high) // 2
+            position = _U32.unpack_from(self._mmap, sorted_offset + middle * _U32.size)[0]
+            entry_key, start, count = _ENTRY.unpack_from(self._mmap, entries_offset + position * _ENTRY.size)
+            if entry_key == key_id:
+                base = self._postings_offset + start * _U32.size
+                return [_U32.unpack_from(self._mmap, base + i * _U32.size)[0] for i in range(count)]
+            if entry_key < key_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    # --- ResourceCatalog interface ---
+
+    @property
+    def skill_metadata(self) -> Dict[str, Dict]:
+        return self.metadata["skill_metadata"]
+
+    @property
+    def metadata(self) -> Dict:
+        if self._metadata is None:
+            offset, length = self._section("metadata")
+            self._metadata = json.loads(self._mmap[offset:offset + length].decode("utf-8"))
+        return self._metadata
+
+    @property
+    def overrides(self) -> Dict[str, Dict[str, Dict[int, Dict]]]:
+        if self._overrides is None:
+            offset, length = self._section("overrides")
+            raw = json.loads(self._mmap[offset:offset + length].decode("utf-8"))
+            self._overrides = {
+                source: {key: {int(position): fields for position, fields in positions.items()}
+                         for key, positions in keys.items()}
+                for source, keys in raw.items()
+            }
+        return self._overrides
+
+    @property
+    def records(self) -> List[Dict]:
+        """Every record, decoded (intended for tooling, not the request path)."""
+        return [self._record(record_id) for record_id in range(self.record_count)]
+
+    def has_listing(self, source: str, key: str) -> bool:
+        return self._postings(f"listing:{source}", key) is not None
+
+    def listing_keys(self, source: str) -> List[str]:
+        return [self._string(key_id) for key_id, _, _ in self._map_entries(f"listing:{source}")]
+
+    def get_listing(self, source: str, key: str) -> List[Dict]:
+        record_ids = self._postings(f"listing:{source}", key) or []
+        overrides = self.overrides.get(source, {}).get(key, {}) if record_ids else {}
+        return [
+            {**self._record(record_id), **overrides.get(position, {})}
+            for position, record_id in enumerate(record_ids)
+        ]
+
+    def get_by_url(self, url: str) -> Optional[Dict]:
+        record_ids = self._postings("index:url", normalize_url(url))
+        return self._record(record_ids[0]) if record_ids else None
+
+    def find(self, skill: str = None, subskill: str = None, resource_type: str = None,
+             domain: str = None, limit: int = None) -> List[Dict]:
+        candidates = None
+        for name, value in (("skill", skill), ("subskill", subskill), ("resource_type", resource_type), ("domain", domain)):
+            if value is None:
+                continue
+            key = value if name == "resource_type" else value.strip().lower()
+            ids = set(self._postings(f"index:{name}", key) or ())
+            candidates = ids if candidates is None else candidates & ids
+
+        if candidates is None:
+            candidates = range(self.record_count)
+
+        results = sorted((self._record(record_id) for record_id in candidates),
+                         key=lambda record: record["quality_score"], reverse=True)
+        return results[:limit]
+
+    def stats(self) -> Dict:
+        return {
+            "version": self.version,
+            "snapshot_path": self.path,
+            "built_at": self.metadata.get("built_at"),
+            "total_records": self.record_count,
+            "listings_per_source": {
+                name[len("map:listing:"):]: sum(1 for _ in self._map_entries(name[len("map:"):]))
+                for name in self._sections if name.startswith("map:listing:")
+            },
+            "snapshot_bytes": len(self._mmap),
+        }
+
+    # --- hot reload support ---
+
+    def is_stale(self) -> bool:
+        """True if the file at ``path`` has been replaced since it was mapped."""
+        try:
+            return _file_identity(os.stat(self.path)) != self._file_id
+        except OSError:
+            return False
+
+
+def _file_identity(stat_result) -> tuple:
+    return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def load_snapshot(path: str) -> MappedResourceCatalog:
+    """Memory-map a snapshot file written by ``write_snapshot``."""
+    return MappedResourceCatalog(path)
+
+
+def verify_snapshot(catalog: ResourceCatalog, snapshot: MappedResourceCatalog) -> List[str]:
+    """Compare a mapped snapshot with the catalog it was built from; return differences."""
+    problems = []
+    if snapshot.version != catalog.version:
+        problems.append(f"version {snapshot.version} != {catalog.version}")
+    for source in catalog.listings:
+        if snapshot.listing_keys(source) != catalog.listing_keys(source):
+            problems.append(f"listing keys differ for {source}")
+            continue
+        for key in catalog.listing_keys(source):
+            if snapshot.get_listing(source, key) != catalog.get_listing(source, key):
+                problems.append(f"listing {source}/{key} differs")
+    if snapshot.skill_metadata != catalog.skill_metadata:
+        problems.append("skill metadata differs")
+    return problems
+
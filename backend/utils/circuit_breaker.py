@@ -0,0 +1,261 @@
+"""
+Circuit Breakers for Scraping Backends
+======================================
+
+One breaker per host (without ``www.``), shared by every module that scrapes
+external sites: the async scrapers in ``resource_search`` and the engines in
+``robust_resource_fetcher``. When Bing starts blocking us, every caller then
+skips it instantly instead of each one paying the full timeout.
+
+URL validation's HEAD requests use their own breakers in a separate
+namespace (``head:<host>``). Many hosts reject HEAD outright, and bulk
+validation must never open the breaker that real searches depend on.
+
+Validation touches every host that appears in a resource URL, so the
+registry keeps at most ``CIRCUIT_MAX_BREAKERS`` breakers. Beyond that the
+least recently used idle ones (closed, with no failure in their window) are
+dropped; a host seen again simply starts with a fresh breaker.
+
+States:
+- CLOSED: requests flow; outcomes are kept for a sliding time window. The
+  breaker opens when the window holds at least ``min_calls`` outcomes and the
+  failure rate reaches ``failure_threshold``.
+- OPEN: requests are rejected without touching the network until the
+  cool-down expires. Each consecutive trip doubles the cool-down, up to
+  ``max_cooldown``.
+- HALF_OPEN: one probe request is let through. Success closes the breaker and
+  resets the cool-down; failure reopens it with the next, longer cool-down.
+
+Configuration (environment):
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_WINDOW_SECONDS, CIRCUIT_MIN_CALLS,
+    CIRCUIT_BASE_COOLDOWN, CIRCUIT_MAX_COOLDOWN, CIRCUIT_MAX_BREAKERS
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Optional
+
+from .resource_catalog import get_domain
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_FAILURE_THRESHOLD = float(os.environ.get("CIRCUIT_FAILURE_THRESHOLD", "0.5"))
+CIRCUIT_WINDOW_SECONDS = float(os.environ.get("CIRCUIT_WINDOW_SECONDS", "60"))
+CIRCUIT_MIN_CALLS = int(os.environ.get("CIRCUIT_MIN_CALLS", "5"))
+CIRCUIT_BASE_COOLDOWN = float(os.environ.get("CIRCUIT_BASE_COOLDOWN", "5"))
+CIRCUIT_MAX_COOLDOWN = float(os.environ.get("CIRCUIT_MAX_COOLDOWN", "300"))
+CIRCUIT_MAX_BREAKERS = int(os.environ.get("CIRCUIT_MAX_BREAKERS", "1024"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a request to a host whose breaker is open."""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit breaker open for {name}")
+        self.name = name
+
+
+def is_failure_status(status_code: int) -> bool:
+    """Statuses that mean the host is blocking or failing us (not just a missing page)."""
+    return status_code in (403, 429) or status_code >= 500
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker with a sliding-window failure rate."""
+
+    def __init__(self, name: str, failure_threshold: float = CIRCUIT_FAILURE_THRESHOLD,
+                 window_seconds: float = CIRCUIT_WINDOW_SECONDS, min_calls: int = CIRCUIT_MIN_CALLS,
+                 base_cooldown: float = CIRCUIT_BASE_COOLDOWN, max_cooldown: float = CIRCUIT_MAX_COOLDOWN):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+
+        self.state = CLOSED
+        self._outcomes = deque()  # (timestamp, succeeded)
+        self._consecutive_trips = 0
+        self._opened_until = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.rejected = 0
+        self.trips = 0
+        self.last_failure: Optional[float] = None
+
+    def _prune(self, now: float):
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    def _cooldown(self) -> float:
+        return min(self.max_cooldown, self.base_cooldown * 2 ** max(0, self._consecutive_trips - 1))
+
+    def _trip(self, now: float):
+        self._consecutive_trips += 1
+        self.trips += 1
+        self.state = OPEN
+        self._opened_until = now + self._cooldown()
+        self._probe_started = None
+        logger.warning(f"Circuit breaker for {self.name} opened for {self._cooldown():.0f}s")
+
+    def allow_request(self) -> bool:
+        """Whether a request may go out now (claims the probe slot when half-open)."""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN and now >= self._opened_until:
+                self.state = HALF_OPEN
+                self._probe_started = None
+
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN:
+                # A probe that never reported back (e.g. cancelled) frees its slot after the base cool-down
+                if self._probe_started is None or now - self._probe_started > self.base_cooldown:
+                    self._probe_started = now
+                    return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                logger.info(f"Circuit breaker for {self.name} closed")
+                self.state = CLOSED
+                self._outcomes.clear()
+                self._consecutive_trips = 0
+                self._probe_started = None
+            self._outcomes.append((now, True))
+            self._prune(now)
+
+    def record_failure(self):
+        with self._lock:
+            now = time.monotonic()
+            self.last_failure = time.time()
+            if self.state == HALF_OPEN:
+                self._trip(now)
+                return
+            if self.state == OPEN:
+                return
+
+            self._outcomes.append((now, False))
+            self._prune(now)
+            failures = sum(1 for _, succeeded in self._outcomes if not succeeded)
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_threshold:
+                self._outcomes.clear()
+                self._trip(now)
+
+    def record_status(self, status_code: int):
+        """Record the outcome of a request that got an HTTP response."""
+        if is_failure_status(status_code):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def release(self):
+        """Give back a half-open probe slot without recording an outcome (e.g. on cancellation)."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_started = None
+
+    def is_idle(self) -> bool:
+        """Closed with no failure in the window, so a fresh breaker would behave the same."""
+        with self._lock:
+            self._prune(time.monotonic())
+            return self.state == CLOSED and all(succeeded for _, succeeded in self._outcomes)
+
+    def reset(self):
+        with self._lock:
+            self.state = CLOSED
+            self._outcomes.clear()
+            self._consecutive_trips = 0
+            self._probe_started = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            now = time.monotonic()
+            self._prune(now)
+            failures = sum(1 for _, succeeded in self._outcomes if not succeeded)
+            return {
+                "state": self.state,
+                "window_calls": len(self._outcomes),
+                "window_failure_rate": round(failures / len(self._outcomes), 3) if self._outcomes else 0.0,
+                "trips": self.trips,
+                "consecutive_trips": self._consecutive_trips,
+                "rejected": self.rejected,
+                "retry_in_seconds": round(max(0.0, self._opened_until - now), 1) if self.state == OPEN else 0.0,
+                "last_failure": self.last_failure,
+            }
+
+
+class CircuitBreakerRegistry:
+    """Process-wide breakers keyed by host, bounded by evicting idle ones (least recently used first)."""
+
+    def __init__(self, max_breakers: int = CIRCUIT_MAX_BREAKERS):
+        self.max_breakers = max_breakers
+        self._breakers: "OrderedDict[str, CircuitBreaker]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = CircuitBreaker(name)
+                self._breakers[name] = breaker
+                if len(self._breakers) > self.max_breakers:
+                    self._evict_idle()
+            else:
+                self._breakers.move_to_end(name)
+            return breaker
+
+    def _evict_idle(self):
+        """Drop idle breakers, oldest first, until back under the limit (tripped ones are always kept)."""
+        for name, breaker in list(self._breakers.items())[:-1]:
+            if len(self._breakers) <= self.max_breakers:
+                break
+            if breaker.is_idle():
+                del self._breakers[name]
+                self.evicted += 1
+
+    def for_url(self, url: str, namespace: str = None) -> CircuitBreaker:
+        domain = get_domain(url)
+        return self.get(f"{namespace}:{domain}" if namespace else domain)
+
+    def reset(self, name: str = None) -> bool:
+        """Reset one breaker (or all of them); returns False if ``name`` is unknown."""
+        with self._lock:
+            breakers = list(self._breakers.values()) if name is None else [self._breakers.get(name)]
+        if None in breakers:
+            return False
+        for breaker in breakers:
+            breaker.reset()
+        return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.stats() for name, breaker in sorted(breakers.items())}
+
+
+# Global registry shared by all scrapers
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def get_circuit_breaker(url: str, namespace: str = None) -> CircuitBreaker:
+    """Breaker for the host of ``url`` (in ``namespace``, if given)."""
+    return circuit_breakers.for_url(url, namespace)
+
+
+def get_circuit_breaker_stats() -> Dict:
+    return circuit_breakers.stats()
@@ -0,0 +1,3349 @@
+"""
+Raw curated resource literals for SkillSprint.
+==============================================
+
+These dictionaries are the source data for the unified resource catalog. They
+are only imported when the catalog is built, either by the offline snapshot
+build step (scripts/build_resource_snapshot.py) or in-process when no snapshot
+is available, so serving workers that map a snapshot never load them.
+"""
+
+# Enhanced fast fallback resources with subskill specificity
+FAST_FALLBACK_RESOURCES = {
+    # === DSA SUBSKILLS - UNIQUE RESOURCES FOR EACH ===
+    "Arrays": [
+        {
+            "title": "Array Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/array-data-structure/",
+            "description": "Comprehensive array tutorial with problems and solutions",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Array Problems - LeetCode",
+            "url": "https://leetcode.com/tag/array/",
+            "description": "Practice array problems with detailed explanations",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Array Algorithms Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Array.html",
+            "description": "Interactive visualization of array operations",
+            "resource_type": "tutorial",
+            "quality_score": 88
+        },
+        {
+            "title": "Array Data Structure - MDN Documentation",
+            "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Array",
+            "description": "Complete JavaScript Array documentation with examples",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Array Algorithms Tutorial - YouTube",
+            "url": "https://www.youtube.com/watch?v=QJNwK2uJyGs",
+            "description": "Comprehensive video tutorial on array algorithms and techniques",
+            "resource_type": "video",
+            "quality_score": 87
+        },
+        {
+            "title": "Awesome Array Algorithms - GitHub",
+            "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/arrays",
+            "description": "Collection of array algorithm implementations in Python",
+            "resource_type": "github",
+            "quality_score": 85
+        }
+    ],
+    "Linked Lists": [
+        {
+            "title": "Linked List Complete Tutorial",
+            "url": "https://www.geeksforgeeks.org/data-structures/linked-list/",
+            "description": "Complete guide to linked lists with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Linked List Problems - LeetCode",
+            "url": "https://leetcode.com/tag/linked-list/",
+            "description": "Practice linked list problems with step-by-step solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Linked List Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/LinkedList.html",
+            "description": "Interactive linked list operations visualization",
+            "resource_type": "tutorial",
+            "quality_score": 90
+        },
+        {
+            "title": "Linked Lists - CS50 Documentation",
+            "url": "https://cs50.harvard.edu/x/2023/notes/5/",
+            "description": "Harvard CS50 comprehensive notes on linked lists",
+            "resource_type": "documentation",
+            "quality_score": 94
+        },
+        {
+            "title": "Linked List Masterclass - YouTube",
+            "url": "https://www.youtube.com/watch?v=WwfhLC16bis",
+            "description": "Complete linked list tutorial with coding examples",
+            "resource_type": "video",
+            "quality_score": 86
+        },
+        {
+            "title": "Linked List Implementations - GitHub",
+            "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/linked_list",
+            "description": "Various linked list implementations and algorithms",
+            "resource_type": "github",
+            "quality_score": 84
+        }
+    ],
+    "Binary Trees": [
+        {
+            "title": "Binary Tree Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree tutorial with traversals",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Problems - LeetCode",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree problems with solutions",
+            "resource_type": "course",
+            "quality_score": 89
+        },
+        {
+            "title": "Tree Traversal Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BinTree.html",
+            "description": "Interactive binary tree traversal visualization",
+            "resource_type": "tutorial",
+            "quality_score": 88
+        },
+        {
+            "title": "Trees - Algorithm Design Manual",
+            "url": "https://www3.cs.stonybrook.edu/~skiena/214/lectures/lect10/lect10.html",
+            "description": "Academic documentation on tree data structures",
+            "resource_type": "documentation",
+            "quality_score": 93
+        },
+        {
+            "title": "Binary Trees Explained - YouTube",
+            "url": "https://www.youtube.com/watch?v=H5JubkIy_p8",
+            "description": "Visual explanation of binary trees and operations",
+            "resource_type": "video",
+            "quality_score": 85
+        },
+        {
+            "title": "Binary Tree Algorithms - GitHub",
+            "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/binary_tree",
+            "description": "Binary tree algorithm implementations",
+            "resource_type": "github",
+            "quality_score": 83
+        }
+    ],
+    "Binary Search Trees": [
+        {
+            "title": "BST Complete Tutorial",
+            "url": "https://www.geeksforgeeks.org/binary-search-tree-data-structure/",
+            "description": "Complete guide to Binary Search Trees",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "BST Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive BST operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "BST Problems Practice",
+            "url": "https://leetcode.com/tag/binary-search-tree/",
+            "description": "Practice BST problems with solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "AVL Trees and Self-Balancing",
+            "url": "https://www.geeksforgeeks.org/avl-tree-set-1-insertion/",
+            "description": "Learn about self-balancing BSTs",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Stacks": [
+        {
+            "title": "Stack Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack tutorial with applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Problems - LeetCode",
+            "url": "https://leetcode.com/tag/stack/",
+            "description": "Practice stack problems with explanations",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Monotonic Stack Technique",
+            "url": "https://www.geeksforgeeks.org/introduction-to-monotonic-stack/",
+            "description": "Master the monotonic stack pattern",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Queues": [
+        {
+            "title": "Queue Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Complete queue tutorial with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue Tutorial",
+            "url": "https://www.geeksforgeeks.org/priority-queue-set-1-introduction/",
+            "description": "Learn about priority queues and heaps",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Deque (Double-ended Queue)",
+            "url": "https://www.geeksforgeeks.org/deque-set-1-introduction-applications/",
+            "description": "Understanding deque and its applications",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Graphs": [
+        {
+            "title": "Graph Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Comprehensive graph theory and algorithms",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Algorithms Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive graph traversal visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Graph Problems - LeetCode",
+            "url": "https://leetcode.com/tag/graph/",
+            "description": "Practice graph problems with solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Graph Theory for Programmers",
+            "url": "https://www.youtube.com/watch?v=LFKZLXVO-Dg",
+            "description": "Complete graph theory course for coding interviews",
+            "resource_type": "video",
+            "quality_score": 85
+        }
+    ],
+    "Dynamic Programming": [
+        {
+            "title": "Dynamic Programming Complete Guide",
+            "url": "https://www.geeksforgeeks.org/dynamic-programming/",
+            "description": "Master dynamic programming with patterns",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "DP Patterns for Coding Interviews",
+            "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns",
+            "description": "Common DP patterns and when to use them",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Dynamic Programming - LeetCode",
+            "url": "https://leetcode.com/tag/dynamic-programming/",
+            "description": "Practice DP problems with detailed solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "DP Optimization Techniques",
+            "url": "https://www.geeksforgeeks.org/overlapping-subproblems-property/",
+            "description": "Learn memoization and tabulation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Sorting Algorithms": [
+        {
+            "title": "Sorting Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/sorting-algorithms/",
+            "description": "All sorting algorithms with complexity analysis",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Sorting Algorithms Visualization",
+            "url": "https://www.sorting-algorithms.com/",
+            "description": "Interactive visualization of all sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Merge Sort vs Quick Sort",
+            "url": "https://www.geeksforgeeks.org/quick-sort-vs-merge-sort/",
+            "description": "Detailed comparison of major sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Counting Sort and Radix Sort",
+            "url": "https://www.geeksforgeeks.org/counting-sort/",
+            "description": "Non-comparison based sorting techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Searching Algorithms": [
+        {
+            "title": "Search Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/searching-algorithms/",
+            "description": "All searching algorithms with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Search Mastery",
+            "url": "https://leetcode.com/explore/learn/card/binary-search/",
+            "description": "Master binary search and its variations",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Search Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html",
+            "description": "Interactive binary search visualization",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Advanced Search Techniques",
+            "url": "https://www.geeksforgeeks.org/ternary-search/",
+            "description": "Ternary search and other advanced techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Stacks": [
+        {
+            "title": "Stack Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack implementation and applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Operations Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Applications Tutorial",
+            "url": "https://www.programiz.com/dsa/stack",
+            "description": "Real-world stack applications and use cases",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Expression Evaluation with Stacks",
+            "url": "https://www.geeksforgeeks.org/stack-set-2-infix-to-postfix/",
+            "description": "Learn infix to postfix conversion using stacks",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Queues": [
+        {
+            "title": "Queue Data Structure Tutorial",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Comprehensive queue implementation guide",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue and Heaps",
+            "url": "https://www.programiz.com/dsa/priority-queue",
+            "description": "Learn priority queues and heap data structure",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Circular Queue Implementation",
+            "url": "https://www.geeksforgeeks.org/circular-queue-set-1-introduction-array-implementation/",
+            "description": "Master circular queue implementation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Trees": [
+        {
+            "title": "Tree Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive tree data structure tutorial",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Traversal Algorithms",
+            "url": "https://www.programiz.com/dsa/tree-traversal",
+            "description": "Master inorder, preorder, and postorder traversals",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Binary Search Tree Operations",
+            "url": "https://www.geeksforgeeks.org/binary-search-tree-data-structure/",
+            "description": "Learn BST insertion, deletion, and search",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Binary Trees": [
+        {
+            "title": "Binary Tree Problems and Solutions",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree problem collection",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree LeetCode Problems",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree coding problems",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Height and Depth Algorithms",
+            "url": "https://www.geeksforgeeks.org/write-a-c-program-to-find-the-maximum-depth-or-height-of-a-tree/",
+            "description": "Learn to calculate tree height and depth",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Lowest Common Ancestor",
+            "url": "https://www.geeksforgeeks.org/lowest-common-ancestor-binary-tree-set-1/",
+            "description": "Master LCA algorithms for binary trees",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Graphs": [
+        {
+            "title": "Graph Data Structure and Algorithms",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Complete graph algorithms and implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Traversal Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive BFS and DFS visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Shortest Path Algorithms",
+            "url": "https://www.programiz.com/dsa/dijkstra-algorithm",
+            "description": "Learn Dijkstra's and other shortest path algorithms",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Graph Cycle Detection",
+            "url": "https://www.geeksforgeeks.org/detect-cycle-in-a-graph/",
+            "description": "Detect cycles in directed and undirected graphs",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Dynamic Programming": [
+        {
+            "title": "Dynamic Programming Complete Guide",
+            "url": "https://www.geeksforgeeks.org/dynamic-programming/",
+            "description": "Master dynamic programming with patterns",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "DP Patterns for Coding Interviews",
+            "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns",
+            "description": "Common DP patterns and when to use them",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Dynamic Programming - LeetCode",
+            "url": "https://leetcode.com/tag/dynamic-programming/",
+            "description": "Practice DP problems with detailed solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "DP Optimization Techniques",
+            "url": "https://www.geeksforgeeks.org/overlapping-subproblems-property/",
+            "description": "Learn memoization and tabulation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Sorting Algorithms": [
+        {
+            "title": "Sorting Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/sorting-algorithms/",
+            "description": "All sorting algorithms with complexity analysis",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Sorting Algorithms Visualization",
+            "url": "https://www.sorting-algorithms.com/",
+            "description": "Interactive visualization of all sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Merge Sort vs Quick Sort",
+            "url": "https://www.geeksforgeeks.org/quick-sort-vs-merge-sort/",
+            "description": "Detailed comparison of major sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Counting Sort and Radix Sort",
+            "url": "https://www.geeksforgeeks.org/counting-sort/",
+            "description": "Non-comparison based sorting techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Searching Algorithms": [
+        {
+            "title": "Search Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/searching-algorithms/",
+            "description": "All searching algorithms with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Search Mastery",
+            "url": "https://leetcode.com/explore/learn/card/binary-search/",
+            "description": "Master binary search and its variations",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Search Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html",
+            "description": "Interactive binary search visualization",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Advanced Search Techniques",
+            "url": "https://www.geeksforgeeks.org/ternary-search/",
+            "description": "Ternary search and other advanced techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Stacks": [
+        {
+            "title": "Stack Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack implementation and applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Operations Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Applications Tutorial",
+            "url": "https://www.programiz.com/dsa/stack",
+            "description": "Real-world stack applications and use cases",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Expression Evaluation with Stacks",
+            "url": "https://www.geeksforgeeks.org/stack-set-2-infix-to-postfix/",
+            "description": "Learn infix to postfix conversion using stacks",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Queues": [
+        {
+            "title": "Queue Data Structure Tutorial",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Comprehensive queue implementation guide",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue and Heaps",
+            "url": "https://www.programiz.com/dsa/priority-queue",
+            "description": "Learn priority queues and heap data structure",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Circular Queue Implementation",
+            "url": "https://www.geeksforgeeks.org/circular-queue-set-1-introduction-array-implementation/",
+            "description": "Master circular queue implementation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Trees": [
+        {
+            "title": "Tree Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive tree data structure tutorial",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Traversal Algorithms",
+            "url": "https://www.programiz.com/dsa/tree-traversal",
+            "description": "Master inorder, preorder, and postorder traversals",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Binary Search Tree Operations",
+            "url": "https://www.geeksforgeeks.org/binary-search-tree-data-structure/",
+            "description": "Learn BST insertion, deletion, and search",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Binary Trees": [
+        {
+            "title": "Binary Tree Problems and Solutions",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree problem collection",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree LeetCode Problems",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree coding problems",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Height and Depth Algorithms",
+            "url": "https://www.geeksforgeeks.org/write-a-c-program-to-find-the-maximum-depth-or-height-of-a-tree/",
+            "description": "Learn to calculate tree height and depth",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Lowest Common Ancestor",
+            "url": "https://www.geeksforgeeks.org/lowest-common-ancestor-binary-tree-set-1/",
+            "description": "Master LCA algorithms for binary trees",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Graphs": [
+        {
+            "title": "Graph Data Structure and Algorithms",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Complete graph algorithms and implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Traversal Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive BFS and DFS visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Shortest Path Algorithms",
+            "url": "https://www.programiz.com/dsa/dijkstra-algorithm",
+            "description": "Learn Dijkstra's and other shortest path algorithms",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Graph Cycle Detection",
+            "url": "https://www.geeksforgeeks.org/detect-cycle-in-a-graph/",
+            "description": "Detect cycles in directed and undirected graphs",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Dynamic Programming": [
+        {
+            "title": "Dynamic Programming Complete Guide",
+            "url": "https://www.geeksforgeeks.org/dynamic-programming/",
+            "description": "Master dynamic programming with patterns",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "DP Patterns for Coding Interviews",
+            "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns",
+            "description": "Common DP patterns and when to use them",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Dynamic Programming - LeetCode",
+            "url": "https://leetcode.com/tag/dynamic-programming/",
+            "description": "Practice DP problems with detailed solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "DP Optimization Techniques",
+            "url": "https://www.geeksforgeeks.org/overlapping-subproblems-property/",
+            "description": "Learn memoization and tabulation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Sorting Algorithms": [
+        {
+            "title": "Sorting Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/sorting-algorithms/",
+            "description": "All sorting algorithms with complexity analysis",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Sorting Algorithms Visualization",
+            "url": "https://www.sorting-algorithms.com/",
+            "description": "Interactive visualization of all sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Merge Sort vs Quick Sort",
+            "url": "https://www.geeksforgeeks.org/quick-sort-vs-merge-sort/",
+            "description": "Detailed comparison of major sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Counting Sort and Radix Sort",
+            "url": "https://www.geeksforgeeks.org/counting-sort/",
+            "description": "Non-comparison based sorting techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Searching Algorithms": [
+        {
+            "title": "Search Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/searching-algorithms/",
+            "description": "All searching algorithms with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Search Mastery",
+            "url": "https://leetcode.com/explore/learn/card/binary-search/",
+            "description": "Master binary search and its variations",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Search Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html",
+            "description": "Interactive binary search visualization",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Advanced Search Techniques",
+            "url": "https://www.geeksforgeeks.org/ternary-search/",
+            "description": "Ternary search and other advanced techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Stacks": [
+        {
+            "title": "Stack Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack implementation and applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Operations Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Applications Tutorial",
+            "url": "https://www.programiz.com/dsa/stack",
+            "description": "Real-world stack applications and use cases",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Expression Evaluation with Stacks",
+            "url": "https://www.geeksforgeeks.org/stack-set-2-infix-to-postfix/",
+            "description": "Learn infix to postfix conversion using stacks",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Queues": [
+        {
+            "title": "Queue Data Structure Tutorial",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Comprehensive queue implementation guide",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue and Heaps",
+            "url": "https://www.programiz.com/dsa/priority-queue",
+            "description": "Learn priority queues and heap data structure",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Circular Queue Implementation",
+            "url": "https://www.geeksforgeeks.org/circular-queue-set-1-introduction-array-implementation/",
+            "description": "Master circular queue implementation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Trees": [
+        {
+            "title": "Tree Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive tree data structure tutorial",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Traversal Algorithms",
+            "url": "https://www.programiz.com/dsa/tree-traversal",
+            "description": "Master inorder, preorder, and postorder traversals",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Binary Search Tree Operations",
+            "url": "https://www.geeksforgeeks.org/binary-search-tree-data-structure/",
+            "description": "Learn BST insertion, deletion, and search",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Binary Trees": [
+        {
+            "title": "Binary Tree Problems and Solutions",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree problem collection",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree LeetCode Problems",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree coding problems",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Height and Depth Algorithms",
+            "url": "https://www.geeksforgeeks.org/write-a-c-program-to-find-the-maximum-depth-or-height-of-a-tree/",
+            "description": "Learn to calculate tree height and depth",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Lowest Common Ancestor",
+            "url": "https://www.geeksforgeeks.org/lowest-common-ancestor-binary-tree-set-1/",
+            "description": "Master LCA algorithms for binary trees",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Graphs": [
+        {
+            "title": "Graph Data Structure and Algorithms",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Complete graph algorithms and implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Traversal Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive BFS and DFS visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Shortest Path Algorithms",
+            "url": "https://www.programiz.com/dsa/dijkstra-algorithm",
+            "description": "Learn Dijkstra's and other shortest path algorithms",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Graph Cycle Detection",
+            "url": "https://www.geeksforgeeks.org/detect-cycle-in-a-graph/",
+            "description": "Detect cycles in directed and undirected graphs",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Dynamic Programming": [
+        {
+            "title": "Dynamic Programming Complete Guide",
+            "url": "https://www.geeksforgeeks.org/dynamic-programming/",
+            "description": "Master dynamic programming with patterns",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "DP Patterns for Coding Interviews",
+            "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns",
+            "description": "Common DP patterns and when to use them",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Dynamic Programming - LeetCode",
+            "url": "https://leetcode.com/tag/dynamic-programming/",
+            "description": "Practice DP problems with detailed solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "DP Optimization Techniques",
+            "url": "https://www.geeksforgeeks.org/overlapping-subproblems-property/",
+            "description": "Learn memoization and tabulation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Sorting Algorithms": [
+        {
+            "title": "Sorting Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/sorting-algorithms/",
+            "description": "All sorting algorithms with complexity analysis",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Sorting Algorithms Visualization",
+            "url": "https://www.sorting-algorithms.com/",
+            "description": "Interactive visualization of all sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Merge Sort vs Quick Sort",
+            "url": "https://www.geeksforgeeks.org/quick-sort-vs-merge-sort/",
+            "description": "Detailed comparison of major sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Counting Sort and Radix Sort",
+            "url": "https://www.geeksforgeeks.org/counting-sort/",
+            "description": "Non-comparison based sorting techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Searching Algorithms": [
+        {
+            "title": "Search Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/searching-algorithms/",
+            "description": "All searching algorithms with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Search Mastery",
+            "url": "https://leetcode.com/explore/learn/card/binary-search/",
+            "description": "Master binary search and its variations",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Search Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html",
+            "description": "Interactive binary search visualization",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Advanced Search Techniques",
+            "url": "https://www.geeksforgeeks.org/ternary-search/",
+            "description": "Ternary search and other advanced techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Stacks": [
+        {
+            "title": "Stack Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack implementation and applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Operations Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Applications Tutorial",
+            "url": "https://www.programiz.com/dsa/stack",
+            "description": "Real-world stack applications and use cases",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Expression Evaluation with Stacks",
+            "url": "https://www.geeksforgeeks.org/stack-set-2-infix-to-postfix/",
+            "description": "Learn infix to postfix conversion using stacks",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Queues": [
+        {
+            "title": "Queue Data Structure Tutorial",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Comprehensive queue implementation guide",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue and Heaps",
+            "url": "https://www.programiz.com/dsa/priority-queue",
+            "description": "Learn priority queues and heap data structure",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Circular Queue Implementation",
+            "url": "https://www.geeksforgeeks.org/circular-queue-set-1-introduction-array-implementation/",
+            "description": "Master circular queue implementation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Trees": [
+        {
+            "title": "Tree Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive tree data structure tutorial",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Traversal Algorithms",
+            "url": "https://www.programiz.com/dsa/tree-traversal",
+            "description": "Master inorder, preorder, and postorder traversals",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Binary Search Tree Operations",
+            "url": "https://www.geeksforgeeks.org/binary-search-tree-data-structure/",
+            "description": "Learn BST insertion, deletion, and search",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Binary Trees": [
+        {
+            "title": "Binary Tree Problems and Solutions",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree problem collection",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree LeetCode Problems",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree coding problems",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Height and Depth Algorithms",
+            "url": "https://www.geeksforgeeks.org/write-a-c-program-to-find-the-maximum-depth-or-height-of-a-tree/",
+            "description": "Learn to calculate tree height and depth",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Lowest Common Ancestor",
+            "url": "https://www.geeksforgeeks.org/lowest-common-ancestor-binary-tree-set-1/",
+            "description": "Master LCA algorithms for binary trees",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Graphs": [
+        {
+            "title": "Graph Data Structure and Algorithms",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Complete graph algorithms and implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Traversal Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive BFS and DFS visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Shortest Path Algorithms",
+            "url": "https://www.programiz.com/dsa/dijkstra-algorithm",
+            "description": "Learn Dijkstra's and other shortest path algorithms",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Graph Cycle Detection",
+            "url": "https://www.geeksforgeeks.org/detect-cycle-in-a-graph/",
+            "description": "Detect cycles in directed and undirected graphs",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Dynamic Programming": [
+        {
+            "title": "Dynamic Programming Complete Guide",
+            "url": "https://www.geeksforgeeks.org/dynamic-programming/",
+            "description": "Master dynamic programming with patterns",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "DP Patterns for Coding Interviews",
+            "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns",
+            "description": "Common DP patterns and when to use them",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Dynamic Programming - LeetCode",
+            "url": "https://leetcode.com/tag/dynamic-programming/",
+            "description": "Practice DP problems with detailed solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "DP Optimization Techniques",
+            "url": "https://www.geeksforgeeks.org/overlapping-subproblems-property/",
+            "description": "Learn memoization and tabulation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Sorting Algorithms": [
+        {
+            "title": "Sorting Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/sorting-algorithms/",
+            "description": "All sorting algorithms with complexity analysis",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Sorting Algorithms Visualization",
+            "url": "https://www.sorting-algorithms.com/",
+            "description": "Interactive visualization of all sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Merge Sort vs Quick Sort",
+            "url": "https://www.geeksforgeeks.org/quick-sort-vs-merge-sort/",
+            "description": "Detailed comparison of major sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Counting Sort and Radix Sort",
+            "url": "https://www.geeksforgeeks.org/counting-sort/",
+            "description": "Non-comparison based sorting techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Searching Algorithms": [
+        {
+            "title": "Search Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/searching-algorithms/",
+            "description": "All searching algorithms with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Search Mastery",
+            "url": "https://leetcode.com/explore/learn/card/binary-search/",
+            "description": "Master binary search and its variations",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Search Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html",
+            "description": "Interactive binary search visualization",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Advanced Search Techniques",
+            "url": "https://www.geeksforgeeks.org/ternary-search/",
+            "description": "Ternary search and other advanced techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Stacks": [
+        {
+            "title": "Stack Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack implementation and applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Operations Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Applications Tutorial",
+            "url": "https://www.programiz.com/dsa/stack",
+            "description": "Real-world stack applications and use cases",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Expression Evaluation with Stacks",
+            "url": "https://www.geeksforgeeks.org/stack-set-2-infix-to-postfix/",
+            "description": "Learn infix to postfix conversion using stacks",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Queues": [
+        {
+            "title": "Queue Data Structure Tutorial",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Comprehensive queue implementation guide",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue and Heaps",
+            "url": "https://www.programiz.com/dsa/priority-queue",
+            "description": "Learn priority queues and heap data structure",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Circular Queue Implementation",
+            "url": "https://www.geeksforgeeks.org/circular-queue-set-1-introduction-array-implementation/",
+            "description": "Master circular queue implementation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Trees": [
+        {
+            "title": "Tree Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive tree data structure tutorial",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Traversal Algorithms",
+            "url": "https://www.programiz.com/dsa/tree-traversal",
+            "description": "Master inorder, preorder, and postorder traversals",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Binary Search Tree Operations",
+            "url": "https://www.geeksforgeeks.org/binary-search-tree-data-structure/",
+            "description": "Learn BST insertion, deletion, and search",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Binary Trees": [
+        {
+            "title": "Binary Tree Problems and Solutions",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree problem collection",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree LeetCode Problems",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree coding problems",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Height and Depth Algorithms",
+            "url": "https://www.geeksforgeeks.org/write-a-c-program-to-find-the-maximum-depth-or-height-of-a-tree/",
+            "description": "Learn to calculate tree height and depth",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Lowest Common Ancestor",
+            "url": "https://www.geeksforgeeks.org/lowest-common-ancestor-binary-tree-set-1/",
+            "description": "Master LCA algorithms for binary trees",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Graphs": [
+        {
+            "title": "Graph Data Structure and Algorithms",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Complete graph algorithms and implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Traversal Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive BFS and DFS visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Shortest Path Algorithms",
+            "url": "https://www.programiz.com/dsa/dijkstra-algorithm",
+            "description": "Learn Dijkstra's and other shortest path algorithms",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Graph Cycle Detection",
+            "url": "https://www.geeksforgeeks.org/detect-cycle-in-a-graph/",
+            "description": "Detect cycles in directed and undirected graphs",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Dynamic Programming": [
+        {
+            "title": "Dynamic Programming Complete Guide",
+            "url": "https://www.geeksforgeeks.org/dynamic-programming/",
+            "description": "Master dynamic programming with patterns",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "DP Patterns for Coding Interviews",
+            "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns",
+            "description": "Common DP patterns and when to use them",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Dynamic Programming - LeetCode",
+            "url": "https://leetcode.com/tag/dynamic-programming/",
+            "description": "Practice DP problems with detailed solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "DP Optimization Techniques",
+            "url": "https://www.geeksforgeeks.org/overlapping-subproblems-property/",
+            "description": "Learn memoization and tabulation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Sorting Algorithms": [
+        {
+            "title": "Sorting Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/sorting-algorithms/",
+            "description": "All sorting algorithms with complexity analysis",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Sorting Algorithms Visualization",
+            "url": "https://www.sorting-algorithms.com/",
+            "description": "Interactive visualization of all sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Merge Sort vs Quick Sort",
+            "url": "https://www.geeksforgeeks.org/quick-sort-vs-merge-sort/",
+            "description": "Detailed comparison of major sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Counting Sort and Radix Sort",
+            "url": "https://www.geeksforgeeks.org/counting-sort/",
+            "description": "Non-comparison based sorting techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Searching Algorithms": [
+        {
+            "title": "Search Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/searching-algorithms/",
+            "description": "All searching algorithms with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Search Mastery",
+            "url": "https://leetcode.com/explore/learn/card/binary-search/",
+            "description": "Master binary search and its variations",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Search Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html",
+            "description": "Interactive binary search visualization",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Advanced Search Techniques",
+            "url": "https://www.geeksforgeeks.org/ternary-search/",
+            "description": "Ternary search and other advanced techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Stacks": [
+        {
+            "title": "Stack Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack implementation and applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Operations Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Applications Tutorial",
+            "url": "https://www.programiz.com/dsa/stack",
+            "description": "Real-world stack applications and use cases",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Expression Evaluation with Stacks",
+            "url": "https://www.geeksforgeeks.org/stack-set-2-infix-to-postfix/",
+            "description": "Learn infix to postfix conversion using stacks",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Queues": [
+        {
+            "title": "Queue Data Structure Tutorial",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Comprehensive queue implementation guide",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue and Heaps",
+            "url": "https://www.programiz.com/dsa/priority-queue",
+            "description": "Learn priority queues and heap data structure",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Circular Queue Implementation",
+            "url": "https://www.geeksforgeeks.org/circular-queue-set-1-introduction-array-implementation/",
+            "description": "Master circular queue implementation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Trees": [
+        {
+            "title": "Tree Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive tree data structure tutorial",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Traversal Algorithms",
+            "url": "https://www.programiz.com/dsa/tree-traversal",
+            "description": "Master inorder, preorder, and postorder traversals",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Binary Search Tree Operations",
+            "url": "https://www.geeksforgeeks.org/binary-search-tree-data-structure/",
+            "description": "Learn BST insertion, deletion, and search",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Binary Trees": [
+        {
+            "title": "Binary Tree Problems and Solutions",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree problem collection",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree LeetCode Problems",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree coding problems",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Height and Depth Algorithms",
+            "url": "https://www.geeksforgeeks.org/write-a-c-program-to-find-the-maximum-depth-or-height-of-a-tree/",
+            "description": "Learn to calculate tree height and depth",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Lowest Common Ancestor",
+            "url": "https://www.geeksforgeeks.org/lowest-common-ancestor-binary-tree-set-1/",
+            "description": "Master LCA algorithms for binary trees",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Graphs": [
+        {
+            "title": "Graph Data Structure and Algorithms",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Complete graph algorithms and implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Traversal Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive BFS and DFS visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Shortest Path Algorithms",
+            "url": "https://www.programiz.com/dsa/dijkstra-algorithm",
+            "description": "Learn Dijkstra's and other shortest path algorithms",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Graph Cycle Detection",
+            "url": "https://www.geeksforgeeks.org/detect-cycle-in-a-graph/",
+            "description": "Detect cycles in directed and undirected graphs",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Dynamic Programming": [
+        {
+            "title": "Dynamic Programming Complete Guide",
+            "url": "https://www.geeksforgeeks.org/dynamic-programming/",
+            "description": "Master dynamic programming with patterns",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "DP Patterns for Coding Interviews",
+            "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns",
+            "description": "Common DP patterns and when to use them",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Dynamic Programming - LeetCode",
+            "url": "https://leetcode.com/tag/dynamic-programming/",
+            "description": "Practice DP problems with detailed solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "DP Optimization Techniques",
+            "url": "https://www.geeksforgeeks.org/overlapping-subproblems-property/",
+            "description": "Learn memoization and tabulation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Sorting Algorithms": [
+        {
+            "title": "Sorting Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/sorting-algorithms/",
+            "description": "All sorting algorithms with complexity analysis",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Sorting Algorithms Visualization",
+            "url": "https://www.sorting-algorithms.com/",
+            "description": "Interactive visualization of all sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Merge Sort vs Quick Sort",
+            "url": "https://www.geeksforgeeks.org/quick-sort-vs-merge-sort/",
+            "description": "Detailed comparison of major sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Counting Sort and Radix Sort",
+            "url": "https://www.geeksforgeeks.org/counting-sort/",
+            "description": "Non-comparison based sorting techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Searching Algorithms": [
+        {
+            "title": "Search Algorithms Complete Guide",
+            "url": "https://www.geeksforgeeks.org/searching-algorithms/",
+            "description": "All searching algorithms with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Search Mastery",
+            "url": "https://leetcode.com/explore/learn/card/binary-search/",
+            "description": "Master binary search and its variations",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Search Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html",
+            "description": "Interactive binary search visualization",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Advanced Search Techniques",
+            "url": "https://www.geeksforgeeks.org/ternary-search/",
+            "description": "Ternary search and other advanced techniques",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Stacks": [
+        {
+            "title": "Stack Data Structure Guide",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack implementation and applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Operations Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Applications Tutorial",
+            "url": "https://www.programiz.com/dsa/stack",
+            "description": "Real-world stack applications and use cases",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Expression Evaluation with Stacks",
+            "url": "https://www.geeksforgeeks.org/stack-set-2-infix-to-postfix/",
+            "description": "Learn infix to postfix conversion using stacks",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Queues": [
+        {
+            "title": "Queue Data Structure Tutorial",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Comprehensive queue implementation guide",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue and Heaps",
+            "url": "https://www.programiz.com/dsa/priority-queue",
+            "description": "Learn priority queues and heap data structure",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Circular Queue Implementation",
+            "url": "https://www.geeksforgeeks.org/circular-queue-set-1-introduction-array-implementation/",
+            "description": "Master circular queue implementation",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Trees": [
+        {
+            "title": "Tree Data Structure Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive tree data structure tutorial",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Traversal Algorithms",
+            "url": "https://www.programiz.com/dsa/tree-traversal",
+            "description": "Master inorder, preorder, and postorder traversals",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Binary Search Tree Operations",
+            "url": "https://www.geeksforgeeks.org/binary-search-tree-data-structure/",
+            "description": "Learn BST insertion, deletion, and search",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Binary Trees": [
+        {
+            "title": "Binary Tree Problems and Solutions",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree problem collection",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree LeetCode Problems",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree coding problems",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Height and Depth Algorithms",
+            "url": "https://www.geeksforgeeks.org/write-a-c-program-to-find-the-maximum-depth-or-height-of-a-tree/",
+            "description": "Learn to calculate tree height and depth",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Lowest Common Ancestor",
+            "url": "https://www.geeksforgeeks.org/lowest-common-ancestor-binary-tree-set-1/",
+            "description": "Master LCA algorithms for binary trees",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "Graphs": [
+        {
+            "title": "Graph Data Structure and Algorithms",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Complete graph algorithms and implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Traversal Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive BFS and DFS visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Shortest Path Algorithms",
+            "url": "https://www.programiz.com/dsa/dijkstra-algorithm",
+            "description": "Learn shortest path algorithms like Dijkstra and Floyd-Warshall",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    # Design & Creative
+    "Photoshop": [
+        {
+            "title": "Adobe Photoshop Tutorials",
+            "url": "https://helpx.adobe.com/photoshop/tutorials.html",
+            "description": "Official Adobe Photoshop tutorials",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "GIMP Alternative Tutorial",
+            "url": "https://www.gimp.org/tutorials/",
+            "description": "Free alternative to Photoshop with tutorials",
+            "resource_type": "course",
+            "quality_score": 85
+        }
+    ],
+    "Figma": [
+        {
+            "title": "Figma Academy",
+            "url": "https://www.figma.com/academy/",
+            "description": "Official Figma design tutorials",
+            "resource_type": "course",
+            "quality_score": 92
+        },
+        {
+            "title": "Figma Tutorial - freeCodeCamp",
+            "url": "https://www.youtube.com/watch?v=jwCmIBJ8Jtc",
+            "description": "Complete Figma course for beginners",
+            "resource_type": "video",
+            "quality_score": 88
+        }
+    ],
+    "UI/UX Design": [
+        {
+            "title": "Google UX Design Certificate",
+            "url": "https://www.coursera.org/professional-certificates/google-ux-design",
+            "description": "Professional UX design course (audit for free)",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "UX Design Fundamentals",
+            "url": "https://www.interaction-design.org/",
+            "description": "Free UX design courses and articles",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    
+    # Cloud & DevOps
+    "AWS": [
+        {
+            "title": "AWS Training and Certification",
+            "url": "https://aws.amazon.com/training/",
+            "description": "Free AWS training courses and labs",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "AWS Cloud Practitioner Essentials",
+            "url": "https://aws.amazon.com/training/course-descriptions/cloud-practitioner-essentials/",
+            "description": "Free foundational AWS course",
+            "resource_type": "course",
+            "quality_score": 92
+        }
+    ],
+    "Docker": [
+        {
+            "title": "Docker Documentation",
+            "url": "https://docs.docker.com/",
+            "description": "Official Docker documentation and tutorials",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Docker Tutorial for Beginners",
+            "url": "https://www.youtube.com/watch?v=fqMOX6JJhGo",
+            "description": "Complete Docker course",
+            "resource_type": "video",
+            "quality_score": 90
+        }
+    ],
+    "Kubernetes": [
+        {
+            "title": "Kubernetes Documentation",
+            "url": "https://kubernetes.io/docs/home/",
+            "description": "Official Kubernetes documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Kubernetes Tutorial - freeCodeCamp",
+            "url": "https://www.freecodecamp.org/news/learn-kubernetes-in-under-3-hours-a-detailed-guide-to-orchestrating-containers/",
+            "description": "Complete Kubernetes tutorial",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    
+    # Mobile Development
+    "Android Development": [
+        {
+            "title": "Android Developer Guides",
+            "url": "https://developer.android.com/guide",
+            "description": "Official Android development documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Android Development - Udacity",
+            "url": "https://www.udacity.com/course/android-kotlin-developer-nanodegree--nd940",
+            "description": "Free Android development courses",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "iOS Development": [
+        {
+            "title": "Apple Developer Documentation",
+            "url": "https://developer.apple.com/documentation/",
+            "description": "Official iOS development documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "iOS Development Tutorial",
+            "url": "https://www.raywenderlich.com/ios",
+            "description": "Comprehensive iOS development tutorials",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "React Native": [
+        {
+            "title": "React Native Documentation",
+            "url": "https://reactnative.dev/docs/getting-started",
+            "description": "Official React Native documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "React Native Tutorial",
+            "url": "https://www.freecodecamp.org/news/create-an-app-with-react-native/",
+            "description": "Complete React Native course",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "Flutter": [
+        {
+            "title": "Flutter Documentation",
+            "url": "https://flutter.dev/docs",
+            "description": "Official Flutter documentation and tutorials",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Flutter Course - freeCodeCamp",
+            "url": "https://www.freecodecamp.org/news/learn-flutter-full-course/",
+            "description": "Complete Flutter development course",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    
+    # Business & Soft Skills
+    "Digital Marketing": [
+        {
+            "title": "Google Digital Marketing Course",
+            "url": "https://learndigital.withgoogle.com/digitalgarage",
+            "description": "Free digital marketing certification from Google",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "HubSpot Academy",
+            "url": "https://academy.hubspot.com/",
+            "description": "Free marketing, sales, and service courses",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "Project Management": [
+        {
+            "title": "Google Project Management Certificate",
+            "url": "https://www.coursera.org/professional-certificates/google-project-management",
+            "description": "Professional project management course (audit for free)",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "PMI Resources",
+            "url": "https://www.pmi.org/learning/library",
+            "description": "Project management resources and guides",
+            "resource_type": "article",
+            "quality_score": 88
+        }
+    ],
+    "Public Speaking": [
+        {
+            "title": "Toastmasters International",
+            "url": "https://www.toastmasters.org/pathways-overview",
+            "description": "Public speaking and leadership development",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "TED Masterclass",
+            "url": "https://www.ted.com/playlists/574/how_to_make_a_great_presentation",
+            "description": "Learn from the best TED speakers",
+            "resource_type": "video",
+            "quality_score": 88
+        }
+    ],
+
+    # Additional Programming Languages
+    "Java": [
+        {
+            "title": "Oracle Java Tutorial",
+            "url": "https://docs.oracle.com/javase/tutorial/",
+            "description": "Official Java tutorial from Oracle",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Java Programming - freeCodeCamp",
+            "url": "https://www.freecodecamp.org/news/java-tutorial-for-beginners/",
+            "description": "Complete Java programming course",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Codecademy Java Course",
+            "url": "https://www.codecademy.com/learn/learn-java",
+            "description": "Interactive Java programming course",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "Java Code Examples",
+            "url": "https://www.programiz.com/java-programming",
+            "description": "Java programming examples and tutorials",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "C++": [
+        {
+            "title": "C++ Tutorial - cplusplus.com",
+            "url": "https://www.cplusplus.com/doc/tutorial/",
+            "description": "Comprehensive C++ programming tutorial",
+            "resource_type": "documentation",
+            "quality_score": 92
+        },
+        {
+            "title": "Learn C++ - freeCodeCamp",
+            "url": "https://www.freecodecamp.org/news/c-plus-plus-tutorial/",
+            "description": "Complete C++ programming course",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "C++ Programming Examples",
+            "url": "https://www.programiz.com/cpp-programming",
+            "description": "C++ examples and practice problems",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "C#": [
+        {
+            "title": "Microsoft C# Documentation",
+            "url": "https://docs.microsoft.com/en-us/dotnet/csharp/",
+            "description": "Official C# documentation and tutorials",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "C# Tutorial - W3Schools",
+            "url": "https://www.w3schools.com/cs/",
+            "description": "Interactive C# tutorial with examples",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "Go": [
+        {
+            "title": "Go by Example",
+            "url": "https://gobyexample.com/",
+            "description": "Hands-on introduction to Go programming",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Tour of Go",
+            "url": "https://tour.golang.org/",
+            "description": "Interactive introduction to Go",
+            "resource_type": "course",
+            "quality_score": 92
+        }
+    ],
+    "Rust": [
+        {
+            "title": "The Rust Programming Language Book",
+            "url": "https://doc.rust-lang.org/book/",
+            "description": "The official Rust programming language book",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Rust by Example",
+            "url": "https://doc.rust-lang.org/stable/rust-by-example/",
+            "description": "Learn Rust with examples",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "Swift": [
+        {
+            "title": "Swift Programming Language Guide",
+            "url": "https://docs.swift.org/swift-book/",
+            "description": "Official Swift programming guide",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "100 Days of SwiftUI",
+            "url": "https://www.hackingwithswift.com/100/swiftui",
+            "description": "Free SwiftUI course",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "Kotlin": [
+        {
+            "title": "Kotlin Documentation",
+            "url": "https://kotlinlang.org/docs/",
+            "description": "Official Kotlin documentation and tutorials",
+            "resource_type": "documentation",
+            "quality_score": 92
+        },
+        {
+            "title": "Kotlin Koans",
+            "url": "https://play.kotlinlang.org/koans/",
+            "description": "Interactive Kotlin exercises",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    
+    # Frameworks and Libraries
+    "Angular": [
+        {
+            "title": "Angular Documentation",
+            "url": "https://angular.io/docs",
+            "description": "Official Angular documentation and tutorials",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Angular Tutorial - freeCodeCamp",
+            "url": "https://www.freecodecamp.org/learn/front-end-development-libraries/",
+            "description": "Complete Angular course",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "Vue.js": [
+        {
+            "title": "Vue.js Guide",
+            "url": "https://vuejs.org/guide/",
+            "description": "Official Vue.js guide and documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Vue Mastery",
+            "url": "https://www.vuemastery.com/courses-path/beginner",
+            "description": "Free Vue.js courses for beginners",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "Django": [
+        {
+            "title": "Django Documentation",
+            "url": "https://docs.djangoproject.com/en/stable/",
+            "description": "Official Django documentation and tutorial",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Django for Beginners",
+            "url": "https://djangoforbeginners.com/",
+            "description": "Complete Django tutorial book",
+            "resource_type": "article",
+            "quality_score": 90
+        }
+    ],
+    "Flask": [
+        {
+            "title": "Flask Documentation",
+            "url": "https://flask.palletsprojects.com/",
+            "description": "Official Flask documentation and quickstart",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Flask Mega-Tutorial",
+            "url": "https://blog.miguelgrinberg.com/post/the-flask-mega-tutorial-part-i-hello-world",
+            "description": "Comprehensive Flask tutorial series",
+            "resource_type": "article",
+            "quality_score": 92
+        }
+    ],
+    
+    # Data & Analytics
+    "Excel": [
+        {
+            "title": "Excel Tutorial - ExcelJet",
+            "url": "https://exceljet.net/excel-tutorial",
+            "description": "Comprehensive Excel tutorials and tips",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Microsoft Excel Help Center",
+            "url": "https://support.microsoft.com/en-us/excel",
+            "description": "Official Excel help and tutorials",
+            "resource_type": "documentation",
+            "quality_score": 88
+        }
+    ],
+    "Tableau": [
+        {
+            "title": "Tableau Learning",
+            "url": "https://www.tableau.com/learn",
+            "description": "Free Tableau training and tutorials",
+            "resource_type": "course",
+            "quality_score": 92
+        },
+        {
+            "title": "Tableau Public Training",
+            "url": "https://public.tableau.com/en-us/s/resources",
+            "description": "Free resources for Tableau Public",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "Power BI": [
+        {
+            "title": "Microsoft Power BI Learning",
+            "url": "https://docs.microsoft.com/en-us/power-bi/guided-learning/",
+            "description": "Official Power BI guided learning",
+            "resource_type": "course",
+            "quality_score": 92
+        },
+        {
+            "title": "Power BI YouTube Channel",
+            "url": "https://www.youtube.com/user/mspowerbi",
+            "description": "Official Power BI video tutorials",
+            "resource_type": "video",
+            "quality_score": 88
+        }
+    ],
+    
+    # Design & Creative
+    "Photoshop": [
+        {
+            "title": "Adobe Photoshop Tutorials",
+            "url": "https://helpx.adobe.com/photoshop/tutorials.html",
+            "description": "Official Adobe Photoshop tutorials",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "GIMP Alternative Tutorial",
+            "url": "https://www.gimp.org/tutorials/",
+            "description": "Free alternative to Photoshop with tutorials",
+            "resource_type": "course",
+            "quality_score": 85
+        }
+    ],
+    "Figma": [
+        {
+            "title": "Figma Academy",
+            "url": "https://www.figma.com/academy/",
+            "description": "Official Figma design tutorials",
+            "resource_type": "course",
+            "quality_score": 92
+        },
+        {
+            "title": "Figma Tutorial - freeCodeCamp",
+            "url": "https://www.youtube.com/watch?v=jwCmIBJ8Jtc",
+            "description": "Complete Figma course for beginners",
+            "resource_type": "video",
+            "quality_score": 88
+        }
+    ],
+    "UI/UX Design": [
+        {
+            "title": "Google UX Design Certificate",
+            "url": "https://www.coursera.org/professional-certificates/google-ux-design",
+            "description": "Professional UX design course (audit for free)",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "UX Design Fundamentals",
+            "url": "https://www.interaction-design.org/",
+            "description": "Free UX design courses and articles",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    
+    # Cloud & DevOps
+    "AWS": [
+        {
+            "title": "AWS Training and Certification",
+            "url": "https://aws.amazon.com/training/",
+            "description": "Free AWS training courses and labs",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "AWS Cloud Practitioner Essentials",
+            "url": "https://aws.amazon.com/training/course-descriptions/cloud-practitioner-essentials/",
+            "description": "Free foundational AWS course",
+            "resource_type": "course",
+            "quality_score": 92
+        }
+    ],
+    "Docker": [
+        {
+            "title": "Docker Documentation",
+            "url": "https://docs.docker.com/",
+            "description": "Official Docker documentation and tutorials",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Docker Tutorial for Beginners",
+            "url": "https://www.youtube.com/watch?v=fqMOX6JJhGo",
+            "description": "Complete Docker course",
+            "resource_type": "video",
+            "quality_score": 90
+        }
+    ],
+    "Kubernetes": [
+        {
+            "title": "Kubernetes Documentation",
+            "url": "https://kubernetes.io/docs/home/",
+            "description": "Official Kubernetes documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Kubernetes Tutorial - freeCodeCamp",
+            "url": "https://www.freecodecamp.org/news/learn-kubernetes-in-under-3-hours-a-detailed-guide-to-orchestrating-containers/",
+            "description": "Complete Kubernetes tutorial",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    
+    # Mobile Development
+    "Android Development": [
+        {
+            "title": "Android Developer Guides",
+            "url": "https://developer.android.com/guide",
+            "description": "Official Android development documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Android Development - Udacity",
+            "url": "https://www.udacity.com/course/android-kotlin-developer-nanodegree--nd940",
+            "description": "Free Android development courses",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "iOS Development": [
+        {
+            "title": "Apple Developer Documentation",
+            "url": "https://developer.apple.com/documentation/",
+            "description": "Official iOS development documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "iOS Development Tutorial",
+            "url": "https://www.raywenderlich.com/ios",
+            "description": "Comprehensive iOS development tutorials",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "React Native": [
+        {
+            "title": "React Native Documentation",
+            "url": "https://reactnative.dev/docs/getting-started",
+            "description": "Official React Native documentation",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "React Native Tutorial",
+            "url": "https://www.freecodecamp.org/news/create-an-app-with-react-native/",
+            "description": "Complete React Native course",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "Flutter": [
+        {
+            "title": "Flutter Documentation",
+            "url": "https://flutter.dev/docs",
+            "description": "Official Flutter documentation and tutorials",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Flutter Course - freeCodeCamp",
+            "url": "https://www.freecodecamp.org/news/learn-flutter-full-course/",
+            "description": "Complete Flutter development course",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    
+    # Business & Soft Skills
+    "Digital Marketing": [
+        {
+            "title": "Google Digital Marketing Course",
+            "url": "https://learndigital.withgoogle.com/digitalgarage",
+            "description": "Free digital marketing certification from Google",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "HubSpot Academy",
+            "url": "https://academy.hubspot.com/",
+            "description": "Free marketing, sales, and service courses",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "Project Management": [
+        {
+            "title": "Google Project Management Certificate",
+            "url": "https://www.coursera.org/professional-certificates/google-project-management",
+            "description": "Professional project management course (audit for free)",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "PMI Resources",
+            "url": "https://www.pmi.org/learning/library",
+            "description": "Project management resources and guides",
+            "resource_type": "article",
+            "quality_score": 88
+        }
+    ],
+    "Public Speaking": [
+        {
+            "title": "Toastmasters International",
+            "url": "https://www.toastmasters.org/pathways-overview",
+            "description": "Public speaking and leadership development",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "TED Masterclass",
+            "url": "https://www.ted.com/playlists/574/how_to_make_a_great_presentation",
+            "description": "Learn from the best TED speakers",
+            "resource_type": "video",
+            "quality_score": 88
+        }
+    ]
+}
+
+# Comprehensive subskill-specific resources for detailed learning paths
+SUBSKILL_RESOURCES = {
+    # Data Structures & Algorithms Subskills
+    "arrays": [
+        {
+            "title": "Array Data Structure - GeeksforGeeks",
+            "url": "https://www.geeksforgeeks.org/array-data-structure/",
+            "description": "Comprehensive guide to arrays with problems and solutions",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Array Problems - LeetCode",
+            "url": "https://leetcode.com/tag/array/",
+            "description": "Practice array problems with detailed solutions",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Arrays Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Array.html",
+            "description": "Interactive array operations visualization",
+            "resource_type": "article",
+            "quality_score": 88
+        }
+    ],
+    "linked lists": [
+        {
+            "title": "Linked List Data Structure",
+            "url": "https://www.geeksforgeeks.org/data-structures/linked-list/",
+            "description": "Complete guide to linked lists with implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Linked List Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/LinkedList.html",
+            "description": "Interactive linked list operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Linked List Problems - HackerRank",
+            "url": "https://www.hackerrank.com/domains/data-structures/linked-lists",
+            "description": "Practice linked list problems with step-by-step solutions",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "stacks": [
+        {
+            "title": "Stack Data Structure",
+            "url": "https://www.geeksforgeeks.org/stack-data-structure/",
+            "description": "Complete stack implementation and applications",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Stack Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/StackArray.html",
+            "description": "Interactive stack operations visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Stack Applications Tutorial",
+            "url": "https://www.programiz.com/dsa/stack",
+            "description": "Stack applications with real-world examples",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "queues": [
+        {
+            "title": "Queue Data Structure",
+            "url": "https://www.geeksforgeeks.org/queue-data-structure/",
+            "description": "Comprehensive queue implementation guide",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Queue Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/QueueArray.html",
+            "description": "Interactive queue operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Priority Queue Tutorial",
+            "url": "https://www.programiz.com/dsa/priority-queue",
+            "description": "Priority queues and heap implementation",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "trees": [
+        {
+            "title": "Tree Data Structure",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Complete guide to tree data structures",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Tree Traversal Algorithms",
+            "url": "https://www.programiz.com/dsa/tree-traversal",
+            "description": "In-depth tree traversal techniques",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "binary trees": [
+        {
+            "title": "Binary Tree Complete Guide",
+            "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/",
+            "description": "Comprehensive binary tree tutorial with problems",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Binary Tree Problems - LeetCode",
+            "url": "https://leetcode.com/tag/binary-tree/",
+            "description": "Practice binary tree problems",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Tree Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html",
+            "description": "Interactive binary tree operations",
+            "resource_type": "article",
+            "quality_score": 88
+        }
+    ],
+    "graphs": [
+        {
+            "title": "Graph Data Structure",
+            "url": "https://www.geeksforgeeks.org/graph-data-structure-and-algorithms/",
+            "description": "Complete graph algorithms and implementations",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Graph Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/BFS.html",
+            "description": "Interactive graph traversal algorithms",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Graph Algorithms Course",
+            "url": "https://www.coursera.org/learn/algorithms-on-graphs",
+            "description": "Free algorithms on graphs course",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "sorting algorithms": [
+        {
+            "title": "Sorting Algorithms Guide",
+            "url": "https://www.geeksforgeeks.org/sorting-algorithms/",
+            "description": "Complete guide to all sorting algorithms",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Sorting Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/ComparisonSort.html",
+            "description": "Interactive sorting algorithm visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Sorting Algorithms Comparison",
+            "url": "https://www.programiz.com/dsa/sorting-algorithm",
+            "description": "Time complexity analysis of sorting algorithms",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "searching algorithms": [
+        {
+            "title": "Searching Algorithms",
+            "url": "https://www.geeksforgeeks.org/searching-algorithms/",
+            "description": "Binary search, linear search, and advanced techniques",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Search Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html",
+            "description": "Interactive searching algorithm visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Binary Search Mastery",
+            "url": "https://leetcode.com/explore/learn/card/binary-search/",
+            "description": "Complete binary search tutorial with problems",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "dynamic programming": [
+        {
+            "title": "Dynamic Programming Guide",
+            "url": "https://www.geeksforgeeks.org/dynamic-programming/",
+            "description": "Complete dynamic programming tutorial with patterns",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "DP Patterns for Coding Interviews",
+            "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns",
+            "description": "Essential DP patterns with examples",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Dynamic Programming Course",
+            "url": "https://www.coursera.org/learn/algorithmic-toolbox",
+            "description": "Free algorithmic toolbox course covering DP",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "recursion": [
+        {
+            "title": "Recursion Complete Guide",
+            "url": "https://www.geeksforgeeks.org/recursion/",
+            "description": "Master recursion with examples and practice problems",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Recursion Visualization",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/RecursiveFactorial.html",
+            "description": "Interactive recursion visualization",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Thinking Recursively",
+            "url": "https://think-recursively.com/",
+            "description": "Learn to think recursively with interactive examples",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+
+    # Web Development Subskills
+    "html basics": [
+        {
+            "title": "HTML5 Tutorial - MDN",
+            "url": "https://developer.mozilla.org/en-US/docs/Learn/HTML",
+            "description": "Complete HTML5 tutorial from Mozilla",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "HTML Tutorial - W3Schools",
+            "url": "https://www.w3schools.com/html/",
+            "description": "Interactive HTML tutorial with examples",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "HTML Semantic Elements",
+            "url": "https://www.freecodecamp.org/news/semantic-html5-elements/",
+            "description": "Learn semantic HTML for better accessibility",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "css styling": [
+        {
+            "title": "CSS Complete Guide - MDN",
+            "url": "https://developer.mozilla.org/en-US/docs/Learn/CSS",
+            "description": "Comprehensive CSS learning guide",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "CSS Grid Garden",
+            "url": "https://cssgridgarden.com/",
+            "description": "Learn CSS Grid through interactive games",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Flexbox Froggy",
+            "url": "https://flexboxfroggy.com/",
+            "description": "Master CSS Flexbox with fun exercises",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "javascript fundamentals": [
+        {
+            "title": "JavaScript.info - Modern Tutorial",
+            "url": "https://javascript.info/",
+            "description": "The modern JavaScript tutorial covering all fundamentals",
+            "resource_type": "article",
+            "quality_score": 95
+        },
+        {
+            "title": "You Don't Know JS - Kyle Simpson",
+            "url": "https://github.com/getify/You-Dont-Know-JS",
+            "description": "Deep dive into JavaScript fundamentals",
+            "resource_type": "github",
+            "quality_score": 92
+        },
+        {
+            "title": "JavaScript30",
+            "url": "https://javascript30.com/",
+            "description": "30 projects in 30 days with vanilla JavaScript",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "dom manipulation": [
+        {
+            "title": "DOM Manipulation Guide",
+            "url": "https://developer.mozilla.org/en-US/docs/Web/API/Document_Object_Model/Introduction",
+            "description": "Complete DOM manipulation tutorial",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "DOM Manipulation Crash Course",
+            "url": "https://www.freecodecamp.org/news/dom-manipulation-htmlcollection-vs-nodelist/",
+            "description": "Practical DOM manipulation techniques",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Interactive DOM Tutorial",
+            "url": "https://www.w3schools.com/js/js_htmldom.asp",
+            "description": "Hands-on DOM manipulation examples",
+            "resource_type": "course",
+            "quality_score": 85
+        }
+    ],
+
+    # Machine Learning Subskills
+    "linear algebra": [
+        {
+            "title": "Linear Algebra - Khan Academy",
+            "url": "https://www.khanacademy.org/math/linear-algebra",
+            "description": "Complete linear algebra course with interactive exercises",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "3Blue1Brown - Essence of Linear Algebra",
+            "url": "https://www.youtube.com/playlist?list=PLZHQObOWTQDPD3MizzM2xVFitgF8hE_ab",
+            "description": "Visual and intuitive approach to linear algebra",
+            "resource_type": "video",
+            "quality_score": 98
+        },
+        {
+            "title": "Linear Algebra for ML",
+            "url": "https://machinelearningmastery.com/linear-algebra-machine-learning/",
+            "description": "Linear algebra concepts essential for machine learning",
+            "resource_type": "article",
+            "quality_score": 88
+        }
+    ],
+    "statistics": [
+        {
+            "title": "Statistics - Khan Academy",
+            "url": "https://www.khanacademy.org/math/statistics-probability",
+            "description": "Comprehensive statistics and probability course",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "Think Stats",
+            "url": "https://greenteapress.com/thinkstats2/",
+            "description": "Free statistics textbook with Python examples",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Statistical Learning - Stanford",
+            "url": "https://online.stanford.edu/courses/sohs-ystatslearning-statistical-learning",
+            "description": "Free statistical learning course from Stanford",
+            "resource_type": "course",
+            "quality_score": 92
+        }
+    ],
+    "supervised learning": [
+        {
+            "title": "Supervised Learning Guide",
+            "url": "https://scikit-learn.org/stable/supervised_learning.html",
+            "description": "Scikit-learn's comprehensive supervised learning guide",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Machine Learning Course - Andrew Ng",
+            "url": "https://www.coursera.org/learn/machine-learning",
+            "description": "Famous ML course covering supervised learning",
+            "resource_type": "course",
+            "quality_score": 98
+        },
+        {
+            "title": "Supervised Learning Algorithms",
+            "url": "https://machinelearningmastery.com/supervised-and-unsupervised-machine-learning-algorithms/",
+            "description": "Overview of key supervised learning algorithms",
+            "resource_type": "article",
+            "quality_score": 88
+        }
+    ],
+
+    # Python Subskills
+    "python basics": [
+        {
+            "title": "Python.org Official Tutorial",
+            "url": "https://docs.python.org/3/tutorial/",
+            "description": "The official Python tutorial - start here",
+            "resource_type": "documentation",
+            "quality_score": 98
+        },
+        {
+            "title": "Automate the Boring Stuff",
+            "url": "https://automatetheboringstuff.com/",
+            "description": "Learn Python through practical automation projects",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "Python for Everybody",
+            "url": "https://www.py4e.com/",
+            "description": "Free Python course from University of Michigan",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "object oriented programming": [
+        {
+            "title": "OOP in Python - Real Python",
+            "url": "https://realpython.com/python3-object-oriented-programming/",
+            "description": "Comprehensive guide to OOP concepts in Python",
+            "resource_type": "article",
+            "quality_score": 95
+        },
+        {
+            "title": "Python OOP Tutorial",
+            "url": "https://www.programiz.com/python-programming/object-oriented-programming",
+            "description": "Step-by-step OOP tutorial with examples",
+            "resource_type": "course",
+            "quality_score": 88
+        },
+        {
+            "title": "OOP Design Patterns",
+            "url": "https://github.com/faif/python-patterns",
+            "description": "Python implementation of design patterns",
+            "resource_type": "github",
+            "quality_score": 85
+        }
+    ],
+    "data structures in python": [
+        {
+            "title": "Python Data Structures",
+            "url": "https://docs.python.org/3/tutorial/datastructures.html",
+            "description": "Official Python data structures documentation",
+            "resource_type": "documentation",
+            "quality_score": 98
+        },
+        {
+            "title": "Python Collections Module",
+            "url": "https://realpython.com/python-collections-module/",
+            "description": "Advanced data structures using collections",
+            "resource_type": "article",
+            "quality_score": 90
+        },
+        {
+            "title": "Data Structures and Algorithms in Python",
+            "url": "https://github.com/TheAlgorithms/Python",
+            "description": "Python implementations of data structures and algorithms",
+            "resource_type": "github",
+            "quality_score": 88
+        }
+    ]
+}
+
+# Manually curated high-quality resources for common skills
+CURATED_RESOURCES = {
+    "python": [
+        {
+            "title": "Python Official Tutorial",
+            "url": "https://docs.python.org/3/tutorial/",
+            "description": "The official Python tutorial from python.org - comprehensive and authoritative",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "Python for Everybody (Free Course)",
+            "url": "https://www.py4e.com/",
+            "description": "Free comprehensive Python course taught by Dr. Chuck Severance - completely free to audit",
+            "resource_type": "course",
+            "quality_score": 90
+        },
+        {
+            "title": "Automate the Boring Stuff with Python",
+            "url": "https://automatetheboringstuff.com/",
+            "description": "Free online book teaching practical Python programming for total beginners",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Python Crash Course - Eric Matthes",
+            "url": "https://github.com/ehmatthes/pcc_2e",
+            "description": "Code examples and exercises from the popular Python Crash Course book",
+            "resource_type": "github",
+            "quality_score": 85
+        }
+    ],
+    "javascript": [
+        {
+            "title": "MDN JavaScript Guide",
+            "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Guide",
+            "description": "Mozilla Developer Network's comprehensive JavaScript guide - the gold standard",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "JavaScript.info - The Modern JavaScript Tutorial",
+            "url": "https://javascript.info/",
+            "description": "Comprehensive, well-structured JavaScript tutorial covering modern standards",
+            "resource_type": "article",
+            "quality_score": 92
+        },
+        {
+            "title": "freeCodeCamp JavaScript Algorithms and Data Structures",
+            "url": "https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/",
+            "description": "Free interactive JavaScript course with projects and certification",
+            "resource_type": "course",
+            "quality_score": 88
+        }
+    ],
+    "react": [
+        {
+            "title": "React Official Documentation",
+            "url": "https://reactjs.org/docs/getting-started.html",
+            "description": "Official React documentation with tutorials and guides",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "React Tutorial for Beginners - Programming with Mosh",
+            "url": "https://www.youtube.com/watch?v=Ke90Tje7VS0",
+            "description": "Comprehensive React tutorial covering all fundamentals",
+            "resource_type": "video",
+            "quality_score": 90
+        },
+        {
+            "title": "React Developer Roadmap",
+            "url": "https://github.com/adam-golab/react-developer-roadmap",
+            "description": "Complete roadmap for becoming a React developer with resources",
+            "resource_type": "github",
+            "quality_score": 87
+        }
+    ],
+    "data science": [
+        {
+            "title": "Python Data Science Handbook",
+            "url": "https://jakevdp.github.io/PythonDataScienceHandbook/",
+            "description": "Free online book covering essential tools for working with data in Python",
+            "resource_type": "article",
+            "quality_score": 93
+        },
+        {
+            "title": "Coursera Data Science Specialization",
+            "url": "https://www.coursera.org/specializations/jhu-data-science",
+            "description": "Johns Hopkins University's comprehensive data science specialization",
+            "resource_type": "course",
+            "quality_score": 91
+        },
+        {
+            "title": "Kaggle Learn",
+            "url": "https://www.kaggle.com/learn",
+            "description": "Free micro-courses on data science topics with hands-on practice",
+            "resource_type": "course",
+            "quality_score": 89
+        }
+    ],
+    "machine learning": [
+        {
+            "title": "Machine Learning Course - Andrew Ng",
+            "url": "https://www.coursera.org/learn/machine-learning",
+            "description": "Stanford's famous machine learning course taught by Andrew Ng",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "Scikit-learn User Guide",
+            "url": "https://scikit-learn.org/stable/user_guide.html",
+            "description": "Comprehensive guide to machine learning with Python's scikit-learn",
+            "resource_type": "documentation",
+            "quality_score": 90
+        },
+        {
+            "title": "Machine Learning Yearning - Andrew Ng",
+            "url": "https://github.com/ajaymache/machine-learning-yearning",
+            "description": "Free book on machine learning project strategy by Andrew Ng",
+            "resource_type": "github",
+            "quality_score": 88
+        }
+    ],
+    "web development": [
+        {
+            "title": "freeCodeCamp Web Development Curriculum",
+            "url": "https://www.freecodecamp.org/learn/",
+            "description": "Complete free web development curriculum with projects and certifications",
+            "resource_type": "course",
+            "quality_score": 92
+        },
+        {
+            "title": "MDN Web Docs",
+            "url": "https://developer.mozilla.org/en-US/docs/Learn",
+            "description": "Mozilla's comprehensive web development learning area",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "The Odin Project",
+            "url": "https://www.theodinproject.com/",
+            "description": "Free full stack curriculum with project-based learning",
+            "resource_type": "course",
+            "quality_score": 90
+        }
+    ],
+    "html": [
+        {
+            "title": "MDN HTML Basics",
+            "url": "https://developer.mozilla.org/en-US/docs/Learn/Getting_started_with_the_web/HTML_basics",
+            "description": "Mozilla's definitive guide to HTML fundamentals",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "HTML Tutorial - W3Schools",
+            "url": "https://www.w3schools.com/html/",
+            "description": "Comprehensive HTML tutorial with examples and exercises",
+            "resource_type": "article",
+            "quality_score": 85
+        }
+    ],
+    "css": [
+        {
+            "title": "MDN CSS Basics",
+            "url": "https://developer.mozilla.org/en-US/docs/Learn/CSS",
+            "description": "Mozilla's comprehensive CSS learning guide",
+            "resource_type": "documentation",
+            "quality_score": 95
+        },
+        {
+            "title": "CSS-Tricks",
+            "url": "https://css-tricks.com/",
+            "description": "Popular website with CSS tutorials, guides, and reference materials",
+            "resource_type": "article",
+            "quality_score": 88
+        },
+        {
+            "title": "Flexbox Froggy",
+            "url": "https://flexboxfroggy.com/",
+            "description": "Interactive game for learning CSS Flexbox",
+            "resource_type": "course",
+            "quality_score": 85
+        }
+    ],
+    "data structures": [
+        {
+            "title": "Striver's A2Z DSA Course/Sheet",
+            "url": "https://takeuforward.org/strivers-a2z-dsa-course/strivers-a2z-dsa-course-sheet-2/",
+            "description": "Comprehensive step-by-step DSA sheet by Striver - most popular DSA preparation resource",
+            "resource_type": "course",
+            "quality_score": 98
+        },
+        {
+            "title": "Data Structures Visualizations",
+            "url": "https://www.cs.usfca.edu/~galles/visualization/Algorithms.html",
+            "description": "Interactive data structure and algorithm visualizations",
+            "resource_type": "article",
+            "quality_score": 95
+        },
+        {
+            "title": "GeeksforGeeks Data Structures",
+            "url": "https://www.geeksforgeeks.org/data-structures/",
+            "description": "Comprehensive data structures tutorials",
+            "resource_type": "article",
+            "quality_score": 88
+        }
+    ],
+    "algorithms": [
+        {
+            "title": "Striver's A2Z DSA Course/Sheet",
+            "url": "https://takeuforward.org/strivers-a2z-dsa-course/strivers-a2z-dsa-course-sheet-2/",
+            "description": "Comprehensive step-by-step DSA sheet by Striver - most popular DSA preparation resource",
+            "resource_type": "course",
+            "quality_score": 98
+        },
+        {
+            "title": "Introduction to Algorithms - MIT",
+            "url": "https://ocw.mit.edu/courses/electrical-engineering-and-computer-science/6-006-introduction-to-algorithms-fall-2011/",
+            "description": "Free MIT algorithms course with video lectures",
+            "resource_type": "course",
+            "quality_score": 95
+        },
+        {
+            "title": "Algorithm Visualizer",
+            "url": "https://algorithm-visualizer.org/",
+            "description": "Interactive algorithm visualizations",
+            "resource_type": "article",
+            "quality_score": 90
+        }
+    ]
+}
@@ -0,0 +1,238 @@
+"""
+Dashboard Statistics
+====================
+
+The aggregates behind ``/dashboard/stats``, computed by one SQL statement
+and cached per user.
+
+- ``read_dashboard_aggregates`` selects one scalar subquery per figure:
+  completed and in-progress skills (conditional counts), study time, average
+  quiz score, weekly XP and today's subskill completions. It returns scalars
+  only; no progress or quiz rows are loaded. Every subquery is served by a
+  per-user index (see the hot-query indexes migration).
+- ``DashboardStatsCache`` keeps each user's aggregates for
+  DASHBOARD_STATS_CACHE_TTL seconds. Each entry is served only while the
+  user's watermark, ``users.dashboard_version``, is unchanged; reading it is
+  a primary-key lookup. The version is bumped in the same transaction as the
+  write: the session hooks below bump it on flushes touching the user's
+  ``SkillProgress``, ``SubskillProgress``, ``QuizAttempt``,
+  ``XPTransaction`` or ``UserBehavior`` rows, and the behaviour write-behind
+  buffer bumps it with ``last_activity``. Bulk ``Query.update`` calls bypass
+  the hooks and must bump it themselves.
+  The cache is per process; the version is what keeps other uvicorn workers
+  from serving stale stats. In the writing process the hooks also drop the
+  entry right away on commit, and on flushes of the behaviour buffer.
+  Entries are also keyed by UTC day, so "today" and "this week" never come
+  from yesterday's entry. The TTL bounds how far the 7-day XP window can
+  slide before a recount.
+
+Configuration (environment):
+    DASHBOARD_STATS_CACHE_TTL   seconds an entry is served (0 disables the cache)
+    DASHBOARD_STATS_CACHE_SIZE  users kept in the cache
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Float, case, cast, event, func, select
+from sqlalchemy.orm import Session
+
+from models.models import User, SkillProgress, SubskillProgress, QuizAttempt, XPTransaction, UserBehavior
+from utils.behavior_buffer import behavior_buffer
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_STATS_CACHE_TTL = float(os.environ.get("DASHBOARD_STATS_CACHE_TTL", "300"))
+DASHBOARD_STATS_CACHE_SIZE = int(os.environ.get("DASHBOARD_STATS_CACHE_SIZE", "10000"))
+
+WEEKLY_XP_DAYS = 7
+
+
+def read_dashboard_aggregates(db: Session, user_id: int, now: Optional[datetime] = None) -> Dict[str, float]:
+    """
+    A user's dashboard aggregates, in one query.
+
+    Args:
+        db: Database session
+        user_id: Target user
+        now: Current UTC time (defaults to ``utcnow``)
+
+    Returns:
+        ``{skills_completed, skills_in_progress, total_study_time_minutes,
+        quiz_average_score, weekly_xp, subskills_completed_today}``
+    """
+    now = now or datetime.utcnow()
+    today = datetime.combine(now.date(), datetime.min.time())
+    week_ago = now - timedelta(days=WEEKLY_XP_DAYS)
+
+    progress = select(
+        func.count(case((SkillProgress.completed == True, 1))),
+        func.count(case(((SkillProgress.completed != True) & (SkillProgress.progress_percentage > 0), 1))),
+    ).where(SkillProgress.user_id == user_id).subquery()
+    quiz_ratio = cast(QuizAttempt.score, Float) / func.nullif(QuizAttempt.total_questions, 0)
+
+    row = db.execute(select(
+        progress.c[0],
+        progress.c[1],
+        select(func.coalesce(func.sum(SubskillProgress.time_spent_minutes), 0))
+        .where(SubskillProgress.user_id == user_id).scalar_subquery(),
+        select(func.avg(quiz_ratio)).where(QuizAttempt.user_id == user_id).scalar_subquery(),
+        select(func.coalesce(func.sum(XPTransaction.amount), 0))
+        .where(XPTransaction.user_id == user_id, XPTransaction.created_at >= week_ago).scalar_subquery(),
+        select(func.count(UserBehavior.id)).where(
+            UserBehavior.user_id == user_id,
+            UserBehavior.timestamp >= today,
+            UserBehavior.action_type == "complete_subskill"
+        ).scalar_subquery(),
+    ).select_from(progress)).one()
+
+    skills_completed, skills_in_progress, study_time, quiz_ratio_avg, weekly_xp, completed_today = row
+    return {
+        "skills_completed": int(skills_completed or 0),
+        "skills_in_progress": int(skills_in_progress or 0),
+        "total_study_time_minutes": int(study_time or 0),
+        "quiz_average_score": round((quiz_ratio_avg or 0.0) * 100, 1),
+        "weekly_xp": int(weekly_xp or 0),
+        "subskills_completed_today": int(completed_today or 0),
+    }
+
+
+def read_dashboard_watermark(db: Session, user_id: int) -> Optional[int]:
+    """The user's ``dashboard_version``, which changes with any write to their dashboard aggregates."""
+    return db.execute(select(User.dashboard_version).where(User.id == user_id)).scalar()
+
+
+class DashboardStatsCache:
+    """Per-user TTL cache of dashboard aggregates, valid while the user's watermark is unchanged."""
+
+    def __init__(self, ttl: float = DASHBOARD_STATS_CACHE_TTL, max_entries: int = DASHBOARD_STATS_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # user_id -> (UTC day, loaded at, watermark, aggregates)
+        self._entries: "OrderedDict[int, Tuple[date, float, Optional[int], Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, db: Session, user_id: int, now: Optional[datetime] = None) -> Dict[str, float]:
+        """
+        The user's aggregates, from the cache or ``read_dashboard_aggregates``.
+
+        A cached entry costs one watermark query; it is used only if the
+        watermark is unchanged, so writes made by other processes are seen.
+
+        Args:
+            db: Database session
+            user_id: Target user
+            now: Current UTC time (defaults to ``utcnow``)
+
+        Returns:
+            A copy of the aggregates dict
+        """
+        now = now or datetime.utcnow()
+        if self.ttl <= 0:
+            return read_dashboard_aggregates(db, user_id, now)
+
+        # Read the clock and watermark before the aggregates, so a write racing the
+        # aggregate query makes the entry stale rather than hiding the write
+        loaded_at = time.monotonic()
+        watermark = read_dashboard_watermark(db, user_id)
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if (entry is not None and entry[0] == now.date() and loaded_at - entry[1] < self.ttl
+                    and entry[2] == watermark):
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return dict(entry[3])
+            self.misses += 1
+
+        aggregates = read_dashboard_aggregates(db, user_id, now)
+        with self._lock:
+            self._entries[user_id] = (now.date(), loaded_at, watermark, aggregates)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return dict(aggregates)
+
+    def invalidate(self, user_ids):
+        with self._lock:
+            for user_id in user_ids:
+                if self._entries.pop(user_id, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "cached_users": len(self._entries),
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+# Global instance
+dashboard_stats_cache = DashboardStatsCache()
+
+
+def get_dashboard_aggregates(db: Session, user_id: int) -> Dict[str, float]:
+    return dashboard_stats_cache.get(db, user_id)
+
+
+def get_dashboard_stats_cache_stats() -> Dict:
+    return dashboard_stats_cache.stats()
+
+
+# ---- SQLAlchemy hooks ----
+
+_CHANGED_USERS_KEY = "dashboard_stats_changed_users"
+
+_TRACKED_MODELS = (SkillProgress, SubskillProgress, QuizAttempt, XPTransaction, UserBehavior)
+
+
+def _collect_changed_users(session, flush_context):
+    changed = {obj.user_id for obj in list(session.new) + list(session.dirty) + list(session.deleted)
+               if isinstance(obj, _TRACKED_MODELS) and obj.user_id is not None}
+    if not changed:
+        return
+    session.info.setdefault(_CHANGED_USERS_KEY, set()).update(changed)
+    # In the flush's transaction, so the new version is visible exactly when the write is
+    users = User.__table__
+    session.connection().execute(
+        users.update().where(users.c.id.in_(sorted(changed))).values(dashboard_version=users.c.dashboard_version + 1)
+    )
+
+
+def _invalidate_changed_users(session):
+    users = session.info.pop(_CHANGED_USERS_KEY, None)
+    if users:
+        dashboard_stats_cache.invalidate(users)
+
+
+def _discard_changed_users(session, previous_transaction=None):
+    session.info.pop(_CHANGED_USERS_KEY, None)
+
+
+def _invalidate_written_users(user_ids):
+    dashboard_stats_cache.invalidate(user_ids)
+
+
+def register_dashboard_stats_hooks():
+    """Bump a user's dashboard version and drop their cached entry when their progress, quizzes, XP or behaviour change."""
+    # Buffered behaviour events are bulk-inserted, bypassing the ORM session hooks
+    behavior_buffer.add_flush_listener(_invalidate_written_users)
+    if not event.contains(Session, "after_flush", _collect_changed_users):
+        event.listen(Session, "after_flush", _collect_changed_users)
+        event.listen(Session, "after_commit", _invalidate_changed_users)
+        event.listen(Session, "after_soft_rollback", _discard_changed_users)
@@ -1,17 +1,18 @@
 """
 Enhanced resource uniqueness and quality system
 """
-import requests
 import time
 from urllib.parse import urlparse
 import logging
 
+from .url_validator import url_validator
+
 logger = logging.getLogger(__name__)
 
 def validate_url_accessibility(url, timeout=5):
     """
     Validate that a URL is accessible and returns a valid response.
-    Now validates ALL URLs to guarantee quality.
+    Results are cached (see utils.url_validator), so repeated checks are free.
     
     Args:
         url (str): URL to validate
@@ -21,48 +22,7 @@ def validate_url_accessibility(url, timeout=5):
         bool: True if URL is accessible, False otherwise
     """
     try:
-        if not url or url.strip() == '':
-            return False
-            
-        # Expanded list of trusted domains that we know are reliable
-        trusted_domains = [
-            'geeksforgeeks.org', 'leetcode.com', 'github.com',
-            'developer.mozilla.org', 'react.dev', 'docs.python.org',
-            'freecodecamp.org', 'youtube.com', 'youtu.be',
-            'stackoverflow.com', 'w3schools.com', 'mdn.webdocs.org',
-            'nodejs.org', 'reactjs.org', 'vuejs.org', 'angular.io',
-            'coursera.org', 'udemy.com', 'edx.org', 'khanacademy.org',
-            'codecademy.com', 'pluralsight.com', 'educative.io',
-            'interviewbit.com', 'hackerrank.com', 'codechef.com',
-            'codeforces.com', 'topcoder.com', 'javascript.info',
-            'css-tricks.com', 'smashingmagazine.com', 'a11yproject.com'
-        ]
-        
-        parsed_url = urlparse(url)
-        domain = parsed_url.netloc.lower()
-        
-        # Even for trusted domains, do a quick validation
-        if any(trusted in domain for trusted in trusted_domains):
-            # Quick validation for trusted domains
-            try:
-                response = requests.head(url, timeout=2, allow_redirects=True)
-                return response.status_code < 400
-            except:
-                return True  # Assume trusted domains are good if check fails
-            
-        # For other domains, do a thorough validation
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
-        
-        # Check for common error status codes
-        if response.status_code >= 400:
-            return False
-            
-        # Check for redirects to error pages
-        if 'error' in response.url.lower() or '404' in response.url.lower():
-            return False
-            
-        return True
-        
+        return url_validator.validate(url, timeout)
     except Exception as e:
         logger.debug(f"URL validation failed for {url}: {e}")
         return False
@@ -164,52 +124,74 @@ def ensure_resource_uniqueness_and_quality(all_resources, skill_name, max_resour
     # Sort by quality score first
     sorted_resources = sorted(all_resources, key=lambda x: x.get('quality_score', 0), reverse=True)
     
-    for resource in sorted_resources:
-        url = resource.get('url', '').lower()
-        title = resource.get('title', '').lower()
-        resource_type = resource.get('resource_type', 'unknown')
+    # Validate a batch of candidates at a time: one concurrent round of HEAD
+    # requests per batch instead of a blocking request per resource
+    batch_size = max(8, max_resources * 2)
+    for batch_start in range(0, len(sorted_resources), batch_size):
+        batch = sorted_resources[batch_start:batch_start + batch_size]
+        candidate_urls = [
+            r.get('url', '') for r in batch
+            if r.get('url', '').lower() not in seen_urls
+            and calculate_comprehensive_quality_score(r) >= QUALITY_THRESHOLDS.get(r.get('resource_type', 'unknown'), 65)
+        ]
+        try:
+            accessible = url_validator.validate_many(candidate_urls)
+        except Exception as e:
+            logger.warning(f"Bulk URL validation failed, checking one by one: {e}")
+            accessible = {}
         
-        # Check URL uniqueness
-        if url in seen_urls:
-            continue
+        for resource in batch:
+            url = resource.get('url', '').lower()
+            title = resource.get('title', '').lower()
+            resource_type = resource.get('resource_type', 'unknown')
+        
+            # Check URL uniqueness
+            if url in seen_urls:
+                continue
             
-        # Check title similarity (avoid very similar titles)
-        title_words = set(title.split())
-        is_similar = False
-        for seen_title in seen_titles:
-            seen_words = set(seen_title.split())
-            # More strict similarity check (70% threshold instead of 60%)
-            if len(title_words & seen_words) / max(len(title_words), len(seen_words)) > 0.7:
-                is_similar = True
-                break
+            # Check title similarity (avoid very similar titles)
+            title_words = set(title.split())
+            is_similar = False
+            for seen_title in seen_titles:
+                seen_words = set(seen_title.split())
+                # More strict similarity check (70% threshold instead of 60%)
+                if len(title_words & seen_words) / max(len(title_words), len(seen_words)) > 0.7:
+                    is_similar = True
+                    break
         
-        if is_similar:
-            continue
+            if is_similar:
+                continue
         
-        # Check for domain diversity (avoid too many from same domain)
-        domain = urlparse(resource.get('url', '')).netloc.lower()
-        domain_count = sum(1 for r in unique_resources if urlparse(r.get('url', '')).netloc.lower() == domain)
-        if domain_count >= 2 and domain not in ['geeksforgeeks.org', 'developer.mozilla.org']:
-            continue
+            # Check for domain diversity (avoid too many from same domain)
+            domain = urlparse(resource.get('url', '')).netloc.lower()
+            domain_count = sum(1 for r in unique_resources if urlparse(r.get('url', '')).netloc.lower() == domain)
+            if domain_count >= 2 and domain not in ['geeksforgeeks.org', 'developer.mozilla.org']:
+                continue
         
-        # Calculate comprehensive quality score
-        quality_score = calculate_comprehensive_quality_score(resource)
-        resource['quality_score'] = quality_score
+            # Calculate comprehensive quality score
+            quality_score = calculate_comprehensive_quality_score(resource)
+            resource['quality_score'] = quality_score
         
-        # Check quality threshold
-        threshold = QUALITY_THRESHOLDS.get(resource_type, 65)
-        if quality_score < threshold:
-            continue
+            # Check quality threshold
+            threshold = QUALITY_THRESHOLDS.get(resource_type, 65)
+            if quality_score < threshold:
+                continue
         
-        # Validate URL accessibility (VALIDATE ALL URLs for guaranteed quality)
-        if not validate_url_accessibility(resource.get('url', '')):
-            logger.debug(f"Skipping inaccessible URL: {resource.get('url')}")
-            continue
+            # Validate URL accessibility (VALIDATE ALL URLs for guaranteed quality)
+            is_accessible = accessible.get(resource.get('url', ''))
+            if is_accessible is None:
+                is_accessible = validate_url_accessibility(resource.get('url', ''))
+            if not is_accessible:
+                logger.debug(f"Skipping inaccessible URL: {resource.get('url')}")
+                continue
         
-        # Add to unique resources
-        unique_resources.append(resource)
-        seen_urls.add(url)
-        seen_titles.add(title)
+            # Add to unique resources
+            unique_resources.append(resource)
+            seen_urls.add(url)
+            seen_titles.add(title)
+        
+            if len(unique_resources) >= max_resources:
+                break
         
         if len(unique_resources) >= max_resources:
             break
@@ -257,13 +239,13 @@ def ensure_resource_uniqueness_and_quality(all_resources, skill_name, max_resour
     return final_resources[:max_resources]
 
 
-def get_specialized_resources_for_subskill(subskill_name):
+def _initialize_specialized_resources():
     """
-    Get highly specialized resources that are unique to specific subskills.
+    Highly specialized resources that are unique to specific subskills.
     These are hand-curated to ensure maximum uniqueness and relevance.
+    Loaded once into the shared resource catalog.
     """
-    
-    SPECIALIZED_RESOURCES = {
+    return {
         # DSA - Each subskill gets completely unique, comprehensive resources
         "Arrays": [
             {
@@ -552,8 +534,15 @@ def get_specialized_resources_for_subskill(subskill_name):
             }
         ]
     }
-    
-    return SPECIALIZED_RESOURCES.get(subskill_name, [])
+
+
+def get_specialized_resources_for_subskill(subskill_name):
+    """
+    Get highly specialized resources that are unique to specific subskills.
+    Served from the shared resource catalog (a single dictionary hit).
+    """
+    from .resource_catalog import get_resource_catalog, SOURCE_SPECIALIZED
+    return get_resource_catalog().get_listing(SOURCE_SPECIALIZED, subskill_name)
 
 def get_performance_metrics(resource_list):
     """
@@ -0,0 +1,273 @@
+"""
+Persistent HTTP Response Cache
+==============================
+
+On-disk cache for scraped search-result pages, shared by every worker
+process through one SQLite database in WAL mode.
+
+- Entries are keyed by the normalized request URL and store the
+  zlib-compressed body together with the response's ETag and Last-Modified.
+- Each source (host) has its own TTL. Fresh entries are served without
+  touching the network.
+- Expired entries are revalidated with a conditional GET. A 304 just extends
+  the entry.
+- Expired entries are also served as a fallback when the host fails or its
+  circuit breaker is open.
+- Callers can pass a check for the page (e.g. "parses to at least one
+  result"); a 200 that fails it, such as a block or CAPTCHA page, is never
+  stored, and the last good copy is served instead when there is one.
+- Entries expired for longer than ``max_stale`` are pruned on open and then
+  every ``prune_interval`` seconds by whichever process stores a response.
+
+Configuration (environment):
+    HTTP_CACHE_ENABLED      "false" disables the cache
+    HTTP_CACHE_PATH         SQLite file (default: backend/data/http_cache.sqlite3)
+    HTTP_CACHE_DEFAULT_TTL  seconds for hosts without an override
+    HTTP_CACHE_TTLS         per-host overrides, e.g. "youtube.com=21600,github.com=86400"
+    HTTP_CACHE_MAX_STALE    seconds an expired entry is kept for revalidation/fallback
+    HTTP_CACHE_PRUNE_INTERVAL  seconds between prunes of long-expired entries
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, NamedTuple, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .resource_catalog import get_domain
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_ENABLED = os.environ.get("HTTP_CACHE_ENABLED", "true").lower() != "false"
+HTTP_CACHE_PATH = os.environ.get(
+    "HTTP_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "http_cache.sqlite3")
+)
+HTTP_CACHE_DEFAULT_TTL = float(os.environ.get("HTTP_CACHE_DEFAULT_TTL", "3600"))
+HTTP_CACHE_MAX_STALE = float(os.environ.get("HTTP_CACHE_MAX_STALE", str(7 * 24 * 3600)))
+HTTP_CACHE_PRUNE_INTERVAL = float(os.environ.get("HTTP_CACHE_PRUNE_INTERVAL", "3600"))
+
+# Built-in TTLs (seconds) for the pages we scrape; matched on host suffix
+DEFAULT_SOURCE_TTLS = {
+    "youtube.com": 6 * 3600,
+    "duckduckgo.com": 12 * 3600,
+    "bing.com": 12 * 3600,
+    "startpage.com": 12 * 3600,
+    "github.com": 24 * 3600,
+}
+
+
+def parse_ttls(spec: str) -> Dict[str, float]:
+    """Parse ``host=seconds`` pairs separated by commas."""
+    ttls = {}
+    for entry in (spec or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            host, seconds = entry.split("=", 1)
+            ttls[host.strip().lower()] = float(seconds)
+        except ValueError:
+            logger.warning(f"Ignoring malformed cache TTL entry: {entry!r}")
+    return ttls
+
+
+def cache_key(url: str) -> str:
+    """
+    Normalize a request URL: lower-case scheme and host, drop ``www.`` and the
+    fragment, and sort query parameters.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), host, parts.path or "/", query, ""))
+
+
+class CachedResponse(NamedTuple):
+    status: int
+    text: str
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class HttpResponseCache:
+    """SQLite-backed response cache safe to share between threads and processes."""
+
+    def __init__(self, path: str = HTTP_CACHE_PATH, ttls: Dict[str, float] = None,
+                 default_ttl: float = HTTP_CACHE_DEFAULT_TTL, max_stale: float = HTTP_CACHE_MAX_STALE,
+                 prune_interval: float = HTTP_CACHE_PRUNE_INTERVAL):
+        self.path = path
+        self.ttls = dict(DEFAULT_SOURCE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.max_stale = max_stale
+        self.prune_interval = prune_interval
+        self._last_prune = time.time()
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale_served = 0
+        self.stores = 0
+        self.rejected = 0
+        self.pruned = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connect().execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_responses (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._connect().execute("CREATE INDEX IF NOT EXISTS ix_http_responses_expires_at ON http_responses (expires_at)")
+
+    @classmethod
+    def from_env(cls) -> "HttpResponseCache":
+        ttls = dict(DEFAULT_SOURCE_TTLS)
+        ttls.update(parse_ttls(os.environ.get("HTTP_CACHE_TTLS", "")))
+        return cls(ttls=ttls)
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets worker processes read while another writes."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _count(self, counter: str):
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def ttl_for(self, url: str) -> float:
+        host = get_domain(url)
+        for source, ttl in self.ttls.items():
+            if host == source or host.endswith("." + source):
+                return ttl
+        return self.default_ttl
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for ``url`` (fresh or stale), or None."""
+        row = self._connect().execute(
+            "SELECT status, body, url, etag, last_modified, fetched_at, expires_at FROM http_responses WHERE url_key = ?",
+            (cache_key(url),)
+        ).fetchone()
+        if row is None:
+            self._count("misses")
+            return None
+        status, body, final_url, etag, last_modified, fetched_at, expires_at = row
+        cached = CachedResponse(status, zlib.decompress(body).decode("utf-8"), final_url,
+                                etag, last_modified, fetched_at, expires_at)
+        self._count("hits" if cached.is_fresh else "misses")
+        return cached
+
+    def put(self, url: str, status: int, text: str, final_url: str = None,
+            etag: str = None, last_modified: str = None):
+        now = time.time()
+        self._connect().execute(
+            "INSERT OR REPLACE INTO http_responses "
+            "(url_key, url, status, body, etag, last_modified, fetched_at, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (cache_key(url), final_url or url, status, zlib.compress(text.encode("utf-8"), 6),
+             etag, last_modified, now, now + self.ttl_for(url))
+        )
+        self._count("stores")
+        if now - self._last_prune >= self.prune_interval:
+            self.prune()
+
+    def refresh(self, url: str, etag: str = None, last_modified: str = None):
+        """Extend an entry after a 304 Not Modified."""
+        now = time.time()
+        self._connect().execute(
+            "UPDATE http_responses SET fetched_at = ?, expires_at = ?, "
+            "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url_key = ?",
+            (now, now + self.ttl_for(url), etag, last_modified, cache_key(url))
+        )
+        self._count("revalidated")
+
+    def record_stale_served(self):
+        self._count("stale_served")
+
+    def record_rejected(self):
+        """Count a 200 response that failed the caller's check and was not stored."""
+        self._count("rejected")
+
+    def prune(self) -> int:
+        """Delete entries that expired more than ``max_stale`` seconds ago."""
+        now = time.time()
+        with self._stats_lock:
+            self._last_prune = now
+        cursor = self._connect().execute(
+            "DELETE FROM http_responses WHERE expires_at < ?", (now - self.max_stale,)
+        )
+        with self._stats_lock:
+            self.pruned += cursor.rowcount
+        return cursor.rowcount
+
+    def clear(self):
+        self._connect().execute("DELETE FROM http_responses")
+
+    def stats(self) -> Dict:
+        entries, body_bytes = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM http_responses"
+        ).fetchone()
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": self.path,
+                "entries": entries,
+                "compressed_bytes": body_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "revalidated": self.revalidated,
+                "stale_served": self.stale_served,
+                "stores": self.stores,
+                "rejected": self.rejected,
+                "pruned": self.pruned,
+            }
+
+
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HttpResponseCache]:
+    """The process-wide cache, opened on first use (None when disabled or unavailable)."""
+    global _http_cache, HTTP_CACHE_ENABLED
+    if _http_cache is None and HTTP_CACHE_ENABLED:
+        with _http_cache_lock:
+            if _http_cache is None and HTTP_CACHE_ENABLED:
+                try:
+                    _http_cache = HttpResponseCache.from_env()
+                    _http_cache.prune()
+                except sqlite3.Error as e:
+                    logger.warning(f"HTTP response cache disabled, could not open {HTTP_CACHE_PATH}: {e}")
+                    HTTP_CACHE_ENABLED = False
+    return _http_cache
+
+
+def get_http_cache_stats() -> Dict:
+    cache = get_http_cache()
+    return cache.stats() if cache is not None else {"enabled": False}
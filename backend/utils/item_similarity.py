@@ -0,0 +1,190 @@
+"""
+Item-to-Item Skill Similarity
+=============================
+
+Offline co-completion similarity between skills, which keeps per-user
+recommendations cheap.
+
+- ``build_skill_similarity_table`` reads the completed ``skill_progress``
+  rows in one query and builds a binary user × skill matrix X.
+  - The co-completion counts are X.T @ X.
+  - Each skill's top-K neighbours by cosine similarity are written to
+    ``skill_similarities``. Pairs completed together by fewer than
+    ``min_support`` users are dropped. The table comes from ``create_all``
+    or the rollup and similarity tables migration.
+- ``get_item_based_recommendations`` merges the neighbour lists of a user's
+  completed skills. It fetches the recommended skills in one batched query.
+  That is three queries in total, however many users there are.
+
+Configuration (environment):
+    SKILL_SIMILARITY_TOP_K            neighbours stored per skill
+    SKILL_SIMILARITY_MIN_SUPPORT      minimum co-completions for a pair
+    SKILL_SIMILARITY_MAX_AGE_SECONDS  the refresh job rebuilds the table after this long
+"""
+
+import logging
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models.models import Skill, SkillProgress, SkillSimilarity
+
+logger = logging.getLogger(__name__)
+
+SKILL_SIMILARITY_TOP_K = int(os.environ.get("SKILL_SIMILARITY_TOP_K", "20"))
+SKILL_SIMILARITY_MIN_SUPPORT = int(os.environ.get("SKILL_SIMILARITY_MIN_SUPPORT", "2"))
+SKILL_SIMILARITY_MAX_AGE_SECONDS = int(os.environ.get("SKILL_SIMILARITY_MAX_AGE_SECONDS", str(24 * 3600)))
+
+
+def compute_skill_neighbours(pairs, top_k: int = SKILL_SIMILARITY_TOP_K,
+                             min_support: int = SKILL_SIMILARITY_MIN_SUPPORT) -> List[Dict[str, Any]]:
+    """
+    Top-k co-completion neighbours of every skill.
+
+    Args:
+        pairs: Iterable of ``(user_id, skill_id)`` completions
+        top_k: Neighbours kept per skill
+        min_support: Minimum number of users who completed both skills
+
+    Returns:
+        Rows with skill_id, related_skill_id, score and co_completions
+    """
+    user_rows: Dict[int, int] = {}
+    skill_columns: Dict[int, int] = {}
+    cells = set()
+    for user_id, skill_id in pairs:
+        cells.add((user_rows.setdefault(user_id, len(user_rows)), skill_columns.setdefault(skill_id, len(skill_columns))))
+    if not cells:
+        return []
+    rows, columns = map(np.array, zip(*cells))
+    completions = sparse.csr_matrix((np.ones(len(cells), dtype=np.float32), (rows, columns)),
+                                    shape=(len(user_rows), len(skill_columns)))
+
+    co = (completions.T @ completions).tocsr()  # skills × skills co-completion counts
+    counts = co.diagonal()
+    skill_ids = np.fromiter(skill_columns, dtype=np.int64, count=len(skill_columns))
+
+    neighbours = []
+    for column in range(co.shape[0]):
+        start, end = co.indptr[column], co.indptr[column + 1]
+        related, together = co.indices[start:end], co.data[start:end]
+        keep = (related != column) & (together >= min_support)
+        related, together = related[keep], together[keep]
+        if not len(related):
+            continue
+        scores = together / np.sqrt(counts[column] * counts[related])
+        if len(scores) > top_k:
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+            related, together, scores = related[top], together[top], scores[top]
+        for i in np.argsort(-scores, kind="stable"):
+            neighbours.append({
+                "skill_id": int(skill_ids[column]),
+                "related_skill_id": int(skill_ids[related[i]]),
+                "score": round(float(scores[i]), 6),
+                "co_completions": int(together[i]),
+            })
+    return neighbours
+
+
+def build_skill_similarity_table(db: Session, top_k: int = SKILL_SIMILARITY_TOP_K,
+                                 min_support: int = SKILL_SIMILARITY_MIN_SUPPORT) -> int:
+    """Recompute ``skill_similarities`` from completed skill progress; returns the number of rows."""
+    started = time.perf_counter()
+    pairs = db.query(SkillProgress.user_id, SkillProgress.skill_id).filter(
+        SkillProgress.completed == True,
+        SkillProgress.user_id.isnot(None),
+        SkillProgress.skill_id.isnot(None)
+    ).yield_per(10000)
+    neighbours = compute_skill_neighbours(pairs, top_k=top_k, min_support=min_support)
+
+    computed_at = datetime.utcnow()
+    for row in neighbours:
+        row["computed_at"] = computed_at
+    try:
+        db.query(SkillSimilarity).delete(synchronize_session=False)
+        if neighbours:
+            db.execute(SkillSimilarity.__table__.insert(), neighbours)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    logger.info(f"Built skill similarity table: {len(neighbours)} pairs in {time.perf_counter() - started:.2f}s")
+    return len(neighbours)
+
+
+def similarity_table_age(db: Session) -> Optional[float]:
+    """Seconds since the table was last built (None if it is empty or missing)."""
+    try:
+        computed_at = db.query(func.max(SkillSimilarity.computed_at)).scalar()
+    except Exception:
+        db.rollback()
+        return None
+    if computed_at is None:
+        return None
+    if computed_at.tzinfo is not None:
+        computed_at = computed_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return (datetime.utcnow() - computed_at).total_seconds()
+
+
+def get_item_based_recommendations(user_id: int, db: Session, limit: int = 5,
+                                   user_skills: Optional[Dict[int, bool]] = None) -> List[Dict[str, Any]]:
+    """
+    Recommend skills related to the ones a user has completed.
+
+    Args:
+        user_id: Target user
+        db: Database session
+        limit: Number of recommendations to return
+        user_skills: The user's ``{skill_id: completed}``, if already loaded
+
+    Returns:
+        Recommendations (same shape as ``get_collaborative_recommendations``), best first
+    """
+    if user_skills is None:
+        user_skills = {skill_id: bool(completed) for skill_id, completed in db.query(
+            SkillProgress.skill_id, SkillProgress.completed
+        ).filter(SkillProgress.user_id == user_id)}
+    completed = [skill_id for skill_id, done in user_skills.items() if done]
+    if not completed:
+        return []
+
+    scores: Dict[int, float] = defaultdict(float)
+    because: Dict[int, tuple] = {}
+    for skill_id, related_skill_id, score in db.query(
+        SkillSimilarity.skill_id, SkillSimilarity.related_skill_id, SkillSimilarity.score
+    ).filter(SkillSimilarity.skill_id.in_(completed)):
+        if related_skill_id in user_skills:
+            continue
+        scores[related_skill_id] += score
+        if score > because.get(related_skill_id, (None, 0.0))[1]:
+            because[related_skill_id] = (skill_id, score)
+    if not scores:
+        return []
+
+    top = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+    wanted = {skill_id for skill_id, _ in top} | {source for source, _ in because.values()}
+    skills = {skill.id: skill for skill in db.query(Skill).filter(Skill.id.in_(wanted))}
+
+    recommendations = []
+    for skill_id, score in top:
+        skill = skills.get(skill_id)
+        if skill is None:
+            continue
+        source = skills.get(because[skill_id][0])
+        recommendations.append({
+            "type": "skill",
+            "item_id": skill_id,
+            "title": skill.name,
+            "description": skill.description,
+            "score": round(score, 4),
+            "reason": f"Learners who completed {source.name} also completed this skill" if source
+            else "Learners with similar completed skills also completed this skill"
+        })
+    return recommendations
@@ -0,0 +1,94 @@
+"""
+Job Locks
+=========
+
+Keeps a periodic job to one process at a time.
+
+Every uvicorn worker starts the background jobs, and the maintenance scripts
+can run a pass from cron as well. Each pass runs under ``job_lock``; a
+process that cannot take the lock skips its turn instead of doing the same
+work (and writing the same rows) concurrently.
+
+- PostgreSQL: a session-level ``pg_try_advisory_lock`` keyed by the job
+  name, held on a dedicated connection for the whole pass, so it also covers
+  workers on other hosts.
+- Other databases: an exclusive ``flock`` on ``<database file>.<job>.lock``
+  (a file in the temp directory, keyed by the database URL, when the
+  database is not a local file). In-memory databases are private to their
+  process, and without ``fcntl`` (Windows) only the PostgreSQL lock applies,
+  so the lock is always granted there.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+def advisory_key(name: str) -> int:
+    """Stable signed 64-bit key for ``pg_try_advisory_lock``."""
+    return int.from_bytes(hashlib.sha1(name.encode()).digest()[:8], "big", signed=True)
+
+
+def lock_file_path(engine: Engine, name: str) -> str:
+    """Lock file shared by every process using ``engine``'s database."""
+    url = engine.url
+    if url.get_backend_name() == "sqlite" and url.database:
+        return f"{os.path.abspath(url.database)}.{name}.lock"
+    digest = hashlib.sha1(url.render_as_string(hide_password=True).encode()).hexdigest()[:12]
+    return os.path.join(tempfile.gettempdir(), f"{name}-{digest}.lock")
+
+
+@contextmanager
+def job_lock(engine: Engine, name: str) -> Iterator[bool]:
+    """
+    Try to become the one process running job ``name``.
+
+    Args:
+        engine: Engine of the database the job works on
+        name: Job name (one lock per name and database)
+
+    Yields:
+        True if the lock is held until the block exits, False if another process holds it
+    """
+    if engine.dialect.name == "postgresql":
+        key = advisory_key(name)
+        with engine.connect() as conn:
+            held = bool(conn.execute(select(func.pg_try_advisory_lock(key))).scalar())
+            conn.commit()
+            try:
+                yield held
+            finally:
+                if held:
+                    conn.execute(select(func.pg_advisory_unlock(key)))
+                    conn.commit()
+        return
+
+    database = engine.url.database
+    if fcntl is None or (engine.url.get_backend_name() == "sqlite" and database in (None, "", ":memory:")):
+        yield True
+        return
+
+    with open(lock_file_path(engine, name), "a") as lock_file:
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            logger.debug(f"Skipping {name}: another process is running it")
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -16,241 +16,253 @@ import logging
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from .resource_catalog import get_resource_catalog, SOURCE_OPTIMIZED
+
 logger = logging.getLogger(__name__)
 
-class OptimizedResourceDatabase:
-    """
-    Pre-computed resource database optimized for speed and cost efficiency.
-    """
-    
-    def __init__(self):
-        self.resources_db = self._initialize_comprehensive_database()
-        self.cache = {}  # In-memory cache for hot data
+def _initialize_comprehensive_database() -> Dict:
+    """Comprehensive pre-computed resource database (loaded into the shared resource catalog)."""
+    return {
+        # === PROGRAMMING LANGUAGES ===
+        "Python": {
+            "resources": [
+                {"title": "Python Official Tutorial", "url": "https://docs.python.org/3/tutorial/", "type": "documentation", "quality": 98},
+                {"title": "Automate the Boring Stuff with Python", "url": "https://automatetheboringstuff.com/", "type": "course", "quality": 95},
+                {"title": "Real Python Tutorials", "url": "https://realpython.com/", "type": "tutorial", "quality": 92},
+                {"title": "Python Crash Course", "url": "https://github.com/ehmatthes/pcc_2e", "type": "github", "quality": 90},
+                {"title": "Python for Everybody - Coursera", "url": "https://www.coursera.org/specializations/python", "type": "course", "quality": 88},
+                {"title": "Python Programming - FreeCodeCamp", "url": "https://www.freecodecamp.org/learn/scientific-computing-with-python/", "type": "course", "quality": 86}
+            ],
+            "learning_path": {
+                "duration": "8-12 weeks",
+                "phases": [
+                    {"name": "Python Basics", "duration": "2-3 weeks", "resources": [0, 2]},
+                    {"name": "Data Structures", "duration": "2-3 weeks", "resources": [1, 3]},
+                    {"name": "Object-Oriented Programming", "duration": "2-3 weeks", "resources": [0, 4]},
+                    {"name": "Advanced Topics & Projects", "duration": "2-3 weeks", "resources": [1, 5]}
+                ]
+            },
+            "subskills": ["Variables", "Functions", "Data Structures", "OOP", "File I/O", "Libraries"],
+            "quiz_topics": ["Basic Syntax", "Data Types", "Control Flow", "Functions", "Classes", "Modules"]
+        },
         
-    def _initialize_comprehensive_database(self) -> Dict:
-        """Initialize the comprehensive pre-computed resource database."""
-        return {
-            # === PROGRAMMING LANGUAGES ===
-            "Python": {
-                "resources": [
-                    {"title": "Python Official Tutorial", "url": "https://docs.python.org/3/tutorial/", "type": "documentation", "quality": 98},
-                    {"title": "Automate the Boring Stuff with Python", "url": "https://automatetheboringstuff.com/", "type": "course", "quality": 95},
-                    {"title": "Real Python Tutorials", "url": "https://realpython.com/", "type": "tutorial", "quality": 92},
-                    {"title": "Python Crash Course", "url": "https://github.com/ehmatthes/pcc_2e", "type": "github", "quality": 90},
-                    {"title": "Python for Everybody - Coursera", "url": "https://www.coursera.org/specializations/python", "type": "course", "quality": 88},
-                    {"title": "Python Programming - FreeCodeCamp", "url": "https://www.freecodecamp.org/learn/scientific-computing-with-python/", "type": "course", "quality": 86}
-                ],
-                "learning_path": {
-                    "duration": "8-12 weeks",
-                    "phases": [
-                        {"name": "Python Basics", "duration": "2-3 weeks", "resources": [0, 2]},
-                        {"name": "Data Structures", "duration": "2-3 weeks", "resources": [1, 3]},
-                        {"name": "Object-Oriented Programming", "duration": "2-3 weeks", "resources": [0, 4]},
-                        {"name": "Advanced Topics & Projects", "duration": "2-3 weeks", "resources": [1, 5]}
-                    ]
-                },
-                "subskills": ["Variables", "Functions", "Data Structures", "OOP", "File I/O", "Libraries"],
-                "quiz_topics": ["Basic Syntax", "Data Types", "Control Flow", "Functions", "Classes", "Modules"]
+        "JavaScript": {
+            "resources": [
+                {"title": "MDN JavaScript Guide", "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Guide", "type": "documentation", "quality": 98},
+                {"title": "JavaScript.info - Modern Tutorial", "url": "https://javascript.info/", "type": "tutorial", "quality": 96},
+                {"title": "Eloquent JavaScript", "url": "https://eloquentjavascript.net/", "type": "article", "quality": 94},
+                {"title": "JavaScript Algorithms", "url": "https://github.com/trekhleb/javascript-algorithms", "type": "github", "quality": 92},
+                {"title": "FreeCodeCamp JavaScript", "url": "https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/", "type": "course", "quality": 90},
+                {"title": "You Don't Know JS", "url": "https://github.com/getify/You-Dont-Know-JS", "type": "github", "quality": 88}
+            ],
+            "learning_path": {
+                "duration": "8-12 weeks",
+                "phases": [
+                    {"name": "JavaScript Fundamentals", "duration": "3 weeks", "resources": [0, 1]},
+                    {"name": "DOM Manipulation", "duration": "2 weeks", "resources": [2, 4]},
+                    {"name": "Async Programming", "duration": "3 weeks", "resources": [1, 3]},
+                    {"name": "Advanced Concepts", "duration": "4 weeks", "resources": [5, 3]}
+                ]
             },
-            
-            "JavaScript": {
-                "resources": [
-                    {"title": "MDN JavaScript Guide", "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Guide", "type": "documentation", "quality": 98},
-                    {"title": "JavaScript.info - Modern Tutorial", "url": "https://javascript.info/", "type": "tutorial", "quality": 96},
-                    {"title": "Eloquent JavaScript", "url": "https://eloquentjavascript.net/", "type": "article", "quality": 94},
-                    {"title": "JavaScript Algorithms", "url": "https://github.com/trekhleb/javascript-algorithms", "type": "github", "quality": 92},
-                    {"title": "FreeCodeCamp JavaScript", "url": "https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/", "type": "course", "quality": 90},
-                    {"title": "You Don't Know JS", "url": "https://github.com/getify/You-Dont-Know-JS", "type": "github", "quality": 88}
-                ],
-                "learning_path": {
-                    "duration": "8-12 weeks",
-                    "phases": [
-                        {"name": "JavaScript Fundamentals", "duration": "3 weeks", "resources": [0, 1]},
-                        {"name": "DOM Manipulation", "duration": "2 weeks", "resources": [2, 4]},
-                        {"name": "Async Programming", "duration": "3 weeks", "resources": [1, 3]},
-                        {"name": "Advanced Concepts", "duration": "4 weeks", "resources": [5, 3]}
-                    ]
-                },
-                "subskills": ["Variables", "Functions", "Objects", "DOM", "Events", "Async/Await", "ES6+"],
-                "quiz_topics": ["Variables & Types", "Functions", "Objects & Arrays", "DOM Events", "Promises", "ES6 Features"]
+            "subskills": ["Variables", "Functions", "Objects", "DOM", "Events", "Async/Await", "ES6+"],
+            "quiz_topics": ["Variables & Types", "Functions", "Objects & Arrays", "DOM Events", "Promises", "ES6 Features"]
+        },
+        
+        "React": {
+            "resources": [
+                {"title": "React Official Documentation", "url": "https://react.dev/", "type": "documentation", "quality": 98},
+                {"title": "React Tutorial - Official", "url": "https://react.dev/learn", "type": "tutorial", "quality": 96},
+                {"title": "React - FreeCodeCamp", "url": "https://www.freecodecamp.org/learn/front-end-development-libraries/", "type": "course", "quality": 92},
+                {"title": "Awesome React", "url": "https://github.com/enaqx/awesome-react", "type": "github", "quality": 90},
+                {"title": "React Patterns", "url": "https://reactpatterns.com/", "type": "article", "quality": 88},
+                {"title": "React Router Tutorial", "url": "https://reactrouter.com/en/main/start/tutorial", "type": "tutorial", "quality": 86}
+            ],
+            "learning_path": {
+                "duration": "6-10 weeks",
+                "phases": [
+                    {"name": "React Basics", "duration": "2 weeks", "resources": [0, 1]},
+                    {"name": "Components & Props", "duration": "2 weeks", "resources": [1, 2]},
+                    {"name": "State & Hooks", "duration": "2 weeks", "resources": [0, 4]},
+                    {"name": "Routing & Advanced", "duration": "2-4 weeks", "resources": [3, 5]}
+                ]
             },
-            
-            "React": {
-                "resources": [
-                    {"title": "React Official Documentation", "url": "https://react.dev/", "type": "documentation", "quality": 98},
-                    {"title": "React Tutorial - Official", "url": "https://react.dev/learn", "type": "tutorial", "quality": 96},
-                    {"title": "React - FreeCodeCamp", "url": "https://www.freecodecamp.org/learn/front-end-development-libraries/", "type": "course", "quality": 92},
-                    {"title": "Awesome React", "url": "https://github.com/enaqx/awesome-react", "type": "github", "quality": 90},
-                    {"title": "React Patterns", "url": "https://reactpatterns.com/", "type": "article", "quality": 88},
-                    {"title": "React Router Tutorial", "url": "https://reactrouter.com/en/main/start/tutorial", "type": "tutorial", "quality": 86}
-                ],
-                "learning_path": {
-                    "duration": "6-10 weeks",
-                    "phases": [
-                        {"name": "React Basics", "duration": "2 weeks", "resources": [0, 1]},
-                        {"name": "Components & Props", "duration": "2 weeks", "resources": [1, 2]},
-                        {"name": "State & Hooks", "duration": "2 weeks", "resources": [0, 4]},
-                        {"name": "Routing & Advanced", "duration": "2-4 weeks", "resources": [3, 5]}
-                    ]
-                },
-                "subskills": ["JSX", "Components", "Props", "State", "Hooks", "Router", "Context"],
-                "quiz_topics": ["JSX Syntax", "Component Lifecycle", "Hooks Usage", "State Management", "Event Handling"]
+            "subskills": ["JSX", "Components", "Props", "State", "Hooks", "Router", "Context"],
+            "quiz_topics": ["JSX Syntax", "Component Lifecycle", "Hooks Usage", "State Management", "Event Handling"]
+        },
+        
+        # === DATA STRUCTURES & ALGORITHMS ===
+        "Data Structures and Algorithms": {
+            "resources": [
+                {"title": "Introduction to Algorithms (CLRS)", "url": "https://mitpress.mit.edu/9780262046305/introduction-to-algorithms/", "type": "documentation", "quality": 98},
+                {"title": "LeetCode Practice Platform", "url": "https://leetcode.com/", "type": "course", "quality": 96},
+                {"title": "Algorithm Visualizations", "url": "https://visualgo.net/en", "type": "tutorial", "quality": 94},
+                {"title": "TheAlgorithms Repository", "url": "https://github.com/TheAlgorithms", "type": "github", "quality": 92},
+                {"title": "GeeksforGeeks DSA", "url": "https://www.geeksforgeeks.org/data-structures/", "type": "article", "quality": 90},
+                {"title": "Coursera Algorithms Specialization", "url": "https://www.coursera.org/specializations/algorithms", "type": "course", "quality": 88}
+            ],
+            "learning_path": {
+                "duration": "12-16 weeks",
+                "phases": [
+                    {"name": "Basic Data Structures", "duration": "4 weeks", "resources": [4, 3]},
+                    {"name": "Sorting & Searching", "duration": "3 weeks", "resources": [2, 1]},
+                    {"name": "Advanced Structures", "duration": "3 weeks", "resources": [0, 5]},
+                    {"name": "Algorithm Design", "duration": "2-6 weeks", "resources": [1, 0]}
+                ]
             },
-            
-            # === DATA STRUCTURES & ALGORITHMS ===
-            "Data Structures and Algorithms": {
-                "resources": [
-                    {"title": "Introduction to Algorithms (CLRS)", "url": "https://mitpress.mit.edu/9780262046305/introduction-to-algorithms/", "type": "documentation", "quality": 98},
-                    {"title": "LeetCode Practice Platform", "url": "https://leetcode.com/", "type": "course", "quality": 96},
-                    {"title": "Algorithm Visualizations", "url": "https://visualgo.net/en", "type": "tutorial", "quality": 94},
-                    {"title": "TheAlgorithms Repository", "url": "https://github.com/TheAlgorithms", "type": "github", "quality": 92},
-                    {"title": "GeeksforGeeks DSA", "url": "https://www.geeksforgeeks.org/data-structures/", "type": "article", "quality": 90},
-                    {"title": "Coursera Algorithms Specialization", "url": "https://www.coursera.org/specializations/algorithms", "type": "course", "quality": 88}
-                ],
-                "learning_path": {
-                    "duration": "12-16 weeks",
-                    "phases": [
-                        {"name": "Basic Data Structures", "duration": "4 weeks", "resources": [4, 3]},
-                        {"name": "Sorting & Searching", "duration": "3 weeks", "resources": [2, 1]},
-                        {"name": "Advanced Structures", "duration": "3 weeks", "resources": [0, 5]},
-                        {"name": "Algorithm Design", "duration": "2-6 weeks", "resources": [1, 0]}
-                    ]
-                },
-                "subskills": ["Arrays", "Linked Lists", "Stacks", "Queues", "Trees", "Graphs", "Sorting", "Searching", "Dynamic Programming"],
-                "quiz_topics": ["Array Operations", "Tree Traversal", "Graph Algorithms", "Time Complexity", "Space Complexity"]
+            "subskills": ["Arrays", "Linked Lists", "Stacks", "Queues", "Trees", "Graphs", "Sorting", "Searching", "Dynamic Programming"],
+            "quiz_topics": ["Array Operations", "Tree Traversal", "Graph Algorithms", "Time Complexity", "Space Complexity"]
+        },
+        
+        "Arrays": {
+            "resources": [
+                {"title": "Array Data Structure Guide", "url": "https://www.geeksforgeeks.org/array-data-structure/", "type": "article", "quality": 94},
+                {"title": "Array Problems - LeetCode", "url": "https://leetcode.com/tag/array/", "type": "course", "quality": 92},
+                {"title": "Array Algorithms", "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/arrays", "type": "github", "quality": 90},
+                {"title": "JavaScript Array Methods", "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Array", "type": "documentation", "quality": 96},
+                {"title": "Array Visualization", "url": "https://www.cs.usfca.edu/~galles/visualization/Array.html", "type": "tutorial", "quality": 88}
+            ],
+            "learning_path": {
+                "duration": "2-3 weeks",
+                "phases": [
+                    {"name": "Array Basics", "duration": "1 week", "resources": [0, 3]},
+                    {"name": "Array Operations", "duration": "1 week", "resources": [1, 4]},
+                    {"name": "Advanced Techniques", "duration": "1 week", "resources": [2, 1]}
+                ]
             },
-            
-            "Arrays": {
-                "resources": [
-                    {"title": "Array Data Structure Guide", "url": "https://www.geeksforgeeks.org/array-data-structure/", "type": "article", "quality": 94},
-                    {"title": "Array Problems - LeetCode", "url": "https://leetcode.com/tag/array/", "type": "course", "quality": 92},
-                    {"title": "Array Algorithms", "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/arrays", "type": "github", "quality": 90},
-                    {"title": "JavaScript Array Methods", "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Array", "type": "documentation", "quality": 96},
-                    {"title": "Array Visualization", "url": "https://www.cs.usfca.edu/~galles/visualization/Array.html", "type": "tutorial", "quality": 88}
-                ],
-                "learning_path": {
-                    "duration": "2-3 weeks",
-                    "phases": [
-                        {"name": "Array Basics", "duration": "1 week", "resources": [0, 3]},
-                        {"name": "Array Operations", "duration": "1 week", "resources": [1, 4]},
-                        {"name": "Advanced Techniques", "duration": "1 week", "resources": [2, 1]}
-                    ]
-                },
-                "subskills": ["Array Declaration", "Indexing", "Traversal", "Searching", "Sorting", "Two Pointers", "Sliding Window"],
-                "quiz_topics": ["Array Indexing", "Linear Search", "Binary Search", "Sorting Algorithms", "Two Pointer Technique"]
+            "subskills": ["Array Declaration", "Indexing", "Traversal", "Searching", "Sorting", "Two Pointers", "Sliding Window"],
+            "quiz_topics": ["Array Indexing", "Linear Search", "Binary Search", "Sorting Algorithms", "Two Pointer Technique"]
+        },
+        
+        # === WEB DEVELOPMENT ===
+        "HTML": {
+            "resources": [
+                {"title": "MDN HTML Reference", "url": "https://developer.mozilla.org/en-US/docs/Web/HTML", "type": "documentation", "quality": 98},
+                {"title": "HTML Tutorial - W3Schools", "url": "https://www.w3schools.com/html/", "type": "tutorial", "quality": 90},
+                {"title": "HTML5 Boilerplate", "url": "https://html5boilerplate.com/", "type": "github", "quality": 88},
+                {"title": "FreeCodeCamp HTML", "url": "https://www.freecodecamp.org/learn/responsive-web-design/", "type": "course", "quality": 92},
+                {"title": "Web Accessibility Guide", "url": "https://webaim.org/intro/", "type": "article", "quality": 86}
+            ],
+            "learning_path": {
+                "duration": "3-4 weeks",
+                "phases": [
+                    {"name": "HTML Basics", "duration": "1 week", "resources": [0, 1]},
+                    {"name": "Forms & Media", "duration": "1 week", "resources": [3, 0]},
+                    {"name": "Semantic HTML", "duration": "1 week", "resources": [4, 2]},
+                    {"name": "Best Practices", "duration": "1 week", "resources": [2, 4]}
+                ]
             },
-            
-            # === WEB DEVELOPMENT ===
-            "HTML": {
-                "resources": [
-                    {"title": "MDN HTML Reference", "url": "https://developer.mozilla.org/en-US/docs/Web/HTML", "type": "documentation", "quality": 98},
-                    {"title": "HTML Tutorial - W3Schools", "url": "https://www.w3schools.com/html/", "type": "tutorial", "quality": 90},
-                    {"title": "HTML5 Boilerplate", "url": "https://html5boilerplate.com/", "type": "github", "quality": 88},
-                    {"title": "FreeCodeCamp HTML", "url": "https://www.freecodecamp.org/learn/responsive-web-design/", "type": "course", "quality": 92},
-                    {"title": "Web Accessibility Guide", "url": "https://webaim.org/intro/", "type": "article", "quality": 86}
-                ],
-                "learning_path": {
-                    "duration": "3-4 weeks",
-                    "phases": [
-                        {"name": "HTML Basics", "duration": "1 week", "resources": [0, 1]},
-                        {"name": "Forms & Media", "duration": "1 week", "resources": [3, 0]},
-                        {"name": "Semantic HTML", "duration": "1 week", "resources": [4, 2]},
-                        {"name": "Best Practices", "duration": "1 week", "resources": [2, 4]}
-                    ]
-                },
-                "subskills": ["Elements", "Attributes", "Forms", "Media", "Semantic Tags", "Accessibility"],
-                "quiz_topics": ["HTML Elements", "Form Validation", "Semantic Markup", "Accessibility Features"]
+            "subskills": ["Elements", "Attributes", "Forms", "Media", "Semantic Tags", "Accessibility"],
+            "quiz_topics": ["HTML Elements", "Form Validation", "Semantic Markup", "Accessibility Features"]
+        },
+        
+        "CSS": {
+            "resources": [
+                {"title": "MDN CSS Reference", "url": "https://developer.mozilla.org/en-US/docs/Web/CSS", "type": "documentation", "quality": 98},
+                {"title": "CSS-Tricks", "url": "https://css-tricks.com/", "type": "article", "quality": 94},
+                {"title": "Flexbox Froggy", "url": "https://flexboxfroggy.com/", "type": "tutorial", "quality": 92},
+                {"title": "Grid Garden", "url": "https://cssgridgarden.com/", "type": "tutorial", "quality": 90},
+                {"title": "CSS Animation Examples", "url": "https://github.com/animate-css/animate.css", "type": "github", "quality": 88},
+                {"title": "CSS Layout Cookbook", "url": "https://developer.mozilla.org/en-US/docs/Web/CSS/Layout_cookbook", "type": "documentation", "quality": 96}
+            ],
+            "learning_path": {
+                "duration": "4-6 weeks",
+                "phases": [
+                    {"name": "CSS Fundamentals", "duration": "1-2 weeks", "resources": [0, 1]},
+                    {"name": "Layout Techniques", "duration": "1-2 weeks", "resources": [2, 3]},
+                    {"name": "Responsive Design", "duration": "1 week", "resources": [5, 1]},
+                    {"name": "Advanced CSS", "duration": "1 week", "resources": [4, 1]}
+                ]
             },
-            
-            "CSS": {
-                "resources": [
-                    {"title": "MDN CSS Reference", "url": "https://developer.mozilla.org/en-US/docs/Web/CSS", "type": "documentation", "quality": 98},
-                    {"title": "CSS-Tricks", "url": "https://css-tricks.com/", "type": "article", "quality": 94},
-                    {"title": "Flexbox Froggy", "url": "https://flexboxfroggy.com/", "type": "tutorial", "quality": 92},
-                    {"title": "Grid Garden", "url": "https://cssgridgarden.com/", "type": "tutorial", "quality": 90},
-                    {"title": "CSS Animation Examples", "url": "https://github.com/animate-css/animate.css", "type": "github", "quality": 88},
-                    {"title": "CSS Layout Cookbook", "url": "https://developer.mozilla.org/en-US/docs/Web/CSS/Layout_cookbook", "type": "documentation", "quality": 96}
-                ],
-                "learning_path": {
-                    "duration": "4-6 weeks",
-                    "phases": [
-                        {"name": "CSS Fundamentals", "duration": "1-2 weeks", "resources": [0, 1]},
-                        {"name": "Layout Techniques", "duration": "1-2 weeks", "resources": [2, 3]},
-                        {"name": "Responsive Design", "duration": "1 week", "resources": [5, 1]},
-                        {"name": "Advanced CSS", "duration": "1 week", "resources": [4, 1]}
-                    ]
-                },
-                "subskills": ["Selectors", "Box Model", "Flexbox", "Grid", "Responsive Design", "Animations"],
-                "quiz_topics": ["CSS Selectors", "Flexbox Properties", "Grid Layout", "Media Queries", "CSS Animations"]
+            "subskills": ["Selectors", "Box Model", "Flexbox", "Grid", "Responsive Design", "Animations"],
+            "quiz_topics": ["CSS Selectors", "Flexbox Properties", "Grid Layout", "Media Queries", "CSS Animations"]
+        },
+        
+        # === MACHINE LEARNING ===
+        "Machine Learning": {
+            "resources": [
+                {"title": "Andrew Ng's ML Course", "url": "https://www.coursera.org/learn/machine-learning", "type": "course", "quality": 98},
+                {"title": "Scikit-learn Documentation", "url": "https://scikit-learn.org/stable/user_guide.html", "type": "documentation", "quality": 96},
+                {"title": "Hands-On Machine Learning", "url": "https://github.com/ageron/handson-ml2", "type": "github", "quality": 94},
+                {"title": "Fast.ai Course", "url": "https://www.fast.ai/", "type": "course", "quality": 92},
+                {"title": "ML Crash Course - Google", "url": "https://developers.google.com/machine-learning/crash-course", "type": "course", "quality": 90},
+                {"title": "Papers With Code", "url": "https://paperswithcode.com/", "type": "article", "quality": 88}
+            ],
+            "learning_path": {
+                "duration": "12-16 weeks",
+                "phases": [
+                    {"name": "ML Fundamentals", "duration": "3-4 weeks", "resources": [0, 4]},
+                    {"name": "Supervised Learning", "duration": "3-4 weeks", "resources": [1, 2]},
+                    {"name": "Unsupervised Learning", "duration": "2-3 weeks", "resources": [3, 1]},
+                    {"name": "Deep Learning", "duration": "4-5 weeks", "resources": [3, 5]}
+                ]
             },
-            
-            # === MACHINE LEARNING ===
-            "Machine Learning": {
-                "resources": [
-                    {"title": "Andrew Ng's ML Course", "url": "https://www.coursera.org/learn/machine-learning", "type": "course", "quality": 98},
-                    {"title": "Scikit-learn Documentation", "url": "https://scikit-learn.org/stable/user_guide.html", "type": "documentation", "quality": 96},
-                    {"title": "Hands-On Machine Learning", "url": "https://github.com/ageron/handson-ml2", "type": "github", "quality": 94},
-                    {"title": "Fast.ai Course", "url": "https://www.fast.ai/", "type": "course", "quality": 92},
-                    {"title": "ML Crash Course - Google", "url": "https://developers.google.com/machine-learning/crash-course", "type": "course", "quality": 90},
-                    {"title": "Papers With Code", "url": "https://paperswithcode.com/", "type": "article", "quality": 88}
-                ],
-                "learning_path": {
-                    "duration": "12-16 weeks",
-                    "phases": [
-                        {"name": "ML Fundamentals", "duration": "3-4 weeks", "resources": [0, 4]},
-                        {"name": "Supervised Learning", "duration": "3-4 weeks", "resources": [1, 2]},
-                        {"name": "Unsupervised Learning", "duration": "2-3 weeks", "resources": [3, 1]},
-                        {"name": "Deep Learning", "duration": "4-5 weeks", "resources": [3, 5]}
-                    ]
-                },
-                "subskills": ["Linear Algebra", "Statistics", "Supervised Learning", "Unsupervised Learning", "Deep Learning", "Model Evaluation"],
-                "quiz_topics": ["Regression vs Classification", "Overfitting", "Cross-validation", "Neural Networks", "Feature Engineering"]
+            "subskills": ["Linear Algebra", "Statistics", "Supervised Learning", "Unsupervised Learning", "Deep Learning", "Model Evaluation"],
+            "quiz_topics": ["Regression vs Classification", "Overfitting", "Cross-validation", "Neural Networks", "Feature Engineering"]
+        },
+        
+        # === DATABASE & BACKEND ===
+        "SQL": {
+            "resources": [
+                {"title": "SQLBolt Interactive Tutorial", "url": "https://sqlbolt.com/", "type": "tutorial", "quality": 94},
+                {"title": "W3Schools SQL", "url": "https://www.w3schools.com/sql/", "type": "tutorial", "quality": 90},
+                {"title": "PostgreSQL Documentation", "url": "https://www.postgresql.org/docs/", "type": "documentation", "quality": 96},
+                {"title": "SQL Practice - HackerRank", "url": "https://www.hackerrank.com/domains/sql", "type": "course", "quality": 88},
+                {"title": "SQL Style Guide", "url": "https://www.sqlstyle.guide/", "type": "article", "quality": 86}
+            ],
+            "learning_path": {
+                "duration": "4-6 weeks",
+                "phases": [
+                    {"name": "SQL Basics", "duration": "1-2 weeks", "resources": [0, 1]},
+                    {"name": "Advanced Queries", "duration": "1-2 weeks", "resources": [2, 3]},
+                    {"name": "Database Design", "duration": "1 week", "resources": [2, 4]},
+                    {"name": "Optimization", "duration": "1 week", "resources": [2, 4]}
+                ]
             },
-            
-            # === DATABASE & BACKEND ===
-            "SQL": {
-                "resources": [
-                    {"title": "SQLBolt Interactive Tutorial", "url": "https://sqlbolt.com/", "type": "tutorial", "quality": 94},
-                    {"title": "W3Schools SQL", "url": "https://www.w3schools.com/sql/", "type": "tutorial", "quality": 90},
-                    {"title": "PostgreSQL Documentation", "url": "https://www.postgresql.org/docs/", "type": "documentation", "quality": 96},
-                    {"title": "SQL Practice - HackerRank", "url": "https://www.hackerrank.com/domains/sql", "type": "course", "quality": 88},
-                    {"title": "SQL Style Guide", "url": "https://www.sqlstyle.guide/", "type": "article", "quality": 86}
-                ],
-                "learning_path": {
-                    "duration": "4-6 weeks",
-                    "phases": [
-                        {"name": "SQL Basics", "duration": "1-2 weeks", "resources": [0, 1]},
-                        {"name": "Advanced Queries", "duration": "1-2 weeks", "resources": [2, 3]},
-                        {"name": "Database Design", "duration": "1 week", "resources": [2, 4]},
-                        {"name": "Optimization", "duration": "1 week", "resources": [2, 4]}
-                    ]
-                },
-                "subskills": ["SELECT", "INSERT/UPDATE/DELETE", "JOINs", "Subqueries", "Indexes", "Stored Procedures"],
-                "quiz_topics": ["Basic Queries", "JOIN Operations", "Aggregate Functions", "Subqueries", "Database Design"]
+            "subskills": ["SELECT", "INSERT/UPDATE/DELETE", "JOINs", "Subqueries", "Indexes", "Stored Procedures"],
+            "quiz_topics": ["Basic Queries", "JOIN Operations", "Aggregate Functions", "Subqueries", "Database Design"]
+        },
+        
+        "Node.js": {
+            "resources": [
+                {"title": "Node.js Official Docs", "url": "https://nodejs.org/en/docs/", "type": "documentation", "quality": 98},
+                {"title": "Node.js Best Practices", "url": "https://github.com/goldbergyoni/nodebestpractices", "type": "github", "quality": 94},
+                {"title": "Express.js Guide", "url": "https://expressjs.com/en/guide/routing.html", "type": "documentation", "quality": 92},
+                {"title": "Node.js - FreeCodeCamp", "url": "https://www.freecodecamp.org/learn/back-end-development-and-apis/", "type": "course", "quality": 90},
+                {"title": "Awesome Node.js", "url": "https://github.com/sindresorhus/awesome-nodejs", "type": "github", "quality": 88}
+            ],
+            "learning_path": {
+                "duration": "6-8 weeks",
+                "phases": [
+                    {"name": "Node.js Basics", "duration": "2 weeks", "resources": [0, 3]},
+                    {"name": "Express Framework", "duration": "2 weeks", "resources": [2, 1]},
+                    {"name": "Database Integration", "duration": "1-2 weeks", "resources": [1, 4]},
+                    {"name": "API Development", "duration": "1-2 weeks", "resources": [1, 2]}
+                ]
             },
-            
-            "Node.js": {
-                "resources": [
-                    {"title": "Node.js Official Docs", "url": "https://nodejs.org/en/docs/", "type": "documentation", "quality": 98},
-                    {"title": "Node.js Best Practices", "url": "https://github.com/goldbergyoni/nodebestpractices", "type": "github", "quality": 94},
-                    {"title": "Express.js Guide", "url": "https://expressjs.com/en/guide/routing.html", "type": "documentation", "quality": 92},
-                    {"title": "Node.js - FreeCodeCamp", "url": "https://www.freecodecamp.org/learn/back-end-development-and-apis/", "type": "course", "quality": 90},
-                    {"title": "Awesome Node.js", "url": "https://github.com/sindresorhus/awesome-nodejs", "type": "github", "quality": 88}
-                ],
-                "learning_path": {
-                    "duration": "6-8 weeks",
-                    "phases": [
-                        {"name": "Node.js Basics", "duration": "2 weeks", "resources": [0, 3]},
-                        {"name": "Express Framework", "duration": "2 weeks", "resources": [2, 1]},
-                        {"name": "Database Integration", "duration": "1-2 weeks", "resources": [1, 4]},
-                        {"name": "API Development", "duration": "1-2 weeks", "resources": [1, 2]}
-                    ]
-                },
-                "subskills": ["Event Loop", "Modules", "Express", "Middleware", "Routing", "Database", "Authentication"],
-                "quiz_topics": ["Event Loop", "NPM Modules", "Express Routing", "Middleware", "REST APIs"]
-            }
+            "subskills": ["Event Loop", "Modules", "Express", "Middleware", "Routing", "Database", "Authentication"],
+            "quiz_topics": ["Event Loop", "NPM Modules", "Express Routing", "Middleware", "REST APIs"]
         }
+    }
+
+class OptimizedResourceDatabase:
+    """
+    Pre-computed resource database optimized for speed and cost efficiency.
+    """
+    
+    def __init__(self):
+        self.cache = {}  # In-memory cache for hot data
+        self.cache_version = None  # Catalog version the cache was filled from
+    
+    @property
+    def catalog(self):
+        """Shared resource catalog (built lazily on first access)."""
+        return get_resource_catalog()
     
+    @property
+    def resources_db(self) -> Dict:
+        """Per-skill metadata for every skill the catalog knows about."""
+        return self.catalog.skill_metadata
+        
     def get_resources(self, skill_name: str, limit: int = 10) -> List[Dict]:
         """
         Get optimized resources for a skill (O(1) lookup).
@@ -264,6 +276,11 @@ class OptimizedResourceDatabase:
         """
         cache_key = f"{skill_name}_{limit}"
         
+        # Drop cached results when a new catalog snapshot has been loaded
+        if self.cache_version != self.catalog.version:
+            self.cache.clear()
+            self.cache_version = self.catalog.version
+        
         # Check memory cache first
         if cache_key in self.cache:
             return self.cache[cache_key]
@@ -272,23 +289,43 @@ class OptimizedResourceDatabase:
         normalized_skill = self._normalize_skill_name(skill_name)
         
         # Direct lookup
-        if normalized_skill in self.resources_db:
-            resources = self.resources_db[normalized_skill]["resources"][:limit]
+        if self.catalog.has_listing(SOURCE_OPTIMIZED, normalized_skill):
+            resources = self.catalog.get_listing(SOURCE_OPTIMIZED, normalized_skill)[:limit]
             # Convert to expected format
             formatted_resources = []
             for resource in resources:
                 formatted_resources.append({
                     "title": resource["title"],
                     "url": resource["url"],
-                    "description": f"High-quality {resource['type']} for {skill_name}",
-                    "resource_type": resource["type"],
-                    "quality_score": resource["quality"]
+                    "description": f"High-quality {resource['resource_type']} for {skill_name}",
+                    "resource_type": resource["resource_type"],
+                    "quality_score": resource["quality_score"]
                 })
             
             # Cache the result
             self.cache[cache_key] = formatted_resources
             return formatted_resources
         
+        # Closest catalog skill by meaning (only when the embedding model is already loaded)
+        similar_skill = self._find_similar_catalog_skill(skill_name)
+        if similar_skill is not None:
+            # Keyed by the matched catalog skill, so free-text queries cannot grow the cache
+            similar_key = f"similar:{similar_skill}_{limit}"
+            if similar_key in self.cache:
+                return self.cache[similar_key]
+            resources = [
+                {
+                    "title": resource["title"],
+                    "url": resource["url"],
+                    "description": f"High-quality {resource['resource_type']} for {similar_skill}",
+                    "resource_type": resource["resource_type"],
+                    "quality_score": resource["quality_score"]
+                }
+                for resource in self.catalog.get_listing(SOURCE_OPTIMIZED, similar_skill)[:limit]
+            ]
+            self.cache[similar_key] = resources
+            return resources
+        
         # Fallback for unknown skills
         return self._generate_fallback_resources(skill_name, limit)
     
@@ -304,9 +341,9 @@ class OptimizedResourceDatabase:
         """
         normalized_skill = self._normalize_skill_name(skill_name)
         
-        if normalized_skill in self.resources_db:
-            skill_data = self.resources_db[normalized_skill]
-            learning_path = skill_data.get("learning_path", {})
+        if normalized_skill in self.catalog.skill_metadata:
+            learning_path = self.catalog.skill_metadata[normalized_skill].get("learning_path", {})
+            skill_resources = self.catalog.get_listing(SOURCE_OPTIMIZED, normalized_skill)
             
             # Enrich with resource details
             enriched_phases = []
@@ -318,13 +355,13 @@ class OptimizedResourceDatabase:
                 }
                 
                 for resource_idx in phase["resources"]:
-                    if resource_idx < len(skill_data["resources"]):
-                        resource = skill_data["resources"][resource_idx]
+                    if resource_idx < len(skill_resources):
+                        resource = skill_resources[resource_idx]
                         enriched_phase["resources"].append({
                             "title": resource["title"],
                             "url": resource["url"],
-                            "resource_type": resource["type"],
-                            "quality_score": resource["quality"]
+                            "resource_type": resource["resource_type"],
+                            "quality_score": resource["quality_score"]
                         })
                 
                 enriched_phases.append(enriched_phase)
@@ -342,8 +379,8 @@ class OptimizedResourceDatabase:
         """Get quiz topics for a skill."""
         normalized_skill = self._normalize_skill_name(skill_name)
         
-        if normalized_skill in self.resources_db:
-            return self.resources_db[normalized_skill].get("quiz_topics", [])
+        if normalized_skill in self.catalog.skill_metadata:
+            return self.catalog.skill_metadata[normalized_skill].get("quiz_topics", [])
         
         return [f"{skill_name} Basics", f"{skill_name} Intermediate", f"{skill_name} Advanced"]
     
@@ -351,11 +388,23 @@ class OptimizedResourceDatabase:
         """Get subskills for a skill."""
         normalized_skill = self._normalize_skill_name(skill_name)
         
-        if normalized_skill in self.resources_db:
-            return self.resources_db[normalized_skill].get("subskills", [])
+        if normalized_skill in self.catalog.skill_metadata:
+            return self.catalog.skill_metadata[normalized_skill].get("subskills", [])
         
         return [f"{skill_name} Fundamentals", f"{skill_name} Intermediate", f"{skill_name} Advanced"]
     
+    def _find_similar_catalog_skill(self, skill_name: str) -> Optional[str]:
+        """Best semantic match among the catalog's skills, via the skill ANN index."""
+        try:
+            from .skill_index_sync import find_similar_skills
+            from ml.skill_index import SKILL_INDEX_MATCH_THRESHOLD, KIND_CATALOG
+        except ImportError:
+            return None
+        for match in find_similar_skills(skill_name, k=3, kinds=[KIND_CATALOG], require_ready_model=True):
+            if match.score >= SKILL_INDEX_MATCH_THRESHOLD and self.catalog.has_listing(SOURCE_OPTIMIZED, match.name):
+                return match.name
+        return None
+    
     def _normalize_skill_name(self, skill_name: str) -> str:
         """Normalize skill name for consistent lookup."""
         # Handle common variations
@@ -0,0 +1,254 @@
+"""
+Per-Host Token-Bucket Rate Limiter
+==================================
+
+Each host gets its own token bucket with a refill rate (requests per second)
+and a burst capacity. A request only waits when its host's bucket is empty,
+so requests to different hosts never delay each other.
+
+Tokens are reserved under a lock and the bucket is allowed to go into debt.
+Every caller gets a reserved start time later than the caller before it, so
+requests queued for one host are served in FIFO order. The actual wait
+happens outside the lock, with ``time.sleep`` for threads or ``asyncio.sleep``
+for coroutines, so one waiting coroutine never blocks the event loop.
+
+The debt is bounded: a caller whose wait would exceed its ``max_wait``
+(SCRAPER_MAX_WAIT unless the caller has a tighter deadline) gets
+``RateLimitExceeded`` right away and takes no token, so a burst of callers
+cannot push the host's queue arbitrarily far into the future.
+
+Configuration (environment):
+    SCRAPER_DEFAULT_RATE      requests/second for hosts without an override
+    SCRAPER_DEFAULT_BURST     burst capacity for hosts without an override
+    SCRAPER_HOST_RATE_LIMITS  per-host overrides, e.g. "bing.com=0.5/2,searx.be=1/3"
+    SCRAPER_MAX_WAIT          longest wait (seconds) a request queues for before failing
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from .resource_catalog import get_domain
+
+logger = logging.getLogger(__name__)
+
+SCRAPER_DEFAULT_RATE = float(os.environ.get("SCRAPER_DEFAULT_RATE", "0.67"))
+SCRAPER_DEFAULT_BURST = float(os.environ.get("SCRAPER_DEFAULT_BURST", "2"))
+SCRAPER_MAX_WAIT = float(os.environ.get("SCRAPER_MAX_WAIT", "30"))
+
+# Built-in limits for the search engines we scrape (rate/s, burst)
+DEFAULT_HOST_LIMITS = {
+    "bing.com": (0.67, 2),
+    "startpage.com": (0.67, 2),
+    "searx.be": (1.0, 2),
+    "search.privacyguides.net": (1.0, 2),
+    "searx.tiekoetter.com": (1.0, 2),
+    # Hosts searched by the async scrapers in utils.resource_search
+    "youtube.com": (2.0, 6),
+    "html.duckduckgo.com": (1.0, 4),
+    "github.com": (1.0, 4),
+}
+
+
+class RateLimitExceeded(Exception):
+    """Raised instead of waiting longer than the caller's ``max_wait`` for a token."""
+
+    def __init__(self, wait: float, max_wait: float):
+        super().__init__(f"Rate limit needs a {wait:.2f}s wait (max {max(max_wait, 0.0):.2f}s)")
+        self.wait = wait
+
+
+def parse_host_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """
+    Parse ``host=rate/burst`` pairs separated by commas.
+
+    Args:
+        spec: e.g. ``"bing.com=0.5/2,startpage.com=1"`` (burst defaults to SCRAPER_DEFAULT_BURST)
+
+    Returns:
+        Mapping of host to (rate, burst)
+    """
+    limits = {}
+    for entry in (spec or "").split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            host, limit = entry.split("=", 1)
+            rate, _, burst = limit.partition("/")
+            limits[host.strip().lower()] = (float(rate), float(burst) if burst else SCRAPER_DEFAULT_BURST)
+        except ValueError:
+            logger.warning(f"Ignoring malformed rate limit entry: {entry!r}")
+    return limits
+
+
+class TokenBucket:
+    """Token bucket that hands out FIFO reservations."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.requests = 0
+        self.delayed = 0
+        self.waiting = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def reserve(self, max_wait: float = SCRAPER_MAX_WAIT) -> float:
+        """
+        Take one token and return how long the caller must wait before using it.
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed ``max_wait`` (no token is taken)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            delay = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if delay > max_wait:
+                self.rejected += 1
+                raise RateLimitExceeded(delay, max_wait)
+            self._tokens -= 1
+            self.requests += 1
+
+            if delay > 0:
+                self.delayed += 1
+                self.total_wait += delay
+                self.max_wait = max(self.max_wait, delay)
+            return delay
+
+    def acquire(self, max_wait: float = SCRAPER_MAX_WAIT) -> float:
+        """Block the calling thread until a token is available; returns seconds waited."""
+        delay = self.reserve(max_wait)
+        if delay > 0:
+            self._track_waiting(1)
+            try:
+                time.sleep(delay)
+            finally:
+                self._track_waiting(-1)
+        return delay
+
+    async def acquire_async(self, max_wait: float = SCRAPER_MAX_WAIT) -> float:
+        """Suspend the calling coroutine until a token is available; returns seconds waited."""
+        delay = self.reserve(max_wait)
+        if delay > 0:
+            self._track_waiting(1)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._track_waiting(-1)
+        return delay
+
+    def _track_waiting(self, change: int):
+        with self._lock:
+            self.waiting += change
+
+    def stats(self) -> Dict:
+        with self._lock:
+            tokens = min(self.capacity, self._tokens + (time.monotonic() - self._updated) * self.rate)
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.capacity,
+                "available_tokens": round(tokens, 2),
+                "requests": self.requests,
+                "delayed_requests": self.delayed,
+                "rejected_requests": self.rejected,
+                "waiting": self.waiting,
+                "total_wait_seconds": round(self.total_wait, 3),
+                "avg_wait_seconds": round(self.total_wait / self.requests, 3) if self.requests else 0.0,
+                "max_wait_seconds": round(self.max_wait, 3),
+            }
+
+
+class HostRateLimiter:
+    """
+    Token buckets keyed by host name (without ``www.``).
+    """
+
+    def __init__(self, default_rate: float = SCRAPER_DEFAULT_RATE, default_burst: float = SCRAPER_DEFAULT_BURST,
+                 host_limits: Dict[str, Tuple[float, float]] = None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = dict(host_limits or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "HostRateLimiter":
+        host_limits = dict(DEFAULT_HOST_LIMITS)
+        host_limits.update(parse_host_limits(os.environ.get("SCRAPER_HOST_RATE_LIMITS", "")))
+        return cls(host_limits=host_limits)
+
+    @staticmethod
+    def host_key(url_or_host: str) -> str:
+        """Normalize a URL or bare host name into a bucket key."""
+        if "://" in url_or_host:
+            return get_domain(url_or_host)
+        host = url_or_host.strip().lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def bucket_for(self, url_or_host: str) -> TokenBucket:
+        host = self.host_key(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, (self.default_rate, self.default_burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url_or_host: str, max_wait: Optional[float] = None) -> float:
+        """
+        Wait (blocking) for the host's bucket; returns seconds waited.
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed ``max_wait`` (SCRAPER_MAX_WAIT by default)
+        """
+        delay = self.bucket_for(url_or_host).acquire(SCRAPER_MAX_WAIT if max_wait is None else max_wait)
+        if delay > 0:
+            logger.info(f"Rate limiting: waited {delay:.2f}s for {self.host_key(url_or_host)}")
+        return delay
+
+    async def acquire_async(self, url_or_host: str, max_wait: Optional[float] = None) -> float:
+        """
+        Wait (without blocking the event loop) for the host's bucket; returns seconds waited.
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed ``max_wait`` (SCRAPER_MAX_WAIT by default)
+        """
+        delay = await self.bucket_for(url_or_host).acquire_async(
+            SCRAPER_MAX_WAIT if max_wait is None else max_wait)
+        if delay > 0:
+            logger.info(f"Rate limiting: waited {delay:.2f}s for {self.host_key(url_or_host)}")
+        return delay
+
+    def stats(self) -> Dict:
+        with self._lock:
+            buckets = dict(self._buckets)
+        hosts = {host: bucket.stats() for host, bucket in sorted(buckets.items())}
+        return {
+            "hosts": hosts,
+            "total_requests": sum(h["requests"] for h in hosts.values()),
+            "total_wait_seconds": round(sum(h["total_wait_seconds"] for h in hosts.values()), 3),
+            "default_rate_per_second": self.default_rate,
+            "default_burst": self.default_burst,
+        }
+
+
+# Global instance shared by all scrapers
+host_rate_limiter = HostRateLimiter.from_env()
+
+
+def get_rate_limiter_stats() -> Dict:
+    """Per-host request counts and limiter wait times."""
+    return host_rate_limiter.stats()
@@ -0,0 +1,359 @@
+"""
+Materialized Recommendations
+============================
+
+Serves per-user skill recommendations from the ``user_recommendations``
+table instead of recomputing collaborative filtering on every page load.
+
+- ``refresh_user_recommendations`` computes a user's top-N with
+  ``adaptive_engine.get_collaborative_recommendations``. It replaces that
+  user's open rows (rows the user has acted on are kept) in one
+  transaction. Each row carries its ``created_at`` freshness timestamp.
+  A user with nothing to recommend gets one marker row without an item,
+  so they are not recomputed on every read.
+- ``get_user_recommendations`` reads those rows. It computes them inline
+  only on a miss, storing them through its own session; stale rows are still
+  served and queued for a refresh.
+- A background job refreshes:
+  - users whose progress or behaviour changed (committed ``SkillProgress``
+    / ``UserBehavior`` writes, collected by session hooks, and flushes of
+    the behaviour write-behind buffer);
+  - recently active users whose rows are older than
+    RECOMMENDATIONS_MAX_AGE_SECONDS.
+  It also rebuilds the item-to-item ``skill_similarities`` table once that
+  is older than SKILL_SIMILARITY_MAX_AGE_SECONDS (see ``utils.item_similarity``).
+  Every worker runs the job, but a pass holds the ``recommendation_refresh``
+  job lock (``utils.job_lock``), so two workers never refresh the same users
+  concurrently. A worker that finds the lock taken skips the pass and keeps
+  its queued users for its next one.
+
+Configuration (environment):
+    RECOMMENDATIONS_TOP_N             recommendations stored per user
+    RECOMMENDATIONS_REFRESH_INTERVAL  seconds between background passes (0 disables the job)
+    RECOMMENDATIONS_MAX_AGE_SECONDS   rows older than this are refreshed
+    RECOMMENDATIONS_ACTIVE_DAYS       only users active this recently are refreshed on age
+    RECOMMENDATIONS_BATCH_SIZE        users refreshed per background pass on age
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import event, func, or_
+from sqlalchemy.orm import Session
+
+from database.database import SessionLocal
+from models.models import User, UserRecommendation, SkillProgress, UserBehavior
+from utils.adaptive_learning import adaptive_engine
+from utils.behavior_buffer import behavior_buffer
+from utils.job_lock import job_lock
+from utils.item_similarity import (
+    build_skill_similarity_table, similarity_table_age, SKILL_SIMILARITY_MAX_AGE_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+RECOMMENDATIONS_TOP_N = int(os.environ.get("RECOMMENDATIONS_TOP_N", "10"))
+RECOMMENDATIONS_REFRESH_INTERVAL = float(os.environ.get("RECOMMENDATIONS_REFRESH_INTERVAL", "60"))
+RECOMMENDATIONS_MAX_AGE_SECONDS = int(os.environ.get("RECOMMENDATIONS_MAX_AGE_SECONDS", str(6 * 3600)))
+RECOMMENDATIONS_ACTIVE_DAYS = int(os.environ.get("RECOMMENDATIONS_ACTIVE_DAYS", "7"))
+RECOMMENDATIONS_BATCH_SIZE = int(os.environ.get("RECOMMENDATIONS_BATCH_SIZE", "200"))
+
+RECOMMENDATION_TYPE = "skill"
+
+
+def _open_recommendations(db: Session, user_id: int):
+    return db.query(UserRecommendation).filter(
+        UserRecommendation.user_id == user_id,
+        UserRecommendation.recommendation_type == RECOMMENDATION_TYPE,
+        UserRecommendation.user_action.is_(None)
+    )
+
+
+def _utc_naive(value: datetime) -> datetime:
+    # SQLite hands back naive UTC datetimes, PostgreSQL timezone-aware ones
+    return value if value.tzinfo is None else value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _as_dict(row: UserRecommendation) -> Dict[str, Any]:
+    data = row.recommendation_data or {}
+    return {
+        "type": row.recommended_item_type,
+        "item_id": row.recommended_item_id,
+        "title": data.get("title"),
+        "description": data.get("description"),
+        "score": row.score,
+        "reason": row.reason,
+        "generated_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+def store_user_recommendations(user_id: int, recommendations: List[Dict[str, Any]], db: Session,
+                               generated_at: Optional[datetime] = None):
+    """
+    Replace a user's open rows in ``user_recommendations`` with ``recommendations``.
+
+    Args:
+        user_id: User the recommendations belong to
+        recommendations: Output of ``get_collaborative_recommendations``
+        db: Database session (committed, or rolled back on error, by this call)
+        generated_at: Freshness timestamp stored on the rows (defaults to ``utcnow``)
+    """
+    generated_at = generated_at or datetime.utcnow()
+    try:
+        _open_recommendations(db, user_id).delete(synchronize_session=False)
+        if not recommendations:
+            db.add(UserRecommendation(user_id=user_id, recommendation_type=RECOMMENDATION_TYPE,
+                                      recommended_item_id=None, score=0.0, created_at=generated_at))
+        db.add_all(
+            UserRecommendation(
+                user_id=user_id,
+                recommendation_type=RECOMMENDATION_TYPE,
+                recommended_item_id=recommendation["item_id"],
+                recommended_item_type=recommendation.get("type", "skill"),
+                score=float(recommendation.get("score") or 0.0),
+                reason=recommendation.get("reason"),
+                recommendation_data={"title": recommendation.get("title"),
+                                     "description": recommendation.get("description")},
+                created_at=generated_at,
+            )
+            for recommendation in recommendations
+        )
+        db.commit()
+    except Exception as e:
+        logger.error(f"Error storing recommendations for user {user_id}: {str(e)}")
+        db.rollback()
+
+
+def refresh_user_recommendations(user_id: int, db: Session,
+                                 limit: int = RECOMMENDATIONS_TOP_N) -> List[Dict[str, Any]]:
+    """
+    Recompute a user's recommendations and store them in ``user_recommendations``.
+
+    Args:
+        user_id: User to refresh
+        db: Database session (committed by this call)
+        limit: Number of recommendations to store
+
+    Returns:
+        The stored recommendations, best first
+    """
+    recommendations = adaptive_engine.get_collaborative_recommendations(user_id, db, limit=limit)
+    generated_at = datetime.utcnow()
+    store_user_recommendations(user_id, recommendations, db, generated_at)
+    for recommendation in recommendations:
+        recommendation["generated_at"] = generated_at.isoformat()
+    return recommendations
+
+
+def get_user_recommendations(user_id: int, db: Session, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    A user's stored recommendations; computed inline only when there are none.
+
+    Inline results are stored through a separate session, so this read never
+    commits or rolls back the caller's transaction.
+
+    Args:
+        user_id: Target user
+        db: Database session (only read from)
+        limit: Number of recommendations to return
+
+    Returns:
+        List of recommended skills, best first
+    """
+    rows = _open_recommendations(db, user_id).order_by(UserRecommendation.score.desc()).all()
+    if not rows:
+        recommendation_refresher.misses += 1
+        recommendations = adaptive_engine.get_collaborative_recommendations(
+            user_id, db, limit=max(limit, RECOMMENDATIONS_TOP_N)
+        )
+        generated_at = datetime.utcnow()
+        store_db = recommendation_refresher.session_factory()
+        try:
+            store_user_recommendations(user_id, recommendations, store_db, generated_at)
+        finally:
+            store_db.close()
+        for recommendation in recommendations:
+            recommendation["generated_at"] = generated_at.isoformat()
+        return recommendations[:limit]
+
+    recommendation_refresher.hits += 1
+    oldest = min((_utc_naive(row.created_at) for row in rows if row.created_at), default=None)
+    if oldest is not None and datetime.utcnow() - oldest > timedelta(seconds=recommendation_refresher.max_age_seconds):
+        recommendation_refresher.mark_stale([user_id])
+    return [_as_dict(row) for row in rows if row.recommended_item_id is not None][:limit]
+
+
+class RecommendationRefresher:
+    """Background job that keeps ``user_recommendations`` fresh."""
+
+    def __init__(self, session_factory=SessionLocal,
+                 max_age_seconds: int = RECOMMENDATIONS_MAX_AGE_SECONDS,
+                 active_days: int = RECOMMENDATIONS_ACTIVE_DAYS,
+                 batch_size: int = RECOMMENDATIONS_BATCH_SIZE,
+                 similarity_max_age_seconds: int = SKILL_SIMILARITY_MAX_AGE_SECONDS):
+        self.session_factory = session_factory
+        self.max_age_seconds = max_age_seconds
+        self.active_days = active_days
+        self.batch_size = batch_size
+        self.similarity_max_age_seconds = similarity_max_age_seconds
+        self._stale_users: Set[int] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.hits = 0
+        self.misses = 0
+        self.refreshed = 0
+        self.passes = 0
+        self.skipped_passes = 0
+        self.last_pass_seconds = 0.0
+        self.similarity_builds = 0
+
+    def mark_stale(self, user_ids):
+        """Queue users for the next background pass (e.g. after new activity)."""
+        with self._lock:
+            self._stale_users.update(user_id for user_id in user_ids if user_id is not None)
+
+    def _take_stale(self) -> List[int]:
+        with self._lock:
+            users, self._stale_users = list(self._stale_users), set()
+        return users
+
+    def expired_active_users(self, db: Session) -> List[int]:
+        """Recently active users whose newest open recommendation is older than ``max_age_seconds``."""
+        now = datetime.utcnow()
+        newest = db.query(
+            UserRecommendation.user_id.label("user_id"),
+            func.max(UserRecommendation.created_at).label("generated_at")
+        ).filter(
+            UserRecommendation.recommendation_type == RECOMMENDATION_TYPE,
+            UserRecommendation.user_action.is_(None)
+        ).group_by(UserRecommendation.user_id).subquery()
+        rows = db.query(User.id).outerjoin(newest, newest.c.user_id == User.id).filter(
+            User.last_activity >= now - timedelta(days=self.active_days),
+            or_(newest.c.generated_at.is_(None),
+                newest.c.generated_at < now - timedelta(seconds=self.max_age_seconds))
+        ).order_by(User.last_activity.desc()).limit(self.batch_size).all()
+        return [user_id for (user_id,) in rows]
+
+    def rebuild_similarities_if_stale(self, db: Session) -> bool:
+        age = similarity_table_age(db)
+        if age is not None and age < self.similarity_max_age_seconds:
+            return False
+        try:
+            build_skill_similarity_table(db)
+        except Exception as e:
+            logger.warning(f"Skill similarity rebuild failed: {e}")
+            return False
+        self.similarity_builds += 1
+        return True
+
+    def run_once(self) -> int:
+        """Rebuild stale item similarities, refresh event-queued users, then a batch of expired active users."""
+        started = time.perf_counter()
+        db = self.session_factory()
+        refreshed = 0
+        try:
+            with job_lock(db.get_bind(), "recommendation_refresh") as held:
+                if not held:
+                    self.skipped_passes += 1
+                    return 0
+                self.rebuild_similarities_if_stale(db)
+                user_ids = list(dict.fromkeys(self._take_stale() + self.expired_active_users(db)))
+                for user_id in user_ids:
+                    try:
+                        refresh_user_recommendations(user_id, db)
+                        refreshed += 1
+                    except Exception as e:
+                        logger.warning(f"Recommendation refresh failed for user {user_id}: {e}")
+                        db.rollback()
+        finally:
+            db.close()
+        self.refreshed += refreshed
+        self.passes += 1
+        self.last_pass_seconds = round(time.perf_counter() - started, 3)
+        return refreshed
+
+    def start(self, interval: float = RECOMMENDATIONS_REFRESH_INTERVAL):
+        """Run ``run_once`` every ``interval`` seconds on a daemon thread."""
+        if interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+
+        def refresh_loop():
+            while not self._stop.wait(interval):
+                try:
+                    refreshed = self.run_once()
+                    if refreshed:
+                        logger.debug(f"Refreshed recommendations for {refreshed} users")
+                except Exception as e:
+                    logger.warning(f"Recommendation refresh pass failed: {e}")
+
+        self._thread = threading.Thread(target=refresh_loop, name="recommendation-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread = None
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "queued_users": len(self._stale_users),
+            "refreshed": self.refreshed,
+            "passes": self.passes,
+            "skipped_passes": self.skipped_passes,
+            "last_pass_seconds": self.last_pass_seconds,
+            "similarity_builds": self.similarity_builds,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
+
+
+# Global instance
+recommendation_refresher = RecommendationRefresher()
+
+
+# ---- SQLAlchemy hooks ----
+
+_ACTIVE_USERS_KEY = "recommendation_active_users"
+
+
+def _collect_active_users(session, flush_context):
+    users = session.info.setdefault(_ACTIVE_USERS_KEY, set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, (SkillProgress, UserBehavior)):
+            users.add(obj.user_id)
+
+
+def _queue_active_users(session):
+    users = session.info.pop(_ACTIVE_USERS_KEY, None)
+    if users:
+        recommendation_refresher.mark_stale(users)
+
+
+def _discard_active_users(session, previous_transaction=None):
+    session.info.pop(_ACTIVE_USERS_KEY, None)
+
+
+def _queue_written_users(user_ids):
+    recommendation_refresher.mark_stale(user_ids)
+
+
+def register_recommendation_hooks():
+    """Queue a refresh for every user whose progress or behaviour changes."""
+    # Buffered behaviour events are bulk-inserted, bypassing the ORM session hooks
+    behavior_buffer.add_flush_listener(_queue_written_users)
+    if not event.contains(Session, "after_flush", _collect_active_users):
+        event.listen(Session, "after_flush", _collect_active_users)
+        event.listen(Session, "after_commit", _queue_active_users)
+        event.listen(Session, "after_soft_rollback", _discard_active_users)
+
+
+def get_recommendation_stats() -> Dict:
+    return recommendation_refresher.stats()
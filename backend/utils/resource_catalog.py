@@ -0,0 +1,336 @@
+"""
+Unified Resource Catalog
+========================
+
+Single, process-wide home for every hand-curated learning resource.
+
+The curated data used to live in five independent stores (fast fallback,
+curated/subskill resources, the optimized resource database, the robust
+fetcher's backup resources and the specialized subskill resources), each
+scanned or rebuilt on its own. The catalog loads them once, stores exactly one
+record per URL and exposes:
+
+- per-source listings, so each legacy lookup function is a thin view. Where a
+  source's copy of a resource differs from the shared record (another title,
+  description, type or score), the listing keeps just those fields as
+  overrides, so every view returns exactly what its source held
+- secondary indexes by skill, subskill, resource type and domain
+- per-skill metadata (learning path, subskills, quiz topics)
+
+All lookups are dictionary hits. Views hand out shallow copies so callers that
+rescore resources in place cannot corrupt the shared records.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Sources in build order: the first source that registers a URL provides the
+# shared record; later sources keep their differing fields as overrides.
+SOURCE_SPECIALIZED = "specialized"
+SOURCE_SUBSKILL = "subskill"
+SOURCE_CURATED = "curated"
+SOURCE_FAST_FALLBACK = "fast_fallback"
+SOURCE_OPTIMIZED = "optimized"
+SOURCE_BACKUP = "backup"
+
+# Sources whose keys name subskills rather than top-level skills
+SUBSKILL_SOURCES = {SOURCE_SPECIALIZED, SOURCE_SUBSKILL, SOURCE_BACKUP}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL into the key used for de-duplication."""
+    return (url or "").strip().lower().rstrip("/")
+
+
+def get_domain(url: str) -> str:
+    """Return the host of a URL without a leading ``www.``."""
+    domain = urlparse((url or "").strip()).netloc.lower()
+    return domain[4:] if domain.startswith("www.") else domain
+
+
+class ResourceCatalog:
+    """
+    URL-deduplicated store of curated resources with secondary indexes.
+    """
+
+    def __init__(self):
+        self.version = ""
+        self.records: List[Dict] = []
+        self._url_index: Dict[str, int] = {}
+
+        # source -> listing key -> record ids (in the source's original order)
+        self.listings: Dict[str, Dict[str, List[int]]] = {}
+        # source -> listing key -> {position in listing: fields where the source differs}
+        self.overrides: Dict[str, Dict[str, Dict[int, Dict]]] = {}
+        # skill -> {"learning_path": ..., "subskills": ..., "quiz_topics": ...}
+        self.skill_metadata: Dict[str, Dict] = {}
+
+        self.by_skill: Dict[str, List[int]] = {}
+        self.by_subskill: Dict[str, List[int]] = {}
+        self.by_resource_type: Dict[str, List[int]] = {}
+        self.by_domain: Dict[str, List[int]] = {}
+
+    # === BUILDING ===
+
+    def _intern(self, resource: Dict) -> Tuple[int, Dict]:
+        """
+        Return the record id for a resource's URL, registering it if new,
+        and the fields where this copy differs from the shared record.
+        """
+        fields = _record_fields(resource)
+        url_key = normalize_url(fields["url"])
+        record_id = self._url_index.get(url_key)
+
+        if record_id is not None:
+            record = self.records[record_id]
+            return record_id, {name: value for name, value in fields.items() if record[name] != value}
+
+        record_id = len(self.records)
+        self.records.append(fields)
+        self._url_index[url_key] = record_id
+
+        self.by_resource_type.setdefault(fields["resource_type"], []).append(record_id)
+        self.by_domain.setdefault(get_domain(fields["url"]), []).append(record_id)
+        return record_id, {}
+
+    def add_listing(self, source: str, key: str, resources: Iterable[Dict]):
+        """
+        Register the resources a source lists under ``key``.
+
+        Args:
+            source: Source name (one of the ``SOURCE_*`` constants)
+            key: Skill or subskill name exactly as the source spells it
+            resources: Raw resource dictionaries in any of the legacy formats
+        """
+        record_ids: List[int] = []
+        overrides: Dict[int, Dict] = {}
+        for position, resource in enumerate(resources):
+            record_id, differences = self._intern(resource)
+            record_ids.append(record_id)
+            if differences:
+                overrides[position] = differences
+
+        self.listings.setdefault(source, {})[key] = record_ids
+        source_overrides = self.overrides.setdefault(source, {})
+        if overrides:
+            source_overrides[key] = overrides
+        else:
+            source_overrides.pop(key, None)
+
+        index = self.by_subskill if source in SUBSKILL_SOURCES else self.by_skill
+        bucket = index.setdefault(key.strip().lower(), [])
+        for record_id in record_ids:
+            _append_unique(bucket, record_id)
+
+    def add_skill_metadata(self, skill: str, metadata: Dict):
+        """Attach learning-path/subskill/quiz metadata to a skill."""
+        self.skill_metadata[skill] = metadata
+        for subskill in metadata.get("subskills", []):
+            self.by_subskill.setdefault(subskill.strip().lower(), [])
+
+    # === VIEWS ===
+
+    def has_listing(self, source: str, key: str) -> bool:
+        return key in self.listings.get(source, {})
+
+    def listing_keys(self, source: str) -> List[str]:
+        """Keys registered by a source, in their original order."""
+        return list(self.listings.get(source, {}))
+
+    def get_listing(self, source: str, key: str) -> List[Dict]:
+        """Return copies of the resources a source lists under ``key``, as that source held them."""
+        record_ids = self.listings.get(source, {}).get(key, [])
+        overrides = self.overrides.get(source, {}).get(key, {})
+        return [
+            {**self.records[record_id], **overrides.get(position, {})}
+            for position, record_id in enumerate(record_ids)
+        ]
+
+    def get_by_url(self, url: str) -> Optional[Dict]:
+        record_id = self._url_index.get(normalize_url(url))
+        return dict(self.records[record_id]) if record_id is not None else None
+
+    def find(self, skill: str = None, subskill: str = None, resource_type: str = None,
+             domain: str = None, limit: int = None) -> List[Dict]:
+        """
+        Query the secondary indexes; all given filters must match.
+
+        Args:
+            skill: Top-level skill name (case-insensitive)
+            subskill: Subskill name (case-insensitive)
+            resource_type: Resource type such as ``video`` or ``documentation``
+            domain: Host name without ``www.``
+            limit: Maximum number of resources to return
+
+        Returns:
+            Matching resources ordered by quality score
+        """
+        candidates = None
+        for index, value in (
+            (self.by_skill, skill),
+            (self.by_subskill, subskill),
+            (self.by_resource_type, resource_type),
+            (self.by_domain, domain),
+        ):
+            if value is None:
+                continue
+            key = value if index is self.by_resource_type else value.strip().lower()
+            ids = set(index.get(key, ()))
+            candidates = ids if candidates is None else candidates & ids
+
+        if candidates is None:
+            candidates = range(len(self.records))
+
+        results = sorted(
+            (self.records[record_id] for record_id in candidates),
+            key=lambda record: record["quality_score"],
+            reverse=True,
+        )
+        return [dict(record) for record in results[:limit]]
+
+    def content_digest(self) -> str:
+        """Stable hash of the catalog contents, used as its version."""
+        payload = json.dumps(
+            [self.records, self.listings, self.overrides, self.skill_metadata],
+            sort_keys=True, separators=(",", ":"),
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def stats(self) -> Dict:
+        return {
+            "version": self.version,
+            "total_records": len(self.records),
+            "total_listings": sum(len(keys) for keys in self.listings.values()),
+            "listings_per_source": {source: len(keys) for source, keys in self.listings.items()},
+            "skills": len(self.by_skill),
+            "subskills": len(self.by_subskill),
+            "resource_types": len(self.by_resource_type),
+            "domains": len(self.by_domain),
+        }
+
+
+def _record_fields(resource: Dict) -> Dict:
+    """The catalog fields of a raw resource in any of the legacy formats."""
+    return {
+        "title": resource.get("title", ""),
+        "url": resource.get("url", ""),
+        "description": resource.get("description", ""),
+        "resource_type": resource.get("resource_type") or resource.get("type", "article"),
+        "quality_score": resource.get("quality_score", resource.get("quality", resource.get("score", 0))),
+    }
+
+
+def _append_unique(bucket: List[int], record_id: int):
+    if not bucket or record_id not in bucket:
+        bucket.append(record_id)
+
+
+def build_resource_catalog() -> ResourceCatalog:
+    """Merge the five curated resource stores into a single catalog."""
+    from .enhanced_uniqueness import _initialize_specialized_resources
+    from .curated_resource_data import SUBSKILL_RESOURCES, CURATED_RESOURCES, FAST_FALLBACK_RESOURCES
+    from .optimized_resource_db import _initialize_comprehensive_database
+    from .robust_resource_fetcher import _initialize_backup_resources
+
+    catalog = ResourceCatalog()
+
+    for key, resources in _initialize_specialized_resources().items():
+        catalog.add_listing(SOURCE_SPECIALIZED, key, resources)
+    for key, resources in SUBSKILL_RESOURCES.items():
+        catalog.add_listing(SOURCE_SUBSKILL, key, resources)
+    for key, resources in CURATED_RESOURCES.items():
+        catalog.add_listing(SOURCE_CURATED, key, resources)
+    for key, resources in FAST_FALLBACK_RESOURCES.items():
+        catalog.add_listing(SOURCE_FAST_FALLBACK, key, resources)
+    for key, skill_data in _initialize_comprehensive_database().items():
+        catalog.add_listing(SOURCE_OPTIMIZED, key, skill_data.get("resources", []))
+        catalog.add_skill_metadata(key, {
+            "learning_path": skill_data.get("learning_path", {}),
+            "subskills": skill_data.get("subskills", []),
+            "quiz_topics": skill_data.get("quiz_topics", []),
+        })
+    for key, resources in _initialize_backup_resources().items():
+        catalog.add_listing(SOURCE_BACKUP, key, resources)
+
+    catalog.version = catalog.content_digest()
+    logger.info(f"Resource catalog built: {catalog.stats()}")
+    return catalog
+
+
+# Precomputed snapshot written by scripts/build_resource_snapshot.py
+RESOURCE_SNAPSHOT_PATH = os.environ.get(
+    "RESOURCE_SNAPSHOT_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "resource_catalog.snap")
+)
+# How often (seconds) workers check whether a new snapshot version has landed
+RESOURCE_SNAPSHOT_RELOAD_INTERVAL = float(os.environ.get("RESOURCE_SNAPSHOT_RELOAD_INTERVAL", "30"))
+
+_catalog = None
+_catalog_lock = threading.Lock()
+_last_reload_check = 0.0
+
+
+def _load_catalog():
+    """Map the snapshot if one exists, otherwise build the catalog in-process."""
+    if os.path.exists(RESOURCE_SNAPSHOT_PATH):
+        from .catalog_snapshot import load_snapshot
+        try:
+            catalog = load_snapshot(RESOURCE_SNAPSHOT_PATH)
+            logger.info(f"Resource catalog mapped from snapshot {RESOURCE_SNAPSHOT_PATH} (version {catalog.version})")
+            return catalog
+        except Exception as e:
+            logger.warning(f"Could not load resource snapshot {RESOURCE_SNAPSHOT_PATH}: {e}")
+    return build_resource_catalog()
+
+
+def reload_resource_catalog(force: bool = False) -> bool:
+    """
+    Hot-reload the catalog if a new snapshot version has landed.
+
+    Args:
+        force: Reload even if the snapshot file appears unchanged
+
+    Returns:
+        True if the process-wide catalog was replaced
+    """
+    global _catalog, _last_reload_check
+    with _catalog_lock:
+        _last_reload_check = time.time()
+        if not os.path.exists(RESOURCE_SNAPSHOT_PATH):
+            return False
+
+        is_stale = getattr(_catalog, "is_stale", None)
+        if not force and _catalog is not None and is_stale is not None and not is_stale():
+            return False
+
+        from .catalog_snapshot import load_snapshot
+        try:
+            new_catalog = load_snapshot(RESOURCE_SNAPSHOT_PATH)
+        except Exception as e:
+            logger.warning(f"Resource snapshot reload failed, keeping current catalog: {e}")
+            return False
+
+        # The old mapping is released once in-flight readers drop their references
+        _catalog = new_catalog
+        logger.info(f"Resource catalog reloaded (version {new_catalog.version})")
+        return True
+
+
+def get_resource_catalog():
+    """Return the process-wide catalog, loading it on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = _load_catalog()
+    elif RESOURCE_SNAPSHOT_RELOAD_INTERVAL > 0 and time.time() - _last_reload_check > RESOURCE_SNAPSHOT_RELOAD_INTERVAL:
+        reload_resource_catalog()
+    return _catalog
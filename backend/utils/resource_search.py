@@ -1,13 +1,24 @@
 """
 Utility functions for dynamically searching and retrieving resource links
 without using paid APIs or API keys. Enhanced with quality scoring.
+
+Scraping runs on aiohttp through the shared connection pool in
+``utils.async_http``; each skill's searches fan out across resource types
+under one overall deadline. Within a type, search terms and article engines
+are tried one after another and stop as soon as they have enough results. The ``get_*`` functions are
+synchronous wrappers around the ``fetch_*`` coroutines for legacy callers.
 """
-import requests
+import asyncio
+import os
 from bs4 import BeautifulSoup
-import random
 import time
 import re
 import logging
+from collections import OrderedDict
+from urllib.parse import unquote
+from .async_http import fetch_text, run_sync
+from .circuit_breaker import CircuitOpenError
+from .rate_limiter import RateLimitExceeded
 from .curated_resources import get_curated_resources, calculate_resource_quality
 from .fast_fallback import get_fast_fallback_resources
 from .enhanced_uniqueness import ensure_resource_uniqueness_and_quality, get_specialized_resources_for_subskill
@@ -31,22 +42,37 @@ HEADERS = {
 # Timeout settings for faster response
 REQUEST_TIMEOUT = 2  # Reduced from 3 to 2 seconds for faster response
 MAX_RETRIES = 1      # Reduced retries for faster response
+# Overall deadline (seconds) for all scraping done for one skill
+SEARCH_DEADLINE = float(os.environ.get("SCRAPER_SEARCH_DEADLINE", "6"))
+
+# Article search engines, in order of preference
+ARTICLE_SEARCH_ENGINES = [
+    ("https://html.duckduckgo.com/html/?q={query}+tutorial", "DuckDuckGo"),
+    ("https://www.bing.com/search?q={query}+tutorial", "Bing"),
+    ("https://startpage.com/sp/search?q={query}+tutorial", "Startpage")
+]
 
-# Resource caching for improved performance
-_resource_cache = {}
+# Per-process cache of final results (scraped pages themselves live in the shared on-disk HTTP cache)
+_resource_cache = OrderedDict()
 CACHE_EXPIRY = 3600  # 1 hour cache
+CACHE_MAX_ENTRIES = 512
 
 def get_cached_resources(cache_key):
     """Get resources from cache if available and not expired"""
     if cache_key in _resource_cache:
         cached_data, timestamp = _resource_cache[cache_key]
         if time.time() - timestamp < CACHE_EXPIRY:
+            _resource_cache.move_to_end(cache_key)
             return cached_data
+        del _resource_cache[cache_key]
     return None
 
 def cache_resources(cache_key, resources):
-    """Cache resources with timestamp"""
+    """Cache resources with timestamp, evicting the least recently used entry when full"""
     _resource_cache[cache_key] = (resources, time.time())
+    _resource_cache.move_to_end(cache_key)
+    while len(_resource_cache) > CACHE_MAX_ENTRIES:
+        _resource_cache.popitem(last=False)
 
 def extract_youtube_metadata(soup, video_id=None):
     """
@@ -91,7 +117,90 @@ def extract_youtube_metadata(soup, video_id=None):
     
     return metadata
 
-def get_youtube_videos(query, max_results=3):
+def _parse_youtube_results(html, query, max_results):
+    """Extract videos from a YouTube search results page."""
+    # Parse with BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Extract video information
+    videos = []
+    
+    # Method 1: Try to extract from initial data
+    script_tag = soup.find("script", text=re.compile("var ytInitialData"))
+    if script_tag:
+        # Extract the JSON data
+        data_str = script_tag.string
+        start_idx = data_str.find('var ytInitialData = ') + len('var ytInitialData = ')
+        end_idx = data_str.find('};', start_idx) + 1
+        json_str = data_str[start_idx:end_idx]
+          # Extract video IDs using regex
+        video_ids = re.findall(r'"videoId":"([^"]+)"', json_str)[:max_results]
+        video_titles = re.findall(r'"title":{"runs":\[{"text":"([^"]+)"}]}', json_str)[:max_results]
+        # Create result list with quality scoring
+        for i, video_id in enumerate(video_ids):
+            if i < len(video_titles):
+                title = video_titles[i]
+            else:
+                title = f"Video about {query}"
+                
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            description = f"YouTube video about {query}"
+            
+            # Calculate quality score
+            quality_score = calculate_resource_quality(
+                title, description, url, domain_bonus=False
+            )
+            
+            videos.append({
+                'title': title,
+                'url': url,
+                'description': description,
+                'resource_type': 'video',
+                'quality_score': quality_score
+            })
+            
+            if len(videos) >= max_results:
+                break
+    
+    # Method 2: If method 1 fails, try finding video links directly
+    if not videos:
+        video_elements = soup.select('a.yt-uix-tile-link') or soup.select('a#video-title')
+        for element in video_elements:
+            if element.has_attr('href') and element.has_attr('title'):
+                href = element['href']
+                # Only process video links
+                if href.startswith('/watch'):
+                    url = f"https://www.youtube.com{href}"
+                    title = element['title']
+                    videos.append({
+                        'title': title,
+                        'url': url,
+                        'description': f"YouTube video about {query}",
+                        'resource_type': 'video'
+                    })
+                    
+                    if len(videos) >= max_results:
+                        break
+    
+    # Method 3: Fallback to a simple pattern search if all else fails
+    if not videos:
+        video_pattern = re.compile(r'/watch\?v=([a-zA-Z0-9_-]+)')
+        matches = video_pattern.findall(html)
+          # Deduplicate
+        unique_ids = list(set(matches))[:max_results]
+        
+        for video_id in unique_ids:
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            videos.append({
+                'title': f"{query.capitalize()} Tutorial",
+                'url': url,
+                'description': f"YouTube video about {query}",
+                'resource_type': 'video'
+            })
+    
+    return videos[:max_results]
+
+async def fetch_youtube_videos(query, max_results=3):
     """
     Search YouTube for videos related to the query.
     
@@ -106,103 +215,62 @@ def get_youtube_videos(query, max_results=3):
         # Construct the search URL
         search_query = query.replace(' ', '+')
         url = f"https://www.youtube.com/results?search_query={search_query}"
-          # Send request with timeout
-        response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        if response.status_code != 200:
-            logger.warning(f"Failed to fetch YouTube results: {response.status_code}")
+        response = await fetch_text(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, use_cache=True,
+                                    cacheable=lambda html: bool(_parse_youtube_results(html, query, 1)))
+        if response.status != 200:
+            logger.warning(f"Failed to fetch YouTube results: {response.status}")
             return []
         
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Extract video information
-        videos = []
-        
-        # Method 1: Try to extract from initial data
-        script_tag = soup.find("script", text=re.compile("var ytInitialData"))
-        if script_tag:
-            # Extract the JSON data
-            data_str = script_tag.string
-            start_idx = data_str.find('var ytInitialData = ') + len('var ytInitialData = ')
-            end_idx = data_str.find('};', start_idx) + 1
-            json_str = data_str[start_idx:end_idx]
-              # Extract video IDs using regex
-            video_ids = re.findall(r'"videoId":"([^"]+)"', json_str)[:max_results]
-            video_titles = re.findall(r'"title":{"runs":\[{"text":"([^"]+)"}]}', json_str)[:max_results]
-            # Create result list with quality scoring
-            for i, video_id in enumerate(video_ids):
-                if i < len(video_titles):
-                    title = video_titles[i]
-                else:
-                    title = f"Video about {query}"
-                    
-                url = f"https://www.youtube.com/watch?v={video_id}"
-                description = f"YouTube video about {query}"
-                
-                # Calculate quality score
-                quality_score = calculate_resource_quality(
-                    title, description, url, domain_bonus=False
-                )
-                
-                videos.append({
-                    'title': title,
-                    'url': url,
-                    'description': description,
-                    'resource_type': 'video',
-                    'quality_score': quality_score
-                })
-                
-                if len(videos) >= max_results:
-                    break
+        return _parse_youtube_results(response.text, query, max_results)
         
-        # Method 2: If method 1 fails, try finding video links directly
-        if not videos:
-            video_elements = soup.select('a.yt-uix-tile-link') or soup.select('a#video-title')
-            for element in video_elements:
-                if element.has_attr('href') and element.has_attr('title'):
-                    href = element['href']
-                    # Only process video links
-                    if href.startswith('/watch'):
-                        url = f"https://www.youtube.com{href}"
-                        title = element['title']
-                        videos.append({
-                            'title': title,
-                            'url': url,
-                            'description': f"YouTube video about {query}",
-                            'resource_type': 'video'
-                        })
-                        
-                        if len(videos) >= max_results:
-                            break
-        
-        # Method 3: Fallback to a simple pattern search if all else fails
-        if not videos:
-            video_pattern = re.compile(r'/watch\?v=([a-zA-Z0-9_-]+)')
-            matches = video_pattern.findall(response.text)
-              # Deduplicate
-            unique_ids = list(set(matches))[:max_results]
-            
-            for video_id in unique_ids:
-                url = f"https://www.youtube.com/watch?v={video_id}"
-                videos.append({
-                    'title': f"{query.capitalize()} Tutorial",
-                    'url': url,
-                    'description': f"YouTube video about {query}",
-                    'resource_type': 'video'
-                })
-        
-        return videos[:max_results]
-        
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         logger.warning(f"YouTube search timed out for query: {query}")
         return []
+    except (CircuitOpenError, RateLimitExceeded) as e:
+        logger.debug(f"Skipping YouTube search for {query}: {e}")
+        return []
     except Exception as e:
         logger.error(f"Error fetching YouTube videos: {str(e)}")
         return []
 
-def get_articles(query, max_results=3):
+def get_youtube_videos(query, max_results=3):
+    """Synchronous wrapper around fetch_youtube_videos."""
+    return run_sync(fetch_youtube_videos(query, max_results))
+
+async def _fetch_engine_articles(url_template, engine_name, query, max_results):
+    """Run one article search engine; returns an empty list on any failure."""
+    try:
+        # Construct the search URL
+        search_query = query.replace(' ', '+')
+        url = url_template.format(query=search_query)
+        
+        response = await fetch_text(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, use_cache=True,
+                                    cacheable=lambda html: bool(_parse_engine_results(engine_name, html, query, 1)))
+        if response.status == 202:
+            logger.warning(f"{engine_name} returned 202 (rate limited), trying next engine")
+            return []
+        elif response.status != 200:
+            logger.warning(f"Failed to fetch {engine_name} results: {response.status}")
+            return []
+        
+        return _parse_engine_results(engine_name, response.text, query, max_results)
+            
+    except asyncio.TimeoutError:
+        logger.warning(f"{engine_name} search timed out for query: {query}")
+        return []
+    except (CircuitOpenError, RateLimitExceeded) as e:
+        logger.debug(f"Skipping {engine_name} search for {query}: {e}")
+        return []
+    except Exception as e:
+        logger.error(f"Error with {engine_name} search: {str(e)}")
+        return []
+
+async def fetch_articles(query, max_results=3):
     """
-    Search for articles related to the query with improved rate limiting handling.
+    Search for articles related to the query across several search engines.
+    
+    Engines are tried in order of preference and the first one that returns
+    results wins, so a healthy engine costs a single request.
     
     Args:
         query (str): Search query
@@ -211,62 +279,33 @@ def get_articles(query, max_results=3):
     Returns:
         list: List of dictionaries containing article title, URL, and description
     """
-    try:
-        # Multiple search strategies to avoid rate limiting
-        search_strategies = [
-            ("https://html.duckduckgo.com/html/?q={query}+tutorial", "DuckDuckGo"),
-            ("https://www.bing.com/search?q={query}+tutorial", "Bing"),
-            ("https://startpage.com/sp/search?q={query}+tutorial", "Startpage")
-        ]
-        
-        for url_template, engine_name in search_strategies:
-            try:
-                # Construct the search URL
-                search_query = query.replace(' ', '+')
-                url = url_template.format(query=search_query)
-                
-                # Add random delay to avoid rate limiting
-                time.sleep(random.uniform(0.5, 1.5))
-                
-                # Send request with timeout
-                response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-                if response.status_code == 202:
-                    logger.warning(f"{engine_name} returned 202 (rate limited), trying next engine")
-                    continue
-                elif response.status_code != 200:
-                    logger.warning(f"Failed to fetch {engine_name} results: {response.status_code}")
-                    continue
-                
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(response.text, 'html.parser')
-                articles = []
-                
-                # Engine-specific parsing
-                if engine_name == "DuckDuckGo":
-                    articles = _parse_duckduckgo_results(soup, query, max_results)
-                elif engine_name == "Bing":
-                    articles = _parse_bing_results(soup, query, max_results)
-                elif engine_name == "Startpage":
-                    articles = _parse_startpage_results(soup, query, max_results)
-                
-                if articles:
-                    logger.info(f"Successfully got {len(articles)} articles from {engine_name}")
-                    return articles
-                    
-            except requests.exceptions.Timeout:
-                logger.warning(f"{engine_name} search timed out for query: {query}")
-                continue
-            except Exception as e:
-                logger.error(f"Error with {engine_name} search: {str(e)}")
-                continue
-        
-        # If all engines fail, return empty list
-        logger.warning(f"All search engines failed for query: {query}")
-        return []
-        
-    except Exception as e:
-        logger.error(f"Error in get_articles: {str(e)}")
-        return []
+    for url_template, engine_name in ARTICLE_SEARCH_ENGINES:
+        articles = await _fetch_engine_articles(url_template, engine_name, query, max_results)
+        if articles:
+            logger.info(f"Successfully got {len(articles)} articles from {engine_name}")
+            return articles
+    
+    # If all engines fail, return empty list
+    logger.warning(f"All search engines failed for query: {query}")
+    return []
+
+def get_articles(query, max_results=3):
+    """Synchronous wrapper around fetch_articles."""
+    return run_sync(fetch_articles(query, max_results))
+
+def _parse_engine_results(engine_name, html, query, max_results):
+    """Extract articles from one article search engine's results page."""
+    # Parse with BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Engine-specific parsing
+    if engine_name == "DuckDuckGo":
+        return _parse_duckduckgo_results(soup, query, max_results)
+    elif engine_name == "Bing":
+        return _parse_bing_results(soup, query, max_results)
+    elif engine_name == "Startpage":
+        return _parse_startpage_results(soup, query, max_results)
+    return []
 
 def _parse_duckduckgo_results(soup, query, max_results):
     """Parse DuckDuckGo search results."""
@@ -283,7 +322,7 @@ def _parse_duckduckgo_results(soup, query, max_results):
             # Extract the actual URL from DuckDuckGo redirect URL
             actual_url = href
             if 'uddg=' in href:
-                actual_url = requests.utils.unquote(href.split('uddg=')[1].split('&')[0])
+                actual_url = unquote(href.split('uddg=')[1].split('&')[0])
             title = title_element.get_text().strip()
             description = snippet_element.get_text().strip() if snippet_element else f"Article about {query}"
             
@@ -375,7 +414,45 @@ def _parse_startpage_results(soup, query, max_results):
     
     return articles
 
-def get_github_repos(query, max_results=3):
+def _parse_github_results(html, query, max_results):
+    """Extract repositories from a GitHub search results page."""
+    # Parse with BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Extract repository information
+    repos = []
+    
+    # Find all repository elements
+    repo_elements = soup.select('.repo-list-item')
+    
+    for element in repo_elements:
+        title_element = element.select_one('.f4')
+        description_element = element.select_one('.mb-1')
+        
+        if title_element and title_element.find('a'):
+            href = title_element.find('a')['href']
+            url = f"https://github.com{href}"
+            title = title_element.get_text().strip()
+            description = description_element.get_text().strip() if description_element else f"GitHub repository about {query}"
+            
+            # Calculate quality score
+            quality_score = calculate_resource_quality(
+                title, description, url, domain_bonus=True
+            )
+            
+            repos.append({
+                'title': title,
+                'url': url,
+                'description': description,
+                'resource_type': 'github',
+                'quality_score': quality_score
+            })
+            
+            if len(repos) >= max_results:
+                break
+    return repos[:max_results]
+
+async def fetch_github_repos(query, max_results=3):
     """
     Search GitHub for repositories related to the query.
     
@@ -390,68 +467,87 @@ def get_github_repos(query, max_results=3):
         # Construct the search URL
         search_query = query.replace(' ', '+')
         url = f"https://github.com/search?q={search_query}&type=repositories"
-          # Send request with timeout
-        response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        if response.status_code != 200:
-            logger.warning(f"Failed to fetch GitHub results: {response.status_code}")
+        response = await fetch_text(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, use_cache=True,
+                                    cacheable=lambda html: bool(_parse_github_results(html, query, 1)))
+        if response.status != 200:
+            logger.warning(f"Failed to fetch GitHub results: {response.status}")
             return []
         
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Extract repository information
-        repos = []
-        
-        # Find all repository elements
-        repo_elements = soup.select('.repo-list-item')
+        return _parse_github_results(response.text, query, max_results)
         
-        for element in repo_elements:
-            title_element = element.select_one('.f4')
-            description_element = element.select_one('.mb-1')
-            
-            if title_element and title_element.find('a'):
-                href = title_element.find('a')['href']
-                url = f"https://github.com{href}"
-                title = title_element.get_text().strip()
-                description = description_element.get_text().strip() if description_element else f"GitHub repository about {query}"
-                
-                # Calculate quality score
-                quality_score = calculate_resource_quality(
-                    title, description, url, domain_bonus=True
-                )
-                
-                repos.append({
-                    'title': title,
-                    'url': url,
-                    'description': description,
-                    'resource_type': 'github',
-                    'quality_score': quality_score
-                })
-                
-                if len(repos) >= max_results:
-                    break
-        return repos[:max_results]
-        
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         logger.warning(f"GitHub search timed out for query: {query}")
         return []
+    except (CircuitOpenError, RateLimitExceeded) as e:
+        logger.debug(f"Skipping GitHub search for {query}: {e}")
+        return []
     except Exception as e:
         logger.error(f"Error fetching GitHub repos: {str(e)}")
         return []
 
-def get_resources_for_skill(skill_name, resource_types=None, max_per_type=4):
+def get_github_repos(query, max_results=3):
+    """Synchronous wrapper around fetch_github_repos."""
+    return run_sync(fetch_github_repos(query, max_results))
+
+async def _search_resource_type(resource_type, search_term, limit):
+    """Run the scraper that serves ``resource_type`` and label its results."""
+    if resource_type == 'video':
+        return await fetch_youtube_videos(search_term, limit)
+    elif resource_type == 'article':
+        return await fetch_articles(search_term, limit)
+    elif resource_type == 'github':
+        return await fetch_github_repos(search_term, limit)
+    elif resource_type == 'documentation':
+        # Search for documentation specifically
+        doc_search = f"{search_term} documentation official"
+        results = await fetch_articles(doc_search, limit)
+        # Mark as documentation type
+        for r in results:
+            if 'docs.' in r['url'] or '/doc' in r['url'] or 'documentation' in r['title'].lower():
+                r['resource_type'] = 'documentation'
+                r['quality_score'] = r.get('quality_score', 70) + 10  # Bonus for docs
+        return results
+    elif resource_type == 'tutorial':
+        # Search for tutorials specifically  
+        tutorial_search = f"{search_term} step by step complete"
+        results = await fetch_articles(tutorial_search, limit)
+        # Mark as tutorial type
+        for r in results:
+            if 'tutorial' in r['title'].lower() or 'step' in r['title'].lower():
+                r['resource_type'] = 'tutorial'
+                r['quality_score'] = r.get('quality_score', 70) + 5  # Bonus for tutorials
+        return results
+    elif resource_type == 'course':
+        # Search for courses specifically
+        course_search = f"{search_term} course complete training"
+        results = await fetch_articles(course_search, limit)
+        # Mark as course type
+        for r in results:
+            if any(word in r['title'].lower() for word in ['course', 'training', 'bootcamp', 'certification']):
+                r['resource_type'] = 'course'
+                r['quality_score'] = r.get('quality_score', 70) + 8  # Bonus for courses
+        return results
+    return []
+
+async def fetch_resources_for_skill(skill_name, resource_types=None, max_per_type=4, deadline=SEARCH_DEADLINE):
     """
     Get high-quality resources for a skill, prioritizing subskill-specific content and quality scores.
     Now focuses on QUALITY over speed - fetches more resources per subskill.
     
+    Resource types are searched concurrently; whatever has not finished
+    when ``deadline`` expires is cancelled, keeping the results found so far.
+    
     Args:
         skill_name (str): Name of the skill
         resource_types (list): List of resource types to search for (default: all types)
         max_per_type (int): Maximum number of resources per type (increased default for quality)
+        deadline (float): Seconds allowed for all scraping done for this skill
         
     Returns:
         list: List of high-quality resource dictionaries, sorted by quality score
     """
+    started = time.monotonic()
+    
     # Check cache first
     cache_key = f"{skill_name}_{max_per_type}"
     cached_result = get_cached_resources(cache_key)
@@ -558,7 +654,9 @@ def get_resources_for_skill(skill_name, resource_types=None, max_per_type=4):
     
     # Apply enhanced uniqueness and quality filtering
     if all_resources:
-        all_resources = ensure_resource_uniqueness_and_quality(all_resources, skill_name, target_total)
+        all_resources = await asyncio.to_thread(
+            ensure_resource_uniqueness_and_quality, all_resources, skill_name, target_total
+        )
     
     # Special handling for main DSA skills - only add Striver's DSA Sheet for main DSA searches, not subskills
     dsa_main_terms = ['data structure and algorithm', 'data structures and algorithms', 'dsa', 'algorithms and data structures']
@@ -635,74 +733,55 @@ def get_resources_for_skill(skill_name, resource_types=None, max_per_type=4):
         # Order resource types by priority (least represented first)
         type_priority = sorted(resource_types, key=lambda t: current_type_counts.get(t, 0))
         
-        # Search for each resource type with focus on diversity and quality
-        for resource_type in type_priority:
-            current_count = current_type_counts.get(resource_type, 0)
-            if current_count >= max_per_type * 2:  # Allow more resources for quality filtering
-                continue
-                
-            type_resources = []
-            needed = (max_per_type * 2) - current_count  # Fetch extra for quality filtering
-            
-            # Try multiple search terms for comprehensive coverage
+        # Resource types are searched concurrently; within a type, search terms run
+        # one after another and stop once the type's quota is met
+        known_urls = {r['url'] for r in all_resources}
+        type_results = {}
+        
+        async def search_type(resource_type, needed):
+            results = type_results[resource_type]
+            seen_urls = set(known_urls)
             for search_term in search_terms[:4]:  # Use more search terms for quality
-                if len(type_resources) >= needed:
+                if len(results) >= needed:
                     break
-                    
                 try:
-                    if resource_type == 'video':
-                        results = get_youtube_videos(search_term, max(3, needed//2))
-                    elif resource_type == 'article':
-                        results = get_articles(search_term, max(3, needed//2))
-                    elif resource_type == 'github':
-                        results = get_github_repos(search_term, max(3, needed//2))
-                    elif resource_type == 'documentation':
-                        # Search for documentation specifically
-                        doc_search = f"{search_term} documentation official"
-                        results = get_articles(doc_search, max(3, needed//2))
-                        # Mark as documentation type
-                        for r in results:
-                            if 'docs.' in r['url'] or '/doc' in r['url'] or 'documentation' in r['title'].lower():
-                                r['resource_type'] = 'documentation'
-                                r['quality_score'] = r.get('quality_score', 70) + 10  # Bonus for docs
-                    elif resource_type == 'tutorial':
-                        # Search for tutorials specifically  
-                        tutorial_search = f"{search_term} step by step complete"
-                        results = get_articles(tutorial_search, max(3, needed//2))
-                        # Mark as tutorial type
-                        for r in results:
-                            if 'tutorial' in r['title'].lower() or 'step' in r['title'].lower():
-                                r['resource_type'] = 'tutorial'
-                                r['quality_score'] = r.get('quality_score', 70) + 5  # Bonus for tutorials
-                    elif resource_type == 'course':
-                        # Search for courses specifically
-                        course_search = f"{search_term} course complete training"
-                        results = get_articles(course_search, max(3, needed//2))
-                        # Mark as course type
-                        for r in results:
-                            if any(word in r['title'].lower() for word in ['course', 'training', 'bootcamp', 'certification']):
-                                r['resource_type'] = 'course'
-                                r['quality_score'] = r.get('quality_score', 70) + 8  # Bonus for courses
-                    else:
-                        continue
-                    
-                    # Filter out duplicates and add to type_resources
-                    existing_urls = {r['url'] for r in all_resources + type_resources}
-                    for result in results:
-                        if result['url'] not in existing_urls and len(type_resources) < needed:
-                            type_resources.append(result)
-                            existing_urls.add(result['url'])
-                            
+                    found = await _search_resource_type(resource_type, search_term, max(3, needed//2))
                 except Exception as e:
                     logger.error(f"Error searching for {resource_type} resources: {e}")
                     continue
+                # Filter out duplicates; results are kept as they arrive, so a deadline keeps them
+                for result in found:
+                    if result['url'] not in seen_urls and len(results) < needed:
+                        results.append(result)
+                        seen_urls.add(result['url'])
+        
+        searches = []
+        for resource_type in type_priority:
+            current_count = current_type_counts.get(resource_type, 0)
+            if current_count >= max_per_type * 2:  # Allow more resources for quality filtering
+                continue
+            needed = (max_per_type * 2) - current_count  # Fetch extra for quality filtering
+            type_results[resource_type] = []
+            searches.append(asyncio.ensure_future(search_type(resource_type, needed)))
+        
+        if searches:
+            remaining = max(0.0, deadline - (time.monotonic() - started))
+            _, pending = await asyncio.wait(searches, timeout=remaining)
+            if pending:
+                logger.warning(f"Search deadline hit for {skill_name}, dropping {len(pending)} pending resource types")
+                for task in pending:
+                    task.cancel()
+        
+        # Merge in priority order so results match a sequential search
+        for resource_type in type_priority:
+            if resource_type not in type_results:
+                continue
+            existing_urls = {r['url'] for r in all_resources}
+            type_resources = [r for r in type_results[resource_type] if r['url'] not in existing_urls]
             
             # Sort type_resources by quality score and take the best ones
             type_resources.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
             all_resources.extend(type_resources[:max_per_type])
-            
-            # Add small delay only between different resource types, not queries
-            time.sleep(0.1)
     
     # Step 3: Sort all resources by quality score and return the best ones
     all_resources.sort(key=lambda x: x.get('quality_score', 0), reverse=True)
@@ -734,7 +813,10 @@ def get_resources_for_skill(skill_name, resource_types=None, max_per_type=4):
     if len(final_resources) < target_total // 2:
         logger.info(f"Using robust fetcher as fallback for {skill_name}")
         try:
-            robust_resources = get_robust_resources(skill_name, resource_types, max_per_type=3)
+            remaining = max(0.0, deadline - (time.monotonic() - started))
+            robust_resources = await asyncio.wait_for(
+                asyncio.to_thread(get_robust_resources, skill_name, resource_types, max_per_type=3), remaining
+            )
             if robust_resources:
                 final_resources.extend(robust_resources)
                 logger.info(f"Added {len(robust_resources)} resources from robust fetcher")
@@ -749,7 +831,9 @@ def get_resources_for_skill(skill_name, resource_types=None, max_per_type=4):
             final_resources.extend(fallback_resources)
     
     # Final step: Apply enhanced uniqueness and quality filtering to all resources
-    final_resources = ensure_resource_uniqueness_and_quality(all_resources, skill_name, target_total)
+    final_resources = await asyncio.to_thread(
+        ensure_resource_uniqueness_and_quality, all_resources, skill_name, target_total
+    )
     
     # Cache the results for future requests
     cache_resources(cache_key, final_resources)
@@ -757,6 +841,15 @@ def get_resources_for_skill(skill_name, resource_types=None, max_per_type=4):
     logger.info(f"Returning {len(final_resources)} unique, high-quality resources for {skill_name}")
     return final_resources
 
+def get_resources_for_skill(skill_name, resource_types=None, max_per_type=4):
+    """
+    Synchronous wrapper around fetch_resources_for_skill.
+    
+    Async code (FastAPI handlers) should await fetch_resources_for_skill instead,
+    so a slow scrape never blocks the event loop.
+    """
+    return run_sync(fetch_resources_for_skill(skill_name, resource_types, max_per_type))
+
 def get_default_resources(skill_name):
     """
     Get a list of default resources for a skill in case dynamic search fails.
@@ -4,14 +4,270 @@ This system ensures we always get comprehensive, high-quality resources for each
 """
 import requests
 from bs4 import BeautifulSoup
+import os
 import random
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib.parse import quote_plus
 import json
 
+from .resource_catalog import get_resource_catalog, normalize_url, SOURCE_BACKUP
+from .rate_limiter import RateLimitExceeded, host_rate_limiter
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+
 logger = logging.getLogger(__name__)
 
+# "hedged" races the search engines concurrently; "sequential" tries them one by one
+ROBUST_SEARCH_MODE = os.environ.get("ROBUST_SEARCH_MODE", "hedged").lower()
+# Seconds a hedged search may spend waiting on engines before returning what it has
+# (with backup resources to fall back on, it stops once every engine had its hedge delay)
+ROBUST_SEARCH_DEADLINE = float(os.environ.get("ROBUST_SEARCH_DEADLINE", "4"))
+# Seconds to wait on the current best engine before also launching the next one
+ROBUST_HEDGE_DELAY = float(os.environ.get("ROBUST_HEDGE_DELAY", "0.3"))
+
+# Engine calls run on a shared pool; when a hedged search hits its deadline, calls
+# that have not started are cancelled and running ones stop waiting on rate limits
+_search_executor = ThreadPoolExecutor(max_workers=12, thread_name_prefix="robust-search")
+
+def _initialize_backup_resources():
+    """Comprehensive backup resources for all subskills (loaded into the shared resource catalog)."""
+    return {
+        # Programming Fundamentals
+        "Arrays": [
+            {"title": "Complete Array Tutorial - GeeksforGeeks", "url": "https://www.geeksforgeeks.org/array-data-structure/", "type": "article", "score": 95},
+            {"title": "Array Problems Practice - LeetCode", "url": "https://leetcode.com/tag/array/", "type": "course", "score": 92},
+            {"title": "Array Algorithms Documentation", "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Array", "type": "documentation", "score": 94},
+            {"title": "Array Data Structures Video Course", "url": "https://www.youtube.com/watch?v=QJNwK2uJyGs", "type": "video", "score": 88},
+            {"title": "Python Array Implementations", "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/arrays", "type": "github", "score": 86},
+            {"title": "Interactive Array Tutorial", "url": "https://www.programiz.com/dsa/array", "type": "tutorial", "score": 85},
+            {"title": "Array Rotation Techniques", "url": "https://www.geeksforgeeks.org/array-rotation/", "type": "article", "score": 90},
+            {"title": "Advanced Array Patterns", "url": "https://leetcode.com/discuss/study-guide/1152328/Arrays-study-guide", "type": "course", "score": 89}
+        ],
+        "Linked Lists": [
+            {"title": "Linked List Comprehensive Guide", "url": "https://www.geeksforgeeks.org/data-structures/linked-list/", "type": "article", "score": 95},
+            {"title": "Linked List Problems - LeetCode", "url": "https://leetcode.com/tag/linked-list/", "type": "course", "score": 91},
+            {"title": "CS50 Linked Lists Documentation", "url": "https://cs50.harvard.edu/x/2023/notes/5/", "type": "documentation", "score": 93},
+            {"title": "Linked List Masterclass Video", "url": "https://www.youtube.com/watch?v=WwfhLC16bis", "type": "video", "score": 87},
+            {"title": "Linked List Implementations Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/linked_list", "type": "github", "score": 85},
+            {"title": "Interactive Linked List Visualization", "url": "https://www.cs.usfca.edu/~galles/visualization/LinkedList.html", "type": "tutorial", "score": 89},
+            {"title": "Reverse Linked List Patterns", "url": "https://www.geeksforgeeks.org/reverse-a-linked-list/", "type": "article", "score": 88},
+            {"title": "Advanced Linked List Course", "url": "https://leetcode.com/explore/learn/card/linked-list/", "type": "course", "score": 90}
+        ],
+        "Binary Trees": [
+            {"title": "Binary Tree Complete Tutorial", "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/", "type": "article", "score": 94},
+            {"title": "Tree Traversal Algorithms", "url": "https://www.geeksforgeeks.org/tree-traversals-inorder-preorder-and-postorder/", "type": "article", "score": 92},
+            {"title": "Binary Tree Problems - LeetCode", "url": "https://leetcode.com/tag/binary-tree/", "type": "course", "score": 90},
+            {"title": "Tree Data Structures Documentation", "url": "https://en.wikipedia.org/wiki/Binary_tree", "type": "documentation", "score": 88},
+            {"title": "Binary Tree Video Tutorial", "url": "https://www.youtube.com/watch?v=H5JubkIy_p8", "type": "video", "score": 86},
+            {"title": "Tree Algorithms Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/binary_tree", "type": "github", "score": 84},
+            {"title": "Interactive Tree Visualization", "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html", "type": "tutorial", "score": 87},
+            {"title": "Advanced Tree Patterns Course", "url": "https://leetcode.com/explore/learn/card/data-structure-tree/", "type": "course", "score": 89}
+        ],
+        "Dynamic Programming": [
+            {"title": "Dynamic Programming Masterclass", "url": "https://www.geeksforgeeks.org/dynamic-programming/", "type": "article", "score": 95},
+            {"title": "DP Pattern Recognition Guide", "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns", "type": "article", "score": 93},
+            {"title": "Dynamic Programming Problems", "url": "https://leetcode.com/tag/dynamic-programming/", "type": "course", "score": 91},
+            {"title": "DP Algorithms Documentation", "url": "https://en.wikipedia.org/wiki/Dynamic_programming", "type": "documentation", "score": 87},
+            {"title": "DP Tutorial Video Series", "url": "https://www.youtube.com/watch?v=oBt53YbR9Kk", "type": "video", "score": 89},
+            {"title": "DP Implementations Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/dynamic_programming", "type": "github", "score": 85},
+            {"title": "Interactive DP Tutorial", "url": "https://www.programiz.com/dsa/dynamic-programming", "type": "tutorial", "score": 86},
+            {"title": "Advanced DP Techniques Course", "url": "https://www.educative.io/courses/grokking-dynamic-programming-patterns-for-coding-interviews", "type": "course", "score": 92}
+        ],
+        "Sorting Algorithms": [
+            {"title": "Sorting Algorithms Complete Guide", "url": "https://www.geeksforgeeks.org/sorting-algorithms/", "type": "article", "score": 94},
+            {"title": "Sorting Algorithm Comparisons", "url": "https://www.geeksforgeeks.org/analysis-of-different-sorting-techniques/", "type": "article", "score": 91},
+            {"title": "Sorting Problems Practice", "url": "https://leetcode.com/tag/sorting/", "type": "course", "score": 88},
+            {"title": "Sorting Algorithms Documentation", "url": "https://en.wikipedia.org/wiki/Sorting_algorithm", "type": "documentation", "score": 86},
+            {"title": "Sorting Algorithms Video Tutorial", "url": "https://www.youtube.com/watch?v=kPRA0W1kECg", "type": "video", "score": 87},
+            {"title": "Sorting Implementations Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/sorts", "type": "github", "score": 84},
+            {"title": "Interactive Sorting Visualization", "url": "https://www.cs.usfca.edu/~galles/visualization/ComparisonSort.html", "type": "tutorial", "score": 89},
+            {"title": "Advanced Sorting Techniques", "url": "https://www.programiz.com/dsa/sorting-algorithm", "type": "tutorial", "score": 85}
+        ],
+        "Searching Algorithms": [
+            {"title": "Searching Algorithms Tutorial", "url": "https://www.geeksforgeeks.org/searching-algorithms/", "type": "article", "score": 93},
+            {"title": "Binary Search Masterclass", "url": "https://www.geeksforgeeks.org/binary-search/", "type": "article", "score": 92},
+            {"title": "Search Problems - LeetCode", "url": "https://leetcode.com/tag/binary-search/", "type": "course", "score": 89},
+            {"title": "Search Algorithms Documentation", "url": "https://en.wikipedia.org/wiki/Search_algorithm", "type": "documentation", "score": 85},
+            {"title": "Search Algorithms Video Course", "url": "https://www.youtube.com/watch?v=MFhxShGxHWc", "type": "video", "score": 86},
+            {"title": "Search Implementations Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/searches", "type": "github", "score": 83},
+            {"title": "Interactive Search Tutorial", "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html", "type": "tutorial", "score": 87},
+            {"title": "Advanced Search Patterns", "url": "https://leetcode.com/discuss/study-guide/786126/Python-Powerful-Ultimate-Binary-Search-Template", "type": "course", "score": 90}
+        ],
+        
+        # Web Development
+        "HTML Fundamentals": [
+            {"title": "HTML Complete Reference - MDN", "url": "https://developer.mozilla.org/en-US/docs/Web/HTML", "type": "documentation", "score": 98},
+            {"title": "HTML Tutorial - W3Schools", "url": "https://www.w3schools.com/html/", "type": "tutorial", "score": 90},
+            {"title": "HTML Crash Course Video", "url": "https://www.youtube.com/watch?v=UB1O30fR-EE", "type": "video", "score": 87},
+            {"title": "HTML5 Semantic Elements Guide", "url": "https://www.w3schools.com/html/html5_semantic_elements.asp", "type": "article", "score": 89},
+            {"title": "HTML Forms Complete Guide", "url": "https://developer.mozilla.org/en-US/docs/Learn/Forms", "type": "documentation", "score": 92},
+            {"title": "Interactive HTML Course", "url": "https://www.freecodecamp.org/learn/responsive-web-design/", "type": "course", "score": 94},
+            {"title": "HTML Best Practices", "url": "https://github.com/hail2u/html-best-practices", "type": "github", "score": 85},
+            {"title": "Accessibility in HTML", "url": "https://webaim.org/intro/", "type": "article", "score": 88}
+        ],
+        "CSS Fundamentals": [
+            {"title": "CSS Complete Reference - MDN", "url": "https://developer.mozilla.org/en-US/docs/Web/CSS", "type": "documentation", "score": 98},
+            {"title": "CSS Tutorial - W3Schools", "url": "https://www.w3schools.com/css/", "type": "tutorial", "score": 90},
+            {"title": "CSS Flexbox Complete Guide", "url": "https://css-tricks.com/snippets/css/a-guide-to-flexbox/", "type": "article", "score": 95},
+            {"title": "CSS Grid Layout Tutorial", "url": "https://css-tricks.com/snippets/css/complete-guide-grid/", "type": "article", "score": 94},
+            {"title": "CSS Video Course", "url": "https://www.youtube.com/watch?v=1Rs2ND1ryYc", "type": "video", "score": 88},
+            {"title": "CSS Animations Tutorial", "url": "https://developer.mozilla.org/en-US/docs/Web/CSS/CSS_Animations", "type": "documentation", "score": 91},
+            {"title": "CSS Games for Learning", "url": "https://github.com/AllThingsSmitty/css-protips", "type": "github", "score": 86},
+            {"title": "Interactive CSS Course", "url": "https://www.freecodecamp.org/learn/responsive-web-design/", "type": "course", "score": 92}
+        ],
+        "JavaScript Fundamentals": [
+            {"title": "JavaScript Complete Guide - MDN", "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript", "type": "documentation", "score": 98},
+            {"title": "JavaScript.info - Modern Tutorial", "url": "https://javascript.info/", "type": "tutorial", "score": 96},
+            {"title": "JavaScript Crash Course Video", "url": "https://www.youtube.com/watch?v=hdI2bqOjy3c", "type": "video", "score": 89},
+            {"title": "JavaScript ES6+ Features", "url": "https://github.com/lukehoban/es6features", "type": "github", "score": 87},
+            {"title": "You Don't Know JS Book Series", "url": "https://github.com/getify/You-Dont-Know-JS", "type": "github", "score": 94},
+            {"title": "JavaScript Algorithms Practice", "url": "https://github.com/trekhleb/javascript-algorithms", "type": "github", "score": 91},
+            {"title": "Interactive JavaScript Course", "url": "https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/", "type": "course", "score": 93},
+            {"title": "JavaScript Design Patterns", "url": "https://addyosmani.com/resources/essentialjsdesignpatterns/book/", "type": "article", "score": 88}
+        ],
+        "React Fundamentals": [
+            {"title": "React Official Documentation", "url": "https://react.dev/", "type": "documentation", "score": 98},
+            {"title": "React Tutorial - Official", "url": "https://react.dev/learn", "type": "tutorial", "score": 95},
+            {"title": "React Crash Course Video", "url": "https://www.youtube.com/watch?v=w7ejDZ8SWv8", "type": "video", "score": 89},
+            {"title": "React Hooks Complete Guide", "url": "https://react.dev/reference/react", "type": "documentation", "score": 93},
+            {"title": "React Patterns and Best Practices", "url": "https://github.com/vasanthk/react-bits", "type": "github", "score": 87},
+            {"title": "React Router Tutorial", "url": "https://reactrouter.com/en/main/start/tutorial", "type": "tutorial", "score": 90},
+            {"title": "Interactive React Course", "url": "https://scrimba.com/learn/learnreact", "type": "course", "score": 91},
+            {"title": "React Testing Best Practices", "url": "https://kentcdodds.com/blog/common-mistakes-with-react-testing-library", "type": "article", "score": 86}
+        ],
+        "Node.js Backend": [
+            {"title": "Node.js Official Documentation", "url": "https://nodejs.org/en/docs/", "type": "documentation", "score": 97},
+            {"title": "Node.js Tutorial - W3Schools", "url": "https://www.w3schools.com/nodejs/", "type": "tutorial", "score": 88},
+            {"title": "Node.js Crash Course Video", "url": "https://www.youtube.com/watch?v=fBNz5xF-Kx4", "type": "video", "score": 87},
+            {"title": "Express.js Official Guide", "url": "https://expressjs.com/en/guide/routing.html", "type": "documentation", "score": 94},
+            {"title": "Node.js Best Practices", "url": "https://github.com/goldbergyoni/nodebestpractices", "type": "github", "score": 92},
+            {"title": "RESTful API with Node.js", "url": "https://restfulapi.net/", "type": "article", "score": 89},
+            {"title": "Node.js Authentication Tutorial", "url": "https://www.digitalocean.com/community/tutorials/api-authentication-with-json-web-tokens-jwt-and-passport", "type": "tutorial", "score": 85},
+            {"title": "Node.js Performance Best Practices", "url": "https://nodejs.org/en/docs/guides/simple-profiling/", "type": "documentation", "score": 90}
+        ],
+        
+        # Machine Learning
+        "Linear Algebra for ML": [
+            {"title": "Linear Algebra for Machine Learning", "url": "https://machinelearningmastery.com/linear-algebra-machine-learning/", "type": "article", "score": 93},
+            {"title": "Khan Academy Linear Algebra", "url": "https://www.khanacademy.org/math/linear-algebra", "type": "course", "score": 95},
+            {"title": "3Blue1Brown Linear Algebra Series", "url": "https://www.youtube.com/playlist?list=PLZHQObOWTQDPD3MizzM2xVFitgF8hE_ab", "type": "video", "score": 97},
+            {"title": "NumPy Linear Algebra Documentation", "url": "https://numpy.org/doc/stable/reference/routines.linalg.html", "type": "documentation", "score": 89},
+            {"title": "Linear Algebra Implementations", "url": "https://github.com/fastai/numerical-linear-algebra", "type": "github", "score": 87},
+            {"title": "Interactive Linear Algebra", "url": "http://immersivemath.com/ila/index.html", "type": "tutorial", "score": 91},
+            {"title": "MIT Linear Algebra Course", "url": "https://ocw.mit.edu/courses/18-06-linear-algebra-spring-2010/", "type": "course", "score": 96},
+            {"title": "Linear Algebra Cheat Sheet", "url": "https://towardsdatascience.com/linear-algebra-cheat-sheet-for-deep-learning-cd67aba4526c", "type": "article", "score": 84}
+        ],
+        "Statistics for ML": [
+            {"title": "Statistics for Machine Learning", "url": "https://machinelearningmastery.com/statistics_for_machine_learning/", "type": "article", "score": 92},
+            {"title": "Khan Academy Statistics", "url": "https://www.khanacademy.org/math/statistics-probability", "type": "course", "score": 94},
+            {"title": "StatQuest Video Series", "url": "https://www.youtube.com/user/joshstarmer", "type": "video", "score": 96},
+            {"title": "SciPy Statistics Documentation", "url": "https://docs.scipy.org/doc/scipy/reference/stats.html", "type": "documentation", "score": 88},
+            {"title": "Statistics with Python", "url": "https://github.com/rouseguy/intro2stats", "type": "github", "score": 85},
+            {"title": "Interactive Statistics Course", "url": "https://seeing-theory.brown.edu/", "type": "tutorial", "score": 93},
+            {"title": "MIT Statistics Course", "url": "https://ocw.mit.edu/courses/18-05-introduction-to-probability-and-statistics-spring-2014/", "type": "course", "score": 95},
+            {"title": "Bayesian Statistics Tutorial", "url": "https://towardsdatascience.com/a-gentle-introduction-to-bayesian-deep-learning-d298c7243fd6", "type": "article", "score": 87}
+        ],
+        "Supervised Learning": [
+            {"title": "Supervised Learning Complete Guide", "url": "https://machinelearningmastery.com/supervised-and-unsupervised-machine-learning-algorithms/", "type": "article", "score": 91},
+            {"title": "Scikit-learn User Guide", "url": "https://scikit-learn.org/stable/user_guide.html", "type": "documentation", "score": 96},
+            {"title": "Machine Learning Course - Andrew Ng", "url": "https://www.coursera.org/learn/machine-learning", "type": "course", "score": 98},
+            {"title": "ML Algorithms Video Explanations", "url": "https://www.youtube.com/playlist?list=PLblh5JKOoLUICTaGLRoHQDuF_7q2GfuJF", "type": "video", "score": 89},
+            {"title": "ML Algorithms from Scratch", "url": "https://github.com/eriklindernoren/ML-From-Scratch", "type": "github", "score": 87},
+            {"title": "Interactive ML Course", "url": "https://www.kaggle.com/learn/intro-to-machine-learning", "type": "course", "score": 92},
+            {"title": "Hands-On Machine Learning Book", "url": "https://github.com/ageron/handson-ml2", "type": "github", "score": 94},
+            {"title": "ML Model Evaluation Tutorial", "url": "https://machinelearningmastery.com/metrics-evaluate-machine-learning-algorithms-python/", "type": "tutorial", "score": 86}
+        ],
+        "Deep Learning": [
+            {"title": "Deep Learning Specialization", "url": "https://www.coursera.org/specializations/deep-learning", "type": "course", "score": 98},
+            {"title": "Deep Learning Book - Ian Goodfellow", "url": "https://www.deeplearningbook.org/", "type": "documentation", "score": 97},
+            {"title": "TensorFlow Official Tutorials", "url": "https://www.tensorflow.org/tutorials", "type": "tutorial", "score": 95},
+            {"title": "PyTorch Tutorials", "url": "https://pytorch.org/tutorials/", "type": "tutorial", "score": 94},
+            {"title": "3Blue1Brown Neural Networks", "url": "https://www.youtube.com/playlist?list=PLZHQObOWTQDNU6R1_67000Dx_ZCJB-3pi", "type": "video", "score": 96},
+            {"title": "Deep Learning Papers Repository", "url": "https://github.com/floodsung/Deep-Learning-Papers-Reading-Roadmap", "type": "github", "score": 89},
+            {"title": "Fast.ai Deep Learning Course", "url": "https://course.fast.ai/", "type": "course", "score": 93},
+            {"title": "Deep Learning Fundamentals", "url": "https://towardsdatascience.com/deep-learning-fundamentals-handbook-theoretical-and-practical-aspects-a35b7d1b5c5e", "type": "article", "score": 87}
+        ],
+        
+        # Python
+        "Python Basics": [
+            {"title": "Python Official Tutorial", "url": "https://docs.python.org/3/tutorial/", "type": "documentation", "score": 97},
+            {"title": "Python for Beginners - Microsoft", "url": "https://docs.microsoft.com/en-us/learn/paths/beginner-python/", "type": "course", "score": 93},
+            {"title": "Python Crash Course Video", "url": "https://www.youtube.com/watch?v=rfscVS0vtbw", "type": "video", "score": 89},
+            {"title": "Real Python Tutorials", "url": "https://realpython.com/", "type": "tutorial", "score": 95},
+            {"title": "Python Tricks Book Repository", "url": "https://github.com/realpython/python-tricks-the-book", "type": "github", "score": 88},
+            {"title": "Interactive Python Course", "url": "https://www.codecademy.com/learn/learn-python-3", "type": "course", "score": 91},
+            {"title": "Python Style Guide (PEP 8)", "url": "https://pep8.org/", "type": "documentation", "score": 86},
+            {"title": "Automate the Boring Stuff", "url": "https://automatetheboringstuff.com/", "type": "tutorial", "score": 92}
+        ],
+        "Object-Oriented Programming": [
+            {"title": "Python OOP Complete Guide", "url": "https://realpython.com/python3-object-oriented-programming/", "type": "article", "score": 94},
+            {"title": "OOP Concepts Tutorial", "url": "https://www.programiz.com/python-programming/object-oriented-programming", "type": "tutorial", "score": 89},
+            {"title": "Python OOP Video Course", "url": "https://www.youtube.com/watch?v=ZDa-Z5JzLYM", "type": "video", "score": 87},
+            {"title": "Python Classes Documentation", "url": "https://docs.python.org/3/tutorial/classes.html", "type": "documentation", "score": 95},
+            {"title": "OOP Design Patterns in Python", "url": "https://github.com/faif/python-patterns", "type": "github", "score": 91},
+            {"title": "Interactive OOP Course", "url": "https://www.codecademy.com/learn/learn-python-3", "type": "course", "score": 88},
+            {"title": "SOLID Principles in Python", "url": "https://realpython.com/solid-principles-python/", "type": "article", "score": 92},
+            {"title": "Python OOP Best Practices", "url": "https://realpython.com/inheritance-composition-python/", "type": "tutorial", "score": 86}
+        ],
+        "Python Libraries": [
+            {"title": "NumPy Documentation", "url": "https://numpy.org/doc/stable/", "type": "documentation", "score": 96},
+            {"title": "Pandas User Guide", "url": "https://pandas.pydata.org/docs/user_guide/", "type": "documentation", "score": 95},
+            {"title": "Matplotlib Tutorials", "url": "https://matplotlib.org/stable/tutorials/index.html", "type": "tutorial", "score": 93},
+            {"title": "Python Data Science Handbook", "url": "https://jakevdp.github.io/PythonDataScienceHandbook/", "type": "tutorial", "score": 97},
+            {"title": "Scientific Python Video Course", "url": "https://www.youtube.com/playlist?list=PLQVvvaa0QuDfefDfXb9Yf0la1fPDKluPF", "type": "video", "score": 88},
+            {"title": "Awesome Python Libraries", "url": "https://github.com/vinta/awesome-python", "type": "github", "score": 90},
+            {"title": "Data Analysis with Python", "url": "https://www.freecodecamp.org/learn/data-analysis-with-python/", "type": "course", "score": 92},
+            {"title": "Seaborn Statistical Visualization", "url": "https://seaborn.pydata.org/tutorial.html", "type": "tutorial", "score": 89}
+        ]
+    }
+
+class EngineStats:
+    """Running win rate and latency for one search engine."""
+    
+    # Weight of the newest sample in the latency moving average
+    LATENCY_ALPHA = 0.3
+    
+    def __init__(self):
+        self.calls = 0
+        self.successes = 0
+        self.wins = 0
+        self.latency_ewma = None
+        self._lock = threading.Lock()
+    
+    def record(self, latency, success):
+        with self._lock:
+            self.calls += 1
+            if success:
+                self.successes += 1
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma += self.LATENCY_ALPHA * (latency - self.latency_ewma)
+    
+    def record_win(self):
+        with self._lock:
+            self.wins += 1
+    
+    def score(self):
+        """Smoothed win rate discounted by latency; untried engines keep their static order."""
+        with self._lock:
+            win_rate = (self.wins + 1) / (self.calls + 2)
+            latency = self.latency_ewma if self.latency_ewma is not None else 1.0
+            return win_rate / (1.0 + latency)
+    
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "successes": self.successes,
+                "wins": self.wins,
+                "win_rate": round(self.wins / self.calls, 3) if self.calls else 0.0,
+                "success_rate": round(self.successes / self.calls, 3) if self.calls else 0.0,
+                "avg_latency_ms": round(self.latency_ewma * 1000, 1) if self.latency_ewma is not None else None,
+            }
+
 class RobustResourceFetcher:
     def __init__(self):
         self.session = requests.Session()
@@ -25,218 +281,57 @@ class RobustResourceFetcher:
             'Upgrade-Insecure-Requests': '1',
         })
         
-        # Rate limiting
-        self.last_request_time = {}
-        self.min_delay = 1.5  # Minimum delay between requests to same service
-        
-        # Backup resource databases for when APIs fail
-        self.backup_resources = self._initialize_backup_resources()
+        # Per-host token buckets (shared with every other scraper)
+        self.rate_limiter = host_rate_limiter
         
-    def _initialize_backup_resources(self):
-        """Initialize comprehensive backup resources for all subskills."""
-        return {
-            # Programming Fundamentals
-            "Arrays": [
-                {"title": "Complete Array Tutorial - GeeksforGeeks", "url": "https://www.geeksforgeeks.org/array-data-structure/", "type": "article", "score": 95},
-                {"title": "Array Problems Practice - LeetCode", "url": "https://leetcode.com/tag/array/", "type": "course", "score": 92},
-                {"title": "Array Algorithms Documentation", "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Array", "type": "documentation", "score": 94},
-                {"title": "Array Data Structures Video Course", "url": "https://www.youtube.com/watch?v=QJNwK2uJyGs", "type": "video", "score": 88},
-                {"title": "Python Array Implementations", "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/arrays", "type": "github", "score": 86},
-                {"title": "Interactive Array Tutorial", "url": "https://www.programiz.com/dsa/array", "type": "tutorial", "score": 85},
-                {"title": "Array Rotation Techniques", "url": "https://www.geeksforgeeks.org/array-rotation/", "type": "article", "score": 90},
-                {"title": "Advanced Array Patterns", "url": "https://leetcode.com/discuss/study-guide/1152328/Arrays-study-guide", "type": "course", "score": 89}
-            ],
-            "Linked Lists": [
-                {"title": "Linked List Comprehensive Guide", "url": "https://www.geeksforgeeks.org/data-structures/linked-list/", "type": "article", "score": 95},
-                {"title": "Linked List Problems - LeetCode", "url": "https://leetcode.com/tag/linked-list/", "type": "course", "score": 91},
-                {"title": "CS50 Linked Lists Documentation", "url": "https://cs50.harvard.edu/x/2023/notes/5/", "type": "documentation", "score": 93},
-                {"title": "Linked List Masterclass Video", "url": "https://www.youtube.com/watch?v=WwfhLC16bis", "type": "video", "score": 87},
-                {"title": "Linked List Implementations Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/linked_list", "type": "github", "score": 85},
-                {"title": "Interactive Linked List Visualization", "url": "https://www.cs.usfca.edu/~galles/visualization/LinkedList.html", "type": "tutorial", "score": 89},
-                {"title": "Reverse Linked List Patterns", "url": "https://www.geeksforgeeks.org/reverse-a-linked-list/", "type": "article", "score": 88},
-                {"title": "Advanced Linked List Course", "url": "https://leetcode.com/explore/learn/card/linked-list/", "type": "course", "score": 90}
-            ],
-            "Binary Trees": [
-                {"title": "Binary Tree Complete Tutorial", "url": "https://www.geeksforgeeks.org/binary-tree-data-structure/", "type": "article", "score": 94},
-                {"title": "Tree Traversal Algorithms", "url": "https://www.geeksforgeeks.org/tree-traversals-inorder-preorder-and-postorder/", "type": "article", "score": 92},
-                {"title": "Binary Tree Problems - LeetCode", "url": "https://leetcode.com/tag/binary-tree/", "type": "course", "score": 90},
-                {"title": "Tree Data Structures Documentation", "url": "https://en.wikipedia.org/wiki/Binary_tree", "type": "documentation", "score": 88},
-                {"title": "Binary Tree Video Tutorial", "url": "https://www.youtube.com/watch?v=H5JubkIy_p8", "type": "video", "score": 86},
-                {"title": "Tree Algorithms Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/data_structures/binary_tree", "type": "github", "score": 84},
-                {"title": "Interactive Tree Visualization", "url": "https://www.cs.usfca.edu/~galles/visualization/BST.html", "type": "tutorial", "score": 87},
-                {"title": "Advanced Tree Patterns Course", "url": "https://leetcode.com/explore/learn/card/data-structure-tree/", "type": "course", "score": 89}
-            ],
-            "Dynamic Programming": [
-                {"title": "Dynamic Programming Masterclass", "url": "https://www.geeksforgeeks.org/dynamic-programming/", "type": "article", "score": 95},
-                {"title": "DP Pattern Recognition Guide", "url": "https://leetcode.com/discuss/general-discussion/458695/dynamic-programming-patterns", "type": "article", "score": 93},
-                {"title": "Dynamic Programming Problems", "url": "https://leetcode.com/tag/dynamic-programming/", "type": "course", "score": 91},
-                {"title": "DP Algorithms Documentation", "url": "https://en.wikipedia.org/wiki/Dynamic_programming", "type": "documentation", "score": 87},
-                {"title": "DP Tutorial Video Series", "url": "https://www.youtube.com/watch?v=oBt53YbR9Kk", "type": "video", "score": 89},
-                {"title": "DP Implementations Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/dynamic_programming", "type": "github", "score": 85},
-                {"title": "Interactive DP Tutorial", "url": "https://www.programiz.com/dsa/dynamic-programming", "type": "tutorial", "score": 86},
-                {"title": "Advanced DP Techniques Course", "url": "https://www.educative.io/courses/grokking-dynamic-programming-patterns-for-coding-interviews", "type": "course", "score": 92}
-            ],
-            "Sorting Algorithms": [
-                {"title": "Sorting Algorithms Complete Guide", "url": "https://www.geeksforgeeks.org/sorting-algorithms/", "type": "article", "score": 94},
-                {"title": "Sorting Algorithm Comparisons", "url": "https://www.geeksforgeeks.org/analysis-of-different-sorting-techniques/", "type": "article", "score": 91},
-                {"title": "Sorting Problems Practice", "url": "https://leetcode.com/tag/sorting/", "type": "course", "score": 88},
-                {"title": "Sorting Algorithms Documentation", "url": "https://en.wikipedia.org/wiki/Sorting_algorithm", "type": "documentation", "score": 86},
-                {"title": "Sorting Algorithms Video Tutorial", "url": "https://www.youtube.com/watch?v=kPRA0W1kECg", "type": "video", "score": 87},
-                {"title": "Sorting Implementations Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/sorts", "type": "github", "score": 84},
-                {"title": "Interactive Sorting Visualization", "url": "https://www.cs.usfca.edu/~galles/visualization/ComparisonSort.html", "type": "tutorial", "score": 89},
-                {"title": "Advanced Sorting Techniques", "url": "https://www.programiz.com/dsa/sorting-algorithm", "type": "tutorial", "score": 85}
-            ],
-            "Searching Algorithms": [
-                {"title": "Searching Algorithms Tutorial", "url": "https://www.geeksforgeeks.org/searching-algorithms/", "type": "article", "score": 93},
-                {"title": "Binary Search Masterclass", "url": "https://www.geeksforgeeks.org/binary-search/", "type": "article", "score": 92},
-                {"title": "Search Problems - LeetCode", "url": "https://leetcode.com/tag/binary-search/", "type": "course", "score": 89},
-                {"title": "Search Algorithms Documentation", "url": "https://en.wikipedia.org/wiki/Search_algorithm", "type": "documentation", "score": 85},
-                {"title": "Search Algorithms Video Course", "url": "https://www.youtube.com/watch?v=MFhxShGxHWc", "type": "video", "score": 86},
-                {"title": "Search Implementations Repository", "url": "https://github.com/TheAlgorithms/Python/tree/master/searches", "type": "github", "score": 83},
-                {"title": "Interactive Search Tutorial", "url": "https://www.cs.usfca.edu/~galles/visualization/Search.html", "type": "tutorial", "score": 87},
-                {"title": "Advanced Search Patterns", "url": "https://leetcode.com/discuss/study-guide/786126/Python-Powerful-Ultimate-Binary-Search-Template", "type": "course", "score": 90}
-            ],
-            
-            # Web Development
-            "HTML Fundamentals": [
-                {"title": "HTML Complete Reference - MDN", "url": "https://developer.mozilla.org/en-US/docs/Web/HTML", "type": "documentation", "score": 98},
-                {"title": "HTML Tutorial - W3Schools", "url": "https://www.w3schools.com/html/", "type": "tutorial", "score": 90},
-                {"title": "HTML Crash Course Video", "url": "https://www.youtube.com/watch?v=UB1O30fR-EE", "type": "video", "score": 87},
-                {"title": "HTML5 Semantic Elements Guide", "url": "https://www.w3schools.com/html/html5_semantic_elements.asp", "type": "article", "score": 89},
-                {"title": "HTML Forms Complete Guide", "url": "https://developer.mozilla.org/en-US/docs/Learn/Forms", "type": "documentation", "score": 92},
-                {"title": "Interactive HTML Course", "url": "https://www.freecodecamp.org/learn/responsive-web-design/", "type": "course", "score": 94},
-                {"title": "HTML Best Practices", "url": "https://github.com/hail2u/html-best-practices", "type": "github", "score": 85},
-                {"title": "Accessibility in HTML", "url": "https://webaim.org/intro/", "type": "article", "score": 88}
-            ],
-            "CSS Fundamentals": [
-                {"title": "CSS Complete Reference - MDN", "url": "https://developer.mozilla.org/en-US/docs/Web/CSS", "type": "documentation", "score": 98},
-                {"title": "CSS Tutorial - W3Schools", "url": "https://www.w3schools.com/css/", "type": "tutorial", "score": 90},
-                {"title": "CSS Flexbox Complete Guide", "url": "https://css-tricks.com/snippets/css/a-guide-to-flexbox/", "type": "article", "score": 95},
-                {"title": "CSS Grid Layout Tutorial", "url": "https://css-tricks.com/snippets/css/complete-guide-grid/", "type": "article", "score": 94},
-                {"title": "CSS Video Course", "url": "https://www.youtube.com/watch?v=1Rs2ND1ryYc", "type": "video", "score": 88},
-                {"title": "CSS Animations Tutorial", "url": "https://developer.mozilla.org/en-US/docs/Web/CSS/CSS_Animations", "type": "documentation", "score": 91},
-                {"title": "CSS Games for Learning", "url": "https://github.com/AllThingsSmitty/css-protips", "type": "github", "score": 86},
-                {"title": "Interactive CSS Course", "url": "https://www.freecodecamp.org/learn/responsive-web-design/", "type": "course", "score": 92}
-            ],
-            "JavaScript Fundamentals": [
-                {"title": "JavaScript Complete Guide - MDN", "url": "https://developer.mozilla.org/en-US/docs/Web/JavaScript", "type": "documentation", "score": 98},
-                {"title": "JavaScript.info - Modern Tutorial", "url": "https://javascript.info/", "type": "tutorial", "score": 96},
-                {"title": "JavaScript Crash Course Video", "url": "https://www.youtube.com/watch?v=hdI2bqOjy3c", "type": "video", "score": 89},
-                {"title": "JavaScript ES6+ Features", "url": "https://github.com/lukehoban/es6features", "type": "github", "score": 87},
-                {"title": "You Don't Know JS Book Series", "url": "https://github.com/getify/You-Dont-Know-JS", "type": "github", "score": 94},
-                {"title": "JavaScript Algorithms Practice", "url": "https://github.com/trekhleb/javascript-algorithms", "type": "github", "score": 91},
-                {"title": "Interactive JavaScript Course", "url": "https://www.freecodecamp.org/learn/javascript-algorithms-and-data-structures/", "type": "course", "score": 93},
-                {"title": "JavaScript Design Patterns", "url": "https://addyosmani.com/resources/essentialjsdesignpatterns/book/", "type": "article", "score": 88}
-            ],
-            "React Fundamentals": [
-                {"title": "React Official Documentation", "url": "https://react.dev/", "type": "documentation", "score": 98},
-                {"title": "React Tutorial - Official", "url": "https://react.dev/learn", "type": "tutorial", "score": 95},
-                {"title": "React Crash Course Video", "url": "https://www.youtube.com/watch?v=w7ejDZ8SWv8", "type": "video", "score": 89},
-                {"title": "React Hooks Complete Guide", "url": "https://react.dev/reference/react", "type": "documentation", "score": 93},
-                {"title": "React Patterns and Best Practices", "url": "https://github.com/vasanthk/react-bits", "type": "github", "score": 87},
-                {"title": "React Router Tutorial", "url": "https://reactrouter.com/en/main/start/tutorial", "type": "tutorial", "score": 90},
-                {"title": "Interactive React Course", "url": "https://scrimba.com/learn/learnreact", "type": "course", "score": 91},
-                {"title": "React Testing Best Practices", "url": "https://kentcdodds.com/blog/common-mistakes-with-react-testing-library", "type": "article", "score": 86}
-            ],
-            "Node.js Backend": [
-                {"title": "Node.js Official Documentation", "url": "https://nodejs.org/en/docs/", "type": "documentation", "score": 97},
-                {"title": "Node.js Tutorial - W3Schools", "url": "https://www.w3schools.com/nodejs/", "type": "tutorial", "score": 88},
-                {"title": "Node.js Crash Course Video", "url": "https://www.youtube.com/watch?v=fBNz5xF-Kx4", "type": "video", "score": 87},
-                {"title": "Express.js Official Guide", "url": "https://expressjs.com/en/guide/routing.html", "type": "documentation", "score": 94},
-                {"title": "Node.js Best Practices", "url": "https://github.com/goldbergyoni/nodebestpractices", "type": "github", "score": 92},
-                {"title": "RESTful API with Node.js", "url": "https://restfulapi.net/", "type": "article", "score": 89},
-                {"title": "Node.js Authentication Tutorial", "url": "https://www.digitalocean.com/community/tutorials/api-authentication-with-json-web-tokens-jwt-and-passport", "type": "tutorial", "score": 85},
-                {"title": "Node.js Performance Best Practices", "url": "https://nodejs.org/en/docs/guides/simple-profiling/", "type": "documentation", "score": 90}
-            ],
-            
-            # Machine Learning
-            "Linear Algebra for ML": [
-                {"title": "Linear Algebra for Machine Learning", "url": "https://machinelearningmastery.com/linear-algebra-machine-learning/", "type": "article", "score": 93},
-                {"title": "Khan Academy Linear Algebra", "url": "https://www.khanacademy.org/math/linear-algebra", "type": "course", "score": 95},
-                {"title": "3Blue1Brown Linear Algebra Series", "url": "https://www.youtube.com/playlist?list=PLZHQObOWTQDPD3MizzM2xVFitgF8hE_ab", "type": "video", "score": 97},
-                {"title": "NumPy Linear Algebra Documentation", "url": "https://numpy.org/doc/stable/reference/routines.linalg.html", "type": "documentation", "score": 89},
-                {"title": "Linear Algebra Implementations", "url": "https://github.com/fastai/numerical-linear-algebra", "type": "github", "score": 87},
-                {"title": "Interactive Linear Algebra", "url": "http://immersivemath.com/ila/index.html", "type": "tutorial", "score": 91},
-                {"title": "MIT Linear Algebra Course", "url": "https://ocw.mit.edu/courses/18-06-linear-algebra-spring-2010/", "type": "course", "score": 96},
-                {"title": "Linear Algebra Cheat Sheet", "url": "https://towardsdatascience.com/linear-algebra-cheat-sheet-for-deep-learning-cd67aba4526c", "type": "article", "score": 84}
-            ],
-            "Statistics for ML": [
-                {"title": "Statistics for Machine Learning", "url": "https://machinelearningmastery.com/statistics_for_machine_learning/", "type": "article", "score": 92},
-                {"title": "Khan Academy Statistics", "url": "https://www.khanacademy.org/math/statistics-probability", "type": "course", "score": 94},
-                {"title": "StatQuest Video Series", "url": "https://www.youtube.com/user/joshstarmer", "type": "video", "score": 96},
-                {"title": "SciPy Statistics Documentation", "url": "https://docs.scipy.org/doc/scipy/reference/stats.html", "type": "documentation", "score": 88},
-                {"title": "Statistics with Python", "url": "https://github.com/rouseguy/intro2stats", "type": "github", "score": 85},
-                {"title": "Interactive Statistics Course", "url": "https://seeing-theory.brown.edu/", "type": "tutorial", "score": 93},
-                {"title": "MIT Statistics Course", "url": "https://ocw.mit.edu/courses/18-05-introduction-to-probability-and-statistics-spring-2014/", "type": "course", "score": 95},
-                {"title": "Bayesian Statistics Tutorial", "url": "https://towardsdatascience.com/a-gentle-introduction-to-bayesian-deep-learning-d298c7243fd6", "type": "article", "score": 87}
-            ],
-            "Supervised Learning": [
-                {"title": "Supervised Learning Complete Guide", "url": "https://machinelearningmastery.com/supervised-and-unsupervised-machine-learning-algorithms/", "type": "article", "score": 91},
-                {"title": "Scikit-learn User Guide", "url": "https://scikit-learn.org/stable/user_guide.html", "type": "documentation", "score": 96},
-                {"title": "Machine Learning Course - Andrew Ng", "url": "https://www.coursera.org/learn/machine-learning", "type": "course", "score": 98},
-                {"title": "ML Algorithms Video Explanations", "url": "https://www.youtube.com/playlist?list=PLblh5JKOoLUICTaGLRoHQDuF_7q2GfuJF", "type": "video", "score": 89},
-                {"title": "ML Algorithms from Scratch", "url": "https://github.com/eriklindernoren/ML-From-Scratch", "type": "github", "score": 87},
-                {"title": "Interactive ML Course", "url": "https://www.kaggle.com/learn/intro-to-machine-learning", "type": "course", "score": 92},
-                {"title": "Hands-On Machine Learning Book", "url": "https://github.com/ageron/handson-ml2", "type": "github", "score": 94},
-                {"title": "ML Model Evaluation Tutorial", "url": "https://machinelearningmastery.com/metrics-evaluate-machine-learning-algorithms-python/", "type": "tutorial", "score": 86}
-            ],
-            "Deep Learning": [
-                {"title": "Deep Learning Specialization", "url": "https://www.coursera.org/specializations/deep-learning", "type": "course", "score": 98},
-                {"title": "Deep Learning Book - Ian Goodfellow", "url": "https://www.deeplearningbook.org/", "type": "documentation", "score": 97},
-                {"title": "TensorFlow Official Tutorials", "url": "https://www.tensorflow.org/tutorials", "type": "tutorial", "score": 95},
-                {"title": "PyTorch Tutorials", "url": "https://pytorch.org/tutorials/", "type": "tutorial", "score": 94},
-                {"title": "3Blue1Brown Neural Networks", "url": "https://www.youtube.com/playlist?list=PLZHQObOWTQDNU6R1_67000Dx_ZCJB-3pi", "type": "video", "score": 96},
-                {"title": "Deep Learning Papers Repository", "url": "https://github.com/floodsung/Deep-Learning-Papers-Reading-Roadmap", "type": "github", "score": 89},
-                {"title": "Fast.ai Deep Learning Course", "url": "https://course.fast.ai/", "type": "course", "score": 93},
-                {"title": "Deep Learning Fundamentals", "url": "https://towardsdatascience.com/deep-learning-fundamentals-handbook-theoretical-and-practical-aspects-a35b7d1b5c5e", "type": "article", "score": 87}
-            ],
-            
-            # Python
-            "Python Basics": [
-                {"title": "Python Official Tutorial", "url": "https://docs.python.org/3/tutorial/", "type": "documentation", "score": 97},
-                {"title": "Python for Beginners - Microsoft", "url": "https://docs.microsoft.com/en-us/learn/paths/beginner-python/", "type": "course", "score": 93},
-                {"title": "Python Crash Course Video", "url": "https://www.youtube.com/watch?v=rfscVS0vtbw", "type": "video", "score": 89},
-                {"title": "Real Python Tutorials", "url": "https://realpython.com/", "type": "tutorial", "score": 95},
-                {"title": "Python Tricks Book Repository", "url": "https://github.com/realpython/python-tricks-the-book", "type": "github", "score": 88},
-                {"title": "Interactive Python Course", "url": "https://www.codecademy.com/learn/learn-python-3", "type": "course", "score": 91},
-                {"title": "Python Style Guide (PEP 8)", "url": "https://pep8.org/", "type": "documentation", "score": 86},
-                {"title": "Automate the Boring Stuff", "url": "https://automatetheboringstuff.com/", "type": "tutorial", "score": 92}
-            ],
-            "Object-Oriented Programming": [
-                {"title": "Python OOP Complete Guide", "url": "https://realpython.com/python3-object-oriented-programming/", "type": "article", "score": 94},
-                {"title": "OOP Concepts Tutorial", "url": "https://www.programiz.com/python-programming/object-oriented-programming", "type": "tutorial", "score": 89},
-                {"title": "Python OOP Video Course", "url": "https://www.youtube.com/watch?v=ZDa-Z5JzLYM", "type": "video", "score": 87},
-                {"title": "Python Classes Documentation", "url": "https://docs.python.org/3/tutorial/classes.html", "type": "documentation", "score": 95},
-                {"title": "OOP Design Patterns in Python", "url": "https://github.com/faif/python-patterns", "type": "github", "score": 91},
-                {"title": "Interactive OOP Course", "url": "https://www.codecademy.com/learn/learn-python-3", "type": "course", "score": 88},
-                {"title": "SOLID Principles in Python", "url": "https://realpython.com/solid-principles-python/", "type": "article", "score": 92},
-                {"title": "Python OOP Best Practices", "url": "https://realpython.com/inheritance-composition-python/", "type": "tutorial", "score": 86}
-            ],
-            "Python Libraries": [
-                {"title": "NumPy Documentation", "url": "https://numpy.org/doc/stable/", "type": "documentation", "score": 96},
-                {"title": "Pandas User Guide", "url": "https://pandas.pydata.org/docs/user_guide/", "type": "documentation", "score": 95},
-                {"title": "Matplotlib Tutorials", "url": "https://matplotlib.org/stable/tutorials/index.html", "type": "tutorial", "score": 93},
-                {"title": "Python Data Science Handbook", "url": "https://jakevdp.github.io/PythonDataScienceHandbook/", "type": "tutorial", "score": 97},
-                {"title": "Scientific Python Video Course", "url": "https://www.youtube.com/playlist?list=PLQVvvaa0QuDfefDfXb9Yf0la1fPDKluPF", "type": "video", "score": 88},
-                {"title": "Awesome Python Libraries", "url": "https://github.com/vinta/awesome-python", "type": "github", "score": 90},
-                {"title": "Data Analysis with Python", "url": "https://www.freecodecamp.org/learn/data-analysis-with-python/", "type": "course", "score": 92},
-                {"title": "Seaborn Statistical Visualization", "url": "https://seaborn.pydata.org/tutorial.html", "type": "tutorial", "score": 89}
-            ]
+        # Search engines in their static preference order
+        self.engines = {
+            "bing": self._search_bing,
+            "startpage": self._search_startpage,
+            "searx": self._search_searx,
         }
+        self.engine_stats = {name: EngineStats() for name in self.engines}
+        self.search_deadline = ROBUST_SEARCH_DEADLINE
+        self.hedge_delay = ROBUST_HEDGE_DELAY
+        # Deadline of the hedged search the current pool thread is working for
+        self._call_deadline = threading.local()
+        
+    def _deadline_remaining(self):
+        """Seconds left before the calling engine's search deadline (None outside a hedged search)."""
+        deadline_at = getattr(self._call_deadline, "at", None)
+        return None if deadline_at is None else deadline_at - time.monotonic()
     
-    def _wait_for_rate_limit(self, service):
-        """Implement rate limiting to avoid API blocks."""
-        current_time = time.time()
-        if service in self.last_request_time:
-            time_since_last = current_time - self.last_request_time[service]
-            if time_since_last < self.min_delay:
-                sleep_time = self.min_delay - time_since_last
-                logger.info(f"Rate limiting: waiting {sleep_time:.2f}s for {service}")
-                time.sleep(sleep_time)
+    def _get(self, url, timeout=5):
+        """
+        GET a URL once its host's circuit breaker and rate limit allow it.
+        
+        Inside a hedged search the rate-limit wait and the request are capped
+        by what is left of the search deadline, so a late call gives up
+        (RateLimitExceeded or TimeoutError) instead of sleeping.
+        """
+        remaining = self._deadline_remaining()
+        if remaining is not None and remaining <= 0:
+            raise TimeoutError(f"Search deadline expired before requesting {url}")
+        breaker = get_circuit_breaker(url)
+        if not breaker.allow_request():
+            raise CircuitOpenError(breaker.name)
         
-        self.last_request_time[service] = time.time()
+        try:
+            waited = self.rate_limiter.acquire(url, max_wait=remaining)
+        except RateLimitExceeded:
+            breaker.release()
+            raise
+        if remaining is not None:
+            timeout = max(min(timeout, remaining - waited), 0.1)
+        try:
+            response = self.session.get(url, timeout=timeout)
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_status(response.status_code)
+        return response
     
-    def search_with_fallback(self, query, resource_type, max_results=5):
+    def search_with_fallback(self, query, resource_type, max_results=5, hedged=None):
         """
         Search for resources with multiple fallback mechanisms.
         
@@ -244,10 +339,110 @@ class RobustResourceFetcher:
             query (str): Search query
             resource_type (str): Type of resource (article, video, course, etc.)
             max_results (int): Maximum results to return
+            hedged (bool): Race the engines (default from ROBUST_SEARCH_MODE)
             
         Returns:
             list: List of resources
         """
+        if hedged is None:
+            hedged = ROBUST_SEARCH_MODE == "hedged"
+        if hedged:
+            return self._search_hedged(query, resource_type, max_results)
+        return self._search_sequential(query, resource_type, max_results)
+    
+    def hedging_order(self):
+        """Engine names, best expected performer first."""
+        return sorted(self.engines, key=lambda name: self.engine_stats[name].score(), reverse=True)
+    
+    def _call_engine(self, name, query, resource_type, max_results, deadline_at=None):
+        """Run one engine and record its latency and outcome."""
+        started = time.monotonic()
+        self._call_deadline.at = deadline_at
+        try:
+            results = self.engines[name](query, resource_type, max_results)
+        except Exception as e:
+            logger.warning(f"Search engine {name} failed: {e}")
+            results = []
+        finally:
+            self._call_deadline.at = None
+        # An engine cut short by the deadline has not failed
+        if results or deadline_at is None or time.monotonic() < deadline_at:
+            self.engine_stats[name].record(time.monotonic() - started, bool(results))
+        return results or []
+    
+    def _search_hedged(self, query, resource_type, max_results):
+        """
+        Race the engines and merge results as they arrive.
+        
+        Backup resources are looked up first and used as a floor. The engines
+        start in adaptive order, each one ``hedge_delay`` after the previous
+        one or as soon as the previous one comes back empty. Merging stops when
+        ``max_results`` engine results have arrived or the deadline expires.
+        If there is a floor, it is returned as soon as every engine has had its
+        hedge delay without producing anything, instead of waiting for the
+        deadline. The backup resources then fill any remaining slots.
+        """
+        floor = self._get_backup_resources(query, resource_type, max_results)
+        deadline_at = time.monotonic() + self.search_deadline
+        
+        resources = []
+        seen_urls = set()
+        winner = None
+        pending = {}
+        waiting_engines = self.hedging_order()
+        next_launch = 0.0
+        
+        while waiting_engines or pending:
+            now = time.monotonic()
+            if now >= deadline_at or len(resources) >= max_results:
+                break
+            # All engines launched and past their hedge delay with nothing yet: serve the floor
+            if floor and not resources and not waiting_engines and now >= next_launch:
+                break
+            
+            # Launch the next engine when the hedge delay expires or nothing is in flight
+            if waiting_engines and (now >= next_launch or not pending):
+                name = waiting_engines.pop(0)
+                future = _search_executor.submit(self._call_engine, name, query, resource_type, max_results,
+                                                 deadline_at)
+                pending[future] = name
+                next_launch = now + self.hedge_delay
+            
+            wake_at = min(deadline_at, next_launch) if waiting_engines or floor else deadline_at
+            done, _ = wait(pending, timeout=max(0.0, wake_at - time.monotonic()), return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                name = pending.pop(future)
+                engine_resources = future.result()
+                if not engine_resources:
+                    continue
+                if winner is None:
+                    winner = name
+                    self.engine_stats[name].record_win()
+                logger.info(f"Got {len(engine_resources)} resources from {name}")
+                for resource in engine_resources:
+                    url_key = normalize_url(resource.get('url', ''))
+                    if url_key and url_key not in seen_urls and len(resources) < max_results:
+                        seen_urls.add(url_key)
+                        resources.append(resource)
+        
+        # Calls still queued on the pool never start; running ones give up at the deadline
+        running = [future for future in pending if not future.cancel()]
+        if running:
+            logger.info(f"Hedged search for '{query}' returned with {len(running)} engines still running")
+        
+        for resource in floor:
+            url_key = normalize_url(resource.get('url', ''))
+            if len(resources) >= max_results:
+                break
+            if url_key not in seen_urls:
+                seen_urls.add(url_key)
+                resources.append(resource)
+        
+        return resources[:max_results]
+    
+    def _search_sequential(self, query, resource_type, max_results):
+        """Try each engine in order, then the backup resources."""
         resources = []
         
         # Try different search engines with fallbacks
@@ -260,7 +455,6 @@ class RobustResourceFetcher:
         
         for method in search_methods:
             try:
-                self._wait_for_rate_limit(method.__name__)
                 method_resources = method(query, resource_type, max_results - len(resources))
                 if method_resources:
                     resources.extend(method_resources)
@@ -281,7 +475,7 @@ class RobustResourceFetcher:
             search_query = quote_plus(f"{query} {resource_type}")
             url = f"https://www.bing.com/search?q={search_query}"
             
-            response = self.session.get(url, timeout=5)
+            response = self._get(url, timeout=5)
             if response.status_code != 200:
                 return []
             
@@ -319,7 +513,7 @@ class RobustResourceFetcher:
             search_query = quote_plus(f"{query} {resource_type}")
             url = f"https://www.startpage.com/sp/search?q={search_query}"
             
-            response = self.session.get(url, timeout=5)
+            response = self._get(url, timeout=5)
             if response.status_code != 200:
                 return []
             
@@ -365,7 +559,7 @@ class RobustResourceFetcher:
                 search_query = quote_plus(f"{query} {resource_type}")
                 url = f"{instance}/search?q={search_query}&format=json"
                 
-                response = self.session.get(url, timeout=5)
+                response = self._get(url, timeout=5)
                 if response.status_code != 200:
                     continue
                 
@@ -393,15 +587,17 @@ class RobustResourceFetcher:
     def _get_backup_resources(self, query, resource_type, max_results):
         """Get resources from backup database when all searches fail."""
         query_lower = query.lower()
+        catalog = get_resource_catalog()
         
         # Find matching subskill
-        for subskill, resources in self.backup_resources.items():
+        for subskill in catalog.listing_keys(SOURCE_BACKUP):
             if (subskill.lower() in query_lower or 
                 any(word in query_lower for word in subskill.lower().split())):
+                resources = catalog.get_listing(SOURCE_BACKUP, subskill)
                 
                 # Filter by resource type if specified
                 if resource_type != 'all':
-                    filtered_resources = [r for r in resources if r.get('type') == resource_type]
+                    filtered_resources = [r for r in resources if r.get('resource_type') == resource_type]
                 else:
                     filtered_resources = resources
                 
@@ -411,9 +607,9 @@ class RobustResourceFetcher:
                     converted_resources.append({
                         'title': resource['title'],
                         'url': resource['url'],
-                        'description': f"High-quality {resource.get('type', 'resource')} for {subskill}",
-                        'resource_type': resource.get('type', resource_type),
-                        'quality_score': resource.get('score', 85)
+                        'description': f"High-quality {resource.get('resource_type', 'resource')} for {subskill}",
+                        'resource_type': resource.get('resource_type', resource_type),
+                        'quality_score': resource.get('quality_score', 85)
                     })
                 
                 return converted_resources
@@ -456,3 +652,11 @@ def get_robust_resources(skill_name, resource_types=None, max_per_type=8):
     
     logger.info(f"Total robust resources for {skill_name}: {len(unique_resources)}")
     return unique_resources
+
+def get_search_engine_stats():
+    """Per-engine win rates and latencies plus the current hedging order."""
+    return {
+        "mode": ROBUST_SEARCH_MODE,
+        "hedging_order": robust_fetcher.hedging_order(),
+        "engines": {name: stats.stats() for name, stats in robust_fetcher.engine_stats.items()},
+    }
@@ -0,0 +1,168 @@
+"""
+Compiled skill-alias index for instant fallback lookups.
+=======================================================
+
+Replaces per-request linear scans and long ``elif`` chains of substring checks
+with a structure that is built once per process:
+
+- an exact-match hash map over normalized (lower-cased, stripped) skill keys
+- an Aho-Corasick automaton over every alias pattern, so all aliases found in a
+  query are reported in a single pass over its characters
+
+Each alias rule carries an explicit priority (its position in the rule list),
+so more specific aliases such as "python basics" still beat "python" no matter
+where they occur in the query. Lookups cost O(len(query) + matches) regardless
+of how many skills or aliases are registered.
+"""
+
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class AliasRule(NamedTuple):
+    """
+    A single alias rule.
+
+    Attributes:
+        target: Canonical key (or tuple of keys) the rule resolves to
+        any_of: Substrings of which at least one must occur in the query
+        all_of: Substrings that must all occur in the query as well
+        equals: Exact normalized queries that also trigger the rule
+        max_words: Optional upper bound on the number of words in the query
+    """
+    target: object
+    any_of: Tuple[str, ...] = ()
+    all_of: Tuple[str, ...] = ()
+    equals: Tuple[str, ...] = ()
+    max_words: Optional[int] = None
+
+
+class AhoCorasickMatcher:
+    """Multi-pattern substring matcher (Aho-Corasick automaton)."""
+
+    def __init__(self, patterns: List[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(patterns):
+            self._add_pattern(pattern, pattern_id)
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str, pattern_id: int):
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(pattern_id)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                # Inherit matches that end at the failure state
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find_all(self, text: str) -> set:
+        """Return the ids of every pattern occurring in ``text``."""
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            if self._output[node]:
+                found.update(self._output[node])
+        return found
+
+
+class SkillAliasIndex:
+    """
+    Build-once index resolving free-text skill queries to canonical keys.
+
+    Exact (case-insensitive) key matches always win; otherwise the rule with the
+    lowest index whose conditions hold is returned.
+    """
+
+    def __init__(self, keys: List[str], rules: List[AliasRule]):
+        self.exact_keys: Dict[str, str] = {}
+        for key in keys:
+            self.exact_keys.setdefault(key.strip().lower(), key)
+
+        self.rules = list(rules)
+
+        patterns: List[str] = []
+        pattern_ids: Dict[str, int] = {}
+        # pattern id -> rule ids that list it in ``any_of``
+        self._pattern_rules: List[List[int]] = []
+        self._equals: Dict[str, int] = {}
+
+        for rule_id, rule in enumerate(self.rules):
+            for pattern in set(rule.any_of) | set(rule.all_of):
+                if pattern not in pattern_ids:
+                    pattern_ids[pattern] = len(patterns)
+                    patterns.append(pattern)
+                    self._pattern_rules.append([])
+            for pattern in rule.any_of:
+                self._pattern_rules[pattern_ids[pattern]].append(rule_id)
+            for value in rule.equals:
+                self._equals.setdefault(value, rule_id)
+
+        self._pattern_ids = pattern_ids
+        self._matcher = AhoCorasickMatcher(patterns)
+
+    def match_rule(self, query: str) -> Optional[AliasRule]:
+        """Return the highest-priority rule matching ``query`` (or ``None``)."""
+        normalized = query.strip().lower()
+        found = self._matcher.find_all(normalized)
+
+        candidates = set()
+        for pattern_id in found:
+            candidates.update(self._pattern_rules[pattern_id])
+        if normalized in self._equals:
+            candidates.add(self._equals[normalized])
+
+        word_count = None
+        for rule_id in sorted(candidates):
+            rule = self.rules[rule_id]
+            if any(self._pattern_ids[p] not in found for p in rule.all_of):
+                continue
+            if rule.max_words is not None:
+                if word_count is None:
+                    word_count = len(normalized.split())
+                if word_count > rule.max_words:
+                    continue
+            return rule
+        return None
+
+    def lookup(self, query: str) -> Optional[object]:
+        """
+        Resolve a query to a canonical key or rule target.
+
+        Args:
+            query: Free-text skill name
+
+        Returns:
+            The canonical key for an exact match, the matching rule's target,
+            or ``None`` if nothing matches
+        """
+        normalized = query.strip().lower()
+        if normalized in self.exact_keys:
+            return self.exact_keys[normalized]
+
+        rule = self.match_rule(normalized)
+        return rule.target if rule is not None else None
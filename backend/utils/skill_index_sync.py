@@ -0,0 +1,132 @@
+"""
+Skill Index Synchronization
+===========================
+
+Feeds ``ml.skill_index`` with every skill name the backend knows about:
+
+- rows of the ``skills`` table and their ``subskills`` JSON, both the
+  existing ones (seeded before the first search) and new ones (queued by
+  SQLAlchemy after-insert/after-update hooks);
+- the resource catalog's skill and subskill keys;
+- the SKILL_HIERARCHY used by ``ml.skill_decomposition``.
+
+Queuing is cheap. ``warm_skill_index`` seeds and embeds everything on a
+background thread at startup when EMBEDDING_PRELOAD loads the model then;
+with the lazy default the first search does it, so torch is not imported at
+boot. Later searches only embed a handful of new names.
+"""
+
+import logging
+import os
+import sys
+from typing import List, Optional
+
+from sqlalchemy import event
+
+# Append the project root to access the ml directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from database.database import SessionLocal
+from models.models import Skill
+from ml.embeddings import EMBEDDING_PRELOAD
+from ml.skill_index import skill_index, SkillIndex, SkillMatch, KIND_SUBSKILL, KIND_CATALOG
+from .resource_catalog import get_resource_catalog, SUBSKILL_SOURCES
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_catalog_names(index: SkillIndex = skill_index):
+    """Queue the catalog's skills (with their subskills) and listing keys."""
+    catalog = get_resource_catalog()
+    for skill, metadata in catalog.skill_metadata.items():
+        index.add_skill(skill, subskills=metadata.get("subskills", []), kind=KIND_CATALOG)
+    for source, listings in catalog.listings.items():
+        kind = KIND_SUBSKILL if source in SUBSKILL_SOURCES else KIND_CATALOG
+        for key in listings:
+            index.enqueue(key, kind=kind)
+
+
+def enqueue_hierarchy_names(index: SkillIndex = skill_index):
+    from ml.skill_decomposition import SKILL_HIERARCHY
+    for skill, subskills in SKILL_HIERARCHY.items():
+        index.add_skill(skill, subskills=subskills)
+
+
+def enqueue_database_skills(index: SkillIndex = skill_index, session_factory=SessionLocal):
+    db = session_factory()
+    try:
+        for skill_id, name, subskills in db.query(Skill.id, Skill.name, Skill.subskills).yield_per(1000):
+            index.add_skill(name, skill_id=skill_id, subskills=subskills or [])
+    finally:
+        db.close()
+
+
+def seed_skill_index(index: SkillIndex, session_factory=SessionLocal):
+    """Queue every known name (already indexed names are skipped cheaply)."""
+    for enqueue in (enqueue_hierarchy_names, enqueue_catalog_names):
+        try:
+            enqueue(index)
+        except Exception as e:
+            logger.warning(f"Skill index seeding from {enqueue.__name__} failed: {e}")
+    try:
+        enqueue_database_skills(index, session_factory)
+    except Exception as e:
+        logger.warning(f"Skill index seeding from the skills table failed: {e}")
+
+
+def _on_skill_saved(mapper, connection, target):
+    # Runs inside the flush: only queue the names, embedding happens on the next search
+    skill_index.add_skill(target.name, skill_id=target.id, subskills=target.subskills or [])
+
+
+def register_skill_index_hooks(session_factory=SessionLocal):
+    """Seed the global index lazily and keep it current as skills are inserted."""
+    if not event.contains(Skill, "after_insert", _on_skill_saved):
+        event.listen(Skill, "after_insert", _on_skill_saved)
+        event.listen(Skill, "after_update", _on_skill_saved)
+    skill_index.set_seed(lambda index: seed_skill_index(index, session_factory))
+
+
+def warm_skill_index(preload: str = EMBEDDING_PRELOAD) -> bool:
+    """
+    Load/seed the index and embed everything queued on a background thread.
+
+    Embedding loads the model, so this is a no-op under the lazy preload
+    policy until the model is ready (and always without embeddings).
+
+    Returns:
+        True if a warm-up was started
+    """
+    provider = skill_index.provider
+    if not provider.available or (preload == "lazy" and not provider.ready):
+        return False
+    skill_index.warm_in_background()
+    return True
+
+
+def find_similar_skills(query: str, k: int = 5, kinds: Optional[List[str]] = None,
+                        require_ready_model: bool = False) -> List[SkillMatch]:
+    """
+    Top-k known skills/subskills for free text.
+
+    Args:
+        query: Skill name as typed by the user
+        k: Number of matches
+        kinds: Restrict to entry kinds (``skill``, ``subskill``, ``catalog``)
+        require_ready_model: Return nothing rather than load the embedding model now
+
+    Returns:
+        Matches ordered by cosine similarity (empty if embeddings are unavailable)
+    """
+    provider = skill_index.provider
+    if not provider.available or (require_ready_model and not provider.ready):
+        return []
+    try:
+        return skill_index.search(query, k=k, kinds=kinds)
+    except Exception as e:
+        logger.warning(f"Skill index search failed for {query!r}: {e}")
+        return []
+
+
+def get_skill_index_stats():
+    return skill_index.stats()
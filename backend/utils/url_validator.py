@@ -0,0 +1,293 @@
+"""
+URL Validation Service
+======================
+
+Accessibility checks for candidate resource URLs, shared by every request.
+
+- Results are kept in a bounded in-process LRU keyed by normalized URL.
+  Positive and negative results have separate TTLs, because a dead link is
+  more likely to come back than a live one is to die.
+- ``validate_many`` HEADs a list of URLs concurrently through the pooled
+  async client (``utils.async_http``), so a batch of candidates costs one
+  round-trip instead of one per URL.
+- An optional background sweep re-validates frequently requested URLs
+  shortly before they expire, keeping the checks off the request path.
+
+Configuration (environment):
+    URL_VALIDATION_CACHE_SIZE      maximum cached URLs
+    URL_VALIDATION_TTL             seconds a positive result is trusted
+    URL_VALIDATION_NEGATIVE_TTL    seconds a negative result is trusted
+    URL_VALIDATION_CONCURRENCY     simultaneous HEAD requests per batch
+    URL_VALIDATION_SWEEP_INTERVAL  seconds between re-validation sweeps (0 disables)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from .async_http import head, run_sync
+from .circuit_breaker import CircuitOpenError
+from .resource_catalog import get_domain, normalize_url
+
+logger = logging.getLogger(__name__)
+
+URL_VALIDATION_CACHE_SIZE = int(os.environ.get("URL_VALIDATION_CACHE_SIZE", "10000"))
+URL_VALIDATION_TTL = float(os.environ.get("URL_VALIDATION_TTL", str(6 * 3600)))
+URL_VALIDATION_NEGATIVE_TTL = float(os.environ.get("URL_VALIDATION_NEGATIVE_TTL", "900"))
+URL_VALIDATION_CONCURRENCY = int(os.environ.get("URL_VALIDATION_CONCURRENCY", "16"))
+URL_VALIDATION_SWEEP_INTERVAL = float(os.environ.get("URL_VALIDATION_SWEEP_INTERVAL", "0"))
+
+# Hosts we know are reliable: short timeout, and a failed check still passes
+TRUSTED_DOMAINS = [
+    'geeksforgeeks.org', 'leetcode.com', 'github.com',
+    'developer.mozilla.org', 'react.dev', 'docs.python.org',
+    'freecodecamp.org', 'youtube.com', 'youtu.be',
+    'stackoverflow.com', 'w3schools.com', 'mdn.webdocs.org',
+    'nodejs.org', 'reactjs.org', 'vuejs.org', 'angular.io',
+    'coursera.org', 'udemy.com', 'edx.org', 'khanacademy.org',
+    'codecademy.com', 'pluralsight.com', 'educative.io',
+    'interviewbit.com', 'hackerrank.com', 'codechef.com',
+    'codeforces.com', 'topcoder.com', 'javascript.info',
+    'css-tricks.com', 'smashingmagazine.com', 'a11yproject.com'
+]
+TRUSTED_TIMEOUT = 2
+
+# Entries requested at least this often are kept warm by the sweep
+HOT_MIN_HITS = 2
+
+
+def is_trusted_url(url: str) -> bool:
+    domain = get_domain(url)
+    return any(trusted in domain for trusted in TRUSTED_DOMAINS)
+
+
+class _Entry(NamedTuple):
+    url: str
+    valid: bool
+    expires_at: float
+    hits: int
+
+
+class URLValidator:
+    """TTL'd, size-bounded cache of URL accessibility checks with a bulk async API."""
+
+    def __init__(self, max_entries: int = URL_VALIDATION_CACHE_SIZE, ttl: float = URL_VALIDATION_TTL,
+                 negative_ttl: float = URL_VALIDATION_NEGATIVE_TTL, concurrency: int = URL_VALIDATION_CONCURRENCY):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.concurrency = concurrency
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.checks = 0
+        self.evictions = 0
+        self.revalidated = 0
+        self._sweep_thread: Optional[threading.Thread] = None
+        self._sweep_stop = threading.Event()
+
+    # ---- cache ----
+
+    def cached(self, url: str) -> Optional[bool]:
+        """The cached result for ``url`` if it has not expired, else None."""
+        key = normalize_url(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.time():
+                self.misses += 1
+                return None
+            self._entries[key] = entry._replace(hits=entry.hits + 1)
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.valid
+
+    def store(self, url: str, valid: bool):
+        key = normalize_url(url)
+        ttl = self.ttl if valid else self.negative_ttl
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            hits = previous.hits if previous is not None else 0
+            self._entries[key] = _Entry(url, valid, time.time() + ttl, hits)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # ---- checks ----
+
+    async def check(self, url: str, timeout: float = 5) -> Optional[bool]:
+        """
+        HEAD ``url`` and decide whether it is accessible.
+
+        Returns:
+            True/False, or None when the host's circuit breaker is open (the
+            answer is a guess and must not be cached)
+        """
+        trusted = is_trusted_url(url)
+        self.checks += 1
+        try:
+            response = await head(url, timeout=TRUSTED_TIMEOUT if trusted else timeout)
+        except CircuitOpenError:
+            return None
+        except Exception as e:
+            logger.debug(f"URL validation failed for {url}: {e}")
+            return trusted  # Assume trusted domains are good if the check fails
+
+        if response.status >= 400:
+            return False
+        if trusted:
+            return True
+        # Redirects to error pages (look at the path only, not the host or port)
+        final_path = urlsplit(response.url).path.lower()
+        return 'error' not in final_path and '404' not in final_path
+
+    def _split(self, urls: Iterable[str]):
+        """Answer what the cache can; return (results, URLs that still need a check)."""
+        results = {}
+        pending = []
+        for url in urls:
+            if url in results or url in pending:
+                continue
+            if not url or not url.strip():
+                results[url] = False
+                continue
+            cached = self.cached(url)
+            if cached is None:
+                pending.append(url)
+            else:
+                results[url] = cached
+        return results, pending
+
+    async def _check_all(self, urls: List[str], timeout: float) -> Dict[str, bool]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def check_one(url):
+            async with semaphore:
+                return await self.check(url, timeout)
+
+        results = {}
+        outcomes = await asyncio.gather(*(check_one(url) for url in urls))
+        for url, valid in zip(urls, outcomes):
+            if valid is None:
+                # Breaker open: answer as if the check had failed, but don't remember it
+                results[url] = is_trusted_url(url)
+            else:
+                self.store(url, valid)
+                results[url] = valid
+        return results
+
+    async def validate_many_async(self, urls: Iterable[str], timeout: float = 5) -> Dict[str, bool]:
+        """
+        Validate URLs concurrently, answering from the cache where possible.
+
+        Args:
+            urls: URLs to validate (duplicates are checked once)
+            timeout: Per-request timeout for untrusted hosts
+
+        Returns:
+            Mapping of each input URL to whether it is accessible
+        """
+        results, pending = self._split(urls)
+        if pending:
+            results.update(await self._check_all(pending, timeout))
+        return results
+
+    def validate_many(self, urls: Iterable[str], timeout: float = 5) -> Dict[str, bool]:
+        """Blocking version of ``validate_many_async`` for synchronous callers."""
+        results, pending = self._split(urls)
+        if pending:
+            # Only hop to the scraper loop when something actually needs a request
+            results.update(run_sync(self._check_all(pending, timeout)))
+        return results
+
+    def validate(self, url: str, timeout: float = 5) -> bool:
+        return self.validate_many([url], timeout).get(url, False)
+
+    # ---- background re-validation ----
+
+    def hot_urls(self, horizon: float) -> List[str]:
+        """Frequently requested URLs whose results expire within ``horizon`` seconds."""
+        deadline = time.time() + horizon
+        with self._lock:
+            return [entry.url for entry in self._entries.values()
+                    if entry.hits >= HOT_MIN_HITS and entry.expires_at <= deadline]
+
+    async def revalidate_hot_async(self, horizon: float) -> int:
+        """Re-check hot URLs that are about to expire; returns how many were refreshed."""
+        urls = self.hot_urls(horizon)
+        if not urls:
+            return 0
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def refresh(url):
+            async with semaphore:
+                valid = await self.check(url)
+            if valid is not None:
+                self.store(url, valid)
+                return 1
+            return 0
+
+        refreshed = sum(await asyncio.gather(*(refresh(url) for url in urls)))
+        self.revalidated += refreshed
+        return refreshed
+
+    def start_sweep(self, interval: float = URL_VALIDATION_SWEEP_INTERVAL):
+        """Re-validate hot URLs every ``interval`` seconds on a daemon thread."""
+        if interval <= 0 or (self._sweep_thread is not None and self._sweep_thread.is_alive()):
+            return
+        self._sweep_stop.clear()
+
+        def sweep():
+            while not self._sweep_stop.wait(interval):
+                try:
+                    refreshed = run_sync(self.revalidate_hot_async(horizon=interval * 2))
+                    if refreshed:
+                        logger.debug(f"Re-validated {refreshed} hot URLs")
+                except Exception as e:
+                    logger.warning(f"URL re-validation sweep failed: {e}")
+
+        self._sweep_thread = threading.Thread(target=sweep, name="url-revalidation", daemon=True)
+        self._sweep_thread.start()
+
+    def stop_sweep(self):
+        self._sweep_stop.set()
+        self._sweep_thread = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries = len(self._entries)
+            negative = sum(1 for entry in self._entries.values() if not entry.valid)
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "negative_entries": negative,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "checks": self.checks,
+            "evictions": self.evictions,
+            "revalidated": self.revalidated,
+            "sweep_running": self._sweep_thread is not None and self._sweep_thread.is_alive(),
+        }
+
+
+# Global validator shared by every request
+url_validator = URLValidator()
+
+
+def validate_urls(urls: Iterable[str], timeout: float = 5) -> Dict[str, bool]:
+    return url_validator.validate_many(urls, timeout)
+
+
+def get_url_validation_stats() -> Dict:
+    return url_validator.stats()
@@ -0,0 +1,432 @@
+"""
+User × Skill Matrix
+===================
+
+In-memory collaborative-filtering model: a sparse (CSR) matrix of every
+user's skill progress, with values in [0, 1].
+
+- It is built from a single bulk ``skill_progress`` query, with row norms
+  precomputed. A user's cosine similarity to everyone is one sparse
+  matrix-vector product, followed by an ``argpartition`` for the top-k.
+- It is kept current incrementally. Committed ``SkillProgress`` inserts,
+  updates and deletes (from any session, via the hooks installed by
+  ``register_user_skill_matrix_hooks``) replace a single user's row.
+  - Changed rows live in a small override table. Their CSR norm is zeroed,
+    so the base product ignores them.
+  - Once there are ``compact_threshold`` overrides, they are merged back
+    into a new CSR matrix in memory.
+- Rows changed by other workers are picked up every CF_MATRIX_SYNC_SECONDS
+  with one query on ``skill_progress.last_updated`` past a watermark.
+- ``save()`` / ``load()`` snapshot the compacted model together with its
+  watermark. A restarted worker restores the snapshot and catches up,
+  instead of rebuilding from the whole table.
+- A full rebuild (which also drops rows deleted elsewhere) happens every
+  CF_MATRIX_TTL_SECONDS.
+
+Configuration (environment):
+    CF_MATRIX_TTL_SECONDS           full rebuild interval
+    CF_MATRIX_SYNC_SECONDS          catch-up interval for other workers' writes
+    CF_MATRIX_COMPACT_THRESHOLD     changed rows kept before compaction
+    CF_MATRIX_SNAPSHOT_PATH         snapshot file (default: next to the SQLite database)
+    CF_MATRIX_SAVE_INTERVAL         minimum seconds between automatic snapshots
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from models.models import SkillProgress
+
+logger = logging.getLogger(__name__)
+
+
+def default_snapshot_path() -> str:
+    """``<database>.cf_matrix.npz`` for SQLite, otherwise backend/data/cf_matrix.npz."""
+    database_url = os.environ.get("DATABASE_URL", "sqlite:///./skillsprint.db")
+    if database_url.startswith("sqlite:///") and ":memory:" not in database_url:
+        database_path = os.path.abspath(database_url[len("sqlite:///"):])
+        return os.path.splitext(database_path)[0] + ".cf_matrix.npz"
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cf_matrix.npz")
+
+
+CF_MATRIX_TTL_SECONDS = int(os.environ.get("CF_MATRIX_TTL_SECONDS", str(6 * 3600)))
+CF_MATRIX_SYNC_SECONDS = int(os.environ.get("CF_MATRIX_SYNC_SECONDS", "30"))
+CF_MATRIX_COMPACT_THRESHOLD = int(os.environ.get("CF_MATRIX_COMPACT_THRESHOLD", "512"))
+CF_MATRIX_SNAPSHOT_PATH = os.environ.get("CF_MATRIX_SNAPSHOT_PATH") or default_snapshot_path()
+CF_MATRIX_SAVE_INTERVAL = float(os.environ.get("CF_MATRIX_SAVE_INTERVAL", "300"))
+
+
+def _progress_value(percentage) -> float:
+    return (percentage or 0.0) / 100.0
+
+
+class UserSkillMatrix:
+    """Sparse user × skill progress matrix with cached row norms and incremental row updates."""
+
+    def __init__(self, ttl_seconds: int = CF_MATRIX_TTL_SECONDS,
+                 sync_seconds: int = CF_MATRIX_SYNC_SECONDS,
+                 compact_threshold: int = CF_MATRIX_COMPACT_THRESHOLD,
+                 snapshot_path: Optional[str] = CF_MATRIX_SNAPSHOT_PATH,
+                 save_interval: float = CF_MATRIX_SAVE_INTERVAL):
+        self.ttl_seconds = ttl_seconds
+        self.sync_seconds = sync_seconds
+        self.compact_threshold = compact_threshold
+        self.snapshot_path = snapshot_path
+        self.save_interval = save_interval
+        self.matrix: Optional[sparse.csr_matrix] = None
+        self.row_norms = np.zeros(0, dtype=np.float32)
+        self.user_ids = np.zeros(0, dtype=np.int64)
+        self.skill_ids = np.zeros(0, dtype=np.int64)
+        self.user_rows: Dict[int, int] = {}
+        self.skill_columns: Dict[int, int] = {}
+        # Rows changed since the last compaction: user_id -> {skill_id: value}
+        self.overrides: Dict[int, Dict[int, float]] = {}
+        self.watermark: Optional[datetime] = None
+        self.built_at = 0.0
+        self.synced_at = 0.0
+        self.build_seconds = 0.0
+        self.builds = 0
+        self.restores = 0
+        self.row_updates = 0
+        self.compactions = 0
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._lock = threading.RLock()
+
+    # ---- construction ----
+
+    def _install(self, matrix: sparse.csr_matrix, user_ids: np.ndarray, skill_ids: np.ndarray):
+        """Swap in a compacted matrix (caller holds the lock)."""
+        matrix.sum_duplicates()
+        self.matrix = matrix
+        self.row_norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()).astype(np.float32)
+        self.user_ids = np.asarray(user_ids, dtype=np.int64)
+        self.skill_ids = np.asarray(skill_ids, dtype=np.int64)
+        self.user_rows = {int(user_id): row for row, user_id in enumerate(self.user_ids)}
+        self.skill_columns = {int(skill_id): column for column, skill_id in enumerate(self.skill_ids)}
+        self.overrides = {}
+
+    @staticmethod
+    def _from_cells(cells: Dict[Tuple[int, int], float]):
+        user_rows: Dict[int, int] = {}
+        skill_columns: Dict[int, int] = {}
+        rows = np.empty(len(cells), dtype=np.int32)
+        columns = np.empty(len(cells), dtype=np.int32)
+        values = np.empty(len(cells), dtype=np.float32)
+        for i, ((user_id, skill_id), value) in enumerate(cells.items()):
+            rows[i] = user_rows.setdefault(user_id, len(user_rows))
+            columns[i] = skill_columns.setdefault(skill_id, len(skill_columns))
+            values[i] = value
+        matrix = sparse.csr_matrix((values, (rows, columns)), shape=(len(user_rows), len(skill_columns)))
+        return matrix, np.fromiter(user_rows, dtype=np.int64), np.fromiter(skill_columns, dtype=np.int64)
+
+    def build(self, db: Session):
+        """(Re)build the matrix from one query over ``skill_progress``."""
+        started = time.perf_counter()
+        cells = {}
+        watermark = None
+        for user_id, skill_id, percentage, updated in db.query(
+            SkillProgress.user_id, SkillProgress.skill_id, SkillProgress.progress_percentage,
+            SkillProgress.last_updated
+        ).yield_per(10000):
+            if user_id is not None and skill_id is not None:
+                cells[(user_id, skill_id)] = _progress_value(percentage)
+            if updated is not None and (watermark is None or updated > watermark):
+                watermark = updated
+
+        with self._lock:
+            self._install(*self._from_cells(cells))
+            self.watermark = watermark
+            self.built_at = self.synced_at = time.monotonic()
+            self.build_seconds = round(time.perf_counter() - started, 4)
+            self.builds += 1
+            self._dirty = True
+        logger.info(f"Built user×skill matrix: {self.matrix.shape[0]} users, {self.matrix.shape[1]} skills, "
+                    f"{self.matrix.nnz} entries in {self.build_seconds}s")
+
+    def compact(self):
+        """Merge the changed rows back into a fresh CSR matrix (no database access)."""
+        with self._lock:
+            if not self.overrides or self.matrix is None:
+                return
+            coo = self.matrix.tocoo()
+            keep = ~np.isin(self.user_ids[coo.row], np.fromiter(self.overrides, dtype=np.int64))
+            cells = dict(zip(zip(self.user_ids[coo.row[keep]].tolist(), self.skill_ids[coo.col[keep]].tolist()),
+                             coo.data[keep].tolist()))
+            for user_id, row in self.overrides.items():
+                cells.update(((user_id, skill_id), value) for skill_id, value in row.items())
+            self._install(*self._from_cells(cells))
+            self.compactions += 1
+
+    # ---- incremental updates ----
+
+    def row(self, user_id: int) -> Dict[int, float]:
+        """Current ``{skill_id: value}`` of a user."""
+        with self._lock:
+            if user_id in self.overrides:
+                return dict(self.overrides[user_id])
+            row = self.user_rows.get(user_id)
+            if row is None or self.matrix is None:
+                return {}
+            start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+            return {int(self.skill_ids[column]): float(value)
+                    for column, value in zip(self.matrix.indices[start:end], self.matrix.data[start:end])}
+
+    def set_row(self, user_id: int, values: Dict[int, float]):
+        """Replace one user's row; only that row and its norm change."""
+        with self._lock:
+            if self.matrix is None:
+                return
+            self.overrides[user_id] = {skill_id: value for skill_id, value in values.items() if value}
+            row = self.user_rows.get(user_id)
+            if row is not None:
+                self.row_norms[row] = 0.0  # the override replaces the CSR row
+            self.row_updates += 1
+            self._dirty = True
+            if len(self.overrides) >= self.compact_threshold:
+                self.compact()
+
+    def apply_changes(self, changes: List[Tuple[int, int, Optional[float]]]):
+        """Apply committed ``(user_id, skill_id, progress_percentage or None if deleted)`` changes."""
+        by_user: Dict[int, List[Tuple[int, Optional[float]]]] = {}
+        for user_id, skill_id, percentage in changes:
+            if user_id is not None and skill_id is not None:
+                by_user.setdefault(user_id, []).append((skill_id, percentage))
+        with self._lock:
+            if self.matrix is None:
+                return
+            for user_id, cells in by_user.items():
+                row = self.row(user_id)
+                for skill_id, percentage in cells:
+                    if percentage is None:
+                        row.pop(skill_id, None)
+                    else:
+                        row[skill_id] = _progress_value(percentage)
+                self.set_row(user_id, row)
+
+    def sync(self, db: Session) -> int:
+        """Reload the rows of users whose progress changed since the watermark (one query)."""
+        query = db.query(SkillProgress.user_id, SkillProgress.skill_id, SkillProgress.progress_percentage,
+                         SkillProgress.last_updated)
+        if self.watermark is not None:
+            # One second of overlap: SQLite timestamps have second precision and re-applying a row is harmless
+            since = self.watermark - timedelta(seconds=1)
+            changed_users = db.query(SkillProgress.user_id).filter(SkillProgress.last_updated >= since)
+            query = query.filter(SkillProgress.user_id.in_(changed_users.scalar_subquery()))
+        rows: Dict[int, Dict[int, float]] = {}
+        watermark = self.watermark
+        for user_id, skill_id, percentage, updated in query:
+            rows.setdefault(user_id, {})[skill_id] = _progress_value(percentage)
+            if updated is not None and (watermark is None or updated > watermark):
+                watermark = updated
+        with self._lock:
+            for user_id, values in rows.items():
+                self.set_row(user_id, values)
+            self.watermark = watermark
+            self.synced_at = time.monotonic()
+        return len(rows)
+
+    def ensure_fresh(self, db: Session):
+        """Restore or build on first use, then keep up with other workers' writes."""
+        now = time.monotonic()
+        if self.matrix is None:
+            if not self.load():
+                self.build(db)
+                return
+            self.sync(db)
+        elif now - self.built_at > self.ttl_seconds:
+            self.build(db)
+        elif now - self.synced_at > self.sync_seconds:
+            self.sync(db)
+        self.maybe_save()
+
+    # ---- similarity ----
+
+    def similar_users(self, user_id: int, progress: Dict[int, float], k: int = 10,
+                      threshold: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Users most similar to a progress vector by cosine similarity.
+
+        Args:
+            user_id: The target user (excluded from the results)
+            progress: Target user's ``{skill_id: progress 0..1}``
+            k: Maximum number of users returned
+            threshold: Only users strictly above this similarity are returned
+
+        Returns:
+            ``[(user_id, similarity)]`` ordered by similarity, highest first
+        """
+        with self._lock:
+            matrix, row_norms, user_ids = self.matrix, self.row_norms.copy(), self.user_ids
+            skill_columns = self.skill_columns
+            overrides = {other: dict(row) for other, row in self.overrides.items() if other != user_id}
+            own_row = self.user_rows.get(user_id)
+        if matrix is None:
+            return []
+
+        # Norm over the full vector, including skills nobody else has (yet)
+        target_norm = float(np.linalg.norm(list(progress.values()))) if progress else 0.0
+        if target_norm == 0:
+            return []
+
+        scored_ids = []
+        scored_values = []
+        if matrix.shape[0]:
+            target = np.zeros(matrix.shape[1], dtype=np.float32)
+            for skill_id, value in progress.items():
+                if skill_id in skill_columns:
+                    target[skill_columns[skill_id]] = value
+            dots = matrix @ target
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores = np.where(row_norms > 0, dots / (row_norms * target_norm), 0.0)
+            if own_row is not None:
+                scores[own_row] = 0.0
+            candidates = np.flatnonzero(scores > threshold)
+            scored_ids.append(user_ids[candidates])
+            scored_values.append(scores[candidates])
+
+        # Rows changed since the last compaction
+        for other, row in overrides.items():
+            norm = np.linalg.norm(list(row.values())) if row else 0.0
+            if norm:
+                score = sum(value * row.get(skill_id, 0.0) for skill_id, value in progress.items()) / (norm * target_norm)
+                if score > threshold:
+                    scored_ids.append(np.array([other], dtype=np.int64))
+                    scored_values.append(np.array([score]))
+
+        if not scored_ids:
+            return []
+        ids = np.concatenate(scored_ids)
+        scores = np.concatenate(scored_values)
+        if len(scores) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            ids, scores = ids[top], scores[top]
+        order = np.argsort(-scores, kind="stable")
+        return [(int(ids[i]), float(scores[i])) for i in order]
+
+    # ---- persistence ----
+
+    def save(self, path: str = None):
+        path = path or self.snapshot_path
+        if not path:
+            return
+        with self._lock:
+            if self.matrix is None:
+                return
+            self.compact()
+            matrix = self.matrix
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.savez(f, data=matrix.data, indices=matrix.indices, indptr=matrix.indptr,
+                             shape=np.array(matrix.shape), user_ids=self.user_ids, skill_ids=self.skill_ids,
+                             watermark=np.array(self.watermark.isoformat() if self.watermark else ""))
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not save user×skill matrix to {path}: {e}")
+                return
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+    def maybe_save(self):
+        if self._dirty and time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def save_if_dirty(self):
+        if self._dirty:
+            self.save()
+
+    def load(self, path: str = None) -> bool:
+        """Restore a snapshot; ``sync()`` afterwards picks up what changed since it was taken."""
+        path = path or self.snapshot_path
+        if not path:
+            return False
+        try:
+            with np.load(path) as data:
+                matrix = sparse.csr_matrix((data["data"], data["indices"], data["indptr"]),
+                                           shape=tuple(data["shape"]))
+                user_ids, skill_ids = data["user_ids"], data["skill_ids"]
+                watermark = str(data["watermark"])
+        except (OSError, KeyError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Could not load user×skill matrix from {path}: {e}")
+            return False
+        with self._lock:
+            self._install(matrix, user_ids, skill_ids)
+            self.watermark = datetime.fromisoformat(watermark) if watermark else None
+            # A snapshot is as old as a rebuild; a full rebuild still follows after the TTL
+            self.built_at = self.synced_at = time.monotonic()
+            self.restores += 1
+            self._dirty = False
+            self._last_save = time.monotonic()
+        return True
+
+    def stats(self) -> Dict:
+        return {
+            "users": int(self.matrix.shape[0]) + sum(1 for u in self.overrides if u not in self.user_rows)
+            if self.matrix is not None else 0,
+            "skills": int(self.matrix.shape[1]) if self.matrix is not None else 0,
+            "entries": int(self.matrix.nnz) if self.matrix is not None else 0,
+            "pending_rows": len(self.overrides),
+            "builds": self.builds,
+            "restores": self.restores,
+            "row_updates": self.row_updates,
+            "compactions": self.compactions,
+            "build_seconds": self.build_seconds,
+            "age_seconds": round(time.monotonic() - self.built_at, 1) if self.matrix is not None else None,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+        }
+
+
+# Global instance
+user_skill_matrix = UserSkillMatrix()
+
+
+# ---- SQLAlchemy hooks ----
+
+_PENDING_KEY = "user_skill_matrix_changes"
+
+
+def _collect_changes(session, flush_context):
+    # session.new/dirty/deleted still describe what this flush wrote
+    changes = session.info.setdefault(_PENDING_KEY, [])
+    for obj in session.new:
+        if isinstance(obj, SkillProgress):
+            changes.append((obj.user_id, obj.skill_id, obj.progress_percentage))
+    for obj in session.dirty:
+        if isinstance(obj, SkillProgress) and session.is_modified(obj):
+            changes.append((obj.user_id, obj.skill_id, obj.progress_percentage))
+    for obj in session.deleted:
+        if isinstance(obj, SkillProgress):
+            changes.append((obj.user_id, obj.skill_id, None))
+
+
+def _apply_committed_changes(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    if changes:
+        user_skill_matrix.apply_changes(changes)
+
+
+def _discard_changes(session, previous_transaction=None):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_user_skill_matrix_hooks():
+    """Keep the global matrix current with every committed SkillProgress change."""
+    if not event.contains(Session, "after_flush", _collect_changes):
+        event.listen(Session, "after_flush", _collect_changes)
+        event.listen(Session, "after_commit", _apply_committed_changes)
+        event.listen(Session, "after_soft_rollback", _discard_changes)
+
+
+def get_user_skill_matrix_stats() -> Dict:
+    return user_skill_matrix.stats()
@@ -0,0 +1,188 @@
+"""
+Embedding Micro-Batcher
+=======================
+
+Concurrent requests that each need one embedding are grouped into a single
+``encode`` call. Sentence encoders are much faster per text on a batch than
+on one string at a time.
+
+- ``await embedding_batcher.embed(text)`` queues the text on the running
+  event loop and waits for the result.
+- A collector task takes the first queued text. It then waits up to
+  ``max_wait_ms`` for more, stopping early at ``max_batch_size`` texts.
+- The batch is encoded with ``EmbeddingModelProvider.embed`` (so the query
+  embedding cache still applies) on a dedicated worker thread, keeping the
+  event loop free. Each caller's future is then resolved.
+- While a batch is being encoded, new requests keep queuing, so batches
+  grow on their own under load.
+
+Configuration (environment):
+    EMBEDDING_BATCH_MAX_SIZE     texts per encode call (default: 32)
+    EMBEDDING_BATCH_MAX_WAIT_MS  how long the first text waits for company (default: 5)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ml.embeddings import EmbeddingModelProvider, embedding_provider
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BATCH_MAX_SIZE = int(os.environ.get("EMBEDDING_BATCH_MAX_SIZE", "32"))
+EMBEDDING_BATCH_MAX_WAIT_MS = float(os.environ.get("EMBEDDING_BATCH_MAX_WAIT_MS", "5"))
+
+# Number of recent batches kept for the percentile metrics
+METRICS_WINDOW = 1000
+
+
+def _percentile(values, q: float) -> float:
+    return round(float(np.percentile(values, q)), 3) if values else 0.0
+
+
+class EmbeddingBatcher:
+    """Collects single-text embedding requests into batched encode calls."""
+
+    def __init__(self, provider: EmbeddingModelProvider = None,
+                 max_batch_size: int = EMBEDDING_BATCH_MAX_SIZE,
+                 max_wait_ms: float = EMBEDDING_BATCH_MAX_WAIT_MS):
+        self.provider = provider or embedding_provider
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Metrics
+        self.requests = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.max_queue_depth = 0
+        self._batch_sizes = deque(maxlen=METRICS_WINDOW)
+        self._wait_ms = deque(maxlen=METRICS_WINDOW)
+        self._encode_ms = deque(maxlen=METRICS_WINDOW)
+
+    def _worker(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding-batcher")
+            return self._executor
+
+    def _ensure_collector(self) -> asyncio.AbstractEventLoop:
+        """Start the collector on the running loop (again if the loop has changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._collector is None or self._collector.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._collector = loop.create_task(self._collect())
+        return loop
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Embedding of one text, encoded together with other concurrent requests.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            float32 array of shape (dim,)
+
+        Raises:
+            RuntimeError: If the embedding model is unavailable
+        """
+        loop = self._ensure_collector()
+        future = loop.create_future()
+        self._queue.put_nowait((text, future, time.perf_counter()))
+        self.requests += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return await future
+
+    async def embed_many(self, texts: Sequence[str]) -> List[np.ndarray]:
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._encode_batch(loop, batch)
+
+    async def _encode_batch(self, loop: asyncio.AbstractEventLoop, batch):
+        # Callers that gave up (cancelled) don't need encoding
+        batch = [item for item in batch if not item[1].done()]
+        if not batch:
+            return
+        dispatched = time.perf_counter()
+        self._wait_ms.extend((dispatched - queued_at) * 1000 for _, _, queued_at in batch)
+        self._batch_sizes.append(len(batch))
+        self.batches += 1
+        try:
+            vectors = await loop.run_in_executor(self._worker(), self.provider.embed, [text for text, _, _ in batch])
+        except Exception as e:
+            self.failed_batches += 1
+            logger.warning(f"Embedding batch of {len(batch)} failed: {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._encode_ms.append((time.perf_counter() - dispatched) * 1000)
+        for (_, future, _), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+    def close(self):
+        """Stop the collector and the worker thread (pending callers are cancelled)."""
+        if self._collector is not None and not self._collector.done():
+            self._collector.cancel()
+        self._collector = None
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def stats(self) -> Dict:
+        sizes = list(self._batch_sizes)
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "requests": self.requests,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "avg_batch_size": round(sum(sizes) / len(sizes), 2) if sizes else 0.0,
+            "largest_batch": max(sizes) if sizes else 0,
+            "wait_ms_p50": _percentile(self._wait_ms, 50),
+            "wait_ms_p95": _percentile(self._wait_ms, 95),
+            "encode_ms_p50": _percentile(self._encode_ms, 50),
+            "encode_ms_p95": _percentile(self._encode_ms, 95),
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+# Global batcher in front of the shared embedding provider
+embedding_batcher = EmbeddingBatcher()
+
+
+def get_embedding_batcher_stats() -> Dict:
+    return embedding_batcher.stats()
@@ -0,0 +1,293 @@
+"""
+Query Embedding Cache
+=====================
+
+Remembers embeddings of short texts (skill names typed by users) so the same
+strings are not re-encoded on every request.
+
+- The key is the model id plus the normalized text. Whitespace is always
+  collapsed. Case is folded only for models whose tokenizer is uncased
+  (UNCASED_MODELS, e.g. the default MiniLM), where it never changes the
+  embedding; cased models keep "Go" and "go" apart.
+- In front sits a per-process LRU bounded by a byte budget.
+- Behind it is a SQLite store (WAL mode) shared by every worker, with its own
+  byte budget. The least recently used rows are pruned first. A hit only
+  rewrites a row's ``last_used`` once it is LAST_USED_RESOLUTION seconds old,
+  so reads rarely take the store's write lock.
+
+Any code path that embeds text can use it through ``EmbeddingModelProvider.embed``.
+
+Configuration (environment):
+    EMBEDDING_QUERY_CACHE_ENABLED       "false" disables the cache
+    EMBEDDING_QUERY_CACHE_PATH          SQLite file (default: backend/data/embeddings/query_embeddings.sqlite3)
+    EMBEDDING_QUERY_CACHE_MEMORY_BYTES  in-process LRU budget
+    EMBEDDING_QUERY_CACHE_DISK_BYTES    on-disk store budget
+    EMBEDDING_UNCASED_MODELS            extra comma-separated model names whose tokenizer is uncased
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_QUERY_CACHE_ENABLED = os.environ.get("EMBEDDING_QUERY_CACHE_ENABLED", "true").lower() != "false"
+EMBEDDING_QUERY_CACHE_PATH = os.environ.get(
+    "EMBEDDING_QUERY_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                 "backend", "data", "embeddings", "query_embeddings.sqlite3")
+)
+EMBEDDING_QUERY_CACHE_MEMORY_BYTES = int(os.environ.get("EMBEDDING_QUERY_CACHE_MEMORY_BYTES", str(16 * 1024 * 1024)))
+EMBEDDING_QUERY_CACHE_DISK_BYTES = int(os.environ.get("EMBEDDING_QUERY_CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
+
+# Check the disk budget every this many stored rows
+PRUNE_EVERY = 200
+
+# Seconds a disk row's last_used may lag behind its latest hit (pruning is LRU at this resolution)
+LAST_USED_RESOLUTION = 3600
+
+# Sentence encoders whose tokenizer lower-cases its input
+UNCASED_MODELS = {
+    "all-MiniLM-L6-v2",
+    "all-MiniLM-L12-v2",
+    "paraphrase-MiniLM-L3-v2",
+    "paraphrase-MiniLM-L6-v2",
+    "multi-qa-MiniLM-L6-cos-v1",
+}
+UNCASED_MODELS.update(name.strip() for name in os.environ.get("EMBEDDING_UNCASED_MODELS", "").split(",")
+                      if name.strip())
+
+
+def is_uncased_model(model: str) -> bool:
+    """Whether ``model`` (a model id, optionally ``org/``-prefixed or ``@backend``-suffixed) ignores case."""
+    return model.split("@", 1)[0].rsplit("/", 1)[-1] in UNCASED_MODELS
+
+
+def normalize_text(text: str, uncased: bool = False) -> str:
+    """Collapse whitespace, and fold case if the model cannot see it."""
+    return " ".join((text.lower() if uncased else text).split())
+
+
+class EmbeddingCache:
+    """Two-level (memory LRU + shared SQLite) cache of text embeddings."""
+
+    def __init__(self, path: str = EMBEDDING_QUERY_CACHE_PATH,
+                 memory_bytes: int = EMBEDDING_QUERY_CACHE_MEMORY_BYTES,
+                 disk_bytes: int = EMBEDDING_QUERY_CACHE_DISK_BYTES):
+        self.path = path
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._memory: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._disk_enabled = bool(path)
+        self._stored_since_prune = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self.last_used_updates = 0
+
+    # ---- disk store ----
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """One connection per thread, opened on first use (None once the store has failed)."""
+        if not self._disk_enabled:
+            return None
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS query_embeddings (
+                        model TEXT NOT NULL,
+                        text_key TEXT NOT NULL,
+                        vector BLOB NOT NULL,
+                        last_used REAL NOT NULL,
+                        PRIMARY KEY (model, text_key)
+                    )
+                    """
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_query_embeddings_last_used ON query_embeddings (last_used)"
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache store disabled, could not open {self.path}: {e}")
+                self._disk_enabled = False
+                return None
+            self._local.connection = connection
+        return connection
+
+    def _disk_get(self, model: str, keys: List[str]) -> Dict[str, np.ndarray]:
+        connection = self._connect()
+        if connection is None or not keys:
+            return {}
+        found = {}
+        now = time.time()
+        touched = []
+        try:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = connection.execute(
+                    f"SELECT text_key, vector, last_used FROM query_embeddings WHERE model = ? "
+                    f"AND text_key IN ({','.join('?' * len(chunk))})",
+                    [model, *chunk]
+                ).fetchall()
+                for key, blob, last_used in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+                    if now - last_used >= LAST_USED_RESOLUTION:
+                        touched.append((now, model, key))
+            if touched:
+                connection.executemany(
+                    "UPDATE query_embeddings SET last_used = ? WHERE model = ? AND text_key = ?", touched
+                )
+                self.last_used_updates += len(touched)
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache read failed: {e}")
+        return found
+
+    def _disk_put(self, model: str, vectors: Dict[str, np.ndarray]):
+        connection = self._connect()
+        if connection is None or not vectors:
+            return
+        now = time.time()
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO query_embeddings (model, text_key, vector, last_used) VALUES (?, ?, ?, ?)",
+                [(model, key, vector.astype(np.float32).tobytes(), now) for key, vector in vectors.items()]
+            )
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache write failed: {e}")
+            return
+        self._stored_since_prune += len(vectors)
+        if self._stored_since_prune >= PRUNE_EVERY:
+            self._stored_since_prune = 0
+            self.prune_disk()
+
+    def prune_disk(self) -> int:
+        """Delete least recently used rows until the store fits ``disk_bytes``."""
+        connection = self._connect()
+        if connection is None:
+            return 0
+        try:
+            used = connection.execute("SELECT COALESCE(SUM(LENGTH(vector)), 0) FROM query_embeddings").fetchone()[0]
+            if used <= self.disk_bytes:
+                return 0
+            deleted = 0
+            rows = connection.execute(
+                "SELECT rowid, LENGTH(vector) FROM query_embeddings ORDER BY last_used"
+            ).fetchall()
+            doomed = []
+            for rowid, size in rows:
+                if used <= self.disk_bytes:
+                    break
+                doomed.append((rowid,))
+                used -= size
+                deleted += 1
+            connection.executemany("DELETE FROM query_embeddings WHERE rowid = ?", doomed)
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache prune failed: {e}")
+            return 0
+        self.disk_evictions += deleted
+        return deleted
+
+    # ---- memory LRU ----
+
+    def _remember(self, key: tuple, vector: np.ndarray):
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_used -= previous.nbytes
+            self._memory[key] = vector
+            self._memory_used += vector.nbytes
+            while self._memory_used > self.memory_bytes and self._memory:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_used -= evicted.nbytes
+                self.evictions += 1
+
+    # ---- public API ----
+
+    def get_many(self, model: str, texts: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Cached embeddings for ``texts`` (keyed by the original text); missing ones are absent."""
+        found = {}
+        to_disk: Dict[str, List[str]] = {}
+        uncased = is_uncased_model(model)
+        with self._lock:
+            for text in texts:
+                key = normalize_text(text, uncased)
+                vector = self._memory.get((model, key))
+                if vector is not None:
+                    self._memory.move_to_end((model, key))
+                    self.memory_hits += 1
+                    found[text] = vector
+                else:
+                    to_disk.setdefault(key, []).append(text)
+
+        for key, vector in self._disk_get(model, list(to_disk)).items():
+            vector = vector.copy()
+            self._remember((model, key), vector)
+            for text in to_disk.pop(key):
+                found[text] = vector
+                self.disk_hits += 1
+        self.misses += sum(len(texts) for texts in to_disk.values())
+        return found
+
+    def put_many(self, model: str, vectors: Dict[str, np.ndarray]):
+        """Store embeddings keyed by text in memory and in the shared store."""
+        normalized = {}
+        uncased = is_uncased_model(model)
+        for text, vector in vectors.items():
+            vector = np.asarray(vector, dtype=np.float32)
+            key = normalize_text(text, uncased)
+            self._remember((model, key), vector)
+            normalized[key] = vector
+        self._disk_put(model, normalized)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_used = 0
+        connection = self._connect()
+        if connection is not None:
+            connection.execute("DELETE FROM query_embeddings")
+
+    def stats(self) -> Dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        stats = {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_used,
+            "memory_budget_bytes": self.memory_bytes,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "disk_evictions": self.disk_evictions,
+            "last_used_updates": self.last_used_updates,
+            "disk_budget_bytes": self.disk_bytes,
+        }
+        connection = self._connect()
+        if connection is not None:
+            try:
+                stats["disk_entries"], stats["disk_bytes"] = connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM query_embeddings"
+                ).fetchone()
+            except sqlite3.Error:
+                pass
+        return stats
+
+
+def create_default_cache() -> Optional[EmbeddingCache]:
+    return EmbeddingCache() if EMBEDDING_QUERY_CACHE_ENABLED else None
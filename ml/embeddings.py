@@ -0,0 +1,292 @@
+"""
+Embedding Model Provider
+========================
+
+One lazily loaded embedding model per process, shared by the ML code.
+
+Importing this module is cheap: torch (or onnxruntime) and the model weights
+are only loaded on the first ``get_model()`` / ``encode()`` call, or when
+``warm_up()`` is called explicitly (e.g. from the API's startup hook).
+
+Two backends produce the same kind of vectors behind the same ``encode``:
+    torch  SentenceTransformer (default)
+    onnx   int8-quantized export run by onnxruntime on the CPU (``ml.onnx_encoder``),
+           much lighter on memory and latency
+Cached vectors are keyed by ``model_id`` (the model name plus the backend, if
+not torch), so the two never mix.
+
+``embed()`` goes through the query embedding cache (``ml.embedding_cache``),
+so repeated strings are encoded once across all workers.
+
+``EmbeddingMatrix`` holds the normalized float32 embeddings of a fixed list
+of names (e.g. the SKILL_HIERARCHY roots). It is computed once and persisted
+to disk under a key made of the model name plus a hash of the names, so
+matching a query is a single matrix-vector product.
+
+Configuration (environment):
+    EMBEDDING_MODEL_NAME  model to load (default: all-MiniLM-L6-v2)
+    EMBEDDING_BACKEND     torch (default) | onnx
+    EMBEDDING_CACHE_DIR   where embedding matrices are persisted (default: backend/data/embeddings)
+    EMBEDDING_PRELOAD     lazy        - load on first use (default)
+                          background  - start loading at startup without blocking it
+                          eager       - block startup until the model is loaded
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml.embedding_cache import EmbeddingCache, create_default_cache
+from ml.onnx_encoder import OnnxSentenceEncoder, onnx_installed, default_onnx_dir
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL_NAME = os.environ.get("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2")
+EMBEDDING_PRELOAD = os.environ.get("EMBEDDING_PRELOAD", "lazy").lower()
+EMBEDDING_BACKEND = os.environ.get("EMBEDDING_BACKEND", "torch").lower()
+EMBEDDING_CACHE_DIR = os.environ.get(
+    "EMBEDDING_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend", "data", "embeddings")
+)
+
+# Provider states
+NOT_LOADED = "not_loaded"
+LOADING = "loading"
+READY = "ready"
+UNAVAILABLE = "unavailable"
+
+
+def embeddings_installed(backend: str = "torch") -> bool:
+    """Whether the backend's packages are importable, without importing them (or torch)."""
+    if backend == "onnx":
+        return onnx_installed()
+    return importlib.util.find_spec("sentence_transformers") is not None
+
+
+def _load_sentence_transformer(model_name: str):
+    from sentence_transformers import SentenceTransformer
+    # This will download the model the first time it's used
+    return SentenceTransformer(model_name)
+
+
+def _load_onnx_encoder(model_name: str):
+    return OnnxSentenceEncoder.from_directory(default_onnx_dir(model_name, EMBEDDING_CACHE_DIR))
+
+
+BACKEND_LOADERS = {
+    "torch": _load_sentence_transformer,
+    "onnx": _load_onnx_encoder,
+}
+
+
+class EmbeddingModelProvider:
+    """Thread-safe lazy holder for the embedding model."""
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL_NAME, loader: Callable = None,
+                 cache: EmbeddingCache = None, backend: str = EMBEDDING_BACKEND):
+        self.model_name = model_name
+        self.backend = backend
+        self._loader = loader or BACKEND_LOADERS.get(backend)
+        self.cache = cache
+        self._model = None
+        self._lock = threading.Lock()
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        if self._loader is None:
+            self.error = f"Unknown embedding backend {backend!r}"
+            logger.warning(self.error)
+            self.state = UNAVAILABLE
+        else:
+            self.state = NOT_LOADED if (loader is not None or embeddings_installed(backend)) else UNAVAILABLE
+
+    @property
+    def model_id(self) -> str:
+        """Identifies the vectors this provider produces (cache and index key)."""
+        return self.model_name if self.backend == "torch" else f"{self.model_name}@{self.backend}"
+
+    @property
+    def available(self) -> bool:
+        """False once we know the model cannot be loaded in this process."""
+        return self.state != UNAVAILABLE
+
+    @property
+    def ready(self) -> bool:
+        return self.state == READY
+
+    def get_model(self):
+        """Return the loaded model, loading it on first use (None if unavailable)."""
+        if self._model is not None or self.state == UNAVAILABLE:
+            return self._model
+        with self._lock:
+            if self._model is None and self.state != UNAVAILABLE:
+                self.state = LOADING
+                started = time.perf_counter()
+                try:
+                    self._model = self._loader(self.model_name)
+                except Exception as e:
+                    logger.warning(f"Embedding model {self.model_name} could not be loaded: {e}")
+                    self.error = str(e)
+                    self.state = UNAVAILABLE
+                    return None
+                self.load_seconds = round(time.perf_counter() - started, 3)
+                self.state = READY
+                logger.info(f"Loaded embedding model {self.model_id} in {self.load_seconds}s")
+        return self._model
+
+    def warm_up(self, background: bool = False) -> bool:
+        """
+        Load the model now instead of on the first request.
+
+        Args:
+            background: Load on a daemon thread and return immediately
+
+        Returns:
+            True if the model is ready when this call returns
+        """
+        if background:
+            if self.state == NOT_LOADED:
+                threading.Thread(target=self.get_model, name="embedding-warm-up", daemon=True).start()
+            return self.ready
+        return self.get_model() is not None
+
+    def encode(self, texts, **kwargs):
+        """Encode text(s) with the shared model; raises RuntimeError if it is unavailable."""
+        model = self.get_model()
+        if model is None:
+            raise RuntimeError(f"Embedding model {self.model_name} is not available")
+        return model.encode(texts, **kwargs)
+
+    def embed(self, texts):
+        """
+        Encode text(s), answering repeated strings from the query embedding cache.
+
+        Args:
+            texts: A string or a list of strings
+
+        Returns:
+            float32 array of shape (dim,) for a string, (len(texts), dim) for a list
+        """
+        if self.cache is None:
+            return np.asarray(self.encode(texts if isinstance(texts, str) else list(texts)), dtype=np.float32)
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        found = self.cache.get_many(self.model_id, texts)
+        missing = list(dict.fromkeys(text for text in texts if text not in found))
+        if missing:
+            encoded = dict(zip(missing, np.asarray(self.encode(missing), dtype=np.float32)))
+            self.cache.put_many(self.model_id, encoded)
+            found.update(encoded)
+        vectors = np.stack([found[text] for text in texts])
+        return vectors[0] if single else vectors
+
+    def status(self) -> Dict:
+        return {
+            "model": self.model_name,
+            "backend": self.backend,
+            "state": self.state,
+            "ready": self.ready,
+            "load_seconds": self.load_seconds,
+            "error": self.error,
+            "query_cache": self.cache.stats() if self.cache is not None else {"enabled": False},
+        }
+
+
+def normalize_rows(vectors) -> np.ndarray:
+    """L2-normalize embeddings (1-D or 2-D) as float32 so dot products are cosine similarities."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class EmbeddingMatrix:
+    """
+    Normalized embeddings of a fixed list of names, computed once per model and name set.
+
+    The matrix is persisted as ``<cache_dir>/<prefix>-<model>-<hash>.npy``. Changing
+    the names changes the hash, so a stale matrix is never reused. Older
+    files for the same model and ``prefix`` are removed when a new one is saved.
+    """
+
+    def __init__(self, names: Sequence[str], provider: "EmbeddingModelProvider" = None,
+                 cache_dir: str = None, prefix: str = "matrix"):
+        self.names: List[str] = list(names)
+        self.provider = provider or embedding_provider
+        self.cache_dir = cache_dir or EMBEDDING_CACHE_DIR
+        self.prefix = prefix
+        self.key = self.names_hash(self.names)
+        self._matrix: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def names_hash(names: Sequence[str]) -> str:
+        return hashlib.sha256("\n".join(names).encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def path(self) -> str:
+        model_slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", self.provider.model_id)
+        return os.path.join(self.cache_dir, f"{self.prefix}-{model_slug}-{self.key}.npy")
+
+    def matrix(self) -> np.ndarray:
+        """The (len(names), dim) float32 matrix, loaded from disk or encoded on first use."""
+        if self._matrix is not None:
+            return self._matrix
+        with self._lock:
+            if self._matrix is None:
+                matrix = self._load()
+                if matrix is None:
+                    matrix = normalize_rows(self.provider.encode(self.names))
+                    self._save(matrix)
+                self._matrix = matrix
+        return self._matrix
+
+    def _load(self) -> Optional[np.ndarray]:
+        try:
+            matrix = np.load(self.path)
+        except (OSError, ValueError):
+            return None
+        if matrix.ndim != 2 or matrix.shape[0] != len(self.names):
+            return None
+        return matrix.astype(np.float32, copy=False)
+
+    def _save(self, matrix: np.ndarray):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, self.path)
+            # Drop matrices for older name sets of this model
+            stale_prefix = os.path.basename(self.path).rsplit("-", 1)[0] + "-"
+            for filename in os.listdir(self.cache_dir):
+                stale_key = filename[len(stale_prefix):-len(".npy")]
+                if filename.startswith(stale_prefix) and filename.endswith(".npy") \
+                        and len(stale_key) == len(self.key) and stale_key != self.key:
+                    os.remove(os.path.join(self.cache_dir, filename))
+        except OSError as e:
+            logger.warning(f"Could not persist embedding matrix to {self.path}: {e}")
+
+    def best_match(self, embedding) -> Tuple[str, float]:
+        """The name most similar to ``embedding`` and its cosine similarity."""
+        scores = self.matrix() @ normalize_rows(embedding)
+        best = int(np.argmax(scores))
+        return self.names[best], float(scores[best])
+
+
+# Global provider shared by every caller in the process
+embedding_provider = EmbeddingModelProvider(cache=create_default_cache())
+
+
+def preload_embedding_model(mode: str = EMBEDDING_PRELOAD) -> bool:
+    """Apply the EMBEDDING_PRELOAD policy; returns whether the model is ready."""
+    if mode == "eager":
+        return embedding_provider.warm_up()
+    if mode == "background":
+        return embedding_provider.warm_up(background=True)
+    return embedding_provider.ready
@@ -0,0 +1,123 @@
+"""
+ONNX Sentence Encoder
+=====================
+
+Runs an exported, int8-quantized ``all-MiniLM-L6-v2`` through onnxruntime on
+the CPU. Neither torch nor sentence_transformers is needed at runtime.
+
+``OnnxSentenceEncoder.encode`` returns the same vectors as
+``SentenceTransformer.encode`` for MiniLM: the token embeddings are
+mean-pooled over the attention mask, then L2-normalized. It can therefore
+stand in for the torch model behind ``EmbeddingModelProvider``
+(EMBEDDING_BACKEND=onnx).
+
+The model directory is produced by ``backend/scripts/export_onnx_embedding_model.py``:
+    model.int8.onnx   quantized transformer (inputs: input_ids, attention_mask[, token_type_ids])
+    tokenizer.json    HuggingFace fast tokenizer
+
+Configuration (environment):
+    EMBEDDING_ONNX_DIR      model directory (default: <EMBEDDING_CACHE_DIR>/onnx/<model name>)
+    EMBEDDING_ONNX_THREADS  intra-op threads for onnxruntime (default: 0 = onnxruntime's choice)
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ONNX_MODEL_FILENAME = "model.int8.onnx"
+ONNX_TOKENIZER_FILENAME = "tokenizer.json"
+EMBEDDING_ONNX_THREADS = int(os.environ.get("EMBEDDING_ONNX_THREADS", "0"))
+
+# all-MiniLM-L6-v2 is trained with (and truncates to) 256 word pieces
+DEFAULT_MAX_LENGTH = 256
+
+
+def onnx_installed() -> bool:
+    """Whether onnxruntime and tokenizers are importable, without importing them."""
+    return all(importlib.util.find_spec(name) is not None for name in ("onnxruntime", "tokenizers"))
+
+
+def default_onnx_dir(model_name: str, cache_dir: str) -> str:
+    return os.environ.get("EMBEDDING_ONNX_DIR") or os.path.join(cache_dir, "onnx", model_name.replace("/", "_"))
+
+
+def mean_pool(token_embeddings: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    """Average the token embeddings of real (non-padding) tokens, then L2-normalize."""
+    mask = attention_mask[..., None].astype(np.float32)
+    summed = (token_embeddings * mask).sum(axis=1)
+    pooled = summed / np.maximum(mask.sum(axis=1), 1e-9)
+    return (pooled / np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)).astype(np.float32)
+
+
+class OnnxSentenceEncoder:
+    """SentenceTransformer-compatible ``encode`` on top of an onnxruntime session."""
+
+    def __init__(self, session, tokenizer, max_length: int = DEFAULT_MAX_LENGTH):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_length = max_length
+        self.input_names = {model_input.name for model_input in session.get_inputs()}
+
+    @classmethod
+    def from_directory(cls, model_dir: str, threads: int = EMBEDDING_ONNX_THREADS) -> "OnnxSentenceEncoder":
+        model_path = os.path.join(model_dir, ONNX_MODEL_FILENAME)
+        tokenizer_path = os.path.join(model_dir, ONNX_TOKENIZER_FILENAME)
+        for path in (model_path, tokenizer_path):
+            if not os.path.exists(path):
+                raise FileNotFoundError(
+                    f"{path} not found; run backend/scripts/export_onnx_embedding_model.py first"
+                )
+
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads > 0:
+            options.intra_op_num_threads = threads
+        session = onnxruntime.InferenceSession(model_path, sess_options=options,
+                                               providers=["CPUExecutionProvider"])
+        return cls(session, Tokenizer.from_file(tokenizer_path))
+
+    def _encode_batch(self, texts: Sequence[str]) -> np.ndarray:
+        self.tokenizer.enable_truncation(max_length=self.max_length)
+        self.tokenizer.enable_padding()
+        encodings = self.tokenizer.encode_batch(list(texts))
+        feeds = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        feeds = {name: value for name, value in feeds.items() if name in self.input_names}
+        token_embeddings = self.session.run(None, feeds)[0]
+        return mean_pool(token_embeddings, feeds["attention_mask"])
+
+    def encode(self, texts, batch_size: int = 32, **kwargs) -> np.ndarray:
+        """
+        Encode text(s) into normalized sentence embeddings.
+
+        Args:
+            texts: A string or a list of strings
+            batch_size: Texts per onnxruntime call
+
+        Returns:
+            float32 array of shape (dim,) for a string, (len(texts), dim) for a list
+        """
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        # Similar lengths in a batch keep padding (and wasted work) small
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        vectors = [None] * len(texts)
+        for start in range(0, len(texts), batch_size):
+            chunk = order[start:start + batch_size]
+            for i, vector in zip(chunk, self._encode_batch([texts[i] for i in chunk])):
+                vectors[i] = vector
+        if not vectors:
+            return np.zeros((0, 0), dtype=np.float32)
+        vectors = np.stack(vectors)
+        return vectors[0] if single else vectors
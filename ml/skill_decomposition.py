@@ -1,23 +1,25 @@
+import asyncio
 import json
 import numpy as np
 import sys
 import os
 
-# Add parent directory to path to import utility functions
+# Add the project root (for ``ml``) and the backend (for ``utils``) to the path. The
+# backend's utilities must be imported as ``utils.*`` like the app does: importing them
+# as ``backend.utils.*`` would load second copies of their process-wide singletons
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from backend.utils.resource_search import get_resources_for_skill as search_resources
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend')))
+from utils.resource_search import get_resources_for_skill as search_resources
 
-# Handle potential import errors with sentence_transformers
-try:
-    from sentence_transformers import SentenceTransformer, util
-    # Initialize the SentenceTransformer model
-    # This will download the model the first time it's used
-    model = SentenceTransformer('all-MiniLM-L6-v2')
-    ML_AVAILABLE = True
-except ImportError:
+# The embedding model is loaded lazily on first use (see ml/embeddings.py), so
+# importing this module no longer pays for torch and the model weights
+from ml.embeddings import embedding_provider, EmbeddingMatrix
+from ml.embedding_batcher import embedding_batcher
+from ml.skill_index import skill_index, SKILL_INDEX_MATCH_THRESHOLD, KIND_SKILL, KIND_CATALOG
+
+ML_AVAILABLE = embedding_provider.available
+if not ML_AVAILABLE:
     print("Warning: sentence_transformers could not be imported. Using fallback methods.")
-    model = None
-    ML_AVAILABLE = False
 
 # Sample skill hierarchy (can be expanded)
 # Add additional skills to the hierarchy for better coverage
@@ -72,12 +74,27 @@ SKILL_HIERARCHY = {
     ]
 }
 
-def decompose_skill(skill_name):
+_hierarchy_matrix = None
+
+def get_hierarchy_matrix():
+    """
+    Normalized embeddings of the SKILL_HIERARCHY roots, encoded once and persisted to disk.
+    A new matrix is built only when the hierarchy (or the model) changes.
+    """
+    global _hierarchy_matrix
+    known_skills = list(SKILL_HIERARCHY.keys())
+    if (_hierarchy_matrix is None or _hierarchy_matrix.names != known_skills
+            or _hierarchy_matrix.provider is not embedding_provider):
+        _hierarchy_matrix = EmbeddingMatrix(known_skills, provider=embedding_provider, prefix="skill_hierarchy")
+    return _hierarchy_matrix
+
+def decompose_skill(skill_name, skill_embedding=None):
     """
     Break down a skill into subskills using predefined hierarchy or semantic similarity
     
     Args:
         skill_name (str): The name of the skill to decompose
+        skill_embedding (np.ndarray, optional): Precomputed embedding of skill_name
     
     Returns:
         dict: A JSON tree structure of skill and subskills
@@ -92,7 +109,9 @@ def decompose_skill(skill_name):
             "children": [{"name": subskill, "children": []} for subskill in subskills]
         }
         return skill_tree
-    elif not ML_AVAILABLE:
+    if skill_embedding is None and ML_AVAILABLE and embedding_provider.get_model() is not None:
+        skill_embedding = embedding_provider.embed(skill_name)
+    if skill_embedding is None:
         # Fallback for when ML is not available
         print(f"ML not available, using fallback for {skill_name}")
         # Return a generic skill breakdown
@@ -103,18 +122,9 @@ def decompose_skill(skill_name):
         }
         return skill_tree
     else:
-        # Use semantic similarity to find the most related skill
-        skill_embedding = model.encode(skill_name)
-        
-        # Compute similarities with known skills
-        known_skills = list(SKILL_HIERARCHY.keys())
-        known_embeddings = model.encode(known_skills)
-        
-        # Find the most similar skill
-        similarities = util.cos_sim(skill_embedding, known_embeddings)[0]
-        best_match_idx = np.argmax(similarities)
-        best_match = known_skills[best_match_idx]
-        similarity_score = similarities[best_match_idx].item()
+        # Use semantic similarity to find the most related skill: one
+        # matrix-vector product against the cached hierarchy embeddings
+        best_match, similarity_score = get_hierarchy_matrix().best_match(skill_embedding)
         
         # If similarity is high enough, use that skill's hierarchy
         if similarity_score > 0.7:
@@ -125,6 +135,20 @@ def decompose_skill(skill_name):
                 "children": [{"name": subskill, "children": []} for subskill in subskills]
             }
             return skill_tree
+        
+        # Otherwise reuse the tree of the closest skill we already know about
+        try:
+            matches = skill_index.search_embedding(skill_embedding, k=5, kinds=(KIND_SKILL, KIND_CATALOG))
+        except Exception as e:
+            print(f"Skill index search failed for {skill_name}: {e}")
+            matches = []
+        match = next((m for m in matches if m.subskills and m.score >= SKILL_INDEX_MATCH_THRESHOLD), None)
+        if match is not None:
+            return {
+                "name": skill_name,
+                "description": f"Similar to {match.name}",
+                "children": [{"name": subskill, "children": []} for subskill in match.subskills]
+            }
         else:
             # Default decomposition for unknown skills
             return {
@@ -136,6 +160,23 @@ def decompose_skill(skill_name):
                 ]
             }
 
+async def decompose_skill_async(skill_name):
+    """
+    decompose_skill for async callers: the skill name is embedded through the
+    micro-batcher, together with other concurrent requests, off the event loop.
+    The matching step runs in a worker thread too, since it may encode the
+    hierarchy or pending skill index entries on first use.
+    """
+    if skill_name in SKILL_HIERARCHY:
+        return decompose_skill(skill_name)
+    skill_embedding = None
+    if ML_AVAILABLE:
+        try:
+            skill_embedding = await embedding_batcher.embed(skill_name)
+        except RuntimeError as e:
+            print(f"Batched embedding failed for {skill_name}: {e}")
+    return await asyncio.to_thread(decompose_skill, skill_name, skill_embedding)
+
 def generate_learning_path(skill_name):
     """
     Generate a learning path for a given skill based on prerequisite relationships
@@ -175,8 +216,8 @@ def get_resources_for_skill(skill_name):
     # Try to get resources using the enhanced search system
     try:
         # Import the enhanced resource search utility
-        from backend.utils.resource_search import get_resources_for_skill as search_resources
-        from backend.utils.curated_resources import get_curated_resources
+        from utils.resource_search import get_resources_for_skill as search_resources
+        from utils.curated_resources import get_curated_resources
         
         # First try curated resources
         curated = get_curated_resources(skill_name)
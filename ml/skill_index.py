@@ -0,0 +1,447 @@
+"""
+Skill Nearest-Neighbour Index
+=============================
+
+Approximate nearest-neighbour search over every skill and subskill name we
+know: rows of the ``skills`` table, their ``subskills`` JSON, the resource
+catalog keys and the SKILL_HIERARCHY.
+
+``IVFIndex`` is an inverted-file index in plain NumPy (CPU only, no extra
+dependencies):
+
+- Below ``train_threshold`` vectors it does an exact scan.
+- Above it, k-means centroids partition the vectors, and a query only scans
+  the ``nprobe`` closest lists.
+- New vectors are assigned to their nearest centroid as they arrive. The
+  centroids are retrained once the index has grown 4x since the last training.
+
+``SkillIndex`` maps names to vectors. Names are queued cheaply (e.g. from the
+ORM's after-insert hook). A search embeds at most SKILL_INDEX_INLINE_FLUSH
+queued names itself (typically just-created skills). Loading the saved index,
+seeding every known name and embedding larger backlogs happen in a background
+warm-up, while searches serve what is already indexed. The index is
+persisted next to the database, so workers and restarts reuse it.
+
+Configuration (environment):
+    SKILL_INDEX_PATH           index file (default: next to the SQLite database)
+    SKILL_INDEX_NPROBE         inverted lists scanned per query
+    SKILL_INDEX_TRAIN_SIZE     vectors needed before switching from exact search to IVF
+    SKILL_INDEX_SAVE_INTERVAL  minimum seconds between automatic saves
+    SKILL_INDEX_INLINE_FLUSH   queued names a search may embed itself; more go to the background warm-up
+    SKILL_INDEX_FLUSH_BATCH    names embedded per batch by the warm-up
+    SKILL_INDEX_MATCH_THRESHOLD  similarity needed to reuse an existing skill
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ml.embeddings import embedding_provider, normalize_rows
+
+logger = logging.getLogger(__name__)
+
+
+def default_index_path() -> str:
+    """``<database>.skill_index.npz`` for SQLite, otherwise backend/data/skill_index.npz."""
+    database_url = os.environ.get("DATABASE_URL", "sqlite:///./skillsprint.db")
+    if database_url.startswith("sqlite:///") and ":memory:" not in database_url:
+        database_path = os.path.abspath(database_url[len("sqlite:///"):])
+        return os.path.splitext(database_path)[0] + ".skill_index.npz"
+    backend_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+    return os.path.join(backend_dir, "data", "skill_index.npz")
+
+
+SKILL_INDEX_PATH = os.environ.get("SKILL_INDEX_PATH") or default_index_path()
+SKILL_INDEX_NPROBE = int(os.environ.get("SKILL_INDEX_NPROBE", "8"))
+SKILL_INDEX_TRAIN_SIZE = int(os.environ.get("SKILL_INDEX_TRAIN_SIZE", "2048"))
+SKILL_INDEX_SAVE_INTERVAL = float(os.environ.get("SKILL_INDEX_SAVE_INTERVAL", "60"))
+SKILL_INDEX_INLINE_FLUSH = int(os.environ.get("SKILL_INDEX_INLINE_FLUSH", "32"))
+SKILL_INDEX_FLUSH_BATCH = int(os.environ.get("SKILL_INDEX_FLUSH_BATCH", "512"))
+# Minimum cosine similarity for reusing an existing skill's tree or resources
+SKILL_INDEX_MATCH_THRESHOLD = float(os.environ.get("SKILL_INDEX_MATCH_THRESHOLD", "0.75"))
+
+# Entry kinds
+KIND_SKILL = "skill"
+KIND_SUBSKILL = "subskill"
+KIND_CATALOG = "catalog"
+
+
+class IVFIndex:
+    """Inverted-file ANN index over L2-normalized float32 vectors (inner-product search)."""
+
+    def __init__(self, dim: int, nprobe: int = SKILL_INDEX_NPROBE, train_threshold: int = SKILL_INDEX_TRAIN_SIZE,
+                 kmeans_iterations: int = 12, seed: int = 0):
+        self.dim = dim
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self.size = 0
+        self.centroids: Optional[np.ndarray] = None
+        self.assignments = np.zeros(0, dtype=np.int32)
+        self.lists: List[np.ndarray] = []
+        self.trained_size = 0
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[:self.size]
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def add(self, vectors: np.ndarray) -> np.ndarray:
+        """Append normalized vectors; returns their ids."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        start, end = self.size, self.size + len(vectors)
+        if end > len(self._vectors):
+            grown = np.zeros((max(end, 2 * len(self._vectors), 64), self.dim), dtype=np.float32)
+            grown[:self.size] = self.vectors
+            self._vectors = grown
+        self._vectors[start:end] = vectors
+        self.size = end
+
+        if self.is_trained and self.size < 4 * self.trained_size:
+            assigned = np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+            self.assignments = np.concatenate([self.assignments, assigned])
+            self._rebuild_lists()
+        elif self.size >= self.train_threshold:
+            self.train()
+        return np.arange(start, end)
+
+    def train(self):
+        """Spherical k-means over (a sample of) the vectors, then re-assign everything."""
+        data = self.vectors
+        nlist = min(len(data), max(1, int(4 * np.sqrt(len(data)))))
+        rng = np.random.default_rng(self.seed)
+        sample = data if len(data) <= 64 * nlist else data[rng.choice(len(data), 64 * nlist, replace=False)]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(self.kmeans_iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = sample[labels == cluster]
+                if len(members):
+                    centroids[cluster] = members.sum(axis=0)
+            centroids = normalize_rows(centroids)
+
+        self.centroids = centroids
+        self.assignments = np.argmax(data @ centroids.T, axis=1).astype(np.int32)
+        self.trained_size = len(data)
+        self._rebuild_lists()
+
+    def _rebuild_lists(self):
+        order = np.argsort(self.assignments, kind="stable")
+        boundaries = np.searchsorted(self.assignments[order], np.arange(len(self.centroids) + 1))
+        self.lists = [order[boundaries[i]:boundaries[i + 1]] for i in range(len(self.centroids))]
+
+    def search(self, query: np.ndarray, k: int = 5, nprobe: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-``k`` ids and inner-product scores for one normalized query vector.
+        """
+        if self.size == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        query = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        if self.is_trained:
+            probes = min(nprobe or self.nprobe, len(self.centroids))
+            closest = np.argpartition(-(self.centroids @ query), probes - 1)[:probes]
+            candidates = np.concatenate([self.lists[c] for c in closest])
+        else:
+            candidates = np.arange(self.size)
+        if len(candidates) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        scores = self._vectors[candidates] @ query
+        k = min(k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return candidates[top], scores[top]
+
+    def state(self) -> Dict[str, np.ndarray]:
+        state = {"vectors": self.vectors, "assignments": self.assignments,
+                 "trained_size": np.array(self.trained_size)}
+        if self.is_trained:
+            state["centroids"] = self.centroids
+        return state
+
+    def restore(self, state):
+        self._vectors = np.array(state["vectors"], dtype=np.float32)
+        self.size = len(self._vectors)
+        self.trained_size = int(state["trained_size"])
+        if "centroids" in state:
+            self.centroids = np.array(state["centroids"], dtype=np.float32)
+            self.assignments = np.array(state["assignments"], dtype=np.int32)
+            self._rebuild_lists()
+
+
+class SkillMatch(NamedTuple):
+    name: str
+    score: float
+    kind: str
+    skill_id: Optional[int]
+    parent: Optional[str]
+    subskills: List[str]
+
+
+def _key(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+class SkillIndex:
+    """Names of skills/subskills with their embeddings in an ``IVFIndex``."""
+
+    def __init__(self, provider=None, path: str = None, nprobe: int = SKILL_INDEX_NPROBE,
+                 train_threshold: int = SKILL_INDEX_TRAIN_SIZE, save_interval: float = SKILL_INDEX_SAVE_INTERVAL,
+                 inline_flush: int = SKILL_INDEX_INLINE_FLUSH, flush_batch: int = SKILL_INDEX_FLUSH_BATCH):
+        self.provider = provider or embedding_provider
+        self.path = path or SKILL_INDEX_PATH
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.save_interval = save_interval
+        self.inline_flush = inline_flush
+        self.flush_batch = flush_batch
+        self.entries: List[Dict] = []
+        self._ids: Dict[str, int] = {}
+        self._pending: Dict[str, Dict] = {}
+        self._index: Optional[IVFIndex] = None
+        self._lock = threading.RLock()
+        self._seed: Optional[Callable[["SkillIndex"], None]] = None
+        self._prepared = False
+        self._dirty = False
+        self._last_save = 0.0
+        self._warm_thread: Optional[threading.Thread] = None
+        # Separate from _lock, which the warm-up holds while seeding
+        self._warm_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # ---- adding names ----
+
+    def enqueue(self, name: str, kind: str = KIND_SKILL, skill_id: int = None,
+                parent: str = None, subskills: Sequence[str] = ()):
+        """Queue a name for indexing (cheap; embedding happens on the next flush)."""
+        if not name or not name.strip():
+            return
+        key = _key(name)
+        entry = {"name": name.strip(), "kind": kind, "skill_id": skill_id,
+                 "parent": parent, "subskills": list(subskills or [])}
+        with self._lock:
+            existing_id = self._ids.get(key)
+            if existing_id is not None:
+                self._merge(self.entries[existing_id], entry)
+                return
+            queued = self._pending.get(key)
+            if queued is None or kind == KIND_SKILL or queued["kind"] != KIND_SKILL:
+                self._pending[key] = entry
+
+    def _merge(self, existing: Dict, entry: Dict):
+        # Already embedded: only enrich the metadata (DB rows beat catalog keys)
+        if entry["kind"] == KIND_SKILL or existing["kind"] != KIND_SKILL:
+            for field in ("skill_id", "parent", "subskills"):
+                if entry[field]:
+                    existing[field] = entry[field]
+            if entry["kind"] == KIND_SKILL:
+                existing["kind"] = KIND_SKILL
+            self._dirty = True
+
+    def add_skill(self, name: str, skill_id: int = None, subskills: Sequence[str] = (), kind: str = KIND_SKILL):
+        """Queue a skill together with each of its subskills."""
+        self.enqueue(name, kind=kind, skill_id=skill_id, subskills=subskills)
+        for subskill in subskills or []:
+            if isinstance(subskill, str):
+                self.enqueue(subskill, kind=KIND_SUBSKILL, skill_id=skill_id, parent=name)
+
+    def flush(self, limit: int = None) -> int:
+        """
+        Embed queued names in one batch and add them to the index.
+
+        The lock is not held while encoding, so searches keep being served.
+
+        Args:
+            limit: Embed at most this many names (default: all queued)
+
+        Returns:
+            How many names were added
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            keys = list(self._pending)[:limit] if limit else list(self._pending)
+            batch = [(key, self._pending.pop(key)) for key in keys]
+        try:
+            vectors = normalize_rows(self.provider.encode([entry["name"] for _, entry in batch]))
+        except Exception:
+            with self._lock:
+                for key, entry in batch:
+                    self._pending.setdefault(key, entry)
+            raise
+        added = 0
+        with self._lock:
+            fresh = []
+            for row, (key, entry) in enumerate(batch):
+                if key in self._ids:
+                    # Embedded meanwhile by a concurrent flush
+                    self._merge(self.entries[self._ids[key]], entry)
+                else:
+                    fresh.append(row)
+            if fresh:
+                if self._index is None:
+                    self._index = IVFIndex(vectors.shape[1], nprobe=self.nprobe, train_threshold=self.train_threshold)
+                for row, entry_id in zip(fresh, self._index.add(vectors[fresh])):
+                    key, entry = batch[row]
+                    self._ids[key] = int(entry_id)
+                    self.entries.append(entry)
+                added = len(fresh)
+            self._dirty = True
+        self.maybe_save()
+        return added
+
+    # ---- searching ----
+
+    def set_seed(self, seed: Callable[["SkillIndex"], None]):
+        """Callable that enqueues every known name; run once before the first search."""
+        self._seed = seed
+        self._prepared = False
+
+    def prepare(self):
+        """Load the saved index and enqueue names added since it was written (once)."""
+        if self._prepared:
+            return
+        with self._lock:
+            if self._prepared:
+                return
+            if not self.entries:
+                self.load()
+            if self._seed is not None:
+                self._seed(self)
+            self._prepared = True
+
+    def warm(self) -> int:
+        """Prepare the index and embed everything queued, in batches; returns how many names were added."""
+        self.prepare()
+        added = 0
+        while True:
+            count = self.flush(limit=self.flush_batch)
+            if not count and not self._pending:
+                break
+            added += count
+        logger.info(f"Skill index ready: {len(self.entries)} entries ({added} names embedded)")
+        return added
+
+    def warm_in_background(self) -> threading.Thread:
+        """Start ``warm`` on a daemon thread unless one is already running."""
+        with self._warm_lock:
+            if self._warm_thread is None or not self._warm_thread.is_alive():
+                def run():
+                    try:
+                        self.warm()
+                    except Exception as e:
+                        logger.warning(f"Skill index warm-up failed: {e}")
+
+                self._warm_thread = threading.Thread(target=run, name="skill-index-warm-up", daemon=True)
+                self._warm_thread.start()
+            return self._warm_thread
+
+    def _catch_up(self):
+        # Small backlogs (just-created skills) are embedded inline, the rest in the background
+        if self._prepared and len(self._pending) <= self.inline_flush:
+            self.flush()
+        if not self._prepared or self._pending:
+            self.warm_in_background()
+
+    def search(self, query: str, k: int = 5, kinds: Iterable[str] = None) -> List[SkillMatch]:
+        """Top-``k`` indexed names most similar to ``query``."""
+        return self.search_embedding(self.provider.embed(query), k, kinds)
+
+    def search_embedding(self, embedding, k: int = 5, kinds: Iterable[str] = None) -> List[SkillMatch]:
+        """Like ``search`` for an already computed query embedding."""
+        self._catch_up()
+        if self._index is None:
+            return []
+        kinds = set(kinds) if kinds else None
+        # Over-fetch when filtering by kind so k results survive the filter
+        ids, scores = self._index.search(normalize_rows(embedding), k * 4 if kinds else k)
+        matches = []
+        for entry_id, score in zip(ids, scores):
+            entry = self.entries[entry_id]
+            if kinds and entry["kind"] not in kinds:
+                continue
+            matches.append(SkillMatch(entry["name"], float(score), entry["kind"], entry["skill_id"],
+                                      entry["parent"], list(entry["subskills"])))
+            if len(matches) == k:
+                break
+        return matches
+
+    # ---- persistence ----
+
+    def save(self, path: str = None):
+        path = path or self.path
+        with self._lock:
+            if self._index is None:
+                return
+            state = self._index.state()
+            metadata = json.dumps({"model": self.provider.model_id, "entries": self.entries})
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.savez(f, metadata=np.array(metadata), **state)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not save skill index to {path}: {e}")
+                return
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+    def maybe_save(self):
+        """Save if something changed and the last save is older than ``save_interval``."""
+        if self._dirty and time.monotonic() - self._last_save >= self.save_interval:
+            self.save()
+
+    def save_if_dirty(self):
+        if self._dirty:
+            self.save()
+
+    def load(self, path: str = None) -> bool:
+        """Replace the in-memory index with the saved one (if it was built with the same model)."""
+        path = path or self.path
+        try:
+            with np.load(path) as data:
+                metadata = json.loads(str(data["metadata"]))
+                if metadata["model"] != self.provider.model_id:
+                    logger.info(f"Ignoring skill index {path} built with {metadata['model']}")
+                    return False
+                index = IVFIndex(data["vectors"].shape[1], nprobe=self.nprobe, train_threshold=self.train_threshold)
+                index.restore(data)
+        except (OSError, KeyError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Could not load skill index from {path}: {e}")
+            return False
+        with self._lock:
+            self._index = index
+            self.entries = metadata["entries"]
+            self._ids = {_key(entry["name"]): i for i, entry in enumerate(self.entries)}
+            self._dirty = False
+            self._last_save = time.monotonic()
+        return True
+
+    def stats(self) -> Dict:
+        return {
+            "entries": len(self.entries),
+            "pending": len(self._pending),
+            "warming": self._warm_thread is not None and self._warm_thread.is_alive(),
+            "ivf_trained": bool(self._index is not None and self._index.is_trained),
+            "lists": len(self._index.lists) if self._index is not None and self._index.is_trained else 0,
+            "nprobe": self.nprobe,
+            "path": self.path,
+        }
+
+
+# Global index shared by decomposition and resource lookup
+skill_index = SkillIndex()